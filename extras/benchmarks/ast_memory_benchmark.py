@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# ast_memory_benchmark.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Benchmark of the memory used by abstract syntax trees, and of the time needed to clone them.
+
+All of the given files (by default, all models in "models") are parsed, and the memory allocated for the trees
+(including their symbol tables) is measured. The trees are then cloned repeatedly, as done by the code generators
+and transformers; the memory allocated for one set of clones, which do not have a symbol table, and the time needed
+to clone them are reported.
+
+Usage: ast_memory_benchmark.py [model.nestml ...]
+"""
+
+import gc
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+
+REPETITIONS = 5
+
+
+def allocated_memory(func):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        gc.collect()
+        memory, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result, memory
+
+
+def main(argv):
+    paths = argv[1:]
+    if not paths:
+        root_dir = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)
+        paths = sorted(glob.glob(os.path.join(root_dir, "models", "**", "*.nestml"), recursive=True))
+
+    sys.setrecursionlimit(10000)
+    init_predefined()
+    Logger.init_logger(LoggingLevel.NO)
+
+    asts, parse_memory = allocated_memory(lambda: [ModelParser.parse_model(path) for path in paths])
+    asts = [ast for ast in asts if ast is not None]
+    nodes = []
+    for ast in asts:
+        ast.accept(ASTHigherOrderVisitor(nodes.append))
+
+    clones, clone_memory = allocated_memory(lambda: [ast.clone() for ast in asts])
+    start_time = time.perf_counter()
+    for _ in range(REPETITIONS):
+        clones = [ast.clone() for ast in asts]
+    clone_time = (time.perf_counter() - start_time) / REPETITIONS
+
+    print("%-40s %10d" % ("files", len(asts)))
+    print("%-40s %10d" % ("nodes", len(nodes)))
+    print("%-40s %10.1f" % ("parsed trees [kB]", 1E-3 * parse_memory))
+    print("%-40s %10.1f" % ("cloned trees [kB]", 1E-3 * clone_memory))
+    print("%-40s %10.1f" % ("cloned trees [bytes/node]", clone_memory / len(nodes)))
+    print("%-40s %10.1f" % ("clone time [ms]", 1E3 * clone_time))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# cocos_benchmark.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Benchmark of the context condition checks that are performed after the symbol table has been built.
+
+Each of the given models (by default, all models in "models") is parsed, and the context conditions are then
+checked repeatedly on each neuron and synapse: once by checking the cocos one after another, each in its own
+traversal of the model, and once by checking them in a single traversal (see ``CoCosEngine``). The messages of
+both are checked to be identical.
+
+Usage: cocos_benchmark.py [model.nestml ...]
+"""
+
+import glob
+import os
+import sys
+import time
+
+from pynestml.cocos.co_cos_manager import CoCosManager
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.symbol_table.symbol_table import SymbolTable
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+
+REPETITIONS = 10
+
+
+def check_co_cos(node, fused):
+    Logger.init_logger(LoggingLevel.NO)
+    Logger.set_current_node(node)
+    start_time = time.perf_counter()
+    for _ in range(REPETITIONS):
+        CoCosManager.post_symbol_table_builder_checks(node, fused=fused)
+    run_time = (time.perf_counter() - start_time) / REPETITIONS
+
+    return run_time, [(code, str(error_position), log_level) for (_, _, log_level, code, error_position, _) in Logger.get_log().values()]
+
+
+def main(argv):
+    paths = argv[1:]
+    if not paths:
+        paths = sorted(glob.glob(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "**", "*.nestml"), recursive=True))
+
+    init_predefined()
+    SymbolTable.initialize_symbol_table(ASTSourceLocation(start_line=0, start_column=0, end_line=0, end_column=0))
+    Logger.init_logger(LoggingLevel.NO)
+
+    total_time = {True: 0., False: 0.}
+    print("%-40s %14s %14s" % ("model", "separate [ms]", "fused [ms]"))
+    for path in paths:
+        compilation_unit = ModelParser.parse_model(path)
+        if compilation_unit is None:
+            continue
+
+        for node in compilation_unit.get_neuron_list() + compilation_unit.get_synapse_list():
+            times = {}
+            messages = {}
+            for fused in [False, True]:
+                times[fused], messages[fused] = check_co_cos(node, fused)
+                total_time[fused] += times[fused]
+
+            assert messages[False] == messages[True], "Messages differ for model " + node.get_name()
+            print("%-40s %14.2f %14.2f" % (node.get_name(), 1E3 * times[False], 1E3 * times[True]))
+
+    print("%-40s %14.2f %14.2f" % ("total", 1E3 * total_time[False], 1E3 * total_time[True]))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
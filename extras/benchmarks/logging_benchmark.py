@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# logging_benchmark.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Benchmark of logging during context condition checks at logging level ERROR.
+
+Each of the given models (by default, all models in "models") is parsed, and the context conditions are then
+checked repeatedly on each neuron and synapse. This is timed once with all messages being constructed and stored
+in the log (as with ``--store_log``), and once with messages that are not printed at logging level ERROR being
+only counted, without being constructed. The number of messages of each level is checked to be identical.
+
+Additionally, the cost of a single (implicit type cast) INFO message is timed, when it is constructed and stored,
+and when it is deferred.
+
+Usage: logging_benchmark.py [model.nestml ...]
+"""
+
+import glob
+import os
+import sys
+import time
+
+from pynestml.cocos.co_cos_manager import CoCosManager
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.symbol_table.symbol_table import SymbolTable
+from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.messages import Messages
+from pynestml.utils.model_parser import ModelParser
+
+REPETITIONS = 10
+MESSAGES = 100000
+
+
+def check_co_cos(node, store_suppressed):
+    Logger.init_logger(LoggingLevel.ERROR, store_suppressed=store_suppressed)
+    Logger.set_current_node(node)
+    start_time = time.perf_counter()
+    for _ in range(REPETITIONS):
+        CoCosManager.post_symbol_table_builder_checks(node)
+    run_time = (time.perf_counter() - start_time) / REPETITIONS
+
+    return run_time, dict(Logger.get_message_counts())
+
+
+def log_messages(node, deferred):
+    lhs_type = PredefinedTypes.get_type("mV")
+    rhs_type = PredefinedTypes.get_type("V")
+    Logger.init_logger(LoggingLevel.ERROR, store_suppressed=not deferred)
+    Logger.set_current_node(node)
+    start_time = time.perf_counter()
+    for _ in range(MESSAGES):
+        if deferred:
+            Logger.log_deferred_message(lambda: Messages.get_implicit_cast_rhs_to_lhs(rhs_type.print_symbol(), lhs_type.print_symbol()),
+                                        log_level=LoggingLevel.INFO)
+        else:
+            code, message = Messages.get_implicit_cast_rhs_to_lhs(rhs_type.print_symbol(), lhs_type.print_symbol())
+            Logger.log_message(code=code, message=message, log_level=LoggingLevel.INFO)
+
+    return (time.perf_counter() - start_time) / MESSAGES
+
+
+def main(argv):
+    paths = argv[1:]
+    if not paths:
+        paths = sorted(glob.glob(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "**", "*.nestml"), recursive=True))
+
+    init_predefined()
+    SymbolTable.initialize_symbol_table(ASTSourceLocation(start_line=0, start_column=0, end_line=0, end_column=0))
+    Logger.init_logger(LoggingLevel.NO)
+
+    nodes = []
+    for path in paths:
+        compilation_unit = ModelParser.parse_model(path)
+        if compilation_unit is not None:
+            nodes.extend(compilation_unit.get_neuron_list() + compilation_unit.get_synapse_list())
+
+    total_time = {True: 0., False: 0.}
+    print("%-40s %14s %14s" % ("model", "stored [ms]", "deferred [ms]"))
+    for node in nodes:
+        times = {}
+        message_counts = {}
+        for store_suppressed in [True, False]:
+            times[store_suppressed], message_counts[store_suppressed] = check_co_cos(node, store_suppressed)
+            total_time[store_suppressed] += times[store_suppressed]
+
+        assert message_counts[True] == message_counts[False], "Message counts differ for model " + node.get_name()
+        print("%-40s %14.2f %14.2f" % (node.get_name(), 1E3 * times[True], 1E3 * times[False]))
+
+    print("%-40s %14.2f %14.2f" % ("total", 1E3 * total_time[True], 1E3 * total_time[False]))
+
+    print()
+    print("%-40s %14s %14s" % ("single INFO message", "stored [us]", "deferred [us]"))
+    print("%-40s %14.2f %14.2f" % ("", 1E6 * log_messages(nodes[0], False), 1E6 * log_messages(nodes[0], True)))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# ode_toolbox_analysis_benchmark.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Benchmark of the ODE-toolbox analysis that is performed during code generation.
+
+For each of the given models (by default, all neuron models in "models/neurons"), the ODE-toolbox input is
+collected during code generation. The analysis is then timed when performed in a single pass, and when performed
+by invoking ODE-toolbox twice (once for the analytic and once for the numeric solver). The results of both are
+checked to be identical.
+
+Usage: ode_toolbox_analysis_benchmark.py [model.nestml ...]
+"""
+
+import glob
+import os
+import sys
+import tempfile
+import time
+
+from pynestml.codegeneration.nest_code_generator import NESTCodeGenerator
+from pynestml.frontend.pynestml_frontend import generate_target
+from pynestml.utils.ode_toolbox_utils import ODEToolboxUtils
+
+
+class RecordingNESTCodeGenerator(NESTCodeGenerator):
+    """
+    Code generator that records the ODE-toolbox input and options for every neuron.
+    """
+
+    inputs = []
+
+    def _run_ode_toolbox_analysis(self, neuron, odetoolbox_indict, **kwargs):
+        solver_result = super()._run_ode_toolbox_analysis(neuron, odetoolbox_indict, **kwargs)
+        RecordingNESTCodeGenerator.inputs.append((neuron.get_name(), odetoolbox_indict, kwargs))
+        return solver_result
+
+
+def collect_inputs(paths):
+    import pynestml.frontend.pynestml_frontend as pynestml_frontend
+    pynestml_frontend.code_generator_from_target_name = lambda target_name, options=None: RecordingNESTCodeGenerator(options)
+    pynestml_frontend.builder_from_target_name = lambda target_name, options=None: None
+
+    with tempfile.TemporaryDirectory() as target_path:
+        generate_target(paths, target_platform="NEST", target_path=target_path, logging_level="ERROR")
+
+    return RecordingNESTCodeGenerator.inputs
+
+
+def main(argv):
+    paths = argv[1:]
+    if not paths:
+        paths = sorted(glob.glob(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "neurons", "*.nestml")))
+
+    print("Collecting ODE-toolbox inputs for " + str(len(paths)) + " models...")
+    inputs = collect_inputs(paths)
+
+    total_time = {True: 0., False: 0.}
+    print("%-30s %12s %12s" % ("model", "two-pass [s]", "one-pass [s]"))
+    for model_name, indict, kwargs in inputs:
+        results = {}
+        times = {}
+        for single_pass in [False, True]:
+            start_time = time.perf_counter()
+            results[single_pass] = ODEToolboxUtils.analysis(indict, single_pass=single_pass, log_level="ERROR", **kwargs)
+            times[single_pass] = time.perf_counter() - start_time
+            total_time[single_pass] += times[single_pass]
+
+        assert results[False] == results[True], "Results differ for model " + model_name
+        print("%-30s %12.2f %12.2f" % (model_name, times[False], times[True]))
+
+    print("%-30s %12.2f %12.2f" % ("total", total_time[False], total_time[True]))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
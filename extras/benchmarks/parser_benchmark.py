@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# parser_benchmark.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Benchmark of the throughput of the parser.
+
+Each of the given files (by default, all models in "models" and "tests/resources") is lexed, parsed and built into an
+abstract syntax tree repeatedly: once in the full LL prediction mode only, and once in two stages, first in the SLL
+prediction mode and only upon failure in the full LL mode (see ``parse_with_fallback()``). The trees are checked to
+be identical. As the prediction caches of the parser are shared between runs, each file is parsed once in both modes
+before the time is measured.
+
+Usage: parser_benchmark.py [model.nestml ...]
+"""
+
+import glob
+import os
+import sys
+import time
+
+from antlr4 import FileStream
+
+from pynestml.codegeneration.printers.nestml_printer import NESTMLPrinter
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+
+REPETITIONS = 3
+
+
+def build_ast(path, two_stage_parsing):
+    ModelParser.two_stage_parsing = two_stage_parsing
+    try:
+        return ModelParser._build_ast(FileStream(path))
+    finally:
+        ModelParser.two_stage_parsing = True
+
+
+def main(argv):
+    paths = argv[1:]
+    if not paths:
+        root_dir = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)
+        paths = sorted(glob.glob(os.path.join(root_dir, "models", "**", "*.nestml"), recursive=True)) \
+            + sorted(glob.glob(os.path.join(root_dir, "tests", "resources", "**", "*.nestml"), recursive=True))
+
+    sys.setrecursionlimit(10000)
+    init_predefined()
+    Logger.init_logger(LoggingLevel.NO)
+
+    total_time = {True: 0., False: 0.}
+    total_size = 0
+    print("%-40s %10s %10s" % ("file", "LL [ms]", "SLL [ms]"))
+    for path in paths:
+        trees = {}
+        times = {}
+        for two_stage_parsing in [False, True]:
+            ast = build_ast(path, two_stage_parsing)
+            trees[two_stage_parsing] = None if ast is None else NESTMLPrinter().print_node(ast)
+            start_time = time.perf_counter()
+            for _ in range(REPETITIONS):
+                build_ast(path, two_stage_parsing)
+            times[two_stage_parsing] = (time.perf_counter() - start_time) / REPETITIONS
+            total_time[two_stage_parsing] += times[two_stage_parsing]
+
+        assert trees[False] == trees[True], "Trees differ for " + path
+        total_size += os.path.getsize(path)
+        print("%-40s %10.1f %10.1f" % (os.path.basename(path)[:40], 1E3 * times[False], 1E3 * times[True]))
+
+    print("%-40s %10.1f %10.1f" % ("total", 1E3 * total_time[False], 1E3 * total_time[True]))
+    print("%-40s %10.1f %10.1f" % ("throughput [kB/s]", 1E-3 * total_size / total_time[False], 1E-3 * total_size / total_time[True]))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# visitor_benchmark.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Benchmark of the traversal of the AST by the visitors.
+
+Each of the given models (by default, all models in "models") is parsed, and each neuron and synapse is then
+traversed repeatedly by a visitor that does nothing (which measures the cost of the dispatch of each node to its
+``visit_*()``, ``traverse_*()`` and ``endvisit_*()`` methods), by a visitor that counts the variables and
+function calls, and by an ``ASTHigherOrderVisitor`` with a function that does nothing.
+
+Usage: visitor_benchmark.py [model.nestml ...]
+"""
+
+import glob
+import os
+import sys
+import time
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+from pynestml.visitors.ast_visitor import ASTVisitor
+
+REPETITIONS = 10
+
+
+class CountingVisitor(ASTVisitor):
+    def __init__(self):
+        super(CountingVisitor, self).__init__()
+        self.count = 0
+
+    def visit_variable(self, node):
+        self.count += 1
+
+    def endvisit_function_call(self, node):
+        self.count += 1
+
+
+def traverse(nodes, create_visitor):
+    start_time = time.perf_counter()
+    for _ in range(REPETITIONS):
+        for node in nodes:
+            node.accept(create_visitor())
+
+    return (time.perf_counter() - start_time) / REPETITIONS
+
+
+def main(argv):
+    paths = argv[1:]
+    if not paths:
+        paths = sorted(glob.glob(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "models", "**", "*.nestml"), recursive=True))
+
+    init_predefined()
+    Logger.init_logger(LoggingLevel.NO)
+
+    nodes = []
+    for path in paths:
+        compilation_unit = ModelParser.parse_model(path)
+        if compilation_unit is not None:
+            nodes.extend(compilation_unit.get_neuron_list() + compilation_unit.get_synapse_list())
+
+    n_nodes = [0]
+
+    def count_node(node):
+        n_nodes[0] += 1
+
+    for node in nodes:
+        node.accept(ASTHigherOrderVisitor(visit_funcs=count_node))
+
+    def create_higher_order_visitor():
+        return ASTHigherOrderVisitor(visit_funcs=lambda node: None)
+
+    print("%-40s %8d" % ("models", len(nodes)))
+    print("%-40s %8d" % ("nodes", n_nodes[0]))
+    print("%-40s %14s %14s" % ("visitor", "time [ms]", "per node [us]"))
+    for name, create_visitor in [("ASTVisitor", ASTVisitor),
+                                 ("counting visitor", CountingVisitor),
+                                 ("ASTHigherOrderVisitor", create_higher_order_visitor)]:
+        run_time = traverse(nodes, create_visitor)
+        print("%-40s %14.2f %14.3f" % (name, 1E3 * run_time, 1E6 * run_time / n_nodes[0]))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
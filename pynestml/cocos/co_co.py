@@ -18,8 +18,13 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+from typing import Optional
+
 from abc import ABCMeta, abstractmethod
 
+from pynestml.meta_model.ast_node import ASTNode
+from pynestml.visitors.ast_visitor import ASTVisitor
+
 
 class CoCo:
     """
@@ -28,9 +33,12 @@ class CoCo:
     Attributes:
         description type(str): This field can be used to give a short description regarding the properties which
                                 are checked by this coco.
+        modifies_model type(bool): Indicates whether checking this coco changes the model (e.g. the type symbols of
+                                its nodes), so that cocos checked afterwards have to see the changed model.
     """
     __metaclass__ = ABCMeta
     description = None
+    modifies_model = False
 
     @abstractmethod
     def check_co_co(self, node):
@@ -42,3 +50,12 @@ class CoCo:
         :rtype: bool
         """
         pass
+
+    @classmethod
+    def get_visitor(cls, node: ASTNode) -> Optional[ASTVisitor]:
+        """
+        Returns a visitor that checks this coco when it is run over the handed over node, if the coco can be checked in this way. Such cocos can be checked in a single traversal of the model, together with other cocos (see ``CoCosEngine``). The visitor should only override ``visit_*()`` and ``endvisit_*()`` methods, or the generic ``visit()`` and ``endvisit()`` methods; checks that have to be done after the whole model has been visited can be done in ``endvisit_neuron()`` or ``endvisit_synapse()``.
+        :param node: a single neuron or synapse instance on which the coco will be checked.
+        :return: a visitor, or None if the coco cannot be checked by a single visitor.
+        """
+        return None
@@ -33,6 +33,7 @@ class CoCoCorrectNumeratorOfUnit(CoCo):
     Not allowed:
         V_m 2/mV = ...
     """
+    modifies_model = True   # the type symbol of an offending unit is set to an error type
 
     @classmethod
     def check_co_co(cls, node):
@@ -41,7 +42,17 @@ class CoCoCorrectNumeratorOfUnit(CoCo):
         :param node: a single neuron instance.
         :type node: ast_neuron
         """
-        node.accept(NumericNumeratorVisitor())
+        node.accept(cls.get_visitor(node))
+
+    @classmethod
+    def get_visitor(cls, node) -> ASTVisitor:
+        """
+        Returns a visitor that checks the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        :type node: ast_neuron
+        :return: a visitor
+        """
+        return NumericNumeratorVisitor()
 
 
 class NumericNumeratorVisitor(ASTVisitor):
@@ -52,7 +52,17 @@ class CoCoEquationsOnlyForInitValues(CoCo):
         :param node: a single neuron instance.
         :type node: ast_neuron
         """
-        node.accept(EquationsOnlyForInitValues())
+        node.accept(cls.get_visitor(node))
+
+    @classmethod
+    def get_visitor(cls, node) -> ASTVisitor:
+        """
+        Returns a visitor that checks the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        :type node: ast_neuron
+        :return: a visitor
+        """
+        return EquationsOnlyForInitValues()
 
 
 class EquationsOnlyForInitValues(ASTVisitor):
@@ -49,7 +49,17 @@ class CoCoFunctionArgumentTemplateTypesConsistent(CoCo):
         :param neuron: a single neuron instance.
         :type neuron: ASTNeuron
         """
-        neuron.accept(CorrectTemplatedArgumentTypesVisitor())
+        neuron.accept(cls.get_visitor(neuron))
+
+    @classmethod
+    def get_visitor(cls, neuron) -> ASTVisitor:
+        """
+        Returns a visitor that checks the coco for the handed over neuron.
+        :param neuron: a single neuron instance.
+        :type neuron: ASTNeuron
+        :return: a visitor
+        """
+        return CorrectTemplatedArgumentTypesVisitor()
 
 
 class CorrectTemplatedArgumentTypesVisitor(ASTVisitor):
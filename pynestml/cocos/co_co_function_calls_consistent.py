@@ -44,7 +44,17 @@ class CoCoFunctionCallsConsistent(CoCo):
         :param node: a single neuron instance.
         :type node: ASTNeuron
         """
-        node.accept(FunctionCallConsistencyVisitor())
+        node.accept(cls.get_visitor(node))
+
+    @classmethod
+    def get_visitor(cls, node) -> ASTVisitor:
+        """
+        Returns a visitor that checks the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        :type node: ASTNeuron
+        :return: a visitor
+        """
+        return FunctionCallConsistencyVisitor()
 
 
 class FunctionCallConsistencyVisitor(ASTVisitor):
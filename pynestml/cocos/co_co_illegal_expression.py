@@ -43,7 +43,17 @@ class CoCoIllegalExpression(CoCo):
         :param neuron: a single neuron instance.
         :type neuron: ASTNeuron
         """
-        neuron.accept(CorrectExpressionVisitor())
+        neuron.accept(cls.get_visitor(neuron))
+
+    @classmethod
+    def get_visitor(cls, neuron) -> ASTVisitor:
+        """
+        Returns a visitor that checks the coco for the handed over neuron.
+        :param neuron: a single neuron instance.
+        :type neuron: ASTNeuron
+        :return: a visitor
+        """
+        return CorrectExpressionVisitor()
 
 
 class CorrectExpressionVisitor(ASTVisitor):
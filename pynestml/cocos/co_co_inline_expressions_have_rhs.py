@@ -38,7 +38,16 @@ class CoCoInlineExpressionsHaveRhs(CoCo):
         Ensures the coco for the handed over neuron.
         :param node: a single neuron instance.
         """
-        node.accept(InlineRhsVisitor())
+        node.accept(cls.get_visitor(node))
+
+    @classmethod
+    def get_visitor(cls, node: ASTNeuron) -> ASTVisitor:
+        """
+        Returns a visitor that checks the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        :return: a visitor
+        """
+        return InlineRhsVisitor()
 
 
 class InlineRhsVisitor(ASTVisitor):
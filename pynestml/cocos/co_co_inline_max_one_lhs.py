@@ -42,7 +42,17 @@ class CoCoInlineMaxOneLhs(CoCo):
         :param node: a single neuron instance.
         :type node: ast_neuron
         """
-        node.accept(InlineMaxOneLhs())
+        node.accept(cls.get_visitor(node))
+
+    @classmethod
+    def get_visitor(cls, node) -> ASTVisitor:
+        """
+        Returns a visitor that checks the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        :type node: ast_neuron
+        :return: a visitor
+        """
+        return InlineMaxOneLhs()
 
 
 class InlineMaxOneLhs(ASTVisitor):
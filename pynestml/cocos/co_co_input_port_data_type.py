@@ -56,7 +56,16 @@ class CoCoInputPortDataType(CoCo):
         Ensures the coco for the handed over neuron.
         :param node: a single neuron instance.
         """
-        node.accept(InputPortDatatypeVisitor())
+        node.accept(cls.get_visitor(node))
+
+    @classmethod
+    def get_visitor(cls, node: ASTNeuron) -> ASTVisitor:
+        """
+        Returns a visitor that checks the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        :return: a visitor
+        """
+        return InputPortDatatypeVisitor()
 
 
 class InputPortDatatypeVisitor(ASTVisitor):
@@ -60,7 +60,16 @@ class CoCoInputPortNotAssignedTo(CoCo):
         Ensures the coco for the handed over neuron.
         :param node: a single neuron instance.
         """
-        node.accept(NoInputPortAssignedToVisitor())
+        node.accept(cls.get_visitor(node))
+
+    @classmethod
+    def get_visitor(cls, node: ASTNeuron) -> ASTVisitor:
+        """
+        Returns a visitor that checks the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        :return: a visitor
+        """
+        return NoInputPortAssignedToVisitor()
 
 
 class NoInputPortAssignedToVisitor(ASTVisitor):
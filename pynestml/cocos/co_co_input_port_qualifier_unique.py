@@ -51,7 +51,17 @@ class CoCoInputPortQualifierUnique(CoCo):
         :type node: ast_neuron
         """
         cls.neuronName = node.get_name()
-        node.accept(InputPortQualifierUniqueVisitor())
+        node.accept(cls.get_visitor(node))
+
+    @classmethod
+    def get_visitor(cls, node) -> ASTVisitor:
+        """
+        Returns a visitor that checks the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        :type node: ast_neuron
+        :return: a visitor
+        """
+        return InputPortQualifierUniqueVisitor()
 
 
 class InputPortQualifierUniqueVisitor(ASTVisitor):
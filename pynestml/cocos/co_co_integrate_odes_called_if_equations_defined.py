@@ -18,6 +18,8 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+from typing import Optional
+
 from pynestml.cocos.co_co import CoCo
 from pynestml.meta_model.ast_function_call import ASTFunctionCall
 from pynestml.meta_model.ast_neuron import ASTNeuron
@@ -41,40 +43,37 @@ class CoCoIntegrateOdesCalledIfEquationsDefined(CoCo):
         """
         if isinstance(node, ASTSynapse):
             return
-        equations_defined_visitor = EquationsDefinedVisitor()
-        node.accept(equations_defined_visitor)
-        integrate_odes_called_visitor = IntegrateOdesCalledVisitor()
-        node.accept(integrate_odes_called_visitor)
-        if equations_defined_visitor.equations_defined() and not integrate_odes_called_visitor.integrate_odes_called():
-            code, message = Messages.get_equations_defined_but_integrate_odes_not_called()
-            Logger.log_message(code=code, message=message,
-                               error_position=node.get_source_position(), log_level=LoggingLevel.ERROR)
+        node.accept(cls.get_visitor(node))
 
+    @classmethod
+    def get_visitor(cls, node: ASTNeuron) -> Optional[ASTVisitor]:
+        """
+        Returns a visitor that checks the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        :return: a visitor, or None for synapses, for which the coco does not apply
+        """
+        if isinstance(node, ASTSynapse):
+            return None
+        return IntegrateOdesCalledIfEquationsDefinedVisitor()
 
-class EquationsDefinedVisitor(ASTVisitor):
+
+class IntegrateOdesCalledIfEquationsDefinedVisitor(ASTVisitor):
     """
-    This visitor checks if equations are defined.
+    This visitor checks if equations are defined and if integrate_odes() is called. Once the whole neuron has been visited, it reports an error if equations are defined but integrate_odes() is not called.
     """
 
     _equations_defined = False
+    _integrate_odes_called = False
 
     def visit_ode_equation(self, node):
         self._equations_defined = True
 
-    def equations_defined(self) -> bool:
-        return self._equations_defined
-
-
-class IntegrateOdesCalledVisitor(ASTVisitor):
-    """
-    This visitor checks if integrate_odes() is called.
-    """
-
-    _integrate_odes_called = False
-
     def visit_function_call(self, node: ASTFunctionCall):
         if node.get_name() == PredefinedFunctions.INTEGRATE_ODES:
             self._integrate_odes_called = True
 
-    def integrate_odes_called(self) -> bool:
-        return self._integrate_odes_called
+    def endvisit_neuron(self, node: ASTNeuron):
+        if self._equations_defined and not self._integrate_odes_called:
+            code, message = Messages.get_equations_defined_but_integrate_odes_not_called()
+            Logger.log_message(code=code, message=message,
+                               error_position=node.get_source_position(), log_level=LoggingLevel.ERROR)
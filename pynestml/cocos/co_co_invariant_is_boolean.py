@@ -42,8 +42,17 @@ class CoCoInvariantIsBoolean(CoCo):
         :param neuron: a single neuron instance.
         :type neuron: ast_neuron
         """
-        visitor = InvariantTypeVisitor()
-        neuron.accept(visitor)
+        neuron.accept(cls.get_visitor(neuron))
+
+    @classmethod
+    def get_visitor(cls, neuron) -> ASTVisitor:
+        """
+        Returns a visitor that checks the coco for the handed over neuron.
+        :param neuron: a single neuron instance.
+        :type neuron: ast_neuron
+        :return: a visitor
+        """
+        return InvariantTypeVisitor()
 
 
 class InvariantTypeVisitor(ASTVisitor):
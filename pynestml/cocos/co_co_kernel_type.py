@@ -46,9 +46,19 @@ class CoCoKernelType(CoCo):
         :param node: a single neuron instance.
         :type node: ASTNeuron
         """
+        node.accept(cls.get_visitor(node))
+
+    @classmethod
+    def get_visitor(cls, node: ASTNeuron) -> ASTVisitor:
+        """
+        Returns a visitor that checks the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        :type node: ASTNeuron
+        :return: a visitor
+        """
         kernel_type_visitor = KernelTypeVisitor()
         kernel_type_visitor._neuron = node
-        node.accept(kernel_type_visitor)
+        return kernel_type_visitor
 
 
 class KernelTypeVisitor(ASTVisitor):
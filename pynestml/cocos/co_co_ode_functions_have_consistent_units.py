@@ -38,7 +38,17 @@ class CoCoOdeFunctionsHaveConsistentUnits(CoCo):
         :param node: a single neuron instance.
         :type node: ast_neuron
         """
-        node.accept(OdeFunctionConsistentUnitsVisitor())
+        node.accept(cls.get_visitor(node))
+
+    @classmethod
+    def get_visitor(cls, node) -> ASTVisitor:
+        """
+        Returns a visitor that checks the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        :type node: ast_neuron
+        :return: a visitor
+        """
+        return OdeFunctionConsistentUnitsVisitor()
 
 
 class OdeFunctionConsistentUnitsVisitor(ASTVisitor):
@@ -44,9 +44,18 @@ class CoCoOutputPortDefinedIfEmitCall(CoCo):
         Checks the coco for the handed over neuron.
         :param neuron: a single neuron instance.
         """
+        neuron.accept(cls.get_visitor(neuron))
+
+    @classmethod
+    def get_visitor(cls, neuron: ASTNeuron) -> ASTVisitor:
+        """
+        Returns a visitor that checks the coco for the handed over neuron.
+        :param neuron: a single neuron instance.
+        :return: a visitor
+        """
         visitor = OutputPortDefinedIfEmitCalledVisitor()
         visitor.neuron = neuron
-        neuron.accept(visitor)
+        return visitor
 
 
 class OutputPortDefinedIfEmitCalledVisitor(ASTVisitor):
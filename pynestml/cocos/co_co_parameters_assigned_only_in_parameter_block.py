@@ -56,9 +56,19 @@ class CoCoParametersAssignedOnlyInParameterBlock(CoCo):
         """
         assert (node is not None and (isinstance(node, ASTNeuron) or isinstance(node, ASTSynapse))), \
             '(PyNestML.CoCo.BufferNotAssigned) No or wrong type of neuron provided (%s)!' % type(node)
-        node.accept(ParametersAssignmentVisitor())
+        node.accept(cls.get_visitor(node))
         return
 
+    @classmethod
+    def get_visitor(cls, node) -> ASTVisitor:
+        """
+        Returns a visitor that checks the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        :type node: ASTNeuron
+        :return: a visitor
+        """
+        return ParametersAssignmentVisitor()
+
 
 class ParametersAssignmentVisitor(ASTVisitor):
     """
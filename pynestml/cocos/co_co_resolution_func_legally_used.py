@@ -41,9 +41,18 @@ class CoCoResolutionFuncLegallyUsed(CoCo):
         Checks the coco.
         :param node: a single node (typically, a neuron or synapse)
         """
+        node.accept(cls.get_visitor(node))
+
+    @classmethod
+    def get_visitor(cls, node) -> ASTVisitor:
+        """
+        Returns a visitor that checks the coco.
+        :param node: a single node (typically, a neuron or synapse)
+        :return: a visitor
+        """
         visitor = CoCoResolutionFuncLegallyUsedVisitor()
         visitor.neuron = node
-        node.accept(visitor)
+        return visitor
 
 
 class CoCoResolutionFuncLegallyUsedVisitor(ASTVisitor):
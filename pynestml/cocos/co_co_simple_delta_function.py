@@ -43,6 +43,16 @@ class CoCoSimpleDeltaFunction(CoCo):
         :param node: a single neuron instance.
         :type node: ASTNeuron
         """
+        node.accept(cls.get_visitor(node))
+
+    @classmethod
+    def get_visitor(cls, node) -> ASTVisitor:
+        """
+        Returns a visitor that checks the coco for the handed over neuron.
+        :param node: a single neuron instance.
+        :type node: ASTNeuron
+        :return: a visitor
+        """
 
         def check_simple_delta(_expr=None):
             if _expr.is_function_call() and _expr.get_function_call().get_name() == "delta":
@@ -66,4 +76,4 @@ class CoCoSimpleDeltaFunction(CoCo):
         def func(x):
             return check_simple_delta(x) if isinstance(x, ASTSimpleExpression) else True
 
-        node.accept(ASTHigherOrderVisitor(func))
+        return ASTHigherOrderVisitor(func)
@@ -46,8 +46,17 @@ class CoCoSumHasCorrectParameter(CoCo):
         :type neuron: ASTNeuron
         """
         cls.neuronName = neuron.get_name()
-        visitor = ConvolveParametersCorrectVisitor()
-        neuron.accept(visitor)
+        neuron.accept(cls.get_visitor(neuron))
+
+    @classmethod
+    def get_visitor(cls, neuron) -> ASTVisitor:
+        """
+        Returns a visitor that checks the coco for the handed over neuron.
+        :param neuron: a single neuron instance.
+        :type neuron: ASTNeuron
+        :return: a visitor
+        """
+        return ConvolveParametersCorrectVisitor()
 
 
 class ConvolveParametersCorrectVisitor(ASTVisitor):
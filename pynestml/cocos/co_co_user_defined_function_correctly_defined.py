@@ -44,10 +44,7 @@ class CoCoUserDefinedFunctionCorrectlyDefined(CoCo):
         function foo(...) bool:
             return
         end
-    Attributes:
-        __processedFunction (ast_function): A reference to the currently processed function.
     """
-    processed_function = None
 
     @classmethod
     def check_co_co(cls, _node=None):
@@ -60,13 +57,12 @@ class CoCoUserDefinedFunctionCorrectlyDefined(CoCo):
             '(PyNestML.CoCo.FunctionCallsConsistent) No or wrong type of node provided (%s)!' % type(_node)
         cls.__nodeName = _node.get_name()
         for userDefinedFunction in _node.get_functions():
-            cls.processed_function = userDefinedFunction
             symbol = userDefinedFunction.get_scope().resolve_to_symbol(userDefinedFunction.get_name(),
                                                                        SymbolKind.FUNCTION)
             # first ensure that the block contains at least one statement
             if symbol is not None and len(userDefinedFunction.get_block().get_stmts()) > 0:
                 # now check that the last statement is a return
-                cls.__check_return_recursively(symbol.get_return_type(),
+                cls.__check_return_recursively(userDefinedFunction, symbol.get_return_type(),
                                                userDefinedFunction.get_block().get_stmts(), False)
             # now if it does not have a statement, but uses a return type, it is an error
             elif symbol is not None and userDefinedFunction.has_return_type() and \
@@ -78,10 +74,12 @@ class CoCoUserDefinedFunctionCorrectlyDefined(CoCo):
         return
 
     @classmethod
-    def __check_return_recursively(cls, type_symbol=None, stmts=None, ret_defined=False):
+    def __check_return_recursively(cls, processed_function, type_symbol=None, stmts=None, ret_defined=False):
         """
         For a handed over statement, it checks if the statement is a return statement and if it is typed according
         to the handed over type symbol.
+        :param processed_function: the function whose statements are checked
+        :type processed_function: ASTFunction
         :param type_symbol: a single type symbol
         :type type_symbol: type_symbol
         :param stmts: a list of statements, either simple or compound
@@ -128,7 +126,7 @@ class CoCoUserDefinedFunctionCorrectlyDefined(CoCo):
                 if stmt.get_return_stmt().has_expression():
                     type_of_return = stmt.get_return_stmt().get_expression().type
                     if isinstance(type_of_return, ErrorTypeSymbol):
-                        code, message = Messages.get_type_could_not_be_derived(cls.processed_function.get_name())
+                        code, message = Messages.get_type_could_not_be_derived(processed_function.get_name())
                         Logger.log_message(error_position=stmt.get_source_position(),
                                            code=code, message=message, log_level=LoggingLevel.ERROR)
                     elif not type_of_return.equals(type_symbol):
@@ -137,20 +135,20 @@ class CoCoUserDefinedFunctionCorrectlyDefined(CoCo):
             elif isinstance(stmt, ASTCompoundStmt):
                 # otherwise it is a compound stmt, thus check recursively
                 if stmt.is_if_stmt():
-                    cls.__check_return_recursively(type_symbol,
+                    cls.__check_return_recursively(processed_function, type_symbol,
                                                    stmt.get_if_stmt().get_if_clause().get_block().get_stmts(),
                                                    ret_defined)
                     for else_ifs in stmt.get_if_stmt().get_elif_clauses():
-                        cls.__check_return_recursively(type_symbol, else_ifs.get_block().get_stmt(), ret_defined)
+                        cls.__check_return_recursively(processed_function, type_symbol, else_ifs.get_block().get_stmt(), ret_defined)
                     if stmt.get_if_stmt().has_else_clause():
-                        cls.__check_return_recursively(type_symbol,
+                        cls.__check_return_recursively(processed_function, type_symbol,
                                                        stmt.get_if_stmt().get_else_clause().get_block().get_stmts(),
                                                        ret_defined)
                 elif stmt.is_while_stmt():
-                    cls.__check_return_recursively(type_symbol, stmt.get_while_stmt().get_block().get_stmts(),
+                    cls.__check_return_recursively(processed_function, type_symbol, stmt.get_while_stmt().get_block().get_stmts(),
                                                    ret_defined)
                 elif stmt.is_for_stmt():
-                    cls.__check_return_recursively(type_symbol, stmt.get_for_stmt().get_block().get_stmts(),
+                    cls.__check_return_recursively(processed_function, type_symbol, stmt.get_for_stmt().get_block().get_stmts(),
                                                    ret_defined)
             # now, if a return statement has not been defined in the corresponding higher level block, we have
             # to ensure that it is defined here
@@ -36,8 +36,11 @@ class CoCoVectorDeclarationRightSize(CoCo):
 
     @classmethod
     def check_co_co(cls, node: ASTNeuron):
-        visitor = VectorDeclarationVisitor()
-        node.accept(visitor)
+        node.accept(cls.get_visitor(node))
+
+    @classmethod
+    def get_visitor(cls, node: ASTNeuron) -> ASTVisitor:
+        return VectorDeclarationVisitor()
 
 
 class VectorDeclarationVisitor(ASTVisitor):
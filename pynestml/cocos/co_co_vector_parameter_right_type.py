@@ -34,8 +34,11 @@ class CoCoVectorParameterRightType(CoCo):
     """
     @classmethod
     def check_co_co(cls, node: ASTNeuron):
-        visitor = VectorVariablesVisitor()
-        node.accept(visitor)
+        node.accept(cls.get_visitor(node))
+
+    @classmethod
+    def get_visitor(cls, node: ASTNeuron) -> ASTVisitor:
+        return VectorVariablesVisitor()
 
 
 class VectorVariablesVisitor(ASTVisitor):
@@ -44,9 +44,19 @@ class CoCoVectorVariableInNonVectorDeclaration(CoCo):
         """
         assert node is not None and (isinstance(node, ASTNeuron) or isinstance(node, ASTSynapse)), \
             '(PyNestML.CoCo.BufferNotAssigned) No or wrong type provided (%s): expecting neuron or synapse!' % type(node)
-        node.accept(VectorInDeclarationVisitor())
+        node.accept(cls.get_visitor(node))
         return
 
+    @classmethod
+    def get_visitor(cls, node) -> ASTVisitor:
+        """
+        Returns a visitor that checks the coco for the handed over neuron.
+        :param node: a single node instance.
+        :type node: ASTNeuron or ASTSynapse
+        :return: a visitor
+        """
+        return VectorInDeclarationVisitor()
+
 
 class VectorInDeclarationVisitor(ASTVisitor):
     """
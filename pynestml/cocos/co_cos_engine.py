@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+#
+# co_cos_engine.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Callable, List, Optional, Sequence, Type, Union
+
+from pynestml.cocos.co_co import CoCo
+from pynestml.meta_model.ast_node import ASTNode
+from pynestml.utils.logger import Logger
+from pynestml.visitors.ast_composite_visitor import ASTCompositeVisitor
+from pynestml.visitors.ast_visitor import ASTVisitor
+
+
+class CoCosEngine:
+    r"""
+    Checks a sequence of context conditions on a model while traversing the model only once.
+
+    Each coco that can be checked by a visitor (see ``CoCo.get_visitor()``) registers the types of node it is interested in through the ``visit_*()`` and ``endvisit_*()`` methods that its visitor overrides. The model is then traversed once, and each node is handed to the visitors that are interested in it. The other cocos are checked one after another, as before. Cocos that modify the model (see ``CoCo.modifies_model``) are checked by themselves, and split the sequence into parts that are each checked in a single traversal.
+
+    The messages are logged in the same order as if the cocos had been checked one after another: the messages of each visitor are buffered during the traversal, and logged when the coco is reached in the sequence.
+    """
+
+    @classmethod
+    def check_co_cos(cls, node: ASTNode, checks: Sequence[Union[Type[CoCo], Callable[[ASTNode], None]]]) -> None:
+        r"""
+        Checks the handed over cocos.
+        :param node: a single neuron or synapse instance.
+        :param checks: the cocos to check, in order. Each element is either a coco class, or a function that checks a coco on the handed over node.
+        """
+        # cocos that modify the model are checked by themselves, so that the cocos before them see the model as it was, and the cocos after them see the modified model
+        fused_checks = []
+        for check in checks:
+            if isinstance(check, type) and issubclass(check, CoCo) and check.modifies_model:
+                cls._check_co_cos_fused(node, fused_checks)
+                cls._check(check, node)
+                fused_checks = []
+            else:
+                fused_checks.append(check)
+
+        cls._check_co_cos_fused(node, fused_checks)
+
+    @classmethod
+    def _check_co_cos_fused(cls, node: ASTNode, checks: Sequence[Union[Type[CoCo], Callable[[ASTNode], None]]]) -> None:
+        visitors = [cls._get_fusable_visitor(check, node) for check in checks]
+        buffers = [[] if visitor is not None else None for visitor in visitors]
+
+        fused_visitor = ASTFusedVisitor([visitor for visitor in visitors if visitor is not None],
+                                        [buffer for buffer in buffers if buffer is not None])
+        if fused_visitor.get_visitors():
+            try:
+                node.accept(fused_visitor)
+            finally:
+                Logger.message_buffer = None
+
+        for check, buffer in zip(checks, buffers):
+            if buffer is None:
+                cls._check(check, node)
+                continue
+
+            for message in buffer:
+                node_, code, message, error_position, log_level = message
+                Logger.log_message(node=node_, code=code, message=message, error_position=error_position,
+                                   log_level=log_level)
+
+    @classmethod
+    def check_co_cos_separately(cls, node: ASTNode, checks: Sequence[Union[Type[CoCo], Callable[[ASTNode], None]]]) -> None:
+        r"""
+        Checks the handed over cocos one after another, each in its own traversal of the model.
+        :param node: a single neuron or synapse instance.
+        :param checks: the cocos to check, in order. Each element is either a coco class, or a function that checks a coco on the handed over node.
+        """
+        for check in checks:
+            cls._check(check, node)
+
+    @classmethod
+    def _check(cls, check: Union[Type[CoCo], Callable[[ASTNode], None]], node: ASTNode) -> None:
+        if isinstance(check, type) and issubclass(check, CoCo):
+            check.check_co_co(node)
+        else:
+            check(node)
+
+    @classmethod
+    def _get_fusable_visitor(cls, check: Union[Type[CoCo], Callable[[ASTNode], None]], node: ASTNode) -> Optional[ASTVisitor]:
+        if not (isinstance(check, type) and issubclass(check, CoCo)):
+            return None
+
+        visitor = check.get_visitor(node)
+        if visitor is None or not ASTFusedVisitor.can_fuse(visitor):
+            return None
+
+        return visitor
+
+
+class ASTFusedVisitor(ASTCompositeVisitor):
+    r"""
+    Runs several visitors in a single traversal of the AST (see ``ASTCompositeVisitor``). While a visitor handles a node, the messages it logs are appended to its buffer.
+
+    Only visitors that do not change the way the AST is traversed can be fused (see ``can_fuse()``).
+    """
+
+    def __init__(self, visitors: Sequence[ASTVisitor], buffers: Sequence[List]):
+        r"""
+        :param visitors: the visitors to run
+        :param buffers: for each visitor, the list to which the messages it logs are appended
+        """
+        super(ASTFusedVisitor, self).__init__(visitors)
+        self._buffers = buffers
+
+    @classmethod
+    def can_fuse(cls, visitor: ASTVisitor) -> bool:
+        r"""
+        Checks whether the handed over visitor can be run together with others, i.e. it uses the standard traversal of the AST.
+        :param visitor: a visitor
+        :return: True if the visitor can be fused
+        """
+        return cls.can_combine(visitor)
+
+    def visit(self, node: ASTNode) -> None:
+        for i, method in self._get_methods(node, "visit", self._visit_methods):
+            Logger.message_buffer = self._buffers[i]
+            method(node)
+
+    def endvisit(self, node: ASTNode) -> None:
+        for i, method in self._get_methods(node, "endvisit", self._endvisit_methods):
+            Logger.message_buffer = self._buffers[i]
+            method(node)
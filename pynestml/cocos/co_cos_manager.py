@@ -19,8 +19,11 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Union
+from typing import Callable, List, Type, Union
 
+import functools
+
+from pynestml.cocos.co_co import CoCo
 from pynestml.cocos.co_co_all_variables_defined import CoCoAllVariablesDefined
 from pynestml.cocos.co_co_input_port_not_assigned_to import CoCoInputPortNotAssignedTo
 from pynestml.cocos.co_co_convolve_cond_correctly_built import CoCoConvolveCondCorrectlyBuilt
@@ -61,7 +64,9 @@ from pynestml.cocos.co_co_vector_parameter_right_type import CoCoVectorParameter
 from pynestml.cocos.co_co_vector_variable_in_non_vector_declaration import CoCoVectorVariableInNonVectorDeclaration
 from pynestml.cocos.co_co_function_argument_template_types_consistent import CoCoFunctionArgumentTemplateTypesConsistent
 from pynestml.cocos.co_co_priorities_correctly_specified import CoCoPrioritiesCorrectlySpecified
+from pynestml.cocos.co_cos_engine import CoCosEngine
 from pynestml.meta_model.ast_neuron import ASTNeuron
+from pynestml.meta_model.ast_node import ASTNode
 from pynestml.meta_model.ast_synapse import ASTSynapse
 
 
@@ -371,46 +376,63 @@ class CoCosManager:
         CoCoResolutionFuncLegallyUsed.check_co_co(neuron)
 
     @classmethod
-    def post_symbol_table_builder_checks(cls, neuron: ASTNeuron, after_ast_rewrite: bool = False):
+    def get_post_symbol_table_builder_checks(cls, after_ast_rewrite: bool = False) -> List[Union[Type[CoCo], Callable[[ASTNode], None]]]:
+        """
+        Returns the context conditions that are checked after the symbol table has been built, in the order in which they are checked.
+        :param after_ast_rewrite: indicates whether the cocos are checked after the code generator has rewritten the abstract syntax tree.
+        :return: a list of coco classes, and of functions that check a coco on the handed over node
+        """
+        checks = [CoCoEachBlockDefinedAtMostOnce,
+                  CoCoFunctionUnique,
+                  CoCoFunctionCallsConsistent,
+                  CoCoVariableOncePerScope,
+                  CoCoStateVariablesInitialized,
+                  functools.partial(CoCoAllVariablesDefined.check_co_co, after_ast_rewrite=after_ast_rewrite),
+                  CoCoInlineExpressionsHaveRhs,
+                  CoCoInlineMaxOneLhs,
+                  CoCoInputPortNotAssignedTo,
+                  CoCoCorrectOrderInEquation,
+                  CoCoCorrectNumeratorOfUnit,
+                  CoCoNoNestNameSpaceCollision,
+                  CoCoInputPortQualifierUnique,
+                  CoCoParametersAssignedOnlyInParameterBlock,
+                  CoCoContinuousInputPortNotQualified,
+                  CoCoInputPortDataType,
+                  CoCoUserDefinedFunctionCorrectlyDefined,
+                  CoCoEquationsOnlyForInitValues,
+                  CoCoKernelType,
+                  CoCoConvolveCondCorrectlyBuilt,
+                  CoCoOutputPortDefinedIfEmitCall]
+        if not after_ast_rewrite:
+            # units might be incorrect due to e.g. refactoring convolve call (Real type assigned)
+            checks.extend([CoCoOdesHaveConsistentUnits,
+                           CoCoOdeFunctionsHaveConsistentUnits,        # ODE functions have been removed at this point
+                           CoCoNoKernelsExceptInConvolve,
+                           CoCoIntegrateOdesCalledIfEquationsDefined])
+        checks.extend([CoCoInvariantIsBoolean,
+                       CoCoVectorVariableInNonVectorDeclaration,
+                       CoCoSumHasCorrectParameter,
+                       CoCoIllegalExpression,
+                       CoCoSimpleDeltaFunction,
+                       CoCoFunctionArgumentTemplateTypesConsistent,
+                       CoCoVectorParameterDeclaredInRightBlock,
+                       CoCoVectorParameterRightType,
+                       CoCoPrioritiesCorrectlySpecified,
+                       CoCoResolutionFuncLegallyUsed,
+                       CoCoVectorDeclarationRightSize])
+
+        return checks
+
+    @classmethod
+    def post_symbol_table_builder_checks(cls, neuron: ASTNeuron, after_ast_rewrite: bool = False, fused: bool = True):
         """
         Checks all context conditions.
         :param neuron: a single neuron object.
-        """
-        cls.check_each_block_defined_at_most_once(neuron)
-        cls.check_function_defined(neuron)
-        cls.check_function_declared_and_correctly_typed(neuron)
-        cls.check_variables_unique_in_scope(neuron)
-        cls.check_state_variables_initialized(neuron)
-        cls.check_variables_defined_before_usage(neuron, after_ast_rewrite)
-        cls.check_inline_expressions_have_rhs(neuron)
-        cls.check_inline_has_max_one_lhs(neuron)
-        cls.check_input_ports_not_assigned_to(neuron)
-        cls.check_order_of_equations_correct(neuron)
-        cls.check_numerator_of_unit_is_one_if_numeric(neuron)
-        cls.check_no_nest_namespace_collisions(neuron)
-        cls.check_input_port_qualifier_unique(neuron)
-        cls.check_parameters_not_assigned_outside_parameters_block(neuron)
-        cls.check_continuous_input_ports_not_qualified(neuron)
-        cls.check_input_port_data_type(neuron)
-        cls.check_user_defined_function_correctly_built(neuron)
-        cls.check_initial_ode_initial_values(neuron)
-        cls.check_kernel_type(neuron)
-        cls.check_convolve_cond_curr_is_correct(neuron)
-        cls.check_output_port_defined_if_emit_call(neuron)
-        if not after_ast_rewrite:
-            # units might be incorrect due to e.g. refactoring convolve call (Real type assigned)
-            cls.check_odes_have_consistent_units(neuron)
-            cls.check_ode_functions_have_consistent_units(neuron)        # ODE functions have been removed at this point
-            cls.check_correct_usage_of_kernels(neuron)
-            cls.check_integrate_odes_called_if_equations_defined(neuron)
-        cls.check_invariant_type_correct(neuron)
-        cls.check_vector_in_non_vector_declaration_detected(neuron)
-        cls.check_sum_has_correct_parameter(neuron)
-        cls.check_expression_correct(neuron)
-        cls.check_simple_delta_function(neuron)
-        cls.check_function_argument_template_types_consistent(neuron)
-        cls.check_vector_parameter_declaration(neuron)
-        cls.check_vector_parameter_type(neuron)
-        cls.check_co_co_priorities_correctly_specified(neuron)
-        cls.check_resolution_func_legally_used(neuron)
-        cls.check_vector_declaration_size(neuron)
+        :param after_ast_rewrite: indicates whether the cocos are checked after the code generator has rewritten the abstract syntax tree. If True, checks are not as rigorous.
+        :param fused: if True, the cocos that can be checked by a visitor are checked together in a single traversal of the model (see ``CoCosEngine``). Otherwise, each coco traverses the model by itself. The messages are the same in both cases.
+        """
+        checks = cls.get_post_symbol_table_builder_checks(after_ast_rewrite)
+        if fused:
+            CoCosEngine.check_co_cos(neuron, checks)
+        else:
+            CoCosEngine.check_co_cos_separately(neuron, checks)
@@ -19,7 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Sequence, Union
+from typing import List, Sequence, Union
 
 import datetime
 import os
@@ -36,6 +36,7 @@ from pynestml.meta_model.ast_neuron import ASTNeuron
 from pynestml.meta_model.ast_synapse import ASTSynapse
 from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import Logger
+from pynestml.utils.profiler import Profiler
 
 
 class AutoDocCodeGenerator(CodeGenerator):
@@ -55,23 +56,40 @@ class AutoDocCodeGenerator(CodeGenerator):
         """
         Generate model documentation and index page for each neuron and synapse that is provided.
         """
+        self.generate_module_level_code(models)
+        self.generate_per_model_code(models)
+
+        for astnode in models:
+            if Logger.has_errors(astnode):
+                raise Exception("Error(s) occurred during code generation")
+
+    def generate_per_model_code(self, models: Sequence[Union[ASTNeuron, ASTSynapse]]) -> None:
+        """
+        Generate model documentation for each neuron and synapse that is provided.
+        """
         if not os.path.isdir(FrontendConfiguration.get_target_path()):
             os.makedirs(FrontendConfiguration.get_target_path())
         neurons = [model for model in models if isinstance(model, ASTNeuron)]
         synapses = [model for model in models if isinstance(model, ASTSynapse)]
-        self.generate_index(neurons, synapses)
         self.generate_neurons(neurons)
         self.generate_synapses(synapses)
 
-        for astnode in neurons + synapses:
-            if Logger.has_errors(astnode):
-                raise Exception("Error(s) occurred during code generation")
+    def generate_module_level_code(self, models: Sequence[Union[ASTNeuron, ASTSynapse]]) -> None:
+        """
+        Generate the index page for all neurons and synapses that are provided.
+        """
+        if not os.path.isdir(FrontendConfiguration.get_target_path()):
+            os.makedirs(FrontendConfiguration.get_target_path())
+        neurons = [model for model in models if isinstance(model, ASTNeuron)]
+        synapses = [model for model in models if isinstance(model, ASTSynapse)]
+        self.generate_index(neurons, synapses)
 
     def generate_index(self, neurons: Sequence[ASTNeuron], synapses: Sequence[ASTSynapse]):
         """
         Generate model documentation and index page for each neuron and synapse that is provided.
         """
-        nestml_models_index = self._template_nestml_models_index.render(self.setup_index_generation_helpers(neurons, synapses))
+        with Profiler.phase("render", detail="index.rst"):
+            nestml_models_index = self._template_nestml_models_index.render(self.setup_index_generation_helpers(neurons, synapses))
         with open(str(os.path.join(FrontendConfiguration.get_target_path(), 'index.rst')), 'w+') as f:
             f.write(str(nestml_models_index))
 
@@ -80,7 +98,8 @@ class AutoDocCodeGenerator(CodeGenerator):
         Generate model documentation for neuron model.
         :param neuron: a single neuron object.
         """
-        nestml_model_doc = self._template_neuron_nestml_model.render(self.setup_neuron_model_generation_helpers(neuron))
+        with Profiler.phase("render", neuron.get_name(), detail=neuron.get_name() + ".rst"):
+            nestml_model_doc = self._template_neuron_nestml_model.render(self.setup_neuron_model_generation_helpers(neuron))
         with open(str(os.path.join(FrontendConfiguration.get_target_path(), neuron.get_name())) + '.rst',
                   'w+') as f:
             f.write(str(nestml_model_doc))
@@ -90,11 +109,19 @@ class AutoDocCodeGenerator(CodeGenerator):
         Generate model documentation for synapse model.
         :param synapse: a single synapse object.
         """
-        nestml_model_doc = self._template_synapse_nestml_model.render(self.setup_synapse_model_generation_helpers(synapse))
+        with Profiler.phase("render", synapse.get_name(), detail=synapse.get_name() + ".rst"):
+            nestml_model_doc = self._template_synapse_nestml_model.render(self.setup_synapse_model_generation_helpers(synapse))
         with open(str(os.path.join(FrontendConfiguration.get_target_path(), synapse.get_name())) + '.rst',
                   'w+') as f:
             f.write(str(nestml_model_doc))
 
+    def get_generated_file_names(self, model: Union[ASTNeuron, ASTSynapse]) -> List[str]:
+        """
+        Returns the names of the files that are generated for the given neuron or synapse.
+        :param model: a single neuron or synapse object.
+        """
+        return [model.get_name() + '.rst']
+
     def setup_neuron_model_generation_helpers(self, neuron: ASTNeuron):
         """
         Returns a namespace for Jinja2 neuron model documentation template.
@@ -24,7 +24,7 @@ from __future__ import annotations
 import glob
 from abc import abstractmethod
 
-from typing import Any, Dict, Mapping, List, Optional, Sequence, Union
+from typing import Any, Dict, Mapping, List, Optional, Sequence, Tuple, Union
 
 import os
 
@@ -39,13 +39,20 @@ from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import Logger
 from pynestml.utils.logger import LoggingLevel
 from pynestml.utils.messages import Messages
+from pynestml.utils.profiler import Profiler
 from pynestml.utils.with_options import WithOptions
 
 
 class CodeGenerator(WithOptions):
+    r"""
+    Base class for code generators.
+
+    Attributes:
+        keep_templates  If True, loaded templates are kept in memory and reused by later instances of the same code generator class, as long as the template files do not change. This is used by the compile server, which serves many requests in one process.
+    """
     _default_options: Mapping[str, Any] = {}
-    _model_templates = dict()
-    _module_templates = list()
+    keep_templates = False
+    _template_cache: Dict[Tuple[Any, ...], List[Template]] = {}
 
     def __init__(self, target, options: Optional[Mapping[str, Any]] = None):
         from pynestml.frontend.pynestml_frontend import get_known_targets
@@ -57,6 +64,8 @@ class CodeGenerator(WithOptions):
             raise InvalidTargetException()
 
         self._target = target
+        self._model_templates: Dict[str, List[Template]] = dict()
+        self._module_templates: List[Template] = list()
         super(CodeGenerator, self).__init__(options)
 
     def setup_template_env(self):
@@ -69,8 +78,8 @@ class CodeGenerator(WithOptions):
             # Prefix the default templates location
             resources_dir = "resources_" + self._target.lower()
             templates_root_dir = os.path.join(os.path.dirname(__file__), resources_dir, templates_root_dir)
-            code, message = Messages.get_template_root_path_created(templates_root_dir)
-            Logger.log_message(None, code, message, None, LoggingLevel.INFO)
+            Logger.log_deferred_message(lambda: Messages.get_template_root_path_created(templates_root_dir),
+                                        log_level=LoggingLevel.INFO)
         if not os.path.isdir(templates_root_dir):
             raise InvalidPathException("Templates path (" + templates_root_dir + ")  is not a directory")
 
@@ -96,7 +105,7 @@ class CodeGenerator(WithOptions):
             module_templates = self.get_option("templates")["module_templates"]
             if not module_templates:
                 raise Exception("A list of module template files/directories is missing.")
-            self._module_templates.extend(self.__setup_template_env(module_templates, templates_root_dir))
+            self._module_templates = self.__setup_template_env(module_templates, templates_root_dir)
 
     def __setup_template_env(self, template_files: List[str], templates_root_dir: str) -> List[Template]:
         """
@@ -109,6 +118,12 @@ class CodeGenerator(WithOptions):
         _template_files = self._get_abs_template_paths(template_files, templates_root_dir)
         _template_dirs = set([os.path.dirname(_file) for _file in _template_files])
 
+        cache_key = None
+        if self.keep_templates:
+            cache_key = (type(self),) + tuple([(_file, os.path.getmtime(_file)) for _file in _template_files])
+            if cache_key in CodeGenerator._template_cache:
+                return CodeGenerator._template_cache[cache_key]
+
         # Environment for neuron templates
         env = Environment(loader=FileSystemLoader(_template_dirs))
         env.globals["raise"] = self.raise_helper
@@ -119,6 +134,9 @@ class CodeGenerator(WithOptions):
         for _templ_file in _template_files:
             _templates.append(env.get_template(os.path.basename(_templ_file)))
 
+        if cache_key is not None:
+            CodeGenerator._template_cache[cache_key] = _templates
+
         return _templates
 
     def _get_abs_template_paths(self, template_files: List[str], templates_root_dir: str) -> List[str]:
@@ -146,6 +164,20 @@ class CodeGenerator(WithOptions):
         """the base class CodeGenerator does not generate any code"""
         pass
 
+    def generate_per_model_code(self, models: Sequence[Union[ASTNeuron, ASTSynapse]]) -> None:
+        """
+        Analyse, transform and generate code for each of the given models, without generating any code that depends on the complete set of models (such as an extension module). Models that are independent of each other may be handed to separate code generator instances, for instance in different worker processes.
+        :param models: a list of neurons and synapses.
+        """
+        pass
+
+    def generate_module_level_code(self, models: Sequence[Union[ASTNeuron, ASTSynapse]]) -> None:
+        """
+        Generate the code that depends on the complete set of models, for instance, an extension module or an index page. To be invoked after generate_per_model_code() has been run for all models.
+        :param models: a list of neurons and synapses.
+        """
+        pass
+
     def generate_neurons(self, neurons: Sequence[ASTNeuron]) -> None:
         """
         Generate code for the given neurons.
@@ -157,8 +189,8 @@ class CodeGenerator(WithOptions):
         for neuron in neurons:
             self.generate_neuron_code(neuron)
             if not Logger.has_errors(neuron):
-                code, message = Messages.get_code_generated(neuron.get_name(), FrontendConfiguration.get_target_path())
-                Logger.log_message(neuron, code, message, neuron.get_source_position(), LoggingLevel.INFO)
+                Logger.log_deferred_message(lambda: Messages.get_code_generated(neuron.get_name(), FrontendConfiguration.get_target_path()),
+                                            neuron, neuron.get_source_position(), LoggingLevel.INFO)
 
     def generate_synapses(self, synapses: Sequence[ASTSynapse]) -> None:
         """
@@ -171,8 +203,8 @@ class CodeGenerator(WithOptions):
             if Logger.logging_level == LoggingLevel.INFO:
                 print("Generating code for the synapse {}.".format(synapse.get_name()))
             self.generate_synapse_code(synapse)
-            code, message = Messages.get_code_generated(synapse.get_name(), FrontendConfiguration.get_target_path())
-            Logger.log_message(synapse, code, message, synapse.get_source_position(), LoggingLevel.INFO)
+            Logger.log_deferred_message(lambda: Messages.get_code_generated(synapse.get_name(), FrontendConfiguration.get_target_path()),
+                                        synapse, synapse.get_source_position(), LoggingLevel.INFO)
 
     def generate_model_code(self,
                             model_name: str,
@@ -190,39 +222,70 @@ class CodeGenerator(WithOptions):
             os.makedirs(FrontendConfiguration.get_target_path())
 
         for _model_templ in model_templates:
-            if not len(_model_templ.filename.split("/")[-1].split(".")) == 3:
-                raise Exception("Template file name should be of the form: "
-                                "\"PREFIX@NEURON_NAME@SUFFIX.FILE_EXTENSION.jinja2\"")
-            templ_file_name = os.path.basename(_model_templ.filename)
-            if not len(templ_file_name.split(".")) == 3:
-                raise Exception("Template file name \"" + templ_file_name + "\" should be of the form \"PREFIX@NEURON_NAME@SUFFIX.FILE_EXTENSION.jinja2\"")
-            templ_file_name = templ_file_name.split(".")[0]  # for example, "cm_main_@NEURON_NAME@"
-            templ_file_name = templ_file_name.replace(model_name_escape_string, model_name)
-            file_extension = _model_templ.filename.split(".")[-2]  # for example, "cpp"
             rendered_templ_file_name = os.path.join(FrontendConfiguration.get_target_path(),
-                                                    templ_file_name + "." + file_extension)
-            _file = _model_templ.render(template_namespace)
-            Logger.log_message(message="Rendering template " + rendered_templ_file_name,
-                               log_level=LoggingLevel.INFO)
+                                                    self._get_rendered_file_name(_model_templ, model_name, model_name_escape_string))
+            with Profiler.phase("render", model_name, detail=os.path.basename(rendered_templ_file_name)):
+                _file = _model_templ.render(template_namespace)
+            Logger.log_deferred_message(lambda: (None, "Rendering template " + rendered_templ_file_name),
+                                        log_level=LoggingLevel.INFO)
             with open(rendered_templ_file_name, "w+") as f:
                 f.write(str(_file))
 
+    def _get_rendered_file_name(self, model_template: Template, model_name: str, model_name_escape_string: str) -> str:
+        """
+        Returns the name of the file that is generated from the given template.
+        :param model_template: a neuron, synapse or module template
+        :param model_name: name of the neuron, synapse or module
+        :param model_name_escape_string: escape string where the model name is replaced
+        :return: the file name, relative to the target path
+        """
+        if not len(model_template.filename.split("/")[-1].split(".")) == 3:
+            raise Exception("Template file name should be of the form: "
+                            "\"PREFIX@NEURON_NAME@SUFFIX.FILE_EXTENSION.jinja2\"")
+        templ_file_name = os.path.basename(model_template.filename)
+        if not len(templ_file_name.split(".")) == 3:
+            raise Exception("Template file name \"" + templ_file_name + "\" should be of the form \"PREFIX@NEURON_NAME@SUFFIX.FILE_EXTENSION.jinja2\"")
+        templ_file_name = templ_file_name.split(".")[0]  # for example, "cm_main_@NEURON_NAME@"
+        templ_file_name = templ_file_name.replace(model_name_escape_string, model_name)
+        file_extension = model_template.filename.split(".")[-2]  # for example, "cpp"
+
+        return templ_file_name + "." + file_extension
+
+    def get_generated_file_names(self, model: Union[ASTNeuron, ASTSynapse]) -> List[str]:
+        """
+        Returns the names of the files that are generated by generate_per_model_code() for the given model.
+        :param model: a single neuron or synapse
+        :return: a list of file names, relative to the target path
+        """
+        if isinstance(model, ASTNeuron):
+            return [self._get_rendered_file_name(_model_templ, model.get_name(), "@NEURON_NAME@")
+                    for _model_templ in self._model_templates.get("neuron", [])]
+
+        return [self._get_rendered_file_name(_model_templ, model.get_name(), "@SYNAPSE_NAME@")
+                for _model_templ in self._model_templates.get("synapse", [])]
+
     def generate_neuron_code(self, neuron: ASTNeuron) -> None:
+        with Profiler.phase("namespace", neuron.get_name()):
+            template_namespace = self._get_neuron_model_namespace(neuron)
         self.generate_model_code(neuron.get_name(),
                                  model_templates=self._model_templates["neuron"],
-                                 template_namespace=self._get_neuron_model_namespace(neuron),
+                                 template_namespace=template_namespace,
                                  model_name_escape_string="@NEURON_NAME@")
 
     def generate_synapse_code(self, synapse: ASTNeuron) -> None:
+        with Profiler.phase("namespace", synapse.get_name()):
+            template_namespace = self._get_synapse_model_namespace(synapse)
         self.generate_model_code(synapse.get_name(),
                                  model_templates=self._model_templates["synapse"],
-                                 template_namespace=self._get_synapse_model_namespace(synapse),
+                                 template_namespace=template_namespace,
                                  model_name_escape_string="@SYNAPSE_NAME@")
 
     def generate_module_code(self, neurons: Sequence[ASTNeuron], synapses: Sequence[ASTSynapse]) -> None:
+        with Profiler.phase("namespace", FrontendConfiguration.get_module_name()):
+            template_namespace = self._get_module_namespace(neurons, synapses)
         self.generate_model_code(FrontendConfiguration.get_module_name(),
                                  model_templates=self._module_templates,
-                                 template_namespace=self._get_module_namespace(neurons, synapses),
+                                 template_namespace=template_namespace,
                                  model_name_escape_string="@MODULE_NAME@")
-        code, message = Messages.get_module_generated(FrontendConfiguration.get_target_path())
-        Logger.log_message(None, code, message, None, LoggingLevel.INFO)
+        Logger.log_deferred_message(lambda: Messages.get_module_generated(FrontendConfiguration.get_target_path()),
+                                    log_level=LoggingLevel.INFO)
@@ -34,6 +34,7 @@ from pynestml.exceptions.invalid_path_exception import InvalidPathException
 from pynestml.frontend.frontend_configuration import FrontendConfiguration
 from pynestml.utils.logger import Logger
 from pynestml.utils.logger import LoggingLevel
+from pynestml.utils.profiler import Profiler
 
 
 def __add_library_to_sli(lib_path):
@@ -141,21 +142,24 @@ class NESTBuilder(Builder):
 
         # first call cmake with all the arguments
         try:
-            subprocess.check_call(cmake_cmd, stderr=subprocess.STDOUT, shell=shell,
-                                  cwd=str(os.path.join(target_path)))
+            with Profiler.phase("build", detail="cmake"):
+                subprocess.check_call(cmake_cmd, stderr=subprocess.STDOUT, shell=shell,
+                                      cwd=str(os.path.join(target_path)))
         except subprocess.CalledProcessError as e:
             raise GeneratedCodeBuildException('Error occurred during \'cmake\'! More detailed error messages can be found in stdout.')
 
         # now execute make all
         try:
-            subprocess.check_call(make_all_cmd, stderr=subprocess.STDOUT, shell=shell,
-                                  cwd=str(os.path.join(target_path)))
+            with Profiler.phase("build", detail="make all"):
+                subprocess.check_call(make_all_cmd, stderr=subprocess.STDOUT, shell=shell,
+                                      cwd=str(os.path.join(target_path)))
         except subprocess.CalledProcessError as e:
             raise GeneratedCodeBuildException('Error occurred during \'make all\'! More detailed error messages can be found in stdout.')
 
         # finally execute make install
         try:
-            subprocess.check_call(make_install_cmd, stderr=subprocess.STDOUT, shell=shell,
-                                  cwd=str(os.path.join(target_path)))
+            with Profiler.phase("build", detail="make install"):
+                subprocess.check_call(make_install_cmd, stderr=subprocess.STDOUT, shell=shell,
+                                      cwd=str(os.path.join(target_path)))
         except subprocess.CalledProcessError as e:
             raise GeneratedCodeBuildException('Error occurred during \'make install\'! More detailed error messages can be found in stdout.')
@@ -21,11 +21,15 @@
 
 from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
+from collections import OrderedDict
 import datetime
+import difflib
+import importlib.metadata
+import json
 
 from jinja2 import TemplateRuntimeError
 
-import odetoolbox
+import sympy
 
 import pynestml
 from pynestml.codegeneration.code_generator import CodeGenerator
@@ -46,21 +50,35 @@ from pynestml.meta_model.ast_neuron import ASTNeuron
 from pynestml.meta_model.ast_kernel import ASTKernel
 from pynestml.meta_model.ast_ode_equation import ASTOdeEquation
 from pynestml.meta_model.ast_synapse import ASTSynapse
+from pynestml.symbol_table.scope import Scope
 from pynestml.symbol_table.symbol_table import SymbolTable
 from pynestml.symbols.real_type_symbol import RealTypeSymbol
 from pynestml.symbols.unit_type_symbol import UnitTypeSymbol
 from pynestml.symbols.symbol import SymbolKind
+from pynestml.symbols.variable_symbol import VariableSymbol
+from pynestml.utils.ast_sympy_converter import ASTSympyConverter
 from pynestml.utils.ast_utils import ASTUtils
+from pynestml.utils.disk_cache import DiskCache
 from pynestml.utils.logger import Logger
 from pynestml.utils.logger import LoggingLevel
 from pynestml.utils.messages import Messages
 from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.ode_toolbox_utils import ODEToolboxUtils
+from pynestml.utils.profiler import Profiler
+from pynestml.visitors.ast_composite_visitor import ASTCompositeVisitor
 from pynestml.visitors.ast_equations_with_delay_vars_visitor import ASTEquationsWithDelayVarsVisitor
 from pynestml.visitors.ast_mark_delay_vars_visitor import ASTMarkDelayVarsVisitor
 from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 from pynestml.visitors.ast_random_number_generator_visitor import ASTRandomNumberGeneratorVisitor
 
 
+def _get_ode_toolbox_version() -> str:
+    try:
+        return importlib.metadata.version("odetoolbox")
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
 def find_spiking_post_port(synapse, namespace):
     if "paired_neuron" in dir(synapse):
         for post_port_name in namespace["post_ports"]:
@@ -81,20 +99,30 @@ class NESTCodeGenerator(CodeGenerator):
     - **neuron_synapse_pairs**: List of pairs of (neuron, synapse) model names.
     - **preserve_expressions**: Set to True, or a list of strings corresponding to individual variable names, to disable internal rewriting of expressions, and return same output as input expression where possible. Only applies to variables specified as first-order differential equations. (This parameter is passed to ODE-toolbox.)
     - **simplify_expression**: For all expressions ``expr`` that are rewritten by ODE-toolbox: the contents of this parameter string are ``eval()``ed in Python to obtain the final output expression. Override for custom expression simplification steps. Example: ``sympy.simplify(expr)``. Default: ``"sympy.logcombine(sympy.powsimp(sympy.expand(expr)))"``. (This parameter is passed to ODE-toolbox.)
+    - **incremental_symbol_table_update**: After the model has been rewritten during analysis, only update the parts of the symbol table that were affected by the rewrites, instead of rebuilding the symbol table from scratch and checking the context conditions again. Default: ``True``.
+    - **check_incremental_symbol_table_update**: For debugging: compare the result of each incremental symbol table update against a full rebuild, and log an error if they differ. Default: ``False``.
     - **templates**: Path containing jinja templates used to generate code for NEST simulator.
         - **path**: Path containing jinja templates used to generate code for NEST simulator.
         - **model_templates**: A list of the jinja templates or a relative path to a directory containing the neuron and synapse model templates.
             - **neuron**: A list of neuron model jinja templates.
             - **synapse**: A list of synapse model jinja templates.
         - **module_templates**: A list of the jinja templates or a relative path to a directory containing the templates related to generating the NEST module.
+
+    If ``keep_ode_toolbox_results`` is set (as by the compile server, which serves many requests in one process), the results of ODE-toolbox analysis are kept in memory and reused by later instances, up to ``ode_toolbox_result_cache_max_entries`` results.
     """
 
+    keep_ode_toolbox_results = False
+    ode_toolbox_result_cache_max_entries = 1024
+    _ode_toolbox_result_cache: Dict[str, bytes] = OrderedDict()
+
     _default_options = {
         "neuron_parent_class": "ArchivingNode",
         "neuron_parent_class_include": "archiving_node.h",
         "neuron_synapse_pairs": [],
         "preserve_expressions": False,
         "simplify_expression": "sympy.logcombine(sympy.powsimp(sympy.expand(expr)))",
+        "incremental_symbol_table_update": True,
+        "check_incremental_symbol_table_update": False,
         "templates": {
             "path": "point_neuron",
             "model_templates": {
@@ -144,17 +172,25 @@ class NESTCodeGenerator(CodeGenerator):
         return ret
 
     def generate_code(self, models: Sequence[Union[ASTNeuron, ASTSynapse]]) -> None:
+        self.generate_per_model_code(models)
+        self.generate_module_level_code(models)
+
+        for astnode in models:
+            if Logger.has_errors(astnode):
+                raise Exception("Error(s) occurred during code generation")
+
+    def generate_per_model_code(self, models: Sequence[Union[ASTNeuron, ASTSynapse]]) -> None:
         neurons = [model for model in models if isinstance(model, ASTNeuron)]
         synapses = [model for model in models if isinstance(model, ASTSynapse)]
         self.analyse_transform_neurons(neurons)
         self.analyse_transform_synapses(synapses)
         self.generate_neurons(neurons)
         self.generate_synapses(synapses)
-        self.generate_module_code(neurons, synapses)
 
-        for astnode in neurons + synapses:
-            if Logger.has_errors(astnode):
-                raise Exception("Error(s) occurred during code generation")
+    def generate_module_level_code(self, models: Sequence[Union[ASTNeuron, ASTSynapse]]) -> None:
+        neurons = [model for model in models if isinstance(model, ASTNeuron)]
+        synapses = [model for model in models if isinstance(model, ASTSynapse)]
+        self.generate_module_code(neurons, synapses)
 
     def _get_module_namespace(self, neurons: List[ASTNeuron], synapses: List[ASTSynapse]) -> Dict:
         """
@@ -174,9 +210,10 @@ class NESTCodeGenerator(CodeGenerator):
         :param neurons: a list of neurons.
         """
         for neuron in neurons:
-            code, message = Messages.get_analysing_transforming_neuron(neuron.get_name())
-            Logger.log_message(None, code, message, None, LoggingLevel.INFO)
-            spike_updates, post_spike_updates, equations_with_delay_vars = self.analyse_neuron(neuron)
+            Logger.log_deferred_message(lambda: Messages.get_analysing_transforming_neuron(neuron.get_name()),
+                                        log_level=LoggingLevel.INFO)
+            with Profiler.phase("analyse", neuron.get_name()):
+                spike_updates, post_spike_updates, equations_with_delay_vars = self.analyse_neuron(neuron)
             neuron.spike_updates = spike_updates
             neuron.post_spike_updates = post_spike_updates
             neuron.equations_with_delay_vars = equations_with_delay_vars
@@ -189,7 +226,8 @@ class NESTCodeGenerator(CodeGenerator):
         for synapse in synapses:
             if Logger.logging_level == LoggingLevel.INFO:
                 print("Analysing/transforming synapse {}.".format(synapse.get_name()))
-            spike_updates = self.analyse_synapse(synapse)
+            with Profiler.phase("analyse", synapse.get_name()):
+                spike_updates = self.analyse_synapse(synapse)
             synapse.spike_updates = spike_updates
 
     def analyse_neuron(self, neuron: ASTNeuron) -> Tuple[Dict[str, ASTAssignment], Dict[str, ASTAssignment],
@@ -201,8 +239,8 @@ class NESTCodeGenerator(CodeGenerator):
         :return: post_spike_updates: list of post-synaptic spike update expressions
         :return: equations_with_delay_vars: list of equations containing delay variables
         """
-        code, message = Messages.get_start_processing_model(neuron.get_name())
-        Logger.log_message(neuron, code, message, neuron.get_source_position(), LoggingLevel.INFO)
+        Logger.log_deferred_message(lambda: Messages.get_start_processing_model(neuron.get_name()),
+                                    neuron, neuron.get_source_position(), LoggingLevel.INFO)
 
         equations_block = neuron.get_equations_block()
 
@@ -226,7 +264,8 @@ class NESTCodeGenerator(CodeGenerator):
         neuron.accept(equations_with_delay_vars_visitor)
         equations_with_delay_vars = equations_with_delay_vars_visitor.equations
 
-        analytic_solver, numeric_solver = self.ode_toolbox_analysis(neuron, kernel_buffers)
+        with Profiler.phase("ode_toolbox_analysis", neuron.get_name()):
+            analytic_solver, numeric_solver = self.ode_toolbox_analysis(neuron, kernel_buffers)
         self.analytic_solver[neuron.get_name()] = analytic_solver
         self.numeric_solver[neuron.get_name()] = numeric_solver
 
@@ -281,8 +320,8 @@ class NESTCodeGenerator(CodeGenerator):
         Analyse and transform a single synapse.
         :param synapse: a single synapse.
         """
-        code, message = Messages.get_start_processing_model(synapse.get_name())
-        Logger.log_message(synapse, code, message, synapse.get_source_position(), LoggingLevel.INFO)
+        Logger.log_deferred_message(lambda: Messages.get_start_processing_model(synapse.get_name()),
+                                    synapse, synapse.get_source_position(), LoggingLevel.INFO)
 
         equations_block = synapse.get_equations_block()
         spike_updates = {}
@@ -294,7 +333,8 @@ class NESTCodeGenerator(CodeGenerator):
             ASTUtils.replace_inline_expressions_through_defining_expressions(
                 equations_block.get_ode_equations(), equations_block.get_inline_expressions())
 
-            analytic_solver, numeric_solver = self.ode_toolbox_analysis(synapse, kernel_buffers)
+            with Profiler.phase("ode_toolbox_analysis", synapse.get_name()):
+                analytic_solver, numeric_solver = self.ode_toolbox_analysis(synapse, kernel_buffers)
             self.analytic_solver[synapse.get_name()] = analytic_solver
             self.numeric_solver[synapse.get_name()] = numeric_solver
 
@@ -530,13 +570,14 @@ class NESTCodeGenerator(CodeGenerator):
                 # pretend that update expressions are in "equations" block, which should always be present,
                 # as differential equations must have been defined to get here
                 expr_ast.update_scope(neuron.get_equations_blocks().get_scope())
-                expr_ast.accept(ASTSymbolTableVisitor())
-                namespace["update_expressions"][sym] = expr_ast
+                visitors = [ASTSymbolTableVisitor()]
 
                 # Check if the update expression has delay variables
                 if ASTUtils.has_equation_with_delay_variable(neuron.equations_with_delay_vars, sym):
-                    marks_delay_vars_visitor = ASTMarkDelayVarsVisitor()
-                    expr_ast.accept(marks_delay_vars_visitor)
+                    visitors.append(ASTMarkDelayVarsVisitor())
+
+                expr_ast.accept(ASTCompositeVisitor(visitors))
+                namespace["update_expressions"][sym] = expr_ast
 
             namespace["propagators"] = self.analytic_solver[neuron.get_name()]["propagators"]
 
@@ -587,13 +628,14 @@ class NESTCodeGenerator(CodeGenerator):
                 # pretend that update expressions are in "equations" block, which should always be present,
                 # as differential equations must have been defined to get here
                 expr_ast.update_scope(neuron.get_equations_blocks().get_scope())
-                expr_ast.accept(ASTSymbolTableVisitor())
-                namespace["numeric_update_expressions"][sym] = expr_ast
+                visitors = [ASTSymbolTableVisitor()]
 
                 # Check if the update expression has delay variables
                 if ASTUtils.has_equation_with_delay_variable(neuron.equations_with_delay_vars, sym):
-                    marks_delay_vars_visitor = ASTMarkDelayVarsVisitor()
-                    expr_ast.accept(marks_delay_vars_visitor)
+                    visitors.append(ASTMarkDelayVarsVisitor())
+
+                expr_ast.accept(ASTCompositeVisitor(visitors))
+                namespace["numeric_update_expressions"][sym] = expr_ast
 
             if namespace["uses_numeric_solver"]:
                 if "analytic_state_variables_moved" in namespace.keys():
@@ -642,44 +684,127 @@ class NESTCodeGenerator(CodeGenerator):
         odetoolbox_indict = ASTUtils.transform_ode_and_kernels_to_json(neuron, parameters_block, kernel_buffers, printer=self._ode_toolbox_printer)
         odetoolbox_indict["options"] = {}
         odetoolbox_indict["options"]["output_timestep_symbol"] = "__h"
-        solver_result = odetoolbox.analysis(odetoolbox_indict,
-                                            disable_stiffness_check=True,
-                                            preserve_expressions=self.get_option("preserve_expressions"),
-                                            simplify_expression=self.get_option("simplify_expression"),
-                                            log_level=FrontendConfiguration.logging_level)
+        solver_result = self._run_ode_toolbox_analysis(neuron, odetoolbox_indict,
+                                                       disable_stiffness_check=True,
+                                                       preserve_expressions=self.get_option("preserve_expressions"),
+                                                       simplify_expression=self.get_option("simplify_expression"))
         analytic_solver = None
         analytic_solvers = [x for x in solver_result if x["solver"] == "analytical"]
         assert len(analytic_solvers) <= 1, "More than one analytic solver not presently supported"
         if len(analytic_solvers) > 0:
             analytic_solver = analytic_solvers[0]
 
-        # if numeric solver is required, generate a stepping function that includes each state variable, including the analytic ones
+        # if numeric solver is required, it includes each state variable, including the analytic ones
         numeric_solver = None
         numeric_solvers = [x for x in solver_result if x["solver"].startswith("numeric")]
-        if numeric_solvers:
-            solver_result = odetoolbox.analysis(odetoolbox_indict,
-                                                disable_stiffness_check=True,
-                                                disable_analytic_solver=True,
-                                                preserve_expressions=self.get_option("preserve_expressions"),
-                                                simplify_expression=self.get_option("simplify_expression"),
-                                                log_level=FrontendConfiguration.logging_level)
-            numeric_solvers = [x for x in solver_result if x["solver"].startswith("numeric")]
-            assert len(numeric_solvers) <= 1, "More than one numeric solver not presently supported"
-            if len(numeric_solvers) > 0:
-                numeric_solver = numeric_solvers[0]
+        assert len(numeric_solvers) <= 1, "More than one numeric solver not presently supported"
+        if len(numeric_solvers) > 0:
+            numeric_solver = numeric_solvers[0]
 
         return analytic_solver, numeric_solver
 
+    def _run_ode_toolbox_analysis(self, neuron: ASTNeuron, odetoolbox_indict: Dict[str, Any], **kwargs) -> List[Dict[str, Any]]:
+        """
+        Invoke ODE-toolbox analysis for the given neuron with the given input and keyword arguments, to obtain the analytic and the numeric solver (see ``ODEToolboxUtils.analysis()``).
+
+        If an ODE-toolbox cache directory was configured, the result is looked up in the cache first. The cache key is a canonical serialization of the input and keyword arguments, together with the ODE-toolbox and sympy versions, so that identical systems of equations in different models share the same cache entry. If ``keep_ode_toolbox_results`` is set, the result is looked up in memory before that.
+        """
+        # the order of the dynamics entries depends on set iteration order; sort them so that the input (and thereby the result) does not differ from run to run
+        odetoolbox_indict = dict(odetoolbox_indict)
+        odetoolbox_indict["dynamics"] = sorted(odetoolbox_indict["dynamics"], key=lambda entry: entry["expression"])
+
+        if FrontendConfiguration.get_ode_cache_dir() is None and not self.keep_ode_toolbox_results:
+            return ODEToolboxUtils.analysis(odetoolbox_indict, log_level=FrontendConfiguration.logging_level, **kwargs)
+
+        key = DiskCache.compute_key("analytic+numeric",
+                                    _get_ode_toolbox_version(),
+                                    sympy.__version__,
+                                    json.dumps(odetoolbox_indict, sort_keys=True, separators=(",", ":")),
+                                    json.dumps(kwargs, sort_keys=True, separators=(",", ":")))
+
+        cache = None
+        cached_result = None
+        if self.keep_ode_toolbox_results and key in NESTCodeGenerator._ode_toolbox_result_cache:
+            NESTCodeGenerator._ode_toolbox_result_cache.move_to_end(key)
+            cached_result = NESTCodeGenerator._ode_toolbox_result_cache[key]
+        elif FrontendConfiguration.get_ode_cache_dir() is not None:
+            cache = DiskCache(FrontendConfiguration.get_ode_cache_dir(),
+                              max_size=FrontendConfiguration.get_cache_max_size() * 1024**2)
+            cached_result = cache.get(key)
+
+        if cached_result is not None:
+            code, message = Messages.get_ode_toolbox_result_from_cache()
+            Logger.log_message(neuron, code, message, neuron.get_source_position(), LoggingLevel.INFO)
+            self._keep_ode_toolbox_result(key, cached_result)
+            return json.loads(cached_result)
+
+        solver_result = ODEToolboxUtils.analysis(odetoolbox_indict, log_level=FrontendConfiguration.logging_level, **kwargs)
+        serialized_result = json.dumps(solver_result).encode("utf-8")
+        if cache is not None:
+            cache.put(key, serialized_result)
+
+        self._keep_ode_toolbox_result(key, serialized_result)
+
+        return solver_result
+
+    def _keep_ode_toolbox_result(self, key: str, serialized_result: bytes) -> None:
+        r"""
+        Keep a result of ODE-toolbox analysis in memory, if ``keep_ode_toolbox_results`` is set. The least recently used results are dropped if there are more than ``ode_toolbox_result_cache_max_entries``.
+        """
+        if not self.keep_ode_toolbox_results:
+            return
+
+        NESTCodeGenerator._ode_toolbox_result_cache[key] = serialized_result
+        while len(NESTCodeGenerator._ode_toolbox_result_cache) > self.ode_toolbox_result_cache_max_entries:
+            NESTCodeGenerator._ode_toolbox_result_cache.popitem(last=False)
+
     def update_symbol_table(self, neuron) -> None:
         """
         Update symbol table and scope.
+
+        If the ``incremental_symbol_table_update`` option is set, only the symbols affected by the rewrites are updated (see ``ASTUtils.update_symbol_table_incrementally()``). Otherwise, or if the ``check_incremental_symbol_table_update`` option is set, the symbol table is rebuilt from scratch.
         """
+        incremental_symbol_table = None
+        if self.get_option("incremental_symbol_table_update"):
+            ASTUtils.update_symbol_table_incrementally(neuron)
+            if not self.get_option("check_incremental_symbol_table_update"):
+                return
+
+            incremental_symbol_table = self._print_symbol_table(neuron.get_scope())
+
         SymbolTable.delete_neuron_scope(neuron.get_name())
         symbol_table_visitor = ASTSymbolTableVisitor()
         symbol_table_visitor.after_ast_rewrite_ = True
         neuron.accept(symbol_table_visitor)
         SymbolTable.add_neuron_scope(neuron.get_name(), neuron.get_scope())
 
+        if incremental_symbol_table is not None:
+            full_symbol_table = self._print_symbol_table(neuron.get_scope())
+            if incremental_symbol_table != full_symbol_table:
+                difference = [line for line in difflib.unified_diff(full_symbol_table, incremental_symbol_table, "full", "incremental", lineterm="")]
+                code, message = Messages.get_incremental_symbol_table_update_mismatch(neuron.get_name(), "\n".join(difference))
+                Logger.log_message(neuron, code, message, neuron.get_source_position(), LoggingLevel.ERROR)
+
+    def _print_symbol_table(self, scope: Scope) -> List[str]:
+        """
+        Returns a representation of the symbols in the given scope and its sub-scopes, for comparing symbol tables.
+        """
+        lines = []
+        for symbol in scope.get_symbols_in_this_scope():
+            line = symbol.print_symbol()
+            if isinstance(symbol, VariableSymbol):
+                line += ", variable type=" + str(symbol.get_variable_type()) \
+                    + ", declaring expression=" + str(symbol.get_declaring_expression()) \
+                    + ", initial value=" + str(symbol.get_initial_value()) \
+                    + ", ODE or kernel=" + str(symbol.get_ode_or_kernel())
+            lines.append(line)
+
+        for sub_scope in scope.get_scopes():
+            lines.append("<" + sub_scope.get_scope_type().name + ">")
+            lines.extend(["  " + line for line in self._print_symbol_table(sub_scope)])
+
+        return lines
+
     def get_spike_update_expressions(self, neuron: ASTNeuron, kernel_buffers, solver_dicts, delta_factors) -> Tuple[Dict[str, ASTAssignment], Dict[str, ASTAssignment]]:
         r"""
         Generate the equations that update the dynamical variables when incoming spikes arrive. To be invoked after
@@ -755,8 +880,8 @@ class NESTCodeGenerator(CodeGenerator):
             var = k[0]
             inport = k[1]
             assignment_str = var.get_name() + "'" * (var.get_differential_order() - 1) + " += "
-            if not factor in ["1.", "1.0", "1"]:
-                factor_expr = ModelParser.parse_expression(factor)
+            if not factor == 1:
+                factor_expr = ASTSympyConverter.from_sympy(factor)
                 factor_expr.update_scope(neuron.get_scope())
                 factor_expr.accept(ASTSymbolTableVisitor())
                 assignment_str += "(" + self._unitless_expression_printer_no_origin.print_expression(factor_expr) + ") * "
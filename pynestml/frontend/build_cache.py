@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+#
+# build_cache.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import json
+import os
+import pickle
+
+import pynestml
+from pynestml.codegeneration.code_generator import CodeGenerator
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.meta_model.ast_neuron import ASTNeuron
+from pynestml.meta_model.ast_synapse import ASTSynapse
+from pynestml.utils.disk_cache import DiskCache
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.messages import Messages
+
+
+class BuildCache:
+    r"""
+    Incremental build cache: stores the transformed models, together with the files that were generated for them, so that unchanged models do not have to be parsed, analysed and rendered again.
+
+    The input files are grouped into units; the models from each unit are cached in a single entry. The key of an entry is a hash of the contents of the files in the unit, the code generator options, the contents of the templates directory and the PyNESTML version. Normally, each input file forms a unit by itself. If neurons and synapses are to be co-generated, the generated code of one model can depend on models in other files, and all files together form a single unit.
+    """
+
+    def __init__(self, cache_dir: str, max_size: int, codegen_opts: Dict):
+        r"""
+        :param cache_dir: path to the cache directory
+        :param max_size: maximum size of the cache in bytes
+        :param codegen_opts: the code generator (and transformer) options
+        """
+        self._cache = DiskCache(cache_dir, max_size=max_size)
+        self._codegen_opts = codegen_opts
+        self._units: List[Tuple[str, List[str]]] = []
+        self._cached_models: Dict[str, List[Union[ASTNeuron, ASTSynapse]]] = {}
+        self._model_keys: Dict[str, str] = {}   # maps model name to the key of the unit it belongs to
+        self._invalid_keys = set()
+
+    def _get_templates_key(self) -> str:
+        templates_dirs = []
+
+        resources_dir = os.path.join(os.path.dirname(pynestml.codegeneration.__file__),
+                                     "resources_" + FrontendConfiguration.get_target_platform().lower())
+        if os.path.isdir(resources_dir):
+            templates_dirs.append(resources_dir)
+
+        if "templates" in self._codegen_opts.keys() and "path" in self._codegen_opts["templates"].keys() \
+           and os.path.isabs(self._codegen_opts["templates"]["path"]):
+            templates_dirs.append(self._codegen_opts["templates"]["path"])
+
+        return DiskCache.compute_key(*[DiskCache.compute_directory_key(templates_dir) for templates_dir in templates_dirs])
+
+    def _get_units(self, nestml_files: Sequence[str]) -> List[List[str]]:
+        if self._codegen_opts.get("neuron_synapse_pairs"):
+            return [list(nestml_files)]
+
+        return [[nestml_file] for nestml_file in nestml_files]
+
+    def load(self, nestml_files: Sequence[str]) -> Tuple[List[Union[ASTNeuron, ASTSynapse]], List[str]]:
+        r"""
+        Look up the given input files in the cache. For each cache hit, the previously generated files are restored to the target path.
+        :param nestml_files: paths to the input files
+        :return: the cached models, and the input files that were not found in the cache and still need to be processed
+        """
+        options_key = DiskCache.compute_key(pynestml.__version__,
+                                            FrontendConfiguration.get_target_platform(),
+                                            FrontendConfiguration.get_module_name(),
+                                            FrontendConfiguration.suffix,
+                                            str(FrontendConfiguration.get_is_dev()),
+                                            json.dumps(self._codegen_opts, sort_keys=True, default=str),
+                                            self._get_templates_key())
+
+        cached_models = []
+        nestml_files_to_process = []
+        for unit_files in self._get_units(nestml_files):
+            contents = []
+            for nestml_file in unit_files:
+                contents.append(os.path.basename(nestml_file))
+                with open(nestml_file, "rb") as f:
+                    contents.append(f.read())
+            key = DiskCache.compute_key(options_key, *contents)
+            self._units.append((key, unit_files))
+
+            entry = self._cache.get_object(key)
+            if entry is None:
+                nestml_files_to_process.extend(unit_files)
+                continue
+
+            self._restore_files(entry["files"])
+            self._cached_models[key] = entry["models"]
+            cached_models.extend(entry["models"])
+            for model in entry["models"]:
+                code, message = Messages.get_build_cache_hit(model.get_name())
+                Logger.log_message(model, code, message, model.get_source_position(), LoggingLevel.INFO)
+
+        return cached_models, nestml_files_to_process
+
+    def _restore_files(self, files: Dict[str, bytes]) -> None:
+        if not os.path.isdir(FrontendConfiguration.get_target_path()):
+            os.makedirs(FrontendConfiguration.get_target_path())
+
+        for file_name, content in files.items():
+            path = os.path.join(FrontendConfiguration.get_target_path(), file_name)
+            if os.path.isfile(path):
+                with open(path, "rb") as f:
+                    if f.read() == content:
+                        continue    # leave the file untouched, so that it will not be recompiled
+
+            with open(path, "wb") as f:
+                f.write(content)
+
+    def add_parsed_models(self, nestml_file: str, models: Sequence[Union[ASTNeuron, ASTSynapse]]) -> None:
+        r"""
+        Register the models that were parsed from one of the input files that was not found in the cache.
+        :param nestml_file: path to the input file
+        :param models: the neurons and synapses in the file
+        """
+        key = self._get_key_of_file(nestml_file)
+        for model in models:
+            self._model_keys[model.get_name()] = key
+            code, message = Messages.get_build_cache_miss(model.get_name())
+            Logger.log_message(model, code, message, model.get_source_position(), LoggingLevel.INFO)
+            if Logger.has_errors(model):
+                self._invalid_keys.add(key)
+
+    def _get_key_of_file(self, nestml_file: str) -> Optional[str]:
+        for key, unit_files in self._units:
+            if nestml_file in unit_files:
+                return key
+
+        return None
+
+    def _get_key_of_model(self, model: Union[ASTNeuron, ASTSynapse]) -> Optional[str]:
+        if model.get_name() in self._model_keys.keys():
+            return self._model_keys[model.get_name()]
+
+        # models that were added by a transformer can only be attributed if there is a single unit
+        keys = [key for key, _ in self._units if key not in self._cached_models.keys()]
+        if len(keys) == 1:
+            return keys[0]
+
+        return None
+
+    def store(self, models: Sequence[Union[ASTNeuron, ASTSynapse]], code_generator: CodeGenerator) -> None:
+        r"""
+        Store the given models, that were processed in this run, and the files that were generated for them in the cache. Units containing models with errors are not stored.
+        :param models: the models, after code has been generated for them
+        :param code_generator: the code generator that was used
+        """
+        models_per_key = {key: [] for key, _ in self._units if key not in self._cached_models.keys()}
+        for model in models:
+            key = self._get_key_of_model(model)
+            if key is None:
+                # cannot determine which input files this model depends on; do not cache anything
+                return
+
+            models_per_key[key].append(model)
+            if Logger.has_errors(model):
+                self._invalid_keys.add(key)
+
+        for key, unit_models in models_per_key.items():
+            if key in self._invalid_keys or not unit_models:
+                continue
+
+            files = {}
+            for model in unit_models:
+                for file_name in code_generator.get_generated_file_names(model):
+                    path = os.path.join(FrontendConfiguration.get_target_path(), file_name)
+                    if os.path.isfile(path):
+                        with open(path, "rb") as f:
+                            files[file_name] = f.read()
+
+            try:
+                self._cache.put_object(key, {"models": unit_models, "files": files})
+            except (pickle.PicklingError, TypeError, AttributeError, RecursionError) as e:
+                Logger.log_message(message="Could not store models in the build cache: " + str(e),
+                                   log_level=LoggingLevel.WARNING)
+
+    def get_all_models(self, models: Sequence[Union[ASTNeuron, ASTSynapse]]) -> List[Union[ASTNeuron, ASTSynapse]]:
+        r"""
+        Combine the models that were processed in this run with those that were loaded from the cache, in the order of the input files.
+        :param models: the models that were processed in this run
+        :return: all models
+        """
+        all_models = []
+        for key, _ in self._units:
+            if key in self._cached_models.keys():
+                all_models.extend(self._cached_models[key])
+            else:
+                all_models.extend([model for model in models if self._get_key_of_model(model) == key])
+
+        all_models.extend([model for model in models if self._get_key_of_model(model) is None])
+
+        return all_models
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+#
+# compile_server.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Any, Dict, Mapping, Sequence
+
+import contextlib
+import importlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import traceback
+
+from pynestml.frontend.frontend_configuration import FrontendConfiguration, InvalidPathException
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.messages import Messages
+from pynestml.utils.toolchain_context import ToolchainContext
+
+
+class CompileServer:
+    r"""
+    A compile server keeps a warm process, in which the start-up cost of the toolchain (importing the parser, sympy, astropy, jinja2 and ODE-toolbox, and initializing the predefined symbols) is paid only once, and processes requests that are sent to it over a Unix socket.
+
+    Each request is a single line containing a JSON object with the command line arguments (``"args"``) and the working directory of the client (``"cwd"``). It is processed like an invocation of ``nestml`` with these arguments, in a ``ToolchainContext`` of its own. The response is a single line containing a JSON object with the exit code (``"exit_code"``), the printed output, including error output (``"output"``) and the log (``"log"``, in the same format as ``report/log.txt``). A request ``{"shutdown": true}`` stops the server.
+
+    Requests are processed one after another. Besides the state of the process itself (such as the caches of the parser), the loaded templates and the results of ODE-toolbox analysis are kept between requests (see ``CodeGenerator.keep_templates`` and ``NESTCodeGenerator.keep_ode_toolbox_results``).
+    """
+
+    def __init__(self, socket_path: str):
+        r"""
+        :param socket_path: the path of the Unix socket to listen on. An existing file at this path is removed.
+        """
+        self._socket_path = socket_path
+        self._shutdown_requested = False
+
+        compile_server = self
+
+        class RequestHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                response = compile_server.handle_request(json.loads(self.rfile.readline()))
+                self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+        self._server = socketserver.UnixStreamServer(socket_path, RequestHandler)
+
+    @classmethod
+    def warm_up(cls) -> None:
+        r"""
+        Import the modules for parsing, checking and generating code, initialize the predefined symbols, and enable the caches that are kept between requests.
+        """
+        from pynestml.codegeneration.code_generator import CodeGenerator
+        from pynestml.codegeneration.nest_code_generator import NESTCodeGenerator
+        from pynestml.frontend.pynestml_frontend import init_predefined
+
+        for module_name in ["pynestml.utils.model_parser", "pynestml.codegeneration.autodoc_code_generator",
+                            "pynestml.codegeneration.nest_builder"]:
+            importlib.import_module(module_name)
+
+        CodeGenerator.keep_templates = True
+        NESTCodeGenerator.keep_ode_toolbox_results = True
+        sys.setrecursionlimit(10000)
+        init_predefined()
+
+    def serve_forever(self) -> None:
+        r"""
+        Process requests until a shutdown request is received.
+        """
+        self.warm_up()
+        code, message = Messages.get_compile_server_started(self._socket_path)
+        Logger.log_message(code=code, message=message, log_level=LoggingLevel.INFO)
+        try:
+            while not self._shutdown_requested:
+                self._server.handle_request()
+        finally:
+            self._server.server_close()
+            if os.path.exists(self._socket_path):
+                os.remove(self._socket_path)
+
+    def handle_request(self, request: Mapping[str, Any]) -> Dict[str, Any]:
+        r"""
+        Process a single request.
+        :param request: the request, see ``CompileServer``
+        :return: the response, see ``CompileServer``
+        """
+        from pynestml.frontend.pynestml_frontend import process
+
+        if request.get("shutdown", False):
+            self._shutdown_requested = True
+            return {"exit_code": 0, "output": "", "log": []}
+
+        output = io.StringIO()
+        cwd = os.getcwd()
+        with ToolchainContext().activate(), contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            try:
+                os.chdir(request.get("cwd", cwd))
+                FrontendConfiguration.parse_config(request["args"])
+                exit_code = int(process())
+            except InvalidPathException:
+                exit_code = 1
+            except SystemExit as e:
+                # raised by the argument parser (e.g. for --help or invalid arguments), and by builders
+                exit_code = e.code if isinstance(e.code, int) else 1
+            except Exception:
+                traceback.print_exc(file=output)
+                exit_code = 1
+            finally:
+                os.chdir(cwd)
+
+            log = json.loads(Logger.get_json_format())
+
+        return {"exit_code": exit_code, "output": output.getvalue(), "log": log}
+
+
+def send_request(socket_path: str, request: Mapping[str, Any]) -> Dict[str, Any]:
+    r"""
+    Send a request to the compile server listening on the given socket, and wait for the response.
+    :param socket_path: the path of the Unix socket of the server
+    :param request: the request, see ``CompileServer``
+    :return: the response, see ``CompileServer``
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        with sock.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+def run_client(socket_path: str, args: Sequence[str]) -> int:
+    r"""
+    Forward command line arguments to the compile server listening on the given socket, and print its output.
+    :param socket_path: the path of the Unix socket of the server
+    :param args: the command line arguments, without ``--client``
+    :return: the exit code of the request
+    """
+    try:
+        response = send_request(socket_path, {"args": list(args), "cwd": os.getcwd()})
+    except OSError as e:
+        code, message = Messages.get_compile_server_not_available(socket_path, str(e))
+        Logger.log_message(code=code, message=message, log_level=LoggingLevel.ERROR)
+        return 1
+
+    sys.stdout.write(response["output"])
+
+    return response["exit_code"]
@@ -19,7 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Any, Mapping, Optional, Sequence
+from typing import Any, List, Mapping, Optional, Sequence, Tuple
 
 import argparse
 import glob
@@ -32,6 +32,8 @@ from pynestml.exceptions.invalid_target_exception import InvalidTargetException
 from pynestml.utils.logger import Logger
 from pynestml.utils.logger import LoggingLevel
 from pynestml.utils.messages import Messages, MessageCode
+from pynestml.utils.profiler import Profiler
+from pynestml.utils.toolchain_context import ContextBound
 
 help_input_path = 'One or more input path(s). Each path is a NESTML file, or a directory containing NESTML files. Directories will be searched recursively for files matching \'*.nestml\'.'
 help_target_path = 'Path to a directory where generated code should be written to. Standard is "target".'
@@ -43,6 +45,14 @@ help_log = 'Indicates whether a log file containing all messages shall be stored
 help_suffix = 'A suffix string that will be appended to the name of all generated models.'
 help_dev = 'Enable development mode: code generation is attempted even for models that contain errors, and extra information is rendered in the generated code.'
 help_codegen_opts = 'Path to a JSON file containing additional options for the target platform code generator.'
+help_jobs = 'Number of worker processes used to parse, analyse and generate code for the models in parallel. Standard is 1 (no parallel processing).'
+help_cache_dir = 'Path to a directory for the incremental build cache. Code is only regenerated for models that changed since they were last cached, and the parsed models are reused if only the options changed. Standard is no caching.'
+help_cache_max_size = 'Maximum size of the incremental build cache and of the ODE-toolbox result cache in MB (each). Least recently used entries are removed if a cache grows beyond this size. Standard is 256.'
+help_ode_cache_dir = 'Path to a directory for caching ODE-toolbox analysis results. Standard is no caching.'
+help_profile = 'Path to a JSON file to which the wall time and peak memory usage of each phase of processing are written, per model. Standard is no profiling.'
+help_bounded_log = 'Only keep the number of DEBUG and INFO messages, but not the messages themselves, to bound the memory used by the log when processing many models. Warnings and errors are always kept. Standard is NO.'
+help_serve = 'Instead of processing models, start a compile server that accepts requests on the Unix socket at the given path. The server keeps its process, and thereby the imported modules, predefined symbols, parser caches, templates and ODE-toolbox results, warm between requests.'
+help_client = 'Instead of processing the models in this process, forward all other arguments to the compile server listening on the Unix socket at the given path (see --serve), and print its output.'
 
 qualifier_input_path_arg = '--input_path'
 qualifier_target_path_arg = '--target_path'
@@ -54,17 +64,30 @@ qualifier_store_log_arg = '--store_log'
 qualifier_suffix_arg = '--suffix'
 qualifier_dev_arg = '--dev'
 qualifier_codegen_opts_arg = '--codegen_opts'
+qualifier_jobs_arg = '--jobs'
+qualifier_cache_dir_arg = '--cache_dir'
+qualifier_cache_max_size_arg = '--cache_max_size'
+qualifier_ode_cache_dir_arg = '--ode_cache_dir'
+qualifier_profile_arg = '--profile'
+qualifier_bounded_log_arg = '--bounded_log'
+qualifier_serve_arg = '--serve'
+qualifier_client_arg = '--client'
 
 
-class FrontendConfiguration:
+class FrontendConfiguration(metaclass=ContextBound):
     """
-    This class encapsulates all settings as handed over to the frontend at start of the toolchain.
+    This class encapsulates all settings as handed over to the frontend at start of the toolchain. The settings are kept separately for each ``ToolchainContext``.
     """
+    _context_attributes = ("argument_parser", "paths_to_compilation_units", "provided_input_path", "logging_level",
+                           "target", "target_platform", "install_path", "target_path", "module_name", "store_log", "suffix",
+                           "is_dev", "codegen_opts", "codegen_opts_fn", "jobs", "cache_dir", "cache_max_size",
+                           "ode_cache_dir", "profile", "bounded_log")
     argument_parser = None
     paths_to_compilation_units = None
     provided_input_path = None
     logging_level = None
     target = None
+    target_platform = None
     install_path = None
     target_path = None
     module_name = None
@@ -73,6 +96,12 @@ class FrontendConfiguration:
     is_dev = False
     codegen_opts = {}  # type: Mapping[str, Any]
     codegen_opts_fn = ''
+    jobs = 1
+    cache_dir = None
+    cache_max_size = 256
+    ode_cache_dir = None
+    profile = None
+    bounded_log = False
 
     @classmethod
     def parse_config(cls, args):
@@ -105,11 +134,23 @@ appropriate numeric solver otherwise.
         cls.argument_parser.add_argument(qualifier_suffix_arg, metavar='SUFFIX', type=str, help=help_suffix, default='')
         cls.argument_parser.add_argument(qualifier_dev_arg, action='store_true', help=help_dev)
         cls.argument_parser.add_argument(qualifier_codegen_opts_arg, metavar='PATH', type=str, help=help_codegen_opts, default='', dest='codegen_opts_fn')
+        cls.argument_parser.add_argument(qualifier_jobs_arg, metavar='N', type=int, help=help_jobs, default=1)
+        cls.argument_parser.add_argument(qualifier_cache_dir_arg, metavar='PATH', type=str, help=help_cache_dir)
+        cls.argument_parser.add_argument(qualifier_cache_max_size_arg, metavar='MB', type=int, help=help_cache_max_size, default=256)
+        cls.argument_parser.add_argument(qualifier_ode_cache_dir_arg, metavar='PATH', type=str, help=help_ode_cache_dir)
+        cls.argument_parser.add_argument(qualifier_profile_arg, metavar='PATH', type=str, help=help_profile)
+        cls.argument_parser.add_argument(qualifier_bounded_log_arg, action='store_true', help=help_bounded_log)
+        # handled by parse_server_config(); only added here so that they are listed in the help
+        cls.argument_parser.add_argument(qualifier_serve_arg, metavar='PATH', type=str, help=help_serve)
+        cls.argument_parser.add_argument(qualifier_client_arg, metavar='PATH', type=str, help=help_client)
         parsed_args = cls.argument_parser.parse_args(args)
 
         # initialize the logger
         cls.logging_level = Logger.level_to_string(Logger.string_to_level(parsed_args.logging_level))
-        Logger.init_logger(Logger.string_to_level(parsed_args.logging_level))
+        cls.bounded_log = parsed_args.bounded_log
+        # messages that are not printed are only needed if the log is stored
+        Logger.init_logger(Logger.string_to_level(parsed_args.logging_level), bounded=cls.bounded_log,
+                           store_suppressed=parsed_args.store_log)
 
         cls.handle_input_path(parsed_args.input_path)
         cls.handle_target_platform(parsed_args.target_platform)
@@ -117,11 +158,30 @@ appropriate numeric solver otherwise.
         cls.handle_install_path(parsed_args.install_path)
         cls.handle_module_name(parsed_args.module_name)
         cls.handle_codegen_opts_fn(parsed_args.codegen_opts_fn)
+        cls.handle_jobs(parsed_args.jobs)
+        cls.handle_cache_dir(parsed_args.cache_dir)
+        cls.handle_cache_max_size(parsed_args.cache_max_size)
+        cls.handle_ode_cache_dir(parsed_args.ode_cache_dir)
+        cls.handle_profile(parsed_args.profile)
 
         cls.store_log = parsed_args.store_log
         cls.suffix = parsed_args.suffix
         cls.is_dev = parsed_args.dev
 
+    @classmethod
+    def parse_server_config(cls, args: Sequence[str]) -> Tuple[Optional[str], Optional[str], List[str]]:
+        """
+        Extracts the compile server arguments from the command line arguments.
+        :param args: a set of arguments as handed over to the frontend
+        :return: the socket path given with ``--serve`` (or None), the socket path given with ``--client`` (or None), and the remaining arguments
+        """
+        parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+        parser.add_argument(qualifier_serve_arg, metavar='PATH', type=str)
+        parser.add_argument(qualifier_client_arg, metavar='PATH', type=str)
+        parsed_args, remaining_args = parser.parse_known_args(args)
+
+        return parsed_args.serve, parsed_args.client, remaining_args
+
     @classmethod
     def get_provided_input_path(cls) -> Sequence[str]:
         """
@@ -191,6 +251,46 @@ appropriate numeric solver otherwise.
         """
         return cls.is_dev
 
+    @classmethod
+    def get_jobs(cls) -> int:
+        """
+        Returns the number of worker processes to be used for processing the models.
+        :return: the number of jobs.
+        """
+        return cls.jobs
+
+    @classmethod
+    def get_cache_dir(cls) -> Optional[str]:
+        """
+        Returns the directory of the incremental build cache.
+        :return: the path to the cache directory, or None if caching is disabled.
+        """
+        return cls.cache_dir
+
+    @classmethod
+    def get_cache_max_size(cls) -> int:
+        """
+        Returns the maximum size of the incremental build cache and of the ODE-toolbox result cache.
+        :return: the maximum size in MB.
+        """
+        return cls.cache_max_size
+
+    @classmethod
+    def get_ode_cache_dir(cls) -> Optional[str]:
+        """
+        Returns the directory of the ODE-toolbox result cache.
+        :return: the path to the cache directory, or None if caching is disabled.
+        """
+        return cls.ode_cache_dir
+
+    @classmethod
+    def get_profile(cls) -> Optional[str]:
+        """
+        Returns the path of the file to which profiling results are written.
+        :return: the path to the file, or None if profiling is disabled.
+        """
+        return cls.profile
+
     @classmethod
     def get_codegen_opts(cls):
         """Get the code generator options dictionary"""
@@ -219,6 +319,49 @@ appropriate numeric solver otherwise.
             if not cls.codegen_opts:
                 raise Exception('Errors occurred while processing code generator options file')
 
+    @classmethod
+    def handle_jobs(cls, jobs: int) -> None:
+        """check that the number of jobs is a positive integer"""
+        if jobs < 1:
+            raise Exception('Invalid number of jobs specified (' + str(jobs) + '): should be at least 1')
+        cls.jobs = jobs
+
+    @classmethod
+    def handle_cache_dir(cls, path: Optional[str]) -> None:
+        """if a cache directory was specified, convert it to an absolute path and create it if it does not yet exist"""
+        cls.cache_dir = cls._make_cache_dir(path)
+
+    @classmethod
+    def handle_ode_cache_dir(cls, path: Optional[str]) -> None:
+        """if an ODE-toolbox cache directory was specified, convert it to an absolute path and create it if it does not yet exist"""
+        cls.ode_cache_dir = cls._make_cache_dir(path)
+
+    @classmethod
+    def _make_cache_dir(cls, path: Optional[str]) -> Optional[str]:
+        if path is None:
+            return None
+
+        path = os.path.abspath(path)
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        return path
+
+    @classmethod
+    def handle_cache_max_size(cls, cache_max_size: int) -> None:
+        """check that the maximum cache size is a positive integer"""
+        if cache_max_size < 1:
+            raise Exception('Invalid maximum cache size specified (' + str(cache_max_size) + ' MB): should be at least 1')
+        cls.cache_max_size = cache_max_size
+
+    @classmethod
+    def handle_profile(cls, path: Optional[str]) -> None:
+        """if a profile output file was specified, convert it to an absolute path and enable the profiler"""
+        if path is not None:
+            path = os.path.abspath(path)
+        cls.profile = path
+        Profiler.init_profiler(path is not None)
+
     @classmethod
     def handle_module_name(cls, module_name):
         """parse or compose the module name"""
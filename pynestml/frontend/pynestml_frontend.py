@@ -19,29 +19,33 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import multiprocessing
 import os
 import sys
 
-from pynestml.cocos.co_cos_manager import CoCosManager
-from pynestml.codegeneration.builder import Builder
-from pynestml.codegeneration.code_generator import CodeGenerator
 from pynestml.exceptions.code_generator_options_exception import CodeGeneratorOptionsException
 from pynestml.frontend.frontend_configuration import FrontendConfiguration, InvalidPathException, \
     qualifier_store_log_arg, qualifier_module_name_arg, qualifier_logging_level_arg, \
     qualifier_target_platform_arg, qualifier_target_path_arg, qualifier_input_path_arg, qualifier_suffix_arg, \
-    qualifier_dev_arg, qualifier_codegen_opts_arg, qualifier_install_path_arg
-from pynestml.meta_model.ast_neuron import ASTNeuron
-from pynestml.meta_model.ast_synapse import ASTSynapse
-from pynestml.symbols.predefined_functions import PredefinedFunctions
-from pynestml.symbols.predefined_types import PredefinedTypes
-from pynestml.symbols.predefined_units import PredefinedUnits
-from pynestml.symbols.predefined_variables import PredefinedVariables
-from pynestml.transformers.transformer import Transformer
+    qualifier_dev_arg, qualifier_codegen_opts_arg, qualifier_install_path_arg, qualifier_jobs_arg, \
+    qualifier_cache_dir_arg, qualifier_cache_max_size_arg, qualifier_ode_cache_dir_arg, qualifier_profile_arg, \
+    qualifier_bounded_log_arg
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
-from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.profiler import Profiler
+from pynestml.utils.toolchain_context import ToolchainContext
+
+# the modules for parsing, checking and generating code import heavy dependencies (such as the parser, sympy, astropy, jinja2 and ODE-toolbox); they are only imported once they are needed, so that the command line interface starts up quickly
+if TYPE_CHECKING:
+    from pynestml.codegeneration.builder import Builder
+    from pynestml.codegeneration.code_generator import CodeGenerator
+    from pynestml.meta_model.ast_neuron import ASTNeuron
+    from pynestml.meta_model.ast_synapse import ASTSynapse
+    from pynestml.transformers.transformer import Transformer
 
 
 def get_known_targets():
@@ -95,6 +99,7 @@ def code_generator_from_target_name(target_name: str, options: Optional[Mapping[
 
     if target_name.upper() == "NONE":
         # dummy/null target: user requested to not generate any code
+        from pynestml.codegeneration.code_generator import CodeGenerator
         code, message = Messages.get_no_code_generated()
         Logger.log_message(None, code, message, None, LoggingLevel.INFO)
         return CodeGenerator("", options)
@@ -118,9 +123,13 @@ def builder_from_target_name(target_name: str, options: Optional[Mapping[str, An
 
 def generate_target(input_path: Union[str, Sequence[str]], target_platform: str, target_path=None,
                     install_path: str = None, logging_level="ERROR", module_name=None, store_log=False, suffix="",
-                    dev=False, codegen_opts: Optional[Mapping[str, Any]] = None):
+                    dev=False, codegen_opts: Optional[Mapping[str, Any]] = None, jobs: int = 1,
+                    cache_dir: Optional[str] = None, cache_max_size: int = 256, ode_cache_dir: Optional[str] = None,
+                    profile: Optional[str] = None, bounded_log: bool = False, context: Optional[ToolchainContext] = None):
     r"""Generate and build code for the given target platform.
 
+    The configuration, log, symbol table etc. of the run are kept in a ``ToolchainContext`` of its own, so that several runs can be performed concurrently, for instance by a thread pool.
+
     Parameters
     ----------
     input_path : str **or** Sequence[str]
@@ -143,6 +152,20 @@ def generate_target(input_path: Union[str, Sequence[str]], target_platform: str,
         Enable development mode: code generation is attempted even for models that contain errors, and extra information is rendered in the generated code.
     codegen_opts : Optional[Mapping[str, Any]]
         A dictionary containing additional options for the target code generator.
+    jobs : int, optional (default: 1)
+        Number of worker processes used to parse, analyse and generate code for the models in parallel.
+    cache_dir : str, optional (default: None)
+        Path to a directory for the incremental build cache. If given, code is only regenerated for models that changed since they were last cached.
+    cache_max_size : int, optional (default: 256)
+        Maximum size of the incremental build cache and of the ODE-toolbox result cache in MB (each).
+    ode_cache_dir : str, optional (default: None)
+        Path to a directory for caching ODE-toolbox analysis results.
+    profile : str, optional (default: None)
+        Path to a JSON file to which the wall time and peak memory usage of each phase of processing are written, per model.
+    bounded_log : bool, optional (default: False)
+        Only keep the number of DEBUG and INFO messages, but not the messages themselves, to bound the memory used by the log when processing many models. Warnings and errors are always kept.
+    context : ToolchainContext, optional (default: None)
+        The context in which to run. If not given, a new context is created for this call. Pass a context to inspect its state (for instance, the log) after the call, by activating it with ``context.activate()``.
     """
     args = list()
     args.append(qualifier_input_path_arg)
@@ -180,19 +203,48 @@ def generate_target(input_path: Union[str, Sequence[str]], target_platform: str,
     if dev:
         args.append(qualifier_dev_arg)
 
-    FrontendConfiguration.parse_config(args)
+    if jobs != 1:
+        args.append(qualifier_jobs_arg)
+        args.append(str(jobs))
+
+    if cache_dir:
+        args.append(qualifier_cache_dir_arg)
+        args.append(cache_dir)
+
+    if ode_cache_dir:
+        args.append(qualifier_ode_cache_dir_arg)
+        args.append(ode_cache_dir)
+
+    if cache_dir or ode_cache_dir:
+        args.append(qualifier_cache_max_size_arg)
+        args.append(str(cache_max_size))
+
+    if profile:
+        args.append(qualifier_profile_arg)
+        args.append(profile)
+
+    if bounded_log:
+        args.append(qualifier_bounded_log_arg)
+
+    if context is None:
+        context = ToolchainContext()
+
+    with context.activate():
+        FrontendConfiguration.parse_config(args)
 
-    if codegen_opts:
-        FrontendConfiguration.set_codegen_opts(codegen_opts)
+        if codegen_opts:
+            FrontendConfiguration.set_codegen_opts(codegen_opts)
 
-    if not process() == 0:
-        raise Exception("Error(s) occurred while processing the model")
+        if not process() == 0:
+            raise Exception("Error(s) occurred while processing the model")
 
 
 def generate_nest_target(input_path: Union[str, Sequence[str]], target_path: Optional[str] = None,
                          install_path: Optional[str] = None, logging_level="ERROR",
                          module_name=None, store_log: bool = False, suffix: str = "",
-                         dev: bool = False, codegen_opts: Optional[Mapping[str, Any]] = None):
+                         dev: bool = False, codegen_opts: Optional[Mapping[str, Any]] = None, jobs: int = 1,
+                         cache_dir: Optional[str] = None, cache_max_size: int = 256, ode_cache_dir: Optional[str] = None,
+                         profile: Optional[str] = None, bounded_log: bool = False, context: Optional[ToolchainContext] = None):
     r"""Generate and build code for NEST Simulator.
 
     Parameters
@@ -215,10 +267,25 @@ def generate_nest_target(input_path: Union[str, Sequence[str]], target_path: Opt
         Enable development mode: code generation is attempted even for models that contain errors, and extra information is rendered in the generated code.
     codegen_opts : Optional[Mapping[str, Any]]
         A dictionary containing additional options for the target code generator.
+    jobs : int, optional (default: 1)
+        Number of worker processes used to parse, analyse and generate code for the models in parallel.
+    cache_dir : str, optional (default: None)
+        Path to a directory for the incremental build cache. If given, code is only regenerated for models that changed since they were last cached.
+    cache_max_size : int, optional (default: 256)
+        Maximum size of the incremental build cache and of the ODE-toolbox result cache in MB (each).
+    ode_cache_dir : str, optional (default: None)
+        Path to a directory for caching ODE-toolbox analysis results.
+    profile : str, optional (default: None)
+        Path to a JSON file to which the wall time and peak memory usage of each phase of processing are written, per model.
+    bounded_log : bool, optional (default: False)
+        Only keep the number of DEBUG and INFO messages, but not the messages themselves, to bound the memory used by the log when processing many models. Warnings and errors are always kept.
+    context : ToolchainContext, optional (default: None)
+        The context in which to run. If not given, a new context is created for this call.
     """
     generate_target(input_path, target_platform="NEST", target_path=target_path, logging_level=logging_level,
                     module_name=module_name, store_log=store_log, suffix=suffix, install_path=install_path,
-                    dev=dev, codegen_opts=codegen_opts)
+                    dev=dev, codegen_opts=codegen_opts, jobs=jobs, cache_dir=cache_dir, cache_max_size=cache_max_size,
+                    ode_cache_dir=ode_cache_dir, profile=profile, bounded_log=bounded_log, context=context)
 
 
 def main() -> int:
@@ -229,8 +296,18 @@ def main() -> int:
     -------
     The process exit code: 0 for success, > 0 for failure
     """
+    serve_socket_path, client_socket_path, args = FrontendConfiguration.parse_server_config(sys.argv[1:])
+    if serve_socket_path is not None:
+        from pynestml.frontend.compile_server import CompileServer
+        CompileServer(serve_socket_path).serve_forever()
+        return 0
+
+    if client_socket_path is not None:
+        from pynestml.frontend.compile_server import run_client
+        return run_client(client_socket_path, args)
+
     try:
-        FrontendConfiguration.parse_config(sys.argv[1:])
+        FrontendConfiguration.parse_config(args)
     except InvalidPathException as e:
         return 1
     # the default Python recursion limit is 1000, which might not be enough in practice when running an AST visitor on a deep tree, e.g. containing an automatically generated expression
@@ -243,17 +320,37 @@ def process():
     r"""
     The main toolchain workflow entry point. For all models: parse, validate, transform, generate code and build.
 
+    If more than one job was requested, parsing and per-model code generation are distributed over a pool of worker processes; only the neuron/synapse co-generation and the module-level code generation are done in the main process.
+
+    If the log is to be stored, each message is written to ``report/log.jsonl`` while it is logged, and the complete log is written to ``report/log.txt`` at the end.
+
     Returns
     -------
     errors_occurred : bool
         Flag indicating whether errors occurred during processing
     """
-
-    errors_occurred = False
-
     # init log dir
     create_report_dir()
 
+    if FrontendConfiguration.store_log:
+        from pynestml.utils.json_lines_log_writer import JSONLinesLogWriter
+        Logger.set_log_writer(JSONLinesLogWriter(os.path.join(FrontendConfiguration.get_target_path(), "..", "report", "log.jsonl")))
+
+    try:
+        return _process()
+    finally:
+        if Logger.log_writer is not None:
+            Logger.log_writer.close()
+            Logger.set_log_writer(None)
+
+
+def _process():
+    from pynestml.cocos.co_cos_manager import CoCosManager
+    from pynestml.frontend.build_cache import BuildCache
+    from pynestml.utils.model_parser import ModelParser
+
+    errors_occurred = False
+
     # The handed over parameters seem to be correct, proceed with the main routine
     init_predefined()
 
@@ -264,56 +361,109 @@ def process():
     if not type(nestml_files) is list:
         nestml_files = [nestml_files]
 
-    for nestml_file in nestml_files:
-        parsed_unit = ModelParser.parse_model(nestml_file)
-        if parsed_unit is not None:
-            compilation_units.append(parsed_unit)
-
-    # initialize and set options for transformers, code generator and builder
-    codegen_and_builder_opts = FrontendConfiguration.get_codegen_opts()
-    transformers, codegen_and_builder_opts = transformers_from_target_name(FrontendConfiguration.get_target_platform(),
-                                                                           options=codegen_and_builder_opts)
-    _codeGenerator = code_generator_from_target_name(FrontendConfiguration.get_target_platform())
-    codegen_and_builder_opts = _codeGenerator.set_options(codegen_and_builder_opts)
-    _builder = builder_from_target_name(FrontendConfiguration.get_target_platform())
-
-    if _builder is not None:
-        codegen_and_builder_opts = _builder.set_options(codegen_and_builder_opts)
-
-    if len(codegen_and_builder_opts) > 0:
-        raise CodeGeneratorOptionsException("The code generator option(s) \"" + ", ".join(codegen_and_builder_opts.keys()) + "\" do not exist.")
-
-    if len(compilation_units) > 0:
-        # generate a list of all neurons + synapses
-        models: Sequence[Union[ASTNeuron, ASTSynapse]] = []
-        for compilationUnit in compilation_units:
-            models.extend(compilationUnit.get_neuron_list())
-            models.extend(compilationUnit.get_synapse_list())
-
-        # check that no models with duplicate names have been defined
-        CoCosManager.check_no_duplicate_compilation_unit_names(models)
-
-        # now exclude those which are broken, i.e. have errors.
-        if not FrontendConfiguration.is_dev:
+    # look up models in the incremental build cache
+    build_cache = None
+    cached_models = []
+    if FrontendConfiguration.get_cache_dir() is not None:
+        build_cache = BuildCache(FrontendConfiguration.get_cache_dir(),
+                                 max_size=FrontendConfiguration.get_cache_max_size() * 1024**2,
+                                 codegen_opts=FrontendConfiguration.get_codegen_opts())
+        cached_models, nestml_files = build_cache.load(nestml_files)
+
+    pool = None
+    if FrontendConfiguration.get_jobs() > 1:
+        pool = multiprocessing.Pool(processes=FrontendConfiguration.get_jobs(),
+                                    initializer=_init_worker,
+                                    initargs=(_get_frontend_configuration_state(),))
+
+    try:
+        if pool is None:
+            parsed_units = []
+            for nestml_file in nestml_files:
+                with Profiler.phase("parse", detail=nestml_file):
+                    parsed_units.append(ModelParser.parse_model(nestml_file))
+        else:
+            parsed_units = []
+            for parsed_unit, log_entries, message_counts, profiler_records in pool.map(_parse_model_worker, nestml_files):
+                Logger.merge_log(log_entries, message_counts)
+                Profiler.merge_records(profiler_records)
+                parsed_units.append(parsed_unit)
+
+        for nestml_file, parsed_unit in zip(nestml_files, parsed_units):
+            if parsed_unit is not None:
+                compilation_units.append(parsed_unit)
+                if build_cache is not None:
+                    build_cache.add_parsed_models(nestml_file, parsed_unit.get_neuron_list() + parsed_unit.get_synapse_list())
+
+        # initialize and set options for transformers, code generator and builder
+        codegen_and_builder_opts = FrontendConfiguration.get_codegen_opts()
+        transformers, codegen_and_builder_opts = transformers_from_target_name(FrontendConfiguration.get_target_platform(),
+                                                                               options=codegen_and_builder_opts)
+        codegen_opts = codegen_and_builder_opts
+        _codeGenerator = code_generator_from_target_name(FrontendConfiguration.get_target_platform())
+        codegen_and_builder_opts = _codeGenerator.set_options(codegen_and_builder_opts)
+        _builder = builder_from_target_name(FrontendConfiguration.get_target_platform())
+
+        if _builder is not None:
+            codegen_and_builder_opts = _builder.set_options(codegen_and_builder_opts)
+
+        if len(codegen_and_builder_opts) > 0:
+            raise CodeGeneratorOptionsException("The code generator option(s) \"" + ", ".join(codegen_and_builder_opts.keys()) + "\" do not exist.")
+
+        if len(compilation_units) > 0 or len(cached_models) > 0:
+            # generate a list of all neurons + synapses
+            models: Sequence[Union[ASTNeuron, ASTSynapse]] = []
+            for compilationUnit in compilation_units:
+                models.extend(compilationUnit.get_neuron_list())
+                models.extend(compilationUnit.get_synapse_list())
+
+            # check that no models with duplicate names have been defined
+            CoCosManager.check_no_duplicate_compilation_unit_names(cached_models + models)
+
+            # now exclude those which are broken, i.e. have errors.
+            if not FrontendConfiguration.is_dev:
+                for model in models:
+                    if Logger.has_errors(model):
+                        code, message = Messages.get_model_contains_errors(model.get_name())
+                        Logger.log_message(node=model, code=code, message=message,
+                                           error_position=model.get_source_position(),
+                                           log_level=LoggingLevel.WARNING)
+                        models.remove(model)
+                        errors_occurred = True
+
+            # run transformers (models loaded from the build cache have already been transformed)
+            if len(compilation_units) > 0:
+                for transformer in transformers:
+                    with Profiler.phase("transformer", detail=type(transformer).__name__):
+                        models = transformer.transform(models)
+
+            # perform code generation
+            if pool is None and build_cache is None:
+                _codeGenerator.generate_code(models)
+            else:
+                if pool is None:
+                    _codeGenerator.generate_per_model_code(models)
+                else:
+                    models = _generate_per_model_code_in_pool(pool, models, codegen_opts)
+
+                if build_cache is None:
+                    _codeGenerator.generate_module_level_code(models)
+                else:
+                    build_cache.store(models, _codeGenerator)
+                    _codeGenerator.generate_module_level_code(build_cache.get_all_models(models))
+
+                for model in models:
+                    if Logger.has_errors(model):
+                        raise Exception("Error(s) occurred during code generation")
+
             for model in models:
                 if Logger.has_errors(model):
-                    code, message = Messages.get_model_contains_errors(model.get_name())
-                    Logger.log_message(node=model, code=code, message=message,
-                                       error_position=model.get_source_position(),
-                                       log_level=LoggingLevel.WARNING)
-                    models.remove(model)
                     errors_occurred = True
-
-        # run transformers
-        for transformer in transformers:
-            models = transformer.transform(models)
-
-        # perform code generation
-        _codeGenerator.generate_code(models)
-        for model in models:
-            if Logger.has_errors(model):
-                errors_occurred = True
-                break
+                    break
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
 
     # perform build
     if not errors_occurred and _builder is not None:
@@ -322,16 +472,163 @@ def process():
     if FrontendConfiguration.store_log:
         store_log_to_file()
 
+    if FrontendConfiguration.get_profile() is not None:
+        Profiler.write(FrontendConfiguration.get_profile())
+
     return errors_occurred
 
 
+# code generator instance of a worker process; created upon first use in _generate_per_model_code_worker()
+_worker_code_generator: Optional[CodeGenerator] = None
+
+
+def _get_frontend_configuration_state() -> Dict[str, Any]:
+    r"""
+    Collect the settings stored in FrontendConfiguration, so that they can be handed over to worker processes.
+    """
+    return {name: getattr(FrontendConfiguration, name) for name in ["paths_to_compilation_units", "provided_input_path",
+                                                                     "logging_level", "target_platform", "install_path",
+                                                                     "target_path", "module_name", "store_log", "suffix",
+                                                                     "is_dev", "codegen_opts", "codegen_opts_fn", "jobs",
+                                                                     "cache_dir", "cache_max_size", "ode_cache_dir", "profile",
+                                                                     "bounded_log"]}
+
+
+def _init_worker(frontend_configuration_state: Mapping[str, Any]) -> None:
+    r"""
+    Initializer for worker processes: restore the frontend configuration and set up the predefined symbols.
+    """
+    for name, value in frontend_configuration_state.items():
+        setattr(FrontendConfiguration, name, value)
+
+    # messages are written to the log file by the main process, after they have been merged into its log
+    Logger.log_writer = None
+
+    Logger.init_logger(Logger.string_to_level(FrontendConfiguration.get_logging_level()),
+                       bounded=FrontendConfiguration.bounded_log, store_suppressed=FrontendConfiguration.store_log)
+    Profiler.init_profiler(FrontendConfiguration.get_profile() is not None)
+    sys.setrecursionlimit(10000)
+    init_predefined()
+
+
+def _parse_model_worker(nestml_file: str):
+    r"""
+    Parse (and check) a single file in a worker process.
+
+    Returns the compilation unit together with the log entries, message counts and profiler records that were recorded while processing it. These are returned in the same tuple, so that references to models inside the log entries remain intact after transfer to the main process.
+    """
+    from pynestml.utils.model_parser import ModelParser
+
+    Logger.set_log({}, Logger.curr_message)
+    Profiler.init_profiler(Profiler.enabled)
+    with Profiler.phase("parse", detail=nestml_file):
+        parsed_unit = ModelParser.parse_model(nestml_file)
+    return parsed_unit, list(Logger.get_log().values()), Logger.get_message_counts(), Profiler.get_records()
+
+
+def _generate_per_model_code_worker(models: Sequence[Union[ASTNeuron, ASTSynapse]], codegen_opts: Mapping[str, Any]):
+    r"""
+    Analyse, transform and generate code for a group of models in a worker process. The code generator is created upon the first invocation, and reused afterwards.
+
+    Returns the transformed models together with the log entries, message counts and profiler records that were recorded while processing them.
+    """
+    global _worker_code_generator
+
+    if _worker_code_generator is None:
+        Logger.freeze_log()     # messages issued while creating the code generator were already logged by the main process
+        _worker_code_generator = code_generator_from_target_name(FrontendConfiguration.get_target_platform())
+        _worker_code_generator.set_options(codegen_opts)
+        Logger.freeze_log(False)
+
+    Logger.set_log({}, Logger.curr_message)
+    Profiler.init_profiler(Profiler.enabled)
+    _worker_code_generator.generate_per_model_code(models)
+    return models, list(Logger.get_log().values()), Logger.get_message_counts(), Profiler.get_records()
+
+
+def _generate_per_model_code_in_pool(pool, models: Sequence[Union[ASTNeuron, ASTSynapse]], codegen_opts: Mapping[str, Any]) -> List[Union[ASTNeuron, ASTSynapse]]:
+    r"""
+    Distribute the per-model code generation over the worker processes in the pool. A co-generated neuron and synapse reference each other, and are therefore always processed by the same worker.
+
+    Returns the models as transformed by the workers, in the same order as they were passed in.
+    """
+    model_groups = []
+    model_group_indices = []
+    for idx, model in enumerate(models):
+        if any([idx in indices for indices in model_group_indices]):
+            continue
+
+        indices = [idx]
+        for partner_attr in ["paired_neuron", "paired_synapse"]:
+            if partner_attr in dir(model):
+                for partner_idx, partner in enumerate(models):
+                    if partner is getattr(model, partner_attr) and partner_idx not in indices:
+                        indices.append(partner_idx)
+
+        model_groups.append([models[i] for i in indices])
+        model_group_indices.append(indices)
+
+    processed_models = list(models)
+    for indices, (processed_group, log_entries, message_counts, profiler_records) in zip(model_group_indices,
+                                                                         pool.starmap(_generate_per_model_code_worker,
+                                                                                      [(model_group, codegen_opts) for model_group in model_groups])):
+        Logger.merge_log(log_entries, message_counts)
+        Profiler.merge_records(profiler_records)
+        for idx, processed_model in zip(indices, processed_group):
+            processed_models[idx] = processed_model
+
+    return processed_models
+
+
 def init_predefined():
+    r"""
+    Initialize the predefined units, types, functions and variables.
+
+    They are registered only once per process; a snapshot is kept and restored on later calls. If an incremental build cache is used, the table of units (which is relatively expensive to obtain from astropy) is stored in the cache, so that the first call in later processes is faster as well.
+    """
+    from pynestml.symbols.predefined_functions import PredefinedFunctions
+    from pynestml.symbols.predefined_types import PredefinedTypes
+    from pynestml.symbols.predefined_units import PredefinedUnits
+    from pynestml.symbols.predefined_variables import PredefinedVariables
+
+    predefined = [PredefinedUnits, PredefinedTypes, PredefinedFunctions, PredefinedVariables]
+    if all([cls.has_snapshot() for cls in predefined]):
+        for cls in predefined:
+            cls.restore()
+        return
+
     # initialize the predefined elements
-    PredefinedUnits.register_units()
+    PredefinedUnits.register_units(unit_table=_get_unit_table())
     PredefinedTypes.register_types()
     PredefinedFunctions.register_functions()
     PredefinedVariables.register_variables()
 
+    for cls in predefined:
+        cls.snapshot()
+
+
+def _get_unit_table() -> Optional[List[Tuple[str, List[str]]]]:
+    r"""
+    Obtain the table of predefined units from the incremental build cache, if it is used. If the cache does not yet contain the table, it is computed and stored.
+    :return: the table of units, or None if no cache is used
+    """
+    if FrontendConfiguration.get_cache_dir() is None:
+        return None
+
+    import astropy
+    from pynestml.symbols.predefined_units import PredefinedUnits
+    from pynestml.utils.disk_cache import DiskCache
+
+    cache = DiskCache(FrontendConfiguration.get_cache_dir(),
+                      max_size=FrontendConfiguration.get_cache_max_size() * 1024**2)
+    key = DiskCache.compute_key("unit_table", astropy.__version__)
+    unit_table = cache.get_object(key)
+    if unit_table is None:
+        unit_table = PredefinedUnits.get_unit_table()
+        cache.put_object(key, unit_table)
+
+    return unit_table
+
 
 def create_report_dir():
     if not os.path.isdir(os.path.join(FrontendConfiguration.get_target_path(), "..", "report")):
@@ -37,6 +37,8 @@ class ASTArithmeticOperator(ASTNode):
         is_pow_op = False  # type:bool
     """
 
+    __slots__ = ("is_times_op", "is_div_op", "is_modulo_op", "is_plus_op", "is_minus_op", "is_pow_op")
+
     def __init__(self, is_times_op: bool, is_div_op: bool, is_modulo_op: bool, is_plus_op: bool, is_minus_op: bool, is_pow_op: bool, *args, **kwargs):
         super(ASTArithmeticOperator, self).__init__(*args, **kwargs)
         assert ((is_times_op + is_div_op + is_modulo_op + is_plus_op + is_minus_op + is_pow_op) == 1), \
@@ -65,23 +67,13 @@ class ASTArithmeticOperator(ASTNode):
                                     source_position=self.source_position,
                                     scope=self.scope,
                                     comment=self.comment,
-                                    pre_comments=[s for s in self.pre_comments],
+                                    pre_comments=self.pre_comments,
                                     in_comment=self.in_comment,
-                                    post_comments=[s for s in self.post_comments],
+                                    post_comments=self.post_comments,
                                     implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
 
-    def get_parent(self, ast):
-        """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
-        """
-        return None
-
     def equals(self, other):
         # type: (ASTNode) -> bool
         """
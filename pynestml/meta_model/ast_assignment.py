@@ -19,7 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Optional
+from typing import List, Optional
 
 from pynestml.meta_model.ast_node import ASTNode
 from pynestml.meta_model.ast_variable import ASTVariable
@@ -47,6 +47,8 @@ class ASTAssignment(ASTNode):
         rhs = None
     """
 
+    __slots__ = ("lhs", "is_direct_assignment", "is_compound_sum", "is_compound_minus", "is_compound_product", "is_compound_quotient", "rhs")
+
     def __init__(self, lhs: Optional[ASTVariable] = None, is_direct_assignment: bool = False, is_compound_sum: bool = False, is_compound_minus: bool = False,
                  is_compound_product: bool = False, is_compound_quotient: bool = False, rhs: Optional[ASTExpression] = None, *args, **kwargs):
         """
@@ -77,6 +79,7 @@ class ASTAssignment(ASTNode):
         self.is_compound_product = is_compound_product
         self.is_compound_quotient = is_compound_quotient
         self.rhs = rhs
+        self.link_children()
 
     def clone(self):
         """
@@ -102,9 +105,9 @@ class ASTAssignment(ASTNode):
                             source_position=self.source_position,
                             scope=self.scope,
                             comment=self.comment,
-                            pre_comments=[s for s in self.pre_comments],
+                            pre_comments=self.pre_comments,
                             in_comment=self.in_comment,
-                            post_comments=[s for s in self.post_comments],
+                            post_comments=self.post_comments,
                             implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -125,23 +128,12 @@ class ASTAssignment(ASTNode):
         """
         return self.rhs
 
-    def get_parent(self, ast):
+    def get_children(self) -> List[ASTNode]:
         """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
+        Returns the children of this node, if any.
+        :return: List of children of this node.
         """
-        if self.get_variable() is ast:
-            return self
-        if self.get_expression() is ast:
-            return self
-        if self.get_variable().get_parent(ast) is not None:
-            return self.get_variable().get_parent(ast)
-        if self.get_expression().get_parent(ast) is not None:
-            return self.get_expression().get_parent(ast)
-        return None
+        return [child for child in [self.lhs, self.rhs] if child is not None]
 
     def equals(self, other):
         """
@@ -35,6 +35,8 @@ class ASTBitOperator(ASTNode):
         is_bit_shift_right = False
     """
 
+    __slots__ = ("is_bit_shift_right", "is_bit_shift_left", "is_bit_or", "is_bit_xor", "is_bit_and")
+
     def __init__(self, is_bit_and=False, is_bit_xor=False, is_bit_or=False, is_bit_shift_left=False,
                  is_bit_shift_right=False, *args, **kwargs):
         """
@@ -76,23 +78,13 @@ class ASTBitOperator(ASTNode):
                              source_position=self.source_position,
                              scope=self.scope,
                              comment=self.comment,
-                             pre_comments=[s for s in self.pre_comments],
+                             pre_comments=self.pre_comments,
                              in_comment=self.in_comment,
-                             post_comments=[s for s in self.post_comments],
+                             post_comments=self.post_comments,
                              implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
 
-    def get_parent(self, ast):
-        """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
-        """
-        return None
-
     def equals(self, other):
         """
         The equals method.
@@ -19,6 +19,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import List
+
 from pynestml.meta_model.ast_node import ASTNode
 
 
@@ -31,6 +33,8 @@ class ASTBlock(ASTNode):
         stmts = None
     """
 
+    __slots__ = ("stmts",)
+
     def __init__(self, stmts, *args, **kwargs):
         """
         Standard constructor.
@@ -49,6 +53,7 @@ class ASTBlock(ASTNode):
 
         super(ASTBlock, self).__init__(*args, **kwargs)
         self.stmts = stmts
+        self.link_children()
 
     def clone(self):
         """
@@ -63,9 +68,9 @@ class ASTBlock(ASTNode):
                        source_position=self.source_position,
                        scope=self.scope,
                        comment=self.comment,
-                       pre_comments=[s for s in self.pre_comments],
+                       pre_comments=self.pre_comments,
                        in_comment=self.in_comment,
-                       post_comments=[s for s in self.post_comments],
+                       post_comments=self.post_comments,
                        implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -85,6 +90,7 @@ class ASTBlock(ASTNode):
         :type stmt: ASTSmallStmt,ASTCompoundStmt
         """
         self.stmts.append(stmt)
+        stmt.parent = self
 
     def delete_stmt(self, stmt):
         """
@@ -96,20 +102,12 @@ class ASTBlock(ASTNode):
         """
         self.stmts.remove(stmt)
 
-    def get_parent(self, ast):
+    def get_children(self) -> List[ASTNode]:
         """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
+        Returns the children of this node, if any.
+        :return: List of children of this node.
         """
-        for stmt in self.get_stmts():
-            if stmt is ast:
-                return self
-            if stmt.get_parent(ast) is not None:
-                return stmt.get_parent(ast)
-        return None
+        return list(self.stmts)
 
     def equals(self, other):
         """
@@ -19,6 +19,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import List
+
 from pynestml.meta_model.ast_node import ASTNode
 
 
@@ -47,6 +49,8 @@ class ASTBlockWithVariables(ASTNode):
         declarations = None
     """
 
+    __slots__ = ("declarations", "is_internals", "is_parameters", "is_state")
+
     def __init__(self, is_state=False, is_parameters=False, is_internals=False,
                  declarations=None, *args, **kwargs):
         """
@@ -74,6 +78,7 @@ class ASTBlockWithVariables(ASTNode):
         self.is_internals = is_internals
         self.is_parameters = is_parameters
         self.is_state = is_state
+        self.link_children()
 
     def clone(self):
         """
@@ -93,9 +98,9 @@ class ASTBlockWithVariables(ASTNode):
                                     source_position=self.source_position,
                                     scope=self.scope,
                                     comment=self.comment,
-                                    pre_comments=[s for s in self.pre_comments],
+                                    pre_comments=self.pre_comments,
                                     in_comment=self.in_comment,
-                                    post_comments=[s for s in self.post_comments],
+                                    post_comments=self.post_comments,
                                     implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -115,20 +120,12 @@ class ASTBlockWithVariables(ASTNode):
         del self.declarations
         self.declarations = list()
 
-    def get_parent(self, ast=None):
+    def get_children(self) -> List[ASTNode]:
         """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
+        Returns the children of this node, if any.
+        :return: List of children of this node.
         """
-        for stmt in self.get_declarations():
-            if stmt is ast:
-                return self
-            if stmt.get_parent(ast) is not None:
-                return stmt.get_parent(ast)
-        return None
+        return list(self.declarations)
 
     def equals(self, other=None):
         """
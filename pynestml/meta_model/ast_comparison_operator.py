@@ -37,6 +37,8 @@ class ASTComparisonOperator(ASTNode):
         is_gt = False
     """
 
+    __slots__ = ("is_gt", "is_ge", "is_ne2", "is_ne", "is_eq", "is_le", "is_lt")
+
     def __init__(self, is_lt=False, is_le=False, is_eq=False, is_ne=False, is_ne2=False, is_ge=False,
                  is_gt=False, *args, **kwargs):
         """
@@ -88,23 +90,13 @@ class ASTComparisonOperator(ASTNode):
                                     source_position=self.source_position,
                                     scope=self.scope,
                                     comment=self.comment,
-                                    pre_comments=[s for s in self.pre_comments],
+                                    pre_comments=self.pre_comments,
                                     in_comment=self.in_comment,
-                                    post_comments=[s for s in self.post_comments],
+                                    post_comments=self.post_comments,
                                     implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
 
-    def get_parent(self, ast):
-        """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
-        """
-        return None
-
     def equals(self, other):
         """
         The equals method.
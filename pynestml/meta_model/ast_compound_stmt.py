@@ -19,6 +19,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import List
+
 from pynestml.meta_model.ast_for_stmt import ASTForStmt
 from pynestml.meta_model.ast_if_stmt import ASTIfStmt
 from pynestml.meta_model.ast_node import ASTNode
@@ -38,6 +40,8 @@ class ASTCompoundStmt(ASTNode):
         for_stmt = None
     """
 
+    __slots__ = ("if_stmt", "while_stmt", "for_stmt")
+
     def __init__(self, if_stmt=None, while_stmt=None, for_stmt=None, *args, **kwargs):
         """
         Standard constructor.
@@ -63,6 +67,7 @@ class ASTCompoundStmt(ASTNode):
         self.for_stmt = for_stmt
         assert self.is_if_stmt() + self.is_while_stmt() + self.is_for_stmt() == 1, \
             '(PyNestML.ASTCompoundStmt) Please provide precisely one if, while or for statement'
+        self.link_children()
 
     def clone(self):
         """
@@ -87,9 +92,9 @@ class ASTCompoundStmt(ASTNode):
                               source_position=self.source_position,
                               scope=self.scope,
                               comment=self.comment,
-                              pre_comments=[s for s in self.pre_comments],
+                              pre_comments=self.pre_comments,
                               in_comment=self.in_comment,
-                              post_comments=[s for s in self.post_comments],
+                              post_comments=self.post_comments,
                               implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -142,30 +147,12 @@ class ASTCompoundStmt(ASTNode):
         """
         return self.for_stmt
 
-    def get_parent(self, ast):
-        """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
-        """
-        if self.is_if_stmt():
-            if self.get_if_stmt() is ast:
-                return self
-            if self.get_if_stmt().get_parent(ast) is not None:
-                return self.get_if_stmt().get_parent(ast)
-        if self.is_while_stmt():
-            if self.get_while_stmt() is ast:
-                return self
-            if self.get_while_stmt().get_parent(ast) is not None:
-                return self.get_while_stmt().get_parent(ast)
-        if self.is_for_stmt():
-            if self.is_for_stmt() is ast:
-                return self
-            if self.get_for_stmt().get_parent(ast) is not None:
-                return self.get_for_stmt().get_parent(ast)
-        return None
+    def get_children(self) -> List[ASTNode]:
+        """
+        Returns the children of this node, if any.
+        :return: List of children of this node.
+        """
+        return [child for child in [self.if_stmt, self.while_stmt, self.for_stmt] if child is not None]
 
     def equals(self, other):
         """
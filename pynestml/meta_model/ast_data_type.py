@@ -19,7 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Optional
+from typing import List, Optional
 
 from pynestml.meta_model.ast_node import ASTNode
 from pynestml.meta_model.ast_unit_type import ASTUnitType
@@ -48,6 +48,8 @@ class ASTDataType(ASTNode):
         type_symbol = None  # the corresponding type symbol
     """
 
+    __slots__ = ("is_integer", "is_real", "is_string", "is_boolean", "is_void", "unit_type", "type_symbol")
+
     def __init__(self, is_integer=False, is_real=False, is_string=False, is_boolean=False, is_void=False,
                  unit_type: Optional[ASTUnitType] = None, type_symbol=None, *args, **kwargs):
         """
@@ -76,6 +78,7 @@ class ASTDataType(ASTNode):
         self.is_void = is_void
         self.unit_type = unit_type
         self.type_symbol = type_symbol
+        self.link_children()
 
     def clone(self):
         """
@@ -98,9 +101,9 @@ class ASTDataType(ASTNode):
                           source_position=self.source_position,
                           scope=self.scope,
                           comment=self.comment,
-                          pre_comments=[s for s in self.pre_comments],
+                          pre_comments=self.pre_comments,
                           in_comment=self.in_comment,
-                          post_comments=[s for s in self.post_comments],
+                          post_comments=self.post_comments,
                           implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -142,20 +145,12 @@ class ASTDataType(ASTNode):
             '(PyNestML.AST.DataType) No or wrong type of type symbol provided (%s)!' % (type(type_symbol))
         self.type_symbol = type_symbol
 
-    def get_parent(self, ast):
+    def get_children(self) -> List[ASTNode]:
         """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
+        Returns the children of this node, if any.
+        :return: List of children of this node.
         """
-        if self.is_unit_type():
-            if self.get_unit_type() is ast:
-                return self
-            if self.get_unit_type().get_parent(ast) is not None:
-                return self.get_unit_type().get_parent(ast)
-        return None
+        return [self.unit_type] if self.unit_type is not None else []
 
     def equals(self, other):
         """
@@ -60,6 +60,8 @@ class ASTDeclaration(ASTNode):
         invariant = None
     """
 
+    __slots__ = ("is_recordable", "is_inline_expression", "variables", "data_type", "size_parameter", "expression", "invariant", "decorators")
+
     def __init__(self, is_recordable: bool = False, is_inline_expression: bool = False, _variables: Optional[List[ASTVariable]] = None, data_type: Optional[ASTDataType] = None, size_parameter: Optional[str] = None,
                  expression: Optional[ASTExpression] = None, invariant: Optional[ASTExpression] = None, decorators=None, *args, **kwargs):
         """
@@ -88,6 +90,7 @@ class ASTDeclaration(ASTNode):
         self.expression = expression
         self.invariant = invariant
         self.decorators = decorators
+        self.link_children()
 
     def clone(self):
         """
@@ -123,9 +126,9 @@ class ASTDeclaration(ASTNode):
                              source_position=self.source_position,
                              scope=self.scope,
                              comment=self.comment,
-                             pre_comments=[s for s in self.pre_comments],
+                             pre_comments=self.pre_comments,
                              in_comment=self.in_comment,
-                             post_comments=[s for s in self.post_comments],
+                             post_comments=self.post_comments,
                              implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -196,6 +199,8 @@ class ASTDeclaration(ASTNode):
     def set_expression(self, expr):
         # type: (ASTExpression) -> None
         self.expression = expr
+        if expr is not None:
+            expr.parent = self
 
     def has_invariant(self):
         """
@@ -213,34 +218,12 @@ class ASTDeclaration(ASTNode):
         """
         return self.invariant
 
-    def get_parent(self, ast):
+    def get_children(self) -> List[ASTNode]:
         """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
+        Returns the children of this node, if any.
+        :return: List of children of this node.
         """
-        for var in self.get_variables():
-            if var is ast:
-                return self
-            if var.get_parent(ast) is not None:
-                return var.get_parent(ast)
-        if self.get_data_type() is ast:
-            return self
-        if self.get_data_type().get_parent(ast) is not None:
-            return self.get_data_type().get_parent(ast)
-        if self.has_expression():
-            if self.get_expression() is ast:
-                return self
-            if self.get_expression().get_parent(ast) is not None:
-                return self.get_expression().get_parent(ast)
-        if self.has_invariant():
-            if self.get_invariant() is ast:
-                return self
-            if self.get_invariant().get_parent(ast) is not None:
-                return self.get_invariant().get_parent(ast)
-        return None
+        return list(self.variables) + [child for child in [self.data_type, self.expression, self.invariant] if child is not None]
 
     def equals(self, other):
         """
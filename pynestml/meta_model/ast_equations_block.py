@@ -19,7 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Any, Sequence
+from typing import Any, List, Sequence
 
 from pynestml.meta_model.ast_node import ASTNode
 from pynestml.meta_model.ast_ode_equation import ASTOdeEquation
@@ -46,6 +46,8 @@ class ASTEquationsBlock(ASTNode):
         declarations = None
     """
 
+    __slots__ = ("declarations",)
+
     def __init__(self, declarations, *args, **kwargs):
         """
         Standard constructor.
@@ -64,6 +66,7 @@ class ASTEquationsBlock(ASTNode):
                 '(PyNestML.AST.EquationsBlock) No or wrong type of ode-element provided (%s)' % type(decl)
         super(ASTEquationsBlock, self).__init__(*args, **kwargs)
         self.declarations = declarations
+        self.link_children()
 
     def clone(self):
         """
@@ -80,9 +83,9 @@ class ASTEquationsBlock(ASTNode):
                                 source_position=self.source_position,
                                 scope=self.scope,
                                 comment=self.comment,
-                                pre_comments=[s for s in self.pre_comments],
+                                pre_comments=self.pre_comments,
                                 in_comment=self.in_comment,
-                                post_comments=[s for s in self.post_comments],
+                                post_comments=self.post_comments,
                                 implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -95,20 +98,12 @@ class ASTEquationsBlock(ASTNode):
         """
         return self.declarations
 
-    def get_parent(self, ast):
+    def get_children(self) -> List[ASTNode]:
         """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
+        Returns the children of this node, if any.
+        :return: List of children of this node.
         """
-        for decl in self.get_declarations():
-            if decl is ast:
-                return self
-            if decl.get_parent(ast) is not None:
-                return decl.get_parent(ast)
-        return None
+        return list(self.declarations)
 
     def get_ode_equations(self) -> Sequence[ASTOdeEquation]:
         """
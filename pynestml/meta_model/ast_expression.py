@@ -19,9 +19,10 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 from __future__ import annotations
-from typing import Union
+from typing import List, Union
 
 from pynestml.meta_model.ast_expression_node import ASTExpressionNode
+from pynestml.meta_model.ast_node import ASTNode
 from pynestml.meta_model.ast_logical_operator import ASTLogicalOperator
 from pynestml.meta_model.ast_arithmetic_operator import ASTArithmeticOperator
 from pynestml.meta_model.ast_bit_operator import ASTBitOperator
@@ -64,6 +65,8 @@ class ASTExpression(ASTExpressionNode):
         simple_expression = None
     """
 
+    __slots__ = ("is_encapsulated", "is_logical_not", "unary_operator", "expression", "lhs", "binary_operator", "rhs", "condition", "if_true", "if_not", "has_delay")
+
     def __init__(self, is_encapsulated: bool = False, unary_operator: ASTUnaryOperator = None,
                  is_logical_not: bool = False, expression: ASTExpression = None, lhs: ASTExpression = None,
                  binary_operator: Union[ASTLogicalOperator, ASTComparisonOperator, ASTBitOperator,
@@ -102,6 +105,7 @@ class ASTExpression(ASTExpressionNode):
         self.if_true = if_true
         self.if_not = if_not
         self.has_delay = has_delay
+        self.link_children()
 
     def clone(self):
         """
@@ -149,9 +153,9 @@ class ASTExpression(ASTExpressionNode):
                             source_position=self.source_position,
                             scope=self.scope,
                             comment=self.comment,
-                            pre_comments=[s for s in self.pre_comments],
+                            pre_comments=self.pre_comments,
                             in_comment=self.in_comment,
-                            post_comments=[s for s in self.post_comments],
+                            post_comments=self.post_comments,
                             implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -314,51 +318,12 @@ class ASTExpression(ASTExpressionNode):
             ret.extend(self.get_if_not().get_function_calls())
         return ret
 
-    def get_parent(self, ast=None):
+    def get_children(self) -> List[ASTNode]:
         """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
+        Returns the children of this node, if any.
+        :return: List of children of this node.
         """
-        if self.is_expression():
-            if self.get_expression() is ast:
-                return self
-            if self.get_expression().get_parent(ast) is not None:
-                return self.get_expression().get_parent(ast)
-        if self.is_unary_operator():
-            if self.get_unary_operator() is ast:
-                return self
-            if self.get_unary_operator().get_parent(ast) is not None:
-                return self.get_unary_operator().get_parent(ast)
-        if self.is_compound_expression():
-            if self.get_lhs() is ast:
-                return self
-            if self.get_lhs().get_parent(ast) is not None:
-                return self.get_lhs().get_parent(ast)
-            if self.get_binary_operator() is ast:
-                return self
-            if self.get_binary_operator().get_parent(ast) is not None:
-                return self.get_binary_operator().get_parent(ast)
-            if self.get_rhs() is ast:
-                return self
-            if self.get_rhs().get_parent(ast) is not None:
-                return self.get_rhs().get_parent(ast)
-        if self.is_ternary_operator():
-            if self.get_condition() is ast:
-                return self
-            if self.get_condition().get_parent(ast) is not None:
-                return self.get_condition().get_parent(ast)
-            if self.get_if_true() is ast:
-                return self
-            if self.get_if_true().get_parent(ast) is not None:
-                return self.get_if_true().get_parent(ast)
-            if self.get_if_not() is ast:
-                return self
-            if self.get_if_not().get_parent(ast) is not None:
-                return self.get_if_not().get_parent(ast)
-        return None
+        return [child for child in [self.expression, self.unary_operator, self.binary_operator, self.lhs, self.rhs, self.condition, self.if_true, self.if_not] if child is not None]
 
     def equals(self, other):
         """
@@ -30,12 +30,13 @@ class ASTExpressionNode(ASTNode):
 
     This class is abstract, thus no instances can be created.
     """
-    __type = None
-    __typeEither = None
+
+    __slots__ = ("__type",)
     __metaclass__ = ABCMeta
 
     def __init__(self, *args, **kwargs):
         super(ASTExpressionNode, self).__init__(*args, **kwargs)
+        self.__type = None
 
     @property
     def type(self):
@@ -48,8 +49,5 @@ class ASTExpressionNode(ASTNode):
     def type(self, _value):
         self.__type = _value
 
-    def get_parent(self, ast):
-        pass
-
     def equals(self, other):
         pass
@@ -30,8 +30,8 @@ class ASTExternalVariable(ASTVariable):
     r"""
     This class is used to store a single "external" variable: a variable the value of which is obtained during runtime from a neuron's postsynaptic partner.
     """
-    _altscope = None
-    _altname = None
+
+    __slots__ = ("_altname", "_altscope")
 
     def __init__(self, name, altname=None, altscope=None, *args, **kwargs):
         r"""
@@ -56,9 +56,9 @@ class ASTExternalVariable(ASTVariable):
                                    source_position=self.get_source_position(),
                                    scope=self.scope,
                                    comment=self.comment,
-                                   pre_comments=[s for s in self.pre_comments],
+                                   pre_comments=self.pre_comments,
                                    in_comment=self.in_comment,
-                                   post_comments=[s for s in self.post_comments],
+                                   post_comments=self.post_comments,
                                    implicit_conversion_factor=self.implicit_conversion_factor)
 
     def update_alt_scope(self, scope):
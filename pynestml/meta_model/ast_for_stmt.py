@@ -18,6 +18,8 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+from typing import List
+
 from pynestml.meta_model.ast_node import ASTNode
 from pynestml.meta_model.ast_expression import ASTExpression
 
@@ -36,6 +38,8 @@ class ASTForStmt(ASTNode):
         block = None
     """
 
+    __slots__ = ("block", "step", "end_at", "start_from", "variable")
+
     def __init__(self, variable, start_from, end_at, step, block, *args, **kwargs):
         """
         Standard constructor.
@@ -59,6 +63,7 @@ class ASTForStmt(ASTNode):
         self.end_at = end_at
         self.start_from = start_from
         self.variable = variable
+        self.link_children()
 
     def clone(self):
         """
@@ -91,9 +96,9 @@ class ASTForStmt(ASTNode):
                          source_position=self.source_position,
                          scope=self.scope,
                          comment=self.comment,
-                         pre_comments=[s for s in self.pre_comments],
+                         pre_comments=self.pre_comments,
                          in_comment=self.in_comment,
-                         post_comments=[s for s in self.post_comments],
+                         post_comments=self.post_comments,
                          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -138,27 +143,12 @@ class ASTForStmt(ASTNode):
         """
         return self.block
 
-    def get_parent(self, ast):
-        """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
-        """
-        if self.get_start_from() is ast:
-            return self
-        if self.get_start_from().get_parent(ast) is not None:
-            return self.get_start_from().get_parent(ast)
-        if self.get_end_at() is ast:
-            return self
-        if self.get_end_at().get_parent(ast) is not None:
-            return self.get_end_at().get_parent(ast)
-        if self.get_block() is ast:
-            return self
-        if self.get_block().get_parent(ast) is not None:
-            return self.get_block().get_parent(ast)
-        return None
+    def get_children(self) -> List[ASTNode]:
+        """
+        Returns the children of this node, if any.
+        :return: List of children of this node.
+        """
+        return [child for child in [self.start_from, self.end_at, self.block] if child is not None]
 
     def equals(self, other):
         """
@@ -19,6 +19,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import List
+
 from copy import copy
 
 from pynestml.meta_model.ast_node import ASTNode
@@ -50,6 +52,8 @@ class ASTFunction(ASTNode):
         type_symbol = None
     """
 
+    __slots__ = ("block", "return_type", "parameters", "name", "type_symbol")
+
     def __init__(self, name, parameters, return_type, block, type_symbol=None, *args, **kwargs):
         """
         Standard constructor.
@@ -71,6 +75,7 @@ class ASTFunction(ASTNode):
         self.parameters = parameters
         self.name = name
         self.type_symbol = type_symbol
+        self.link_children()
 
     def clone(self):
         """
@@ -97,9 +102,9 @@ class ASTFunction(ASTNode):
                           source_position=self.source_position,
                           scope=self.scope,
                           comment=self.comment,
-                          pre_comments=[s for s in self.pre_comments],
+                          pre_comments=self.pre_comments,
                           in_comment=self.in_comment,
-                          post_comments=[s for s in self.post_comments],
+                          post_comments=self.post_comments,
                           implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -168,29 +173,12 @@ class ASTFunction(ASTNode):
         """
         self.type_symbol = type_symbol
 
-    def get_parent(self, ast):
-        """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
-        """
-        for param in self.get_parameters():
-            if param is ast:
-                return self
-            if param.get_parent(ast) is not None:
-                return param.get_parent(ast)
-        if self.has_return_type():
-            if self.get_return_type() is ast:
-                return self
-            if self.get_return_type().get_parent(ast) is not None:
-                return self.get_return_type().get_parent(ast)
-        if self.get_block() is ast:
-            return self
-        if self.get_block().get_parent(ast) is not None:
-            return self.get_block().get_parent(ast)
-        return None
+    def get_children(self) -> List[ASTNode]:
+        """
+        Returns the children of this node, if any.
+        :return: List of children of this node.
+        """
+        return list(self.parameters) + [child for child in [self.return_type, self.block] if child is not None]
 
     def equals(self, other):
         """
@@ -19,6 +19,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import List
+
 from pynestml.meta_model.ast_node import ASTNode
 
 
@@ -35,6 +37,8 @@ class ASTFunctionCall(ASTNode):
         args = None
     """
 
+    __slots__ = ("callee_name", "args")
+
     def __init__(self, callee_name, function_call_args, *args, **kwargs):
         """
         Standard constructor.
@@ -50,6 +54,7 @@ class ASTFunctionCall(ASTNode):
         assert type(callee_name) is str
         self.callee_name = callee_name
         self.args = function_call_args
+        self.link_children()
 
     def clone(self):
         """
@@ -67,9 +72,9 @@ class ASTFunctionCall(ASTNode):
                               source_position=self.source_position,
                               scope=self.scope,
                               comment=self.comment,
-                              pre_comments=[s for s in self.pre_comments],
+                              pre_comments=self.pre_comments,
                               in_comment=self.in_comment,
-                              post_comments=[s for s in self.post_comments],
+                              post_comments=self.post_comments,
                               implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -98,20 +103,12 @@ class ASTFunctionCall(ASTNode):
         """
         return self.args
 
-    def get_parent(self, ast):
+    def get_children(self) -> List[ASTNode]:
         """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
+        Returns the children of this node, if any.
+        :return: List of children of this node.
         """
-        for param in self.get_args():
-            if param is ast:
-                return self
-            if param.get_parent(ast) is not None:
-                return param.get_parent(ast)
-        return None
+        return list(self.args)
 
     def equals(self, other):
         """
@@ -19,6 +19,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import List
+
 from pynestml.meta_model.ast_node import ASTNode
 
 
@@ -32,6 +34,8 @@ class ASTIfClause(ASTNode):
         block = None
     """
 
+    __slots__ = ("block", "condition")
+
     def __init__(self, condition, block, *args, **kwargs):
         """
         Standard constructor.
@@ -46,6 +50,7 @@ class ASTIfClause(ASTNode):
         super(ASTIfClause, self).__init__(*args, **kwargs)
         self.block = block
         self.condition = condition
+        self.link_children()
 
     def clone(self):
         """
@@ -66,9 +71,9 @@ class ASTIfClause(ASTNode):
                           source_position=self.source_position,
                           scope=self.scope,
                           comment=self.comment,
-                          pre_comments=[s for s in self.pre_comments],
+                          pre_comments=self.pre_comments,
                           in_comment=self.in_comment,
-                          post_comments=[s for s in self.post_comments],
+                          post_comments=self.post_comments,
                           implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -89,23 +94,12 @@ class ASTIfClause(ASTNode):
         """
         return self.block
 
-    def get_parent(self, ast):
+    def get_children(self) -> List[ASTNode]:
         """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: ASTNode
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: Optional[ASTNode]
+        Returns the children of this node, if any.
+        :return: List of children of this node.
         """
-        if self.get_condition() is ast:
-            return self
-        if self.get_condition().get_parent(ast) is not None:
-            return self.get_condition().get_parent(ast)
-        if self.get_block() is ast:
-            return self
-        if self.get_block().get_parent(ast) is not None:
-            return self.get_block().get_parent(ast)
-        return None
+        return [child for child in [self.condition, self.block] if child is not None]
 
     def equals(self, other):
         """
@@ -19,6 +19,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import List
+
 from pynestml.meta_model.ast_node import ASTNode
 
 
@@ -36,6 +38,8 @@ class ASTIfStmt(ASTNode):
         else_clause = None
     """
 
+    __slots__ = ("else_clause", "if_clause", "elif_clauses")
+
     def __init__(self, if_clause, elif_clauses=None, else_clause=None, *args, **kwargs):
         """
         Standard constructor.
@@ -57,6 +61,7 @@ class ASTIfStmt(ASTNode):
         self.else_clause = else_clause
         self.if_clause = if_clause
         self.elif_clauses = elif_clauses
+        self.link_children()
 
     def clone(self):
         """
@@ -81,9 +86,9 @@ class ASTIfStmt(ASTNode):
                         source_position=self.source_position,
                         scope=self.scope,
                         comment=self.comment,
-                        pre_comments=[s for s in self.pre_comments],
+                        pre_comments=self.pre_comments,
                         in_comment=self.in_comment,
-                        post_comments=[s for s in self.post_comments],
+                        post_comments=self.post_comments,
                         implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -128,29 +133,12 @@ class ASTIfStmt(ASTNode):
         """
         return self.else_clause
 
-    def get_parent(self, ast):
-        """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: ASTNode
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: Optional[ASTNode]
-        """
-        if self.get_if_clause() is ast:
-            return self
-        if self.get_if_clause().get_parent(ast) is not None:
-            return self.get_if_clause().get_parent(ast)
-        for elifClause in self.get_elif_clauses():
-            if elifClause is ast:
-                return self
-            if elifClause.get_parent(ast) is not None:
-                return elifClause.get_parent(ast)
-        if self.has_else_clause():
-            if self.get_else_clause() is ast:
-                return self
-            if self.get_else_clause().get_parent(ast) is not None:
-                return self.get_else_clause().get_parent(ast)
-        return None
+    def get_children(self) -> List[ASTNode]:
+        """
+        Returns the children of this node, if any.
+        :return: List of children of this node.
+        """
+        return [self.if_clause] + list(self.elif_clauses) + ([self.else_clause] if self.else_clause is not None else [])
 
     def equals(self, other):
         """
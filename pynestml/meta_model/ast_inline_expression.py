@@ -20,6 +20,8 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
 
+from typing import List
+
 from pynestml.meta_model.ast_expression_node import ASTExpressionNode
 from pynestml.meta_model.ast_node import ASTNode
 
@@ -37,6 +39,8 @@ class ASTInlineExpression(ASTNode):
         expression = None
     """
 
+    __slots__ = ("is_recordable", "variable_name", "data_type", "expression")
+
     def __init__(self, is_recordable=False, variable_name=None, data_type=None, expression=None, *args, **kwargs):
         """
         Standard constructor.
@@ -57,6 +61,7 @@ class ASTInlineExpression(ASTNode):
         self.variable_name = variable_name
         self.data_type = data_type
         self.expression = expression
+        self.link_children()
 
     def clone(self):
         """
@@ -79,9 +84,9 @@ class ASTInlineExpression(ASTNode):
                                   source_position=self.source_position,
                                   scope=self.scope,
                                   comment=self.comment,
-                                  pre_comments=[s for s in self.pre_comments],
+                                  pre_comments=self.pre_comments,
                                   in_comment=self.in_comment,
-                                  post_comments=[s for s in self.post_comments],
+                                  post_comments=self.post_comments,
                                   implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -117,23 +122,12 @@ class ASTInlineExpression(ASTNode):
         """
         return self.expression
 
-    def get_parent(self, ast):
-        """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
-        """
-        if self.get_data_type() is ast:
-            return self
-        if self.get_data_type().get_parent(ast) is not None:
-            return self.get_data_type().get_parent(ast)
-        if self.get_expression() is ast:
-            return self
-        if self.get_expression().get_parent(ast) is not None:
-            return self.get_expression().get_parent(ast)
-        return None
+    def get_children(self) -> List[ASTNode]:
+        """
+        Returns the children of this node, if any.
+        :return: List of children of this node.
+        """
+        return [child for child in [self.data_type, self.expression] if child is not None]
 
     def equals(self, other):
         """
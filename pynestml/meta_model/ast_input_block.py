@@ -19,6 +19,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import List
+
 from pynestml.meta_model.ast_input_port import ASTInputPort
 from pynestml.meta_model.ast_node import ASTNode
 
@@ -45,6 +47,8 @@ class ASTInputBlock(ASTNode):
         input_definitions = None
     """
 
+    __slots__ = ("input_definitions",)
+
     def __init__(self, input_definitions=None, *args, **kwargs):
         """
         Standard constructor.
@@ -63,6 +67,7 @@ class ASTInputBlock(ASTNode):
             assert (definition is not None and isinstance(definition, ASTInputPort)), \
                 '(PyNestML.AST.Input) No or wrong type of input definition provided (%s)!' % type(definition)
         self.input_definitions = input_definitions
+        self.link_children()
 
     def clone(self):
         """
@@ -77,9 +82,9 @@ class ASTInputBlock(ASTNode):
                             source_position=self.source_position,
                             scope=self.scope,
                             comment=self.comment,
-                            pre_comments=[s for s in self.pre_comments],
+                            pre_comments=self.pre_comments,
                             in_comment=self.in_comment,
-                            post_comments=[s for s in self.post_comments],
+                            post_comments=self.post_comments,
                             implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -92,20 +97,12 @@ class ASTInputBlock(ASTNode):
         """
         return self.input_definitions
 
-    def get_parent(self, ast):
+    def get_children(self) -> List[ASTNode]:
         """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
+        Returns the children of this node, if any.
+        :return: List of children of this node.
         """
-        for port in self.get_input_ports():
-            if port is ast:
-                return self
-            if port.get_parent(ast) is not None:
-                return port.get_parent(ast)
-        return None
+        return list(self.input_definitions)
 
     def equals(self, other):
         """
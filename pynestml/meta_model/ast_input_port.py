@@ -55,6 +55,8 @@ class ASTInputPort(ASTNode):
 
     """
 
+    __slots__ = ("name", "signal_type", "size_parameter", "data_type", "input_qualifiers")
+
     def __init__(self,
                  name: str,
                  signal_type: PortSignalType,
@@ -81,6 +83,7 @@ class ASTInputPort(ASTNode):
         self.size_parameter = size_parameter
         self.data_type = data_type
         self.input_qualifiers = input_qualifiers
+        self.link_children()
 
     def clone(self) -> ASTInputPort:
         r"""
@@ -100,9 +103,9 @@ class ASTInputPort(ASTNode):
                            source_position=self.source_position,
                            scope=self.scope,
                            comment=self.comment,
-                           pre_comments=[s for s in self.pre_comments],
+                           pre_comments=self.pre_comments,
                            in_comment=self.in_comment,
-                           post_comments=[s for s in self.post_comments],
+                           post_comments=self.post_comments,
                            implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -196,23 +199,12 @@ class ASTInputPort(ASTNode):
         """
         return self.data_type
 
-    def get_parent(self, ast: ASTNode) -> Optional[ASTNode]:
-        r"""
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :return: AST if this or one of the child nodes contains the handed over element.
-        """
-        if self.has_datatype():
-            if self.get_datatype() is ast:
-                return self
-            if self.get_datatype().get_parent(ast) is not None:
-                return self.get_datatype().get_parent(ast)
-        for qual in self.get_input_qualifiers():
-            if qual is ast:
-                return self
-            if qual.get_parent(ast) is not None:
-                return qual.get_parent(ast)
-        return None
+    def get_children(self) -> List[ASTNode]:
+        """
+        Returns the children of this node, if any.
+        :return: List of children of this node.
+        """
+        return ([self.data_type] if self.data_type is not None else []) + list(self.input_qualifiers)
 
     def equals(self, other: Any) -> bool:
         r"""
@@ -38,6 +38,8 @@ class ASTInputQualifier(ASTNode):
         is_excitatory = False
     """
 
+    __slots__ = ("is_excitatory", "is_inhibitory")
+
     def __init__(self, is_inhibitory=False, is_excitatory=False, *args, **kwargs):
         """
         Standard constructor.
@@ -66,23 +68,13 @@ class ASTInputQualifier(ASTNode):
                                 source_position=self.source_position,
                                 scope=self.scope,
                                 comment=self.comment,
-                                pre_comments=[s for s in self.pre_comments],
+                                pre_comments=self.pre_comments,
                                 in_comment=self.in_comment,
-                                post_comments=[s for s in self.post_comments],
+                                post_comments=self.post_comments,
                                 implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
 
-    def get_parent(self, ast):
-        """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: ASTNode
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: Optional[ASTNode]
-        """
-        return None
-
     def equals(self, other):
         """
         The equals method.
@@ -19,6 +19,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import List
+
 from pynestml.meta_model.ast_node import ASTNode
 
 
@@ -29,6 +31,8 @@ class ASTKernel(ASTNode):
         kernel : KERNEL_KEYWORD variable EQUALS expression (COMMA variable EQUALS expression)* (SEMICOLON)?;
     """
 
+    __slots__ = ("variables", "expressions")
+
     def __init__(self, variables, expressions, *args, **kwargs):
         """
         Standard constructor.
@@ -43,6 +47,7 @@ class ASTKernel(ASTNode):
         super(ASTKernel, self).__init__(*args, **kwargs)
         self.variables = variables
         self.expressions = expressions
+        self.link_children()
 
     def clone(self):
         """
@@ -63,9 +68,9 @@ class ASTKernel(ASTNode):
                         source_position=self.source_position,
                         scope=self.scope,
                         comment=self.comment,
-                        pre_comments=[s for s in self.pre_comments],
+                        pre_comments=self.pre_comments,
                         in_comment=self.in_comment,
-                        post_comments=[s for s in self.post_comments],
+                        post_comments=self.post_comments,
                         implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -94,29 +99,12 @@ class ASTKernel(ASTNode):
         """
         return self.expressions
 
-    def get_parent(self, ast):
+    def get_children(self) -> List[ASTNode]:
         """
-        Indicates whether this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: ASTNode
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: ASTNode or None
+        Returns the children of this node, if any.
+        :return: List of children of this node.
         """
-        for var in self.get_variables():
-            if var is ast:
-                return self
-
-            if var.get_parent(ast) is not None:
-                return var.get_parent(ast)
-
-        for expr in self.get_expressions():
-            if expr is ast:
-                return self
-
-            if expr.get_parent(ast) is not None:
-                return expr.get_parent(ast)
-
-        return None
+        return list(self.variables) + list(self.expressions)
 
     def equals(self, other):
         """
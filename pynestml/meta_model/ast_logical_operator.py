@@ -31,6 +31,8 @@ class ASTLogicalOperator(ASTNode):
         is_logical_or = False
     """
 
+    __slots__ = ("is_logical_and", "is_logical_or")
+
     def __init__(self, is_logical_and=False, is_logical_or=False, *args, **kwargs):
         """
         Standard constructor.
@@ -61,23 +63,13 @@ class ASTLogicalOperator(ASTNode):
                                  source_position=self.source_position,
                                  scope=self.scope,
                                  comment=self.comment,
-                                 pre_comments=[s for s in self.pre_comments],
+                                 pre_comments=self.pre_comments,
                                  in_comment=self.in_comment,
-                                 post_comments=[s for s in self.post_comments],
+                                 post_comments=self.post_comments,
                                  implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
 
-    def get_parent(self, ast):
-        """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
-        """
-        return None
-
     def equals(self, other):
         """
         The equals method.
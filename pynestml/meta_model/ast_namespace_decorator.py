@@ -27,6 +27,8 @@ class ASTNamespaceDecorator(ASTNode):
     """
     """
 
+    __slots__ = ("namespace", "name")
+
     def __init__(self, namespace=None, name=None, *args, **kwargs):
         """
         """
@@ -47,9 +49,9 @@ class ASTNamespaceDecorator(ASTNode):
                                     source_position=self.source_position,
                                     scope=self.scope,
                                     comment=self.comment,
-                                    pre_comments=[s for s in self.pre_comments],
+                                    pre_comments=self.pre_comments,
                                     in_comment=self.in_comment,
-                                    post_comments=[s for s in self.post_comments],
+                                    post_comments=self.post_comments,
                                     implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -70,20 +72,6 @@ class ASTNamespaceDecorator(ASTNode):
         """
         return self.name
 
-    def get_parent(self, ast):
-        """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
-        """
-        if self.get_name() is ast:
-            return self
-        elif self.get_namespace() is ast:
-            return self
-        return None
-
     def equals(self, other):
         """
         The equals operation.
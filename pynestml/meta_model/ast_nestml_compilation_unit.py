@@ -19,7 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Optional
+from typing import List, Optional
 from pynestml.meta_model.ast_neuron import ASTNeuron
 from pynestml.meta_model.ast_synapse import ASTSynapse
 from pynestml.meta_model.ast_node import ASTNode
@@ -35,6 +35,8 @@ class ASTNestMLCompilationUnit(ASTNode):
         artifact_name = None
     """
 
+    __slots__ = ("neuron_list", "synapse_list", "artifact_name", "file_path")
+
     def __init__(self, neuron_list=None, synapse_list=None, artifact_name=None, *args, **kwargs):
         """
         Standard constructor.
@@ -58,6 +60,8 @@ class ASTNestMLCompilationUnit(ASTNode):
             assert type(synapse_list) is list
             self.synapse_list.extend(synapse_list)
         self.artifact_name = artifact_name
+        self.file_path = None
+        self.link_children()
 
     def clone(self):
         """
@@ -73,9 +77,9 @@ class ASTNestMLCompilationUnit(ASTNode):
                                        source_position=self.source_position,
                                        scope=self.scope,
                                        comment=self.comment,
-                                       pre_comments=[s for s in self.pre_comments],
+                                       pre_comments=self.pre_comments,
                                        in_comment=self.in_comment,
-                                       post_comments=[s for s in self.post_comments],
+                                       post_comments=self.post_comments,
                                        implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -89,6 +93,7 @@ class ASTNestMLCompilationUnit(ASTNode):
         assert (neuron is not None and isinstance(neuron, ASTNeuron)), \
             '(PyNestML.AST.CompilationUnit) No or wrong type of neuron provided (%s)!' % type(neuron)
         self.neuron_list.append(neuron)
+        neuron.parent = self
 
     def delete_neuron(self, neuron):
         """
@@ -121,6 +126,7 @@ class ASTNestMLCompilationUnit(ASTNode):
         assert (synapse is not None and isinstance(synapse, ASTSynapse)), \
             '(PyNestML.AST.CompilationUnit) No or wrong type of synapse provided (%s)!' % type(synapse)
         self.synapse_list.append(synapse)
+        synapse.parent = self
         return
 
     def delete_synapse(self, synapse):
@@ -158,25 +164,12 @@ class ASTNestMLCompilationUnit(ASTNode):
 
         return None
 
-    def get_parent(self, ast):
+    def get_children(self) -> List[ASTNode]:
         """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
+        Returns the children of this node, if any.
+        :return: List of children of this node.
         """
-        for neuron in self.get_neuron_list():
-            if neuron is ast:
-                return self
-            if neuron.get_parent(ast) is not None:
-                return neuron.get_parent(ast)
-        for synapse in self.get_synapse_list():
-            if synapse is ast:
-                return self
-            elif synapse.get_parent(ast) is not None:
-                return synapse.get_parent(ast)
-        return None
+        return list(self.neuron_list) + list(self.synapse_list)
 
     def equals(self, other):
         """
@@ -48,6 +48,8 @@ class ASTNeuron(ASTNeuronOrSynapse):
         artifact_name = None
     """
 
+    __slots__ = ()
+
     def __init__(self, name, body, artifact_name=None, *args, **kwargs):
         """
         Standard constructor.
@@ -77,9 +79,9 @@ class ASTNeuron(ASTNeuronOrSynapse):
                         source_position=self.source_position,
                         scope=self.scope,
                         comment=self.comment,
-                        pre_comments=[s for s in self.pre_comments],
+                        pre_comments=self.pre_comments,
                         in_comment=self.in_comment,
-                        post_comments=[s for s in self.post_comments],
+                        post_comments=self.post_comments,
                         implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -534,6 +536,7 @@ class ASTNeuron(ASTNeuronOrSynapse):
         block = ASTNodeFactory.create_ast_block([], ASTSourceLocation.get_predefined_source_position())
         update_block = ASTNodeFactory.create_ast_update_block(block, ASTSourceLocation.get_predefined_source_position())
         self.get_body().get_body_elements().append(update_block)
+        update_block.parent = self.get_body()
 
     def add_to_internal_block(self, declaration, index=-1):
         """
@@ -550,6 +553,7 @@ class ASTNeuron(ASTNeuronOrSynapse):
         else:
             index = 1 + (index % len(self.get_internals_blocks().get_declarations()))
         self.get_internals_blocks().get_declarations().insert(index, declaration)
+        declaration.parent = self.get_internals_blocks()
         declaration.update_scope(self.get_internals_blocks().get_scope())
         from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
         symtable_vistor = ASTSymbolTableVisitor()
@@ -567,6 +571,7 @@ class ASTNeuron(ASTNeuronOrSynapse):
         if self.get_state_blocks() is None:
             ASTUtils.create_state_block(self)
         self.get_state_blocks().get_declarations().append(declaration)
+        declaration.parent = self.get_state_blocks()
         declaration.update_scope(self.get_state_blocks().get_scope())
         from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 
@@ -587,6 +592,7 @@ class ASTNeuron(ASTNeuronOrSynapse):
         """
         assert self.get_equations_block() is not None
         self.get_equations_block().get_declarations().append(kernel)
+        kernel.parent = self.get_equations_block()
         kernel.update_scope(self.get_equations_blocks().get_scope())
 
     """
@@ -661,20 +667,6 @@ class ASTNeuron(ASTNeuronOrSynapse):
             ret += (prefix if prefix is not None else '') + comment + '\n'
         return ret
 
-    def get_parent(self, ast):
-        """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
-        """
-        if self.get_body() is ast:
-            return self
-        if self.get_body().get_parent(ast) is not None:
-            return self.get_body().get_parent(ast)
-        return None
-
     def equals(self, other):
         """
         The equals method.
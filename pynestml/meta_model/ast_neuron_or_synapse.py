@@ -38,6 +38,9 @@ class ASTNeuronOrSynapse(ASTNode):
     This class is used to stuff common to neurons and synapses
     """
 
+    # the code generators and transformers attach further attributes to the models, e.g. ``spike_updates`` and ``paired_synapse``
+    __slots__ = ("name", "body", "artifact_name", "__dict__")
+
     def __init__(self, name, body, artifact_name=None, *args, **kwargs):
         """
         Standard constructor.
@@ -64,6 +67,7 @@ class ASTNeuronOrSynapse(ASTNode):
         self.name = name
         self.body = body
         self.artifact_name = artifact_name
+        self.link_children()
 
     def clone(self):
         """
@@ -79,9 +83,9 @@ class ASTNeuronOrSynapse(ASTNode):
                                  source_position=self.source_position,
                                  scope=self.scope,
                                  comment=self.comment,
-                                 pre_comments=[s for s in self.pre_comments],
+                                 pre_comments=self.pre_comments,
                                  in_comment=self.in_comment,
-                                 post_comments=[s for s in self.post_comments],
+                                 post_comments=self.post_comments,
                                  implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -538,6 +542,7 @@ class ASTNeuronOrSynapse(ASTNode):
         block = ASTNodeFactory.create_ast_block([], ASTSourceLocation.get_predefined_source_position())
         update_block = ASTNodeFactory.create_ast_update_block(block, ASTSourceLocation.get_predefined_source_position())
         self.get_body().get_body_elements().append(update_block)
+        update_block.parent = self.get_body()
 
     def add_to_internal_block(self, declaration, index=-1):
         """
@@ -554,6 +559,7 @@ class ASTNeuronOrSynapse(ASTNode):
         else:
             index = 1 + (index % len(self.get_internals_blocks().get_declarations()))
         self.get_internals_blocks().get_declarations().insert(index, declaration)
+        declaration.parent = self.get_internals_blocks()
         declaration.update_scope(self.get_internals_blocks().get_scope())
         from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
         symtable_vistor = ASTSymbolTableVisitor()
@@ -571,6 +577,7 @@ class ASTNeuronOrSynapse(ASTNode):
         if self.get_state_blocks() is None:
             ASTUtils.create_state_block(self)
         self.get_state_blocks().get_declarations().append(declaration)
+        declaration.parent = self.get_state_blocks()
         declaration.update_scope(self.get_state_blocks().get_scope())
         from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 
@@ -591,6 +598,7 @@ class ASTNeuronOrSynapse(ASTNode):
         """
         assert self.get_equations_block() is not None
         self.get_equations_block().get_declarations().append(kernel)
+        kernel.parent = self.get_equations_block()
         kernel.update_scope(self.get_equations_blocks().get_scope())
 
     """
@@ -665,19 +673,12 @@ class ASTNeuronOrSynapse(ASTNode):
             ret += (prefix if prefix is not None else '') + comment + '\n'
         return ret
 
-    def get_parent(self, ast):
+    def get_children(self) -> List[ASTNode]:
         """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
+        Returns the children of this node, if any.
+        :return: List of children of this node.
         """
-        if self.get_body() is ast:
-            return self
-        if self.get_body().get_parent(ast) is not None:
-            return self.get_body().get_parent(ast)
-        return None
+        return [self.body]
 
     def equals(self, other):
         """
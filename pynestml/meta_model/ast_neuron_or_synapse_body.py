@@ -38,6 +38,8 @@ class ASTNeuronOrSynapseBody(ASTNode):
         body_elements = None
     """
 
+    __slots__ = ("body_elements",)
+
     def __init__(self, body_elements, *args, **kwargs):
         """
         Standard constructor.
@@ -49,6 +51,7 @@ class ASTNeuronOrSynapseBody(ASTNode):
         """
         super(ASTNeuronOrSynapseBody, self).__init__(*args, **kwargs)
         self.body_elements = body_elements
+        self.link_children()
 
     def clone(self):
         """
@@ -65,9 +68,9 @@ class ASTNeuronOrSynapseBody(ASTNode):
                                      source_position=self.source_position,
                                      scope=self.scope,
                                      comment=self.comment,
-                                     pre_comments=[s for s in self.pre_comments],
+                                     pre_comments=self.pre_comments,
                                      in_comment=self.in_comment,
-                                     post_comments=[s for s in self.post_comments],
+                                     post_comments=self.post_comments,
                                      implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -197,20 +200,12 @@ class ASTNeuronOrSynapseBody(ASTNode):
                 ret.append(elem)
         return ret
 
-    def get_parent(self, ast=None):
+    def get_children(self) -> List[ASTNode]:
         """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
+        Returns the children of this node, if any.
+        :return: List of children of this node.
         """
-        for stmt in self.get_body_elements():
-            if stmt is ast:
-                return self
-            if stmt.get_parent(ast) is not None:
-                return stmt.get_parent(ast)
-        return None
+        return list(self.body_elements)
 
     def get_spike_input_ports(self) -> List[ASTInputPort]:
         """
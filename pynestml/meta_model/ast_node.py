@@ -19,12 +19,15 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Optional
+from typing import List, Optional
 
 from abc import ABCMeta, abstractmethod
 
 from pynestml.utils.ast_source_location import ASTSourceLocation
 
+# the (immutable) comments of nodes without comments
+NO_COMMENTS = ()
+
 
 class ASTNode(metaclass=ABCMeta):
     """
@@ -42,8 +45,19 @@ class ASTNode(metaclass=ABCMeta):
         post_comments = list()
         #
         implicit_conversion_factor = None
+        #
+        parent = None
+
+    The attributes of all nodes are stored in ``__slots__``. Empty comment lists are represented by one shared, immutable empty sequence; comments are therefore set by assigning a new list rather than by modifying the existing one.
+
+    Each node keeps a link to its parent node, which is set by the constructor of the parent and by the methods that add nodes to the tree (see ``link_children()``), so that ``get_parent()`` does not need to search the tree. A link that has become invalid because the tree was modified otherwise is detected and repaired by ``get_parent()``; ``ASTUtils.get_nodes_with_invalid_parent_link()`` finds such links for debugging.
     """
 
+    __slots__ = ("source_position", "scope", "comment", "pre_comments", "in_comment", "post_comments", "implicit_conversion_factor", "parent")
+
+    # for debugging: if True, the result of each call of get_parent() is compared against a search of the tree
+    check_parent_links = False
+
     def __init__(self, source_position=None, scope=None, comment=None, pre_comments=None, in_comment=None, post_comments=None, implicit_conversion_factor=None):
         """
         The standard constructor.
@@ -65,14 +79,11 @@ class ASTNode(metaclass=ABCMeta):
         self.source_position = source_position
         self.scope = scope
         self.comment = comment
-        if pre_comments is None:
-            pre_comments = []
-        self.pre_comments = pre_comments
+        self.pre_comments = list(pre_comments) if pre_comments else NO_COMMENTS
         self.in_comment = in_comment
-        if post_comments is None:
-            post_comments = []
-        self.post_comments = post_comments
+        self.post_comments = list(post_comments) if post_comments else NO_COMMENTS
         self.implicit_conversion_factor = implicit_conversion_factor
+        self.parent = None
 
     @abstractmethod
     def clone(self):
@@ -92,17 +103,74 @@ class ASTNode(metaclass=ABCMeta):
         """
         pass
 
-    # todo: we can do this with a visitor instead of hard coding grammar traversals all over the place
-    @abstractmethod
+    def get_children(self) -> List["ASTNode"]:
+        """
+        Returns the child nodes of this node, in the order in which they are traversed by the visitors.
+        :return: the child nodes
+        """
+        return []
+
+    def link_children(self, recursive: bool = False) -> None:
+        """
+        Sets the parent link of the child nodes of this node to this node.
+        :param recursive: if True, also set the parent links of all nodes below the child nodes
+        """
+        for child in self.get_children():
+            child.parent = self
+            if recursive:
+                child.link_children(recursive=True)
+
     def get_parent(self, ast):
         """
-        Indicates whether a this node contains the handed over node.
+        Returns the parent of the handed over node, if this node or one of its child nodes contains it. The parent is looked up by following the parent links from the handed over node upwards, so the cost is proportional to the depth of the handed over node rather than to the size of the tree. If a link turns out to be invalid, the tree is searched instead, and the links below this node are set again.
         :param ast: an arbitrary meta_model node.
         :type ast: AST_
         :return: AST if this or one of the child nodes contains the handed over element.
         :rtype: AST_ or None
         """
-        pass
+        parent = self._get_parent_from_links(ast)
+        if parent is None and ast is not self:
+            parent = self.find_parent(ast)
+            if parent is not None:
+                self.link_children(recursive=True)
+
+        if ASTNode.check_parent_links:
+            assert parent is self.find_parent(ast), "Parent link of " + str(ast) + " is invalid"
+
+        return parent
+
+    def _get_parent_from_links(self, ast) -> Optional["ASTNode"]:
+        """
+        Follows the parent links from the handed over node up to this node, checking that each node is a child of the next one.
+        :return: the parent of the handed over node, or None if the links do not lead to this node
+        """
+        node = ast
+        while node is not self:
+            parent = node.parent
+            if parent is None or not any([child is node for child in parent.get_children()]):
+                return None
+
+            node = parent
+
+        return ast.parent if ast is not self else None
+
+    def find_parent(self, ast):
+        """
+        Returns the parent of the handed over node by searching the tree below this node, without using the parent links.
+        :param ast: an arbitrary meta_model node.
+        :type ast: AST_
+        :return: AST if this or one of the child nodes contains the handed over element.
+        :rtype: AST_ or None
+        """
+        for child in self.get_children():
+            if child is ast:
+                return self
+
+            parent = child.find_parent(ast)
+            if parent is not None:
+                return parent
+
+        return None
 
     def set_implicit_conversion_factor(self, implicit_factor: Optional[float]) -> None:
         """
@@ -20,6 +20,8 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
 
+from typing import List
+
 from pynestml.meta_model.ast_node import ASTNode
 from pynestml.meta_model.ast_expression import ASTExpression
 from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
@@ -40,6 +42,8 @@ class ASTOdeEquation(ASTNode):
         rhs = None
     """
 
+    __slots__ = ("lhs", "rhs")
+
     def __init__(self, lhs, rhs, *args, **kwargs):
         """
         Standard constructor.
@@ -56,6 +60,7 @@ class ASTOdeEquation(ASTNode):
         assert isinstance(rhs, ASTExpression) or isinstance(rhs, ASTSimpleExpression)
         self.lhs = lhs
         self.rhs = rhs
+        self.link_children()
 
     def clone(self):
         """
@@ -70,9 +75,9 @@ class ASTOdeEquation(ASTNode):
                              source_position=self.source_position,
                              scope=self.scope,
                              comment=self.comment,
-                             pre_comments=[s for s in self.pre_comments],
+                             pre_comments=self.pre_comments,
                              in_comment=self.in_comment,
-                             post_comments=[s for s in self.post_comments],
+                             post_comments=self.post_comments,
                              implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -93,23 +98,12 @@ class ASTOdeEquation(ASTNode):
         """
         return self.rhs
 
-    def get_parent(self, ast=None):
+    def get_children(self) -> List[ASTNode]:
         """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
+        Returns the children of this node, if any.
+        :return: List of children of this node.
         """
-        if self.get_lhs() is ast:
-            return self
-        if self.get_lhs().get_parent(ast) is not None:
-            return self.get_lhs().get_parent(ast)
-        if self.get_rhs() is ast:
-            return self
-        if self.get_rhs().get_parent(ast) is not None:
-            return self.get_rhs().get_parent(ast)
-        return None
+        return [child for child in [self.lhs, self.rhs] if child is not None]
 
     def equals(self, other=None):
         """
@@ -21,7 +21,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional, Mapping
+from typing import Any, List, Mapping, Optional
 
 from pynestml.meta_model.ast_block import ASTBlock
 from pynestml.meta_model.ast_node import ASTNode
@@ -39,6 +39,8 @@ class ASTOnReceiveBlock(ASTNode):
 
     """
 
+    __slots__ = ("block", "port_name", "const_parameters")
+
     def __init__(self, block: ASTBlock, port_name: str, const_parameters: Optional[Mapping] = None, *args, **kwargs):
         r"""
         Standard constructor.
@@ -51,6 +53,7 @@ class ASTOnReceiveBlock(ASTNode):
         self.const_parameters = const_parameters
         if self.const_parameters is None:
             self.const_parameters = {}
+        self.link_children()
 
     def clone(self) -> ASTOnReceiveBlock:
         r"""
@@ -65,9 +68,9 @@ class ASTOnReceiveBlock(ASTNode):
                                 source_position=self.source_position,
                                 scope=self.scope,
                                 comment=self.comment,
-                                pre_comments=[s for s in self.pre_comments],
+                                pre_comments=self.pre_comments,
                                 in_comment=self.in_comment,
-                                post_comments=[s for s in self.post_comments],
+                                post_comments=self.post_comments,
                                 implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -89,19 +92,12 @@ class ASTOnReceiveBlock(ASTNode):
         """
         return self.port_name
 
-    def get_parent(self, ast: ASTNode) -> Optional[ASTNode]:
-        r"""
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :return: AST if this or one of the child nodes contains the handed over element.
+    def get_children(self) -> List[ASTNode]:
         """
-        if self.get_block() is ast:
-            return self
-
-        if self.get_block().get_parent(ast) is not None:
-            return self.get_block().get_parent(ast)
-
-        return None
+        Returns the children of this node, if any.
+        :return: List of children of this node.
+        """
+        return [self.block] if self.block is not None else []
 
     def equals(self, other: Any) -> bool:
         r"""
@@ -36,6 +36,8 @@ class ASTOutputBlock(ASTNode):
         type = None
     """
 
+    __slots__ = ("type",)
+
     def __init__(self, o_type, *args, **kwargs):
         """
         Standard constructor.
@@ -61,9 +63,9 @@ class ASTOutputBlock(ASTNode):
                              source_position=self.source_position,
                              scope=self.scope,
                              comment=self.comment,
-                             pre_comments=[s for s in self.pre_comments],
+                             pre_comments=self.pre_comments,
                              in_comment=self.in_comment,
-                             post_comments=[s for s in self.post_comments],
+                             post_comments=self.post_comments,
                              implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -82,16 +84,6 @@ class ASTOutputBlock(ASTNode):
         """
         return self.type is PortSignalType.CONTINUOUS
 
-    def get_parent(self, ast):
-        """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
-        """
-        return None
-
     def equals(self, other) -> bool:
         """
         The equals method.
@@ -20,6 +20,8 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
 
+from typing import List
+
 from pynestml.meta_model.ast_data_type import ASTDataType
 from pynestml.meta_model.ast_node import ASTNode
 
@@ -37,6 +39,8 @@ class ASTParameter(ASTNode):
         data_type (ASTDataType): The data type of the parameter.
     """
 
+    __slots__ = ("data_type", "name")
+
     def __init__(self, name=None, data_type=None, *args, **kwargs):
         """
         Standard constructor.
@@ -52,6 +56,7 @@ class ASTParameter(ASTNode):
         super(ASTParameter, self).__init__(*args, **kwargs)
         self.data_type = data_type
         self.name = name
+        self.link_children()
 
     def clone(self):
         """
@@ -66,9 +71,9 @@ class ASTParameter(ASTNode):
                            source_position=self.source_position,
                            scope=self.scope,
                            comment=self.comment,
-                           pre_comments=[s for s in self.pre_comments],
+                           pre_comments=self.pre_comments,
                            in_comment=self.in_comment,
-                           post_comments=[s for s in self.post_comments],
+                           post_comments=self.post_comments,
                            implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -89,19 +94,12 @@ class ASTParameter(ASTNode):
         """
         return self.data_type
 
-    def get_parent(self, ast):
+    def get_children(self) -> List[ASTNode]:
         """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
+        Returns the children of this node, if any.
+        :return: List of children of this node.
         """
-        if self.get_data_type() is ast:
-            return self
-        if self.get_data_type().get_parent(ast) is not None:
-            return self.get_data_type().get_parent(ast)
-        return None
+        return [self.data_type] if self.data_type is not None else []
 
     def equals(self, other):
         """
@@ -19,6 +19,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import List
+
 from pynestml.meta_model.ast_expression import ASTExpression
 from pynestml.meta_model.ast_node import ASTNode
 from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
@@ -36,6 +38,8 @@ class ASTReturnStmt(ASTNode):
           expression (ASTSimpleExpression or ASTExpression): An rhs representing the returned value.
     """
 
+    __slots__ = ("expression",)
+
     def __init__(self, expression=None, *args, **kwargs):
         """
         Standard constructor.
@@ -47,6 +51,7 @@ class ASTReturnStmt(ASTNode):
         """
         super(ASTReturnStmt, self).__init__(*args, **kwargs)
         self.expression = expression
+        self.link_children()
 
     def clone(self):
         """
@@ -63,9 +68,9 @@ class ASTReturnStmt(ASTNode):
                             source_position=self.source_position,
                             scope=self.scope,
                             comment=self.comment,
-                            pre_comments=[s for s in self.pre_comments],
+                            pre_comments=self.pre_comments,
                             in_comment=self.in_comment,
-                            post_comments=[s for s in self.post_comments],
+                            post_comments=self.post_comments,
                             implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -86,20 +91,12 @@ class ASTReturnStmt(ASTNode):
         """
         return self.expression
 
-    def get_parent(self, ast):
+    def get_children(self) -> List[ASTNode]:
         """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
+        Returns the children of this node, if any.
+        :return: List of children of this node.
         """
-        if self.has_expression():
-            if self.get_expression() is ast:
-                return self
-            if self.get_expression().get_parent(ast) is not None:
-                return self.get_expression().get_parent(ast)
-        return None
+        return [self.expression] if self.expression is not None else []
 
     def equals(self, other):
         """
@@ -19,7 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 import numpy as np
 
@@ -52,6 +52,8 @@ class ASTSimpleExpression(ASTExpressionNode):
 
     """
 
+    __slots__ = ("function_call", "is_boolean_true", "is_boolean_false", "numeric_literal", "is_inf_literal", "variable", "string", "has_delay")
+
     def __init__(self, function_call: ASTFunctionCall = None, boolean_literal: bool = None,
                  numeric_literal: Union[int, float] = None, is_inf: bool = False,
                  variable: ASTVariable = None, string: str = None, has_delay: bool = False, *args, **kwargs):
@@ -94,6 +96,7 @@ class ASTSimpleExpression(ASTExpressionNode):
         self.variable = variable
         self.string = string
         self.has_delay = has_delay
+        self.link_children()
 
     def clone(self):
         """
@@ -127,9 +130,9 @@ class ASTSimpleExpression(ASTExpressionNode):
                                   source_position=self.source_position,
                                   scope=self.scope,
                                   comment=self.comment,
-                                  pre_comments=[s for s in self.pre_comments],
+                                  pre_comments=self.pre_comments,
                                   in_comment=self.in_comment,
-                                  post_comments=[s for s in self.post_comments],
+                                  post_comments=self.post_comments,
                                   implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -276,25 +279,12 @@ class ASTSimpleExpression(ASTExpressionNode):
         """
         return self.string
 
-    def get_parent(self, ast):
+    def get_children(self) -> List[ASTNode]:
         """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
+        Returns the children of this node, if any.
+        :return: List of children of this node.
         """
-        if self.is_function_call():
-            if self.get_function_call() is ast:
-                return self
-            if self.get_function_call().get_parent(ast) is not None:
-                return self.get_function_call().get_parent(ast)
-        if self.variable is not None:
-            if self.variable is ast:
-                return self
-            if self.variable.get_parent(ast) is not None:
-                return self.variable.get_parent(ast)
-        return None
+        return [child for child in [self.function_call, self.variable] if child is not None]
 
     def set_variable(self, variable):
         """
@@ -305,6 +295,8 @@ class ASTSimpleExpression(ASTExpressionNode):
         assert (variable is None or isinstance(variable, ASTVariable)), \
             '(PyNestML.AST.SimpleExpression) No or wrong type of variable provided (%s)!' % type(variable)
         self.variable = variable
+        if variable is not None:
+            variable.parent = self
 
     def set_function_call(self, function_call):
         """
@@ -315,6 +307,8 @@ class ASTSimpleExpression(ASTExpressionNode):
         assert (function_call is None or isinstance(function_call, ASTVariable)), \
             '(PyNestML.AST.SimpleExpression) No or wrong type of function call provided (%s)!' % type(function_call)
         self.function_call = function_call
+        if function_call is not None:
+            function_call.parent = self
 
     def equals(self, other):
         """
@@ -20,6 +20,8 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
 
+from typing import List
+
 from pynestml.meta_model.ast_node import ASTNode
 
 
@@ -38,6 +40,8 @@ class ASTSmallStmt(ASTNode):
         return_stmt (ast_return_stmt): A reference to the returns statement.
     """
 
+    __slots__ = ("assignment", "function_call", "declaration", "return_stmt")
+
     def __init__(self, assignment=None, function_call=None, declaration=None, return_stmt=None, *args, **kwargs):
         """
         Standard constructor.
@@ -58,6 +62,7 @@ class ASTSmallStmt(ASTNode):
         self.function_call = function_call
         self.declaration = declaration
         self.return_stmt = return_stmt
+        self.link_children()
 
     def clone(self):
         """
@@ -86,9 +91,9 @@ class ASTSmallStmt(ASTNode):
                            source_position=self.source_position,
                            scope=self.scope,
                            comment=self.comment,
-                           pre_comments=[s for s in self.pre_comments],
+                           pre_comments=self.pre_comments,
                            in_comment=self.in_comment,
-                           post_comments=[s for s in self.post_comments],
+                           post_comments=self.post_comments,
                            implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -157,35 +162,12 @@ class ASTSmallStmt(ASTNode):
         """
         return self.return_stmt
 
-    def get_parent(self, ast):
-        """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
-        """
-        if self.is_assignment():
-            if self.get_assignment() is ast:
-                return self
-            if self.get_assignment().get_parent(ast) is not None:
-                return self.get_assignment().get_parent(ast)
-        if self.is_function_call():
-            if self.get_function_call() is ast:
-                return self
-            if self.get_function_call().get_parent(ast) is not None:
-                return self.get_function_call().get_parent(ast)
-        if self.is_declaration():
-            if self.get_declaration() is ast:
-                return self
-            if self.get_declaration().get_parent(ast) is not None:
-                return self.get_declaration().get_parent(ast)
-        if self.is_return_stmt():
-            if self.get_return_stmt() is ast:
-                return self
-            if self.get_return_stmt().get_parent(ast) is not None:
-                return self.get_return_stmt().get_parent(ast)
-        return None
+    def get_children(self) -> List[ASTNode]:
+        """
+        Returns the children of this node, if any.
+        :return: List of children of this node.
+        """
+        return [child for child in [self.assignment, self.function_call, self.declaration, self.return_stmt] if child is not None]
 
     def equals(self, other):
         """
@@ -19,7 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Optional
+from typing import List, Optional
 
 from pynestml.meta_model.ast_compound_stmt import ASTCompoundStmt
 from pynestml.meta_model.ast_node import ASTNode
@@ -36,6 +36,8 @@ class ASTStmt(ASTNode):
         compound_stmt = None
     """
 
+    __slots__ = ("small_stmt", "compound_stmt")
+
     def __init__(self, small_stmt, compound_stmt, *args, **kwargs):
         """
         Standard constructor.
@@ -50,6 +52,7 @@ class ASTStmt(ASTNode):
         super(ASTStmt, self).__init__(*args, **kwargs)
         self.small_stmt = small_stmt
         self.compound_stmt = compound_stmt
+        self.link_children()
 
     def clone(self):
         """
@@ -70,26 +73,19 @@ class ASTStmt(ASTNode):
                       source_position=self.source_position,
                       scope=self.scope,
                       comment=self.comment,
-                      pre_comments=[s for s in self.pre_comments],
+                      pre_comments=self.pre_comments,
                       in_comment=self.in_comment,
-                      post_comments=[s for s in self.post_comments],
+                      post_comments=self.post_comments,
                       implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
 
-    def get_parent(self, ast: ASTNode=None) -> Optional[ASTNode]:
+    def get_children(self) -> List[ASTNode]:
         """
-        Returns the parent node of a handed over AST object.
+        Returns the children of this node, if any.
+        :return: List of children of this node.
         """
-        if self.small_stmt is ast:
-            return self
-        if self.small_stmt is not None and self.small_stmt.get_parent(ast) is not None:
-            return self.small_stmt.get_parent(ast)
-        if self.compound_stmt is ast:
-            return self
-        if self.compound_stmt is not None and self.compound_stmt.get_parent(ast) is not None:
-            return self.compound_stmt.get_parent(ast)
-        return None
+        return [child for child in [self.small_stmt, self.compound_stmt] if child is not None]
 
     def is_small_stmt(self):
         return self.small_stmt is not None
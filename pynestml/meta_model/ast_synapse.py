@@ -45,6 +45,8 @@ class ASTSynapse(ASTNeuronOrSynapse):
         artifact_name = None
     """
 
+    __slots__ = ("_default_weight", "_default_delay_variable", "_default_delay_expression", "_default_delay_dtype")
+
     def __init__(self, name, body, default_weight=None, artifact_name=None, *args, **kwargs):
         """
         Standard constructor.
@@ -75,9 +77,9 @@ class ASTSynapse(ASTNeuronOrSynapse):
                          source_position=self.source_position,
                          scope=self.scope,
                          comment=self.comment,
-                         pre_comments=[s for s in self.pre_comments],
+                         pre_comments=self.pre_comments,
                          in_comment=self.in_comment,
-                         post_comments=[s for s in self.post_comments],
+                         post_comments=self.post_comments,
                          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
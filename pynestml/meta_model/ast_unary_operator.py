@@ -33,6 +33,8 @@ class ASTUnaryOperator(ASTNode):
         is_unary_tilde = False
     """
 
+    __slots__ = ("is_unary_plus", "is_unary_minus", "is_unary_tilde")
+
     def __init__(self, is_unary_plus=False, is_unary_minus=False, is_unary_tilde=False, *args, **kwargs):
         """
         Standard constructor.
@@ -67,23 +69,13 @@ class ASTUnaryOperator(ASTNode):
                                source_position=self.source_position,
                                scope=self.scope,
                                comment=self.comment,
-                               pre_comments=[s for s in self.pre_comments],
+                               pre_comments=self.pre_comments,
                                in_comment=self.in_comment,
-                               post_comments=[s for s in self.post_comments],
+                               post_comments=self.post_comments,
                                implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
 
-    def get_parent(self, ast):
-        """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
-        """
-        return None
-
     def equals(self, other):
         """
         The equals method.
@@ -19,6 +19,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import List
+
 from pynestml.meta_model.ast_node import ASTNode
 from pynestml.utils.cloning_helpers import clone_numeric_literal
 
@@ -53,6 +55,8 @@ class ASTUnitType(ASTNode):
         type_symbol = None
     """
 
+    __slots__ = ("is_encapsulated", "compound_unit", "base", "is_pow", "exponent", "lhs", "is_times", "is_div", "rhs", "unit", "type_symbol")
+
     def __init__(self, is_encapsulated=False, compound_unit=None, base=None, is_pow=False,
                  exponent=None, lhs=None, rhs=None, is_div=False, is_times=False, _unit=None, type_symbol=None, *args, **kwargs):
         """
@@ -95,6 +99,7 @@ class ASTUnitType(ASTNode):
         self.rhs = rhs
         self.unit = _unit
         self.type_symbol = type_symbol
+        self.link_children()
 
     def clone(self):
         """
@@ -133,9 +138,9 @@ class ASTUnitType(ASTNode):
                           source_position=self.source_position,
                           scope=self.scope,
                           comment=self.comment,
-                          pre_comments=[s for s in self.pre_comments],
+                          pre_comments=self.pre_comments,
                           in_comment=self.in_comment,
-                          post_comments=[s for s in self.post_comments],
+                          post_comments=self.post_comments,
                           implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -178,36 +183,12 @@ class ASTUnitType(ASTNode):
     def set_type_symbol(self, type_symbol):
         self.type_symbol = type_symbol
 
-    def get_parent(self, ast):
-        """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
-        """
-        if self.is_encapsulated:
-            if self.compound_unit is ast:
-                return self
-            if self.compound_unit.get_parent(ast) is not None:
-                return self.compound_unit.get_parent(ast)
-
-        if self.is_pow:
-            if self.base is ast:
-                return self
-            if self.base.get_parent(ast) is not None:
-                return self.base.get_parent(ast)
-        if self.is_arithmetic_expression():
-            if isinstance(self.get_lhs(), ASTUnitType):
-                if self.get_lhs() is ast:
-                    return self
-                if self.get_lhs().get_parent(ast) is not None:
-                    return self.get_lhs().get_parent(ast)
-            if self.get_rhs() is ast:
-                return self
-            if self.get_rhs().get_parent(ast) is not None:
-                return self.get_rhs().get_parent(ast)
-        return None
+    def get_children(self) -> List[ASTNode]:
+        """
+        Returns the children of this node, if any.
+        :return: List of children of this node.
+        """
+        return [child for child in [self.base, self.lhs, self.rhs, self.compound_unit] if isinstance(child, ASTUnitType)]
 
     def equals(self, other):
         """
@@ -19,6 +19,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import List
+
 from pynestml.meta_model.ast_block import ASTBlock
 from pynestml.meta_model.ast_node import ASTNode
 
@@ -44,6 +46,8 @@ class ASTUpdateBlock(ASTNode):
         block = None
     """
 
+    __slots__ = ("block",)
+
     def __init__(self, block, *args, **kwargs):
         """
         Standard constructor.
@@ -56,6 +60,7 @@ class ASTUpdateBlock(ASTNode):
         super(ASTUpdateBlock, self).__init__(*args, **kwargs)
         assert isinstance(block, ASTBlock)
         self.block = block
+        self.link_children()
 
     def clone(self):
         """
@@ -69,9 +74,9 @@ class ASTUpdateBlock(ASTNode):
                              source_position=self.source_position,
                              scope=self.scope,
                              comment=self.comment,
-                             pre_comments=[s for s in self.pre_comments],
+                             pre_comments=self.pre_comments,
                              in_comment=self.in_comment,
-                             post_comments=[s for s in self.post_comments],
+                             post_comments=self.post_comments,
                              implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -84,19 +89,12 @@ class ASTUpdateBlock(ASTNode):
         """
         return self.block
 
-    def get_parent(self, ast):
+    def get_children(self) -> List[ASTNode]:
         """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :type ast: AST_
-        :return: AST if this or one of the child nodes contains the handed over element.
-        :rtype: AST_ or None
+        Returns the children of this node, if any.
+        :return: List of children of this node.
         """
-        if self.get_block() is ast:
-            return self
-        if self.get_block().get_parent(ast) is not None:
-            return self.get_block().get_parent(ast)
-        return None
+        return [self.block] if self.block is not None else []
 
     def equals(self, other):
         """
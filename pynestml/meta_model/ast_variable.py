@@ -42,6 +42,8 @@ class ASTVariable(ASTNode):
         type_symbol = None
     """
 
+    __slots__ = ("name", "differential_order", "type_symbol", "vector_parameter", "is_homogeneous", "delay_parameter", "_is_post_port")
+
     def __init__(self, name, differential_order=0, type_symbol: Optional[str] = None,
                  vector_parameter: Optional[str] = None, is_homogeneous: bool = False, delay_parameter: Optional[str] = None, *args, **kwargs):
         """
@@ -67,6 +69,8 @@ class ASTVariable(ASTNode):
         self.vector_parameter = vector_parameter
         self.is_homogeneous = is_homogeneous
         self.delay_parameter = delay_parameter
+        # set by SynapsePostNeuronTransformer for references to postsynaptic spike input ports
+        self._is_post_port = False
 
     def clone(self):
         r"""
@@ -81,9 +85,9 @@ class ASTVariable(ASTNode):
                            source_position=self.get_source_position(),
                            scope=self.scope,
                            comment=self.comment,
-                           pre_comments=[s for s in self.pre_comments],
+                           pre_comments=self.pre_comments,
                            in_comment=self.in_comment,
-                           post_comments=[s for s in self.post_comments],
+                           post_comments=self.post_comments,
                            implicit_conversion_factor=self.implicit_conversion_factor)
 
     def resolve_in_own_scope(self):
@@ -179,14 +183,6 @@ class ASTVariable(ASTNode):
         assert (delay is not None), '(PyNestML.AST.Variable) No delay parameter provided'
         self.delay_parameter = delay
 
-    def get_parent(self, ast: ASTNode) -> Optional[ASTNode]:
-        """
-        Indicates whether a this node contains the handed over node.
-        :param ast: an arbitrary meta_model node.
-        :return: AST if this or one of the child nodes contains the handed over element.
-        """
-        return None
-
     def is_unit_variable(self) -> bool:
         r"""
         Provided on-the-fly information whether this variable represents a unit-variable, e.g., nS.
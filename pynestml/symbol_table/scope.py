@@ -21,6 +21,8 @@
 
 from __future__ import annotations
 
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
 from enum import Enum
 
 from pynestml.symbols.symbol import Symbol, SymbolKind
@@ -49,6 +51,8 @@ class Scope:
         declared_elements Elements declared in this scope, i.e., scopes and symbols. Type: list(Scope,Symbol)
         scope_type The type of this scope. Type: ScopeType
         source_position The position in the source file this scope spans over.
+
+    In addition to ``declared_elements``, the symbols and sub-scopes are kept in separate lists, and the symbols are indexed by name and kind, so that resolving a symbol takes constant time per scope level. Elements should therefore only be added and removed by means of the methods of this class.
     """
 
     def __init__(self, scope_type: ScopeType, enclosing_scope: Scope = None, source_position: ASTSourceLocation = None):
@@ -62,6 +66,9 @@ class Scope:
         self.scope_type = scope_type
         self.enclosing_scope = enclosing_scope
         self.source_location = source_position
+        self._symbols = list()   # type: List[Symbol]
+        self._scopes = list()   # type: List[Scope]
+        self._symbols_by_name_and_kind = dict()   # type: Dict[Tuple[str, SymbolKind], List[Symbol]]
 
     def add_symbol(self, symbol: Symbol) -> None:
         r"""
@@ -70,13 +77,18 @@ class Scope:
         """
         self.delete_symbol(symbol)
         self.declared_elements.append(symbol)
+        self._symbols.append(symbol)
+        key = (symbol.get_symbol_name(), symbol.get_symbol_kind())
+        if key in self._symbols_by_name_and_kind.keys():
+            self._symbols_by_name_and_kind[key].append(symbol)
+        else:
+            self._symbols_by_name_and_kind[key] = [symbol]
 
     def update_variable_symbol(self, _symbol: Symbol) -> None:
-        for symbol in self.get_symbols_in_this_scope():
-            if (symbol.get_symbol_kind() == SymbolKind.VARIABLE and symbol.get_symbol_name() == _symbol.get_symbol_name()):
-                self.declared_elements.remove(symbol)
-                self.add_symbol(_symbol)
-                break
+        symbols = self._symbols_by_name_and_kind.get((_symbol.get_symbol_name(), SymbolKind.VARIABLE))
+        if symbols:
+            self.delete_symbol(symbols[0])
+            self.add_symbol(_symbol)
 
     def add_scope(self, scope: Scope) -> None:
         r"""
@@ -84,6 +96,7 @@ class Scope:
         :param scope: a single scope object.
         """
         self.declared_elements.append(scope)
+        self._scopes.append(scope)
 
     def delete_symbol(self, symbol: Symbol) -> bool:
         r"""
@@ -92,11 +105,18 @@ class Scope:
         :type symbol: Symbol
         :return: True, if the element has been deleted, otherwise False.
         """
-        if symbol in self.declared_elements:
-            self.declared_elements.remove(symbol)
-            return True
+        key = (symbol.get_symbol_name(), symbol.get_symbol_kind())
+        symbols = self._symbols_by_name_and_kind.get(key)
+        if not symbols or symbol not in symbols:
+            return False
 
-        return False
+        symbol = symbols.pop(symbols.index(symbol))
+        if not symbols:
+            del self._symbols_by_name_and_kind[key]
+
+        self._remove_element(self._symbols, symbol)
+        self._remove_element(self.declared_elements, symbol)
+        return True
 
     def delete_scope(self, scope: Scope) -> bool:
         r"""
@@ -104,22 +124,41 @@ class Scope:
         :param scope: a single scope object.
         :return: True, if the element has been deleted, otherwise False.
         """
-        if scope in self.declared_elements:
-            self.declared_elements.remove(scope)
+        if scope in self._scopes:
+            self._scopes.remove(scope)
+            self._remove_element(self.declared_elements, scope)
             return True
 
         return False
 
+    def sort_symbols(self, key: Callable[[Symbol], Any]) -> None:
+        r"""
+        Sorts the symbols in this scope by the given key. The sort is stable, i.e., symbols with equal keys keep their relative order. Sub-scopes keep their positions among the declared elements.
+        :param key: a function that returns the sort key of a symbol.
+        """
+        self._symbols.sort(key=key)
+        for symbols in self._symbols_by_name_and_kind.values():
+            symbols.sort(key=key)
+
+        symbols = iter(self._symbols)
+        self.declared_elements = [next(symbols) if isinstance(elem, Symbol) else elem for elem in self.declared_elements]
+
+    @staticmethod
+    def _remove_element(elements: List[Union[Symbol, Scope]], element: Union[Symbol, Scope]) -> None:
+        r"""
+        Remove an element from the given list, comparing by identity rather than equality.
+        """
+        for i, elem in enumerate(elements):
+            if elem is element:
+                del elements[i]
+                return
+
     def get_symbols_in_this_scope(self) -> List[Symbol]:
         r"""
         Returns the set of elements as defined in this scope, but not in the corresponding super scope.
         :return: a list of symbols defined only in this scope, but not in the upper scopes.
         """
-        ret = list()
-        for elem in self.declared_elements:
-            if isinstance(elem, Symbol):
-                ret.append(elem)
-        return ret
+        return list(self._symbols)
 
     def get_symbols_in_complete_scope(self) -> List[Symbol]:
         r"""
@@ -138,11 +177,7 @@ class Scope:
         :return: a list of scope objects
         :rtype: list
         """
-        ret = list()
-        for elem in self.declared_elements:
-            if isinstance(elem, Scope):
-                ret.append(elem)
-        return ret
+        return list(self._scopes)
 
     def resolve_to_all_scopes(self, name: str, kind: SymbolKind) -> Optional[Scope]:
         r"""
@@ -170,14 +205,9 @@ class Scope:
         :param kind: the type of the element
         :return: the corresponding scope object.
         """
-        ret = list()
-        for sim in self.get_symbols_in_this_scope():
-            if sim.get_symbol_name() == name and sim.get_symbol_kind() == kind:
-                ret.append(self)
-        for elem in self.get_scopes():  # otherwise check if it is in one of the sub-scopes
-            temp = elem.__resolve_to_scope_in_spanned_scope(name, kind)
-            if temp is not None:
-                ret.extend(temp)
+        ret = [self] * len(self._symbols_by_name_and_kind.get((name, kind), []))
+        for elem in self._scopes:  # otherwise check if it is in one of the sub-scopes
+            ret.extend(elem.__resolve_to_scope_in_spanned_scope(name, kind))
         return ret
 
     def resolve_to_all_symbols(self, name: str, kind: SymbolKind) -> Optional[Union[Symbol, List[Symbol]]]:
@@ -209,15 +239,9 @@ class Scope:
         :param kind: the type of the element
         :return: the corresponding symbol object.
         """
-        ret = list()
-        for sim in self.get_symbols_in_this_scope():
-            if sim.get_symbol_name() == name and sim.get_symbol_kind() == kind:
-                ret.append(sim)
-
-        for elem in self.get_scopes():  # otherwise check if it is in one of the sub-scopes
-            temp = elem.__resolve_to_symbol_in_spanned_scope(name, kind)
-            if temp is not None:
-                ret.extend(temp)
+        ret = list(self._symbols_by_name_and_kind.get((name, kind), []))
+        for elem in self._scopes:  # otherwise check if it is in one of the sub-scopes
+            ret.extend(elem.__resolve_to_symbol_in_spanned_scope(name, kind))
 
         return ret
 
@@ -229,9 +253,8 @@ class Scope:
         :param kind: the type of the symbol, i.e., Variable,function or type.
         :return: the first matching scope.
         """
-        for sim in self.get_symbols_in_this_scope():
-            if sim.get_symbol_name() == name and sim.get_symbol_kind() == kind:
-                return self
+        if (name, kind) in self._symbols_by_name_and_kind.keys():
+            return self
 
         if self.has_enclosing_scope():
             return self.get_enclosing_scope().resolve_to_scope(name, kind)
@@ -246,9 +269,9 @@ class Scope:
         :param kind: the type of the symbol, i.e., Variable,function or type.
         :return: the first matching symbol.
         """
-        for sim in self.get_symbols_in_this_scope():
-            if sim.get_symbol_name() == name and sim.get_symbol_kind() == kind:
-                return sim
+        symbols = self._symbols_by_name_and_kind.get((name, kind))
+        if symbols:
+            return symbols[0]
 
         if self.has_enclosing_scope():
             return self.get_enclosing_scope().resolve_to_symbol(name, kind)
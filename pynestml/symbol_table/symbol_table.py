@@ -22,16 +22,18 @@
 from typing import Mapping
 
 from pynestml.symbol_table.scope import Scope, ScopeType
+from pynestml.utils.toolchain_context import ContextBound
 
 
-class SymbolTable:
+class SymbolTable(metaclass=ContextBound):
     """
-    This class is used to store a single symbol table, consisting of scope and symbols.
+    This class is used to store a single symbol table, consisting of scope and symbols. A separate symbol table is kept for each ``ToolchainContext``.
 
     Attributes:
         name2neuron_scope A dict from the name of a neuron to the corresponding scope. Type str->Scope
         source_position The source position of the overall compilation unit. Type ASTSourceLocation
     """
+    _context_attributes = ("name2neuron_scope", "name2synapse_scope", "source_location")
     name2neuron_scope = {}   # type: Mapping[str, Scope]
     name2synapse_scope = {}
     source_location = None
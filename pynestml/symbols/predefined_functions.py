@@ -18,13 +18,16 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
-from typing import Mapping
+from typing import Mapping, Optional
+
+from types import MappingProxyType
 
 from pynestml.symbols.function_symbol import FunctionSymbol
 from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.utils.toolchain_context import ContextBound
 
 
-class PredefinedFunctions:
+class PredefinedFunctions(metaclass=ContextBound):
     """
     This class is used to represent all predefined functions of NESTML.
 
@@ -53,7 +56,11 @@ class PredefinedFunctions:
         INTEGRATE_ODES        The callee name of the integrate_odes function.
         CONVOLVE              The callee name of the convolve function.
         name2function         A dict of function symbols as currently defined.
+        _snapshot             Read-only copy of name2function, as it was after registering the functions, or None.
+
+    name2function is kept separately for each ``ToolchainContext``, while the snapshot is shared by all of them.
     """
+    _context_attributes = ("name2function",)
     TIME_RESOLUTION = 'resolution'
     TIME_STEPS = 'steps'
     EMIT_SPIKE = 'emit_spike'
@@ -79,6 +86,7 @@ class PredefinedFunctions:
     CONVOLVE = 'convolve'
     DELIVER_SPIKE = 'deliver_spike'
     name2function = {}   # type: Mapping[str, FunctionSymbol]
+    _snapshot = None   # type: Optional[Mapping[str, FunctionSymbol]]
 
     @classmethod
     def register_functions(cls):
@@ -112,6 +120,28 @@ class PredefinedFunctions:
         cls.__register_deliver_spike()
         return
 
+    @classmethod
+    def snapshot(cls) -> None:
+        """
+        Stores a read-only copy of the currently defined functions, so that they can be restored by ``restore()`` without registering them anew.
+        """
+        cls._snapshot = MappingProxyType(dict(cls.name2function))
+
+    @classmethod
+    def has_snapshot(cls) -> bool:
+        """
+        Indicates whether a snapshot of the functions has been stored.
+        :return: True if ``snapshot()`` has been called, otherwise False.
+        """
+        return cls._snapshot is not None
+
+    @classmethod
+    def restore(cls) -> None:
+        """
+        Restores the functions from the snapshot, discarding any changes made after the snapshot was taken.
+        """
+        cls.name2function = dict(cls._snapshot)
+
     @classmethod
     def register_function(cls, name, params, return_type, element_reference):
         symbol = FunctionSymbol(name=name, param_types=params,
@@ -19,9 +19,10 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Mapping
+from typing import Mapping, Optional
 
 from copy import copy
+from types import MappingProxyType
 
 from astropy.units.core import CompositeUnit
 from astropy.units.quantity import Quantity
@@ -32,11 +33,12 @@ from pynestml.symbols.type_symbol import TypeSymbol
 from pynestml.symbols.unit_type_symbol import UnitTypeSymbol
 from pynestml.utils.logger import LoggingLevel, Logger
 from pynestml.utils.messages import Messages
+from pynestml.utils.toolchain_context import ContextBound
 from pynestml.utils.type_dictionary import TypeDictionary
 from pynestml.utils.unit_type import UnitType
 
 
-class PredefinedTypes:
+class PredefinedTypes(metaclass=ContextBound):
     """
     This class represents all types which are predefined in the system.
 
@@ -47,8 +49,13 @@ class PredefinedTypes:
         BOOLEAN_TYPE  The identifier of the type 'boolean'. Type: str
         STRING_TYPE   The identifier of the type 'string'. Type: str
         INTEGER_TYPE  The identifier of the type 'integer'. Type: str
+        _snapshot     Read-only copy of name2type, as it was after registering the types, or None. Type: dict(str->TypeSymbol)
+
+    name2type is kept separately for each ``ToolchainContext``, while the snapshot is shared by all of them.
     """
+    _context_attributes = ("name2type",)
     name2type = {}   # type: Mapping[str, TypeSymbol]
+    _snapshot = None   # type: Optional[Mapping[str, TypeSymbol]]
     REAL_TYPE = 'real'
     VOID_TYPE = 'void'
     BOOLEAN_TYPE = 'boolean'
@@ -70,6 +77,28 @@ class PredefinedTypes:
         cls.__register_integer()
         return
 
+    @classmethod
+    def snapshot(cls) -> None:
+        """
+        Stores a read-only copy of the currently defined types, so that they can be restored by ``restore()`` without registering them anew.
+        """
+        cls._snapshot = MappingProxyType(dict(cls.name2type))
+
+    @classmethod
+    def has_snapshot(cls) -> bool:
+        """
+        Indicates whether a snapshot of the types has been stored.
+        :return: True if ``snapshot()`` has been called, otherwise False.
+        """
+        return cls._snapshot is not None
+
+    @classmethod
+    def restore(cls) -> None:
+        """
+        Restores the types from the snapshot, discarding any changes made after the snapshot was taken.
+        """
+        cls.name2type = TypeDictionary(cls._snapshot)
+
     @classmethod
     def __register_units(cls):
         """
@@ -19,31 +19,53 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Mapping, Sequence
+from typing import List, Mapping, Optional, Sequence, Tuple
+
+from types import MappingProxyType
 
 from astropy import units as u
 
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
+from pynestml.utils.toolchain_context import ContextBound
 from pynestml.utils.unit_type import UnitType
 
 
-class PredefinedUnits:
+class PredefinedUnits(metaclass=ContextBound):
     """
     This class represents a collection of physical units. Units can be retrieved by means of get_unit(name).
     Attribute:
         name2unit (dict):  Dict of all predefined units, map from name to unit object.
+        _snapshot (dict):  Read-only copy of name2unit, as it was after registering the units, or None.
+
+    name2unit is kept separately for each ``ToolchainContext``, while the snapshot is shared by all of them.
     """
+    _context_attributes = ("name2unit",)
     name2unit = {}   # type: Mapping[str, UnitType]
+    _snapshot = None   # type: Optional[Mapping[str, UnitType]]
 
     @classmethod
-    def register_units(cls):
+    def register_units(cls, unit_table: Optional[Sequence[Tuple[str, Sequence[str]]]] = None):
         """
         Registers all units in astropy.units (more specifically, from the si, cgs and astrophys submodules) as predefined units into NESTML.
+        :param unit_table: a table of units as returned by ``get_unit_table()``, for instance one that was stored to disk during an earlier run. If not given, the table is computed.
         """
-        # first store all base units and the derived units without the prefix in a list
+        if unit_table is None:
+            unit_table = cls.get_unit_table()
+
         cls.name2unit = {}
+        for unit_str, unit_names in unit_table:
+            unit = getattr(u, unit_str)
+            for unit_name in unit_names:
+                cls.name2unit[unit_name] = UnitType(name=unit_name, unit=unit)
 
+    @classmethod
+    def get_unit_table(cls) -> List[Tuple[str, List[str]]]:
+        """
+        Looks up all units in astropy.units (more specifically, in the si, cgs and astrophys submodules). As this is relatively expensive, the result can be stored and passed to ``register_units()`` later on.
+        :return: a list of tuples, each containing the name of the unit object in astropy.units and the names of the unit.
+        """
+        unit_table = []
         for unit_str in dir(u.si) + dir(u.cgs) + dir(u.astrophys):
             try:
                 unit = eval("u." + unit_str)    # grab the unit object
@@ -51,9 +73,31 @@ class PredefinedUnits:
                 unit = None
 
             if issubclass(type(unit), u.core.UnitBase):
-                for unit_name in unit.names:
-                    temp_unit = UnitType(name=str(unit_name), unit=unit)
-                    cls.name2unit[str(unit_name)] = temp_unit
+                unit_table.append((unit_str, [str(unit_name) for unit_name in unit.names]))
+
+        return unit_table
+
+    @classmethod
+    def snapshot(cls) -> None:
+        """
+        Stores a read-only copy of the currently defined units, so that they can be restored by ``restore()`` without registering them anew.
+        """
+        cls._snapshot = MappingProxyType(dict(cls.name2unit))
+
+    @classmethod
+    def has_snapshot(cls) -> bool:
+        """
+        Indicates whether a snapshot of the units has been stored.
+        :return: True if ``snapshot()`` has been called, otherwise False.
+        """
+        return cls._snapshot is not None
+
+    @classmethod
+    def restore(cls) -> None:
+        """
+        Restores the units from the snapshot, discarding any changes made after the snapshot was taken.
+        """
+        cls.name2unit = dict(cls._snapshot)
 
     @classmethod
     def get_unit(cls, name: str) -> UnitType:
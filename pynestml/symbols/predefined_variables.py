@@ -19,17 +19,22 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Mapping
+from typing import Mapping, Optional
+
+from types import MappingProxyType
 
 from pynestml.symbols.predefined_types import PredefinedTypes
 from pynestml.symbols.variable_symbol import VariableSymbol, BlockType, VariableType
+from pynestml.utils.toolchain_context import ContextBound
 
 
-class PredefinedVariables:
+class PredefinedVariables(metaclass=ContextBound):
     """
-    This class is used to store all predefined variables as generally available.
+    This class is used to store all predefined variables as generally available. name2variable is kept separately for each ``ToolchainContext``, while the snapshot is shared by all of them.
     """
+    _context_attributes = ("name2variable",)
     name2variable = {}   # type: Mapping[str, VariableSymbol]
+    _snapshot = None   # type: Optional[Mapping[str, VariableSymbol]]
     E_CONSTANT = 'e'     # type: str
     TIME_CONSTANT = 't'  # type: str
 
@@ -42,6 +47,28 @@ class PredefinedVariables:
         cls.__register_euler_constant()
         cls.__register_time_constant()
 
+    @classmethod
+    def snapshot(cls) -> None:
+        """
+        Stores a read-only copy of the currently defined variables, so that they can be restored by ``restore()`` without registering them anew.
+        """
+        cls._snapshot = MappingProxyType(dict(cls.name2variable))
+
+    @classmethod
+    def has_snapshot(cls) -> bool:
+        """
+        Indicates whether a snapshot of the variables has been stored.
+        :return: True if ``snapshot()`` has been called, otherwise False.
+        """
+        return cls._snapshot is not None
+
+    @classmethod
+    def restore(cls) -> None:
+        """
+        Restores the variables from the snapshot, discarding any changes made after the snapshot was taken.
+        """
+        cls.name2variable = dict(cls._snapshot)
+
     @classmethod
     def __register_predefined_type_variables(cls):
         """
@@ -48,7 +48,7 @@ class UnitTypeSymbol(TypeSymbol):
     def equals(self, other=None):
         basic_equals = super(UnitTypeSymbol, self).equals(other)
         if basic_equals is True:
-            return self.unit == other.unit
+            return self.unit.equals(other.unit)
 
         return False
 
@@ -138,10 +138,9 @@ class UnitTypeSymbol(TypeSymbol):
         if self.differs_only_in_magnitude(other):
             factor = UnitTypeSymbol.get_conversion_factor(self.astropy_unit, other.astropy_unit)
             other.referenced_object.set_implicit_conversion_factor(factor)
-            code, message = Messages.get_implicit_magnitude_conversion(self, other, factor)
-            Logger.log_message(code=code, message=message,
-                               error_position=self.referenced_object.get_source_position(),
-                               log_level=LoggingLevel.INFO)
+            Logger.log_deferred_message(lambda: Messages.get_implicit_magnitude_conversion(self, other, factor),
+                                        error_position=self.referenced_object.get_source_position(),
+                                        log_level=LoggingLevel.INFO)
 
             return self
         else:
@@ -21,7 +21,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Sequence, Mapping, Optional, Union
+from typing import Any, List, Sequence, Mapping, Optional, Union
+
+import copy
 
 from pynestml.frontend.frontend_configuration import FrontendConfiguration
 from pynestml.meta_model.ast_inline_expression import ASTInlineExpression
@@ -49,6 +51,7 @@ class SynapsePostNeuronTransformer(Transformer):
 
     def __init__(self, options: Optional[Mapping[str, Any]] = None):
         super(Transformer, self).__init__(options)
+        self._shared_blocks = []    # the blocks of the model created by ``clone_sharing_blocks()`` that have not been copied yet
 
     def is_special_port(self, special_type: str, port_name: str, neuron_name: str, synapse_name: str) -> bool:
         """
@@ -200,15 +203,69 @@ class SynapsePostNeuronTransformer(Transformer):
 
         return [v.name for v in visitor._variables]
 
+    def clone_sharing_blocks(self, model: ASTNeuronOrSynapse) -> ASTNeuronOrSynapse:
+        r"""
+        Return a clone of the model that shares the blocks in its body (state, equations, update blocks etc.) with the original model. Before a shared block is modified, it has to be replaced by a copy with ``get_writable_blocks()`` (copy-on-write).
+        """
+        new_model = copy.copy(model)
+        new_model.parent = None
+        new_model.body = copy.copy(model.get_body())
+        new_model.get_body().body_elements = list(model.get_body().get_body_elements())
+        new_model.link_children()
+        self._shared_blocks.extend(model.get_body().get_body_elements())
+
+        return new_model
+
+    def get_writable_blocks(self, model: ASTNeuronOrSynapse, blocks: Optional[Union[ASTNode, List[ASTNode]]]) -> Optional[Union[ASTNode, List[ASTNode]]]:
+        r"""
+        Replace the given blocks in the body of the model by copies, if they are shared with another model.
+
+        :param model: the model created by ``clone_sharing_blocks()``
+        :param blocks: a block, a list of blocks, or None (as returned by e.g. ``get_state_blocks()``)
+        :return: the blocks that are owned by the model, in the same form as ``blocks``
+        """
+        if blocks is None:
+            return None
+
+        if isinstance(blocks, list):
+            return [self.get_writable_blocks(model, block) for block in blocks]
+
+        if not any([blocks is shared_block for shared_block in self._shared_blocks]):
+            return blocks
+
+        body_elements = model.get_body().get_body_elements()
+        block_copy = blocks.clone()
+        body_elements[[idx for idx, elem in enumerate(body_elements) if elem is blocks][0]] = block_copy
+        block_copy.parent = model.get_body()
+        self._shared_blocks = [shared_block for shared_block in self._shared_blocks if shared_block is not blocks]
+
+        return block_copy
+
+    def get_writable_blocks_using_variable(self, model: ASTNeuronOrSynapse, var_name: str) -> None:
+        r"""
+        Replace all blocks in the body of the model that refer to a variable by the given name by copies, if they are shared with another model.
+        """
+        def is_using_variable(block: ASTNode) -> bool:
+            var_names = []
+            block.accept(ASTHigherOrderVisitor(lambda node: var_names.append(node.get_name()) if isinstance(node, ASTVariable) else None))
+            return var_name in var_names
+
+        for block in list(model.get_body().get_body_elements()):
+            if any([block is shared_block for shared_block in self._shared_blocks]) and is_using_variable(block):
+                self.get_writable_blocks(model, block)
+
     def transform_neuron_synapse_pair_(self, neuron, synapse):
         r"""
         "Co-generation" or in-tandem generation of neuron and synapse code.
 
-        Does not modify existing neurons or synapses, but returns lists with additional elements representing new pair neuron and synapse
+        Does not modify existing neurons or synapses, but returns lists with additional elements representing new pair neuron and synapse.
+
+        The original synapse is replaced by the new synapse (see ``transform()``), so the new synapse shares the blocks that are not changed by the transformation with the original synapse; the other blocks are copied before they are written to. Only the scopes of the shared blocks are updated to the new synapse at the end. Both the original and the new neuron are generated, and analysed by the code generator, so the neuron is copied completely.
         """
 
         new_neuron = neuron.clone()
-        new_synapse = synapse.clone()
+        self._shared_blocks = []
+        new_synapse = self.clone_sharing_blocks(synapse)
 
         #
         #   suffix for variables that will be transferred to neuron
@@ -291,6 +348,7 @@ class SynapsePostNeuronTransformer(Transformer):
         #   move state variable declarations from synapse to neuron
         #
 
+        self.get_writable_blocks(new_synapse, new_synapse.get_state_blocks())   # the state blocks of the original synapse are written to below
         for state_var in syn_to_neuron_state_vars:
             decls = ASTUtils.move_decls(state_var,
                                         neuron.get_state_blocks(),
@@ -307,7 +365,7 @@ class SynapsePostNeuronTransformer(Transformer):
             Logger.log_message(None, -1, "Moving state var defining equation(s) " + str(state_var),
                                None, LoggingLevel.INFO)
             decls = ASTUtils.equations_from_block_to_block(state_var,
-                                                           new_synapse.get_equations_block(),
+                                                           self.get_writable_blocks(new_synapse, new_synapse.get_equations_block()),
                                                            new_neuron.get_equations_block(),
                                                            var_name_suffix,
                                                            mode="move")
@@ -321,7 +379,7 @@ class SynapsePostNeuronTransformer(Transformer):
             Logger.log_message(None, -1, "Moving state variables for equation(s) " + str(state_var),
                                None, LoggingLevel.INFO)
             ASTUtils.move_decls(var_name=state_var,
-                                from_block=new_synapse.get_state_blocks(),
+                                from_block=self.get_writable_blocks(new_synapse, new_synapse.get_state_blocks()),
                                 to_block=new_neuron.get_state_blocks(),
                                 var_name_suffix=var_name_suffix,
                                 block_type=BlockType.STATE,
@@ -367,7 +425,7 @@ class SynapsePostNeuronTransformer(Transformer):
         assert len(spiking_post_port_names) <= 1, "Can only handle one spiking \"post\" port"
         if len(spiking_post_port_names) > 0:
             post_port_name = spiking_post_port_names[0]
-            post_receive_block = new_synapse.get_on_receive_block(post_port_name)
+            post_receive_block = self.get_writable_blocks(new_synapse, new_synapse.get_on_receive_block(post_port_name))
             assert post_receive_block is not None
             for state_var in syn_to_neuron_state_vars:
                 Logger.log_message(None, -1, "Moving onPost updates for " + str(state_var), None, LoggingLevel.INFO)
@@ -404,6 +462,7 @@ class SynapsePostNeuronTransformer(Transformer):
 
         for state_var, alternate_name in zip(post_connected_continuous_input_ports, post_variable_names):
             Logger.log_message(None, -1, "\t• Replacing variable " + str(state_var), None, LoggingLevel.INFO)
+            self.get_writable_blocks_using_variable(new_synapse, state_var)
             ASTUtils.replace_with_external_variable(state_var, new_synapse, "",
                                                     new_synapse.get_equations_blocks(), alternate_name)
 
@@ -442,6 +501,7 @@ class SynapsePostNeuronTransformer(Transformer):
             None, -1, "In synapse: replacing variables with suffixed external variable references", None, LoggingLevel.INFO)
         for state_var in syn_to_neuron_state_vars:
             Logger.log_message(None, -1, "\t• Replacing variable " + str(state_var), None, LoggingLevel.INFO)
+            self.get_writable_blocks_using_variable(new_synapse, state_var)
             ASTUtils.replace_with_external_variable(
                 state_var, new_synapse, var_name_suffix, new_neuron.get_equations_blocks())
 
@@ -477,6 +537,11 @@ class SynapsePostNeuronTransformer(Transformer):
         new_neuron.accept(ASTSymbolTableVisitor())
         new_synapse.accept(ASTSymbolTableVisitor())
 
+        # the spike updates that were moved into the neuron are not part of its AST, so their scope has to be updated separately
+        for stmt in new_neuron.moved_spike_updates:
+            stmt.update_scope(new_neuron.get_update_blocks().get_scope())
+            stmt.accept(ASTSymbolTableVisitor())
+
         ASTUtils.update_blocktype_for_common_parameters(new_synapse)
 
         Logger.log_message(None, -1, "Successfully constructed neuron-synapse pair "
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+#
+# arithmetic_expression_parser.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import List, Optional, Tuple, Union
+
+import re
+
+from pynestml.generated.PyNestMLLexer import PyNestMLLexer
+from pynestml.meta_model.ast_expression import ASTExpression
+from pynestml.meta_model.ast_node_factory import ASTNodeFactory
+from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
+from pynestml.utils.ast_source_location import ASTSourceLocation
+
+
+class ArithmeticExpressionParser:
+    r"""
+    A hand-written parser for the arithmetic subset of the expression language, i.e., expressions that consist of numbers, variables, the operators ``+``, ``-``, ``*``, ``/`` and ``**``, parentheses and function calls, e.g. ``exp(-h / tau_syn) * (I_syn + 2.5E-3)``. Expressions of this form are created in large numbers by the code generators, in particular from the results of ODE-toolbox (propagators, update expressions and initial values), and can be parsed much faster with a precedence climbing (Pratt) parser than with the full grammar.
+
+    The parser gives the same tree as the ANTLR parser (``ModelParser.parse_expression()``), with the "added" source position for all nodes. It recognises the subset only: if a string contains anything else (e.g. physical units following a number, comparisons, or differential orders), or is not a valid expression, ``None`` is returned, and the string should be parsed with the ANTLR parser instead.
+    """
+
+    # the tokens of the subset, in the order in which the lexer of the grammar matches them; whitespace is skipped
+    _token_regex = re.compile(r"""(?P<ws>[ \t]+)
+                                  |(?P<float>(?:(?:[0-9]*\.[0-9]+|[0-9]+\.)(?:[eE][+-]?[0-9]+)?|[0-9]+[eE][+-]?[0-9]+))
+                                  |(?P<int>[0-9]+)
+                                  |(?P<name>[a-zA-Z_$][a-zA-Z_0-9$]*)
+                                  |(?P<op>\*\*|[-+*/(),])""", re.VERBOSE)
+
+    # names that the lexer recognises as keywords or boolean literals rather than as names
+    _keywords = frozenset([literal_name[1:-1] for literal_name in PyNestMLLexer.literalNames
+                           if re.fullmatch(r"'[a-zA-Z_$][a-zA-Z_0-9$]*'", literal_name)] + ["true", "True", "false", "False"])
+
+    # binding powers of the binary operators, and of the unary operators (which bind stronger than ``*``, but weaker than ``**``)
+    _binary_operators = {"+": 10, "-": 10, "*": 20, "/": 20, "**": 40}
+    _unary_binding_power = 30
+
+    @classmethod
+    def parse(cls, string: str) -> Optional[Union[ASTExpression, ASTSimpleExpression]]:
+        r"""
+        Parse an arithmetic expression.
+        :param string: the expression
+        :return: the tree, or None if the string is not an expression of the arithmetic subset
+        """
+        tokens = cls._tokenize(string)
+        if not tokens:
+            return None
+
+        parser = _PrattParser(tokens)
+        try:
+            node = parser.parse_expression(0)
+        except _NotInSubsetException:
+            return None
+
+        if parser.pos != len(tokens):
+            return None
+
+        return node
+
+    @classmethod
+    def _tokenize(cls, string: str) -> Optional[List[Tuple[str, str]]]:
+        tokens = []
+        pos = 0
+        while pos < len(string):
+            match = cls._token_regex.match(string, pos)
+            if match is None:
+                return None
+
+            kind = match.lastgroup
+            text = match.group(kind)
+            pos = match.end()
+            if kind == "ws":
+                continue
+
+            if kind == "name" and text in cls._keywords:
+                return None
+
+            tokens.append((kind, text))
+
+        return tokens
+
+
+class _NotInSubsetException(Exception):
+    pass
+
+
+class _PrattParser:
+    r"""
+    Builds the tree for a list of tokens; the nodes are created as by ``ASTBuilderVisitor``.
+    """
+
+    def __init__(self, tokens: List[Tuple[str, str]]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def _peek(self) -> Optional[Tuple[str, str]]:
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+
+        return None
+
+    def _next(self) -> Tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            raise _NotInSubsetException()
+
+        self.pos += 1
+        return token
+
+    def _expect(self, text: str) -> None:
+        if self._next() != ("op", text):
+            raise _NotInSubsetException()
+
+    def parse_expression(self, min_binding_power: int) -> Union[ASTExpression, ASTSimpleExpression]:
+        lhs = self._parse_prefix()
+        while True:
+            token = self._peek()
+            if token is None or token[0] != "op" or token[1] not in ArithmeticExpressionParser._binary_operators.keys():
+                return lhs
+
+            binding_power = ArithmeticExpressionParser._binary_operators[token[1]]
+            if binding_power <= min_binding_power:
+                return lhs
+
+            self.pos += 1
+            if token[1] == "**":
+                # right-associative
+                rhs = self.parse_expression(binding_power - 1)
+            else:
+                rhs = self.parse_expression(binding_power)
+
+            op = ASTNodeFactory.create_ast_arithmetic_operator(is_times_op=token[1] == "*", is_div_op=token[1] == "/",
+                                                               is_plus_op=token[1] == "+", is_minus_op=token[1] == "-",
+                                                               is_pow_op=token[1] == "**",
+                                                               source_position=ASTSourceLocation.get_added_source_position())
+            lhs = ASTNodeFactory.create_ast_compound_expression(lhs=lhs, binary_operator=op, rhs=rhs,
+                                                                source_position=ASTSourceLocation.get_added_source_position())
+
+    def _parse_prefix(self) -> Union[ASTExpression, ASTSimpleExpression]:
+        kind, text = self._next()
+        if kind == "op" and text in ["+", "-"]:
+            unary_operator = ASTNodeFactory.create_ast_unary_operator(is_unary_plus=text == "+", is_unary_minus=text == "-",
+                                                                       source_position=ASTSourceLocation.get_added_source_position())
+            expression = self.parse_expression(ArithmeticExpressionParser._unary_binding_power)
+            return ASTNodeFactory.create_ast_expression(unary_operator=unary_operator, expression=expression,
+                                                        source_position=ASTSourceLocation.get_added_source_position())
+
+        if kind == "op" and text == "(":
+            expression = self.parse_expression(0)
+            self._expect(")")
+            return ASTNodeFactory.create_ast_expression(is_encapsulated=True, expression=expression,
+                                                        source_position=ASTSourceLocation.get_added_source_position())
+
+        if kind in ["int", "float"]:
+            next_token = self._peek()
+            if next_token is not None and next_token[0] == "name":
+                # a number followed by a physical unit
+                raise _NotInSubsetException()
+
+            numeric_literal = int(text) if kind == "int" else float(text)
+            return ASTNodeFactory.create_ast_simple_expression(numeric_literal=numeric_literal,
+                                                               source_position=ASTSourceLocation.get_added_source_position())
+
+        if kind == "name":
+            if self._peek() == ("op", "("):
+                self.pos += 1
+                args = []
+                if self._peek() == ("op", ")"):
+                    self.pos += 1
+                else:
+                    args.append(self.parse_expression(0))
+                    while self._peek() == ("op", ","):
+                        self.pos += 1
+                        args.append(self.parse_expression(0))
+
+                    self._expect(")")
+
+                function_call = ASTNodeFactory.create_ast_function_call(callee_name=text, args=args,
+                                                                        source_position=ASTSourceLocation.get_added_source_position())
+                return ASTNodeFactory.create_ast_simple_expression(function_call=function_call,
+                                                                   source_position=ASTSourceLocation.get_added_source_position())
+
+            variable = ASTNodeFactory.create_ast_variable(name=text, differential_order=0,
+                                                          source_position=ASTSourceLocation.get_added_source_position())
+            return ASTNodeFactory.create_ast_simple_expression(variable=variable,
+                                                               source_position=ASTSourceLocation.get_added_source_position())
+
+        raise _NotInSubsetException()
@@ -24,6 +24,8 @@ import sys
 class ASTSourceLocation:
     """
     This class is used to store information regarding the source position of an element.
+
+    Source positions are immutable. The positions created by ``make_ast_source_position()`` (and the predefined and added source positions) are interned, i.e., equal positions are represented by the same object, which is shared between all nodes at this position and their clones.
     Attributes:
         start_line = 0
         start_column = 0
@@ -31,6 +33,11 @@ class ASTSourceLocation:
         end_column = 0
     """
 
+    __slots__ = ("start_line", "start_column", "end_line", "end_column")
+
+    # the interned source positions, by (start_line, start_column, end_line, end_column)
+    _interned = {}
+
     def __init__(self, start_line, start_column, end_line, end_column):
         """
         Standard constructor.
@@ -60,10 +67,20 @@ class ASTSourceLocation:
         :type end_line: int
         :param end_column: The end column of the object
         :type end_column: int
-        :return: a new ASTSourceLocation object
+        :return: an ASTSourceLocation object
         :rtype: ASTSourceLocation
         """
-        return cls(start_line=start_line, start_column=start_column, end_line=end_line, end_column=end_column)
+        key = (start_line, start_column, end_line, end_column)
+        source_position = cls._interned.get(key)
+        if source_position is None:
+            source_position = cls._interned.setdefault(key, cls(start_line=start_line, start_column=start_column,
+                                                                end_line=end_line, end_column=end_column))
+
+        return source_position
+
+    def __reduce__(self):
+        # positions are interned again when they are unpickled or copied
+        return ASTSourceLocation.make_ast_source_position, (self.start_line, self.start_column, self.end_line, self.end_column)
 
     def get_start_line(self):
         """
@@ -150,7 +167,7 @@ class ASTSourceLocation:
         :return: a source position
         :rtype: ASTSourceLocation
         """
-        return cls(-1, -1, -1, -1)
+        return cls.make_ast_source_position(-1, -1, -1, -1)
 
     @classmethod
     def get_added_source_position(cls):
@@ -159,7 +176,7 @@ class ASTSourceLocation:
         :return: a source position.
         :rtype: ASTSourceLocation
         """
-        return cls(sys.maxsize, sys.maxsize, sys.maxsize, sys.maxsize)
+        return cls.make_ast_source_position(sys.maxsize, sys.maxsize, sys.maxsize, sys.maxsize)
 
     def is_predefined_source_position(self):
         """
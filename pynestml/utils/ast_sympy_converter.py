@@ -0,0 +1,390 @@
+# -*- coding: utf-8 -*-
+#
+# ast_sympy_converter.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import List, Union
+
+import sympy
+from sympy.printing.precedence import PRECEDENCE, precedence
+
+from pynestml.codegeneration.printers.unit_converter import UnitConverter
+from pynestml.meta_model.ast_arithmetic_operator import ASTArithmeticOperator
+from pynestml.meta_model.ast_comparison_operator import ASTComparisonOperator
+from pynestml.meta_model.ast_expression import ASTExpression
+from pynestml.meta_model.ast_function_call import ASTFunctionCall
+from pynestml.meta_model.ast_logical_operator import ASTLogicalOperator
+from pynestml.meta_model.ast_node_factory import ASTNodeFactory
+from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
+from pynestml.symbols.predefined_units import PredefinedUnits
+from pynestml.symbols.symbol import SymbolKind
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.ast_utils import ASTUtils
+
+
+class ASTSympyConverter:
+    r"""
+    Converts expressions between the NESTML abstract syntax tree and sympy, without printing them to strings and parsing them again.
+
+    ``to_sympy()`` gives the same expression that ODE-toolbox obtains by parsing an expression printed by the ODE-toolbox printer of the code generator (a ``UnitlessExpressionPrinter`` with an ``ODEToolboxReferenceConverter``); numeric literals are converted without loss of precision.
+
+    ``from_sympy()`` builds the tree that is obtained by parsing the string representation of a sympy expression (``str(expr)``) with ``ModelParser.parse_expression()``, except for floating-point numbers, which are not rounded to the (default) 15 digits with which sympy prints them, and for Euler's number, which is converted to the NESTML constant ``e``.
+    """
+
+    # the functions and constants that ODE-toolbox recognises in its input; other functions are converted to undefined sympy functions
+    _sympy_functions = {"exp": sympy.exp,
+                        "log": sympy.log,
+                        "sin": sympy.sin,
+                        "cos": sympy.cos,
+                        "tan": sympy.tan,
+                        "asin": sympy.asin,
+                        "sinh": sympy.sinh,
+                        "asinh": sympy.asinh,
+                        "acos": sympy.acos,
+                        "cosh": sympy.cosh,
+                        "acosh": sympy.acosh,
+                        "tanh": sympy.tanh,
+                        "atanh": sympy.atanh,
+                        "min": sympy.Min,
+                        "max": sympy.Max,
+                        "Heaviside": sympy.Heaviside,
+                        "DiracDelta": sympy.DiracDelta,
+                        "Pow": sympy.Pow,
+                        "power": sympy.Pow}
+    _sympy_constants = {"e": sympy.E,
+                        "E": sympy.E}
+
+    _sympy_comparisons = {sympy.StrictLessThan: "is_lt",
+                          sympy.LessThan: "is_le",
+                          sympy.StrictGreaterThan: "is_gt",
+                          sympy.GreaterThan: "is_ge"}
+
+    @classmethod
+    def to_sympy(cls, node: Union[ASTExpression, ASTSimpleExpression, ASTFunctionCall], convert_units: bool = True) -> sympy.Expr:
+        r"""
+        Convert an expression (or a function call) to sympy.
+
+        Variables are converted to symbols named as in the ODE-toolbox input and output (see ``ASTUtils.to_ode_toolbox_processed_name()``). If ``convert_units`` is set, physical units are replaced by their conversion factors, as in ``UnitlessExpressionPrinter``; otherwise, they are converted to symbols by their name.
+        :param node: the expression or function call
+        :param convert_units: whether to convert physical units to numbers
+        :return: the sympy expression
+        """
+        expr = cls._to_sympy(node, convert_units)
+        if node.get_implicit_conversion_factor() is not None and not node.get_implicit_conversion_factor() == 1:
+            expr = cls._number_to_sympy(node.get_implicit_conversion_factor()) * expr
+
+        return expr
+
+    @classmethod
+    def _number_to_sympy(cls, value: Union[int, float]) -> sympy.Expr:
+        if isinstance(value, int):
+            return sympy.Integer(value)
+
+        return sympy.Float(value)
+
+    @classmethod
+    def _name_to_sympy(cls, name: str) -> sympy.Expr:
+        if name in cls._sympy_constants.keys():
+            return cls._sympy_constants[name]
+
+        return sympy.Symbol(ASTUtils.to_ode_toolbox_processed_name(name))
+
+    @classmethod
+    def _to_sympy(cls, node: Union[ASTExpression, ASTSimpleExpression, ASTFunctionCall], convert_units: bool) -> sympy.Expr:
+        if isinstance(node, ASTFunctionCall):
+            args = [cls.to_sympy(arg, convert_units) for arg in node.get_args()]
+            if node.get_name() in cls._sympy_functions.keys():
+                return cls._sympy_functions[node.get_name()](*args)
+
+            return sympy.Function(node.get_name())(*args)
+
+        if isinstance(node, ASTSimpleExpression):
+            if node.is_numeric_literal():
+                if node.get_variable() is not None and not convert_units:
+                    return cls._number_to_sympy(node.get_numeric_literal()) * sympy.Symbol(node.get_variable().get_complete_name())
+
+                return cls._number_to_sympy(node.get_numeric_literal())
+
+            if node.is_inf_literal:
+                return sympy.Symbol("inf")
+
+            if node.is_boolean_true:
+                return sympy.Symbol("true")
+
+            if node.is_boolean_false:
+                return sympy.Symbol("false")
+
+            if node.is_variable():
+                name = node.get_variable().get_complete_name()
+                if convert_units and node.get_scope() is not None \
+                   and node.get_scope().resolve_to_symbol(name, SymbolKind.VARIABLE) is None and PredefinedUnits.is_unit(name):
+                    # case for a literal unit, e.g. "ms"
+                    return cls._number_to_sympy(UnitConverter.get_factor(PredefinedUnits.get_unit(name).get_unit()))
+
+                return cls._name_to_sympy(name)
+
+            if node.is_function_call():
+                return cls.to_sympy(node.get_function_call(), convert_units)
+
+            raise NotImplementedError("Cannot convert expression \"" + str(node) + "\" to sympy")
+
+        if node.is_unary_operator():
+            expr = cls.to_sympy(node.get_expression(), convert_units)
+            if node.get_unary_operator().is_unary_minus:
+                return -expr
+
+            if node.get_unary_operator().is_unary_plus:
+                return expr
+
+        if node.is_encapsulated:
+            return cls.to_sympy(node.get_expression(), convert_units)
+
+        if node.is_logical_not:
+            return sympy.Not(cls.to_sympy(node.get_expression(), convert_units))
+
+        if node.is_compound_expression():
+            lhs = cls.to_sympy(node.get_lhs(), convert_units)
+            rhs = cls.to_sympy(node.get_rhs(), convert_units)
+            op = node.get_binary_operator()
+            if isinstance(op, ASTArithmeticOperator):
+                if op.is_pow_op:
+                    return lhs ** rhs
+
+                if op.is_times_op:
+                    return lhs * rhs
+
+                if op.is_div_op:
+                    return lhs / rhs
+
+                if op.is_modulo_op:
+                    return sympy.Mod(lhs, rhs)
+
+                if op.is_plus_op:
+                    return lhs + rhs
+
+                if op.is_minus_op:
+                    return lhs - rhs
+
+            if isinstance(op, ASTComparisonOperator):
+                if op.is_lt:
+                    return sympy.Lt(lhs, rhs)
+
+                if op.is_le:
+                    return sympy.Le(lhs, rhs)
+
+                if op.is_eq:
+                    return sympy.Eq(lhs, rhs)
+
+                if op.is_ne or op.is_ne2:
+                    return sympy.Ne(lhs, rhs)
+
+                if op.is_ge:
+                    return sympy.Ge(lhs, rhs)
+
+                if op.is_gt:
+                    return sympy.Gt(lhs, rhs)
+
+            if isinstance(op, ASTLogicalOperator):
+                if op.is_logical_and:
+                    return sympy.And(lhs, rhs)
+
+                if op.is_logical_or:
+                    return sympy.Or(lhs, rhs)
+
+        if node.is_ternary_operator():
+            # ODE-toolbox does not support the ternary operator; as in ``ODEToolboxReferenceConverter``, the condition is ignored
+            condition = cls.to_sympy(node.get_condition(), convert_units)
+            if_true = cls.to_sympy(node.get_if_true(), convert_units)
+            if_not = cls.to_sympy(node.get_if_not(), convert_units)
+            return 0 * condition + if_true + 0 * if_not
+
+        raise NotImplementedError("Cannot convert expression \"" + str(node) + "\" to sympy")
+
+    @classmethod
+    def from_sympy(cls, expr: sympy.Basic) -> Union[ASTExpression, ASTSimpleExpression]:
+        r"""
+        Convert a sympy expression to an expression. The source positions of all nodes are set to the "added" source position, as for expressions obtained from ``ModelParser.parse_expression()``.
+
+        Arithmetic operations, numbers, symbols, function applications and the relations ``<``, ``<=``, ``>``, ``>=`` are supported.
+        :param expr: the sympy expression
+        :return: the expression
+        """
+        return cls._from_sympy(expr)
+
+    @classmethod
+    def _source_position(cls) -> ASTSourceLocation:
+        return ASTSourceLocation.get_added_source_position()
+
+    @classmethod
+    def _encapsulate(cls, node: Union[ASTExpression, ASTSimpleExpression]) -> ASTExpression:
+        return ASTNodeFactory.create_ast_expression(is_encapsulated=True, expression=node, source_position=cls._source_position())
+
+    @classmethod
+    def _parenthesize(cls, expr: sympy.Basic, level: int) -> Union[ASTExpression, ASTSimpleExpression]:
+        # follows ``StrPrinter.parenthesize(expr, level, strict=False)``
+        node = cls._from_sympy(expr)
+        if precedence(expr) <= level:
+            return cls._encapsulate(node)
+
+        return node
+
+    @classmethod
+    def _negate(cls, node: Union[ASTExpression, ASTSimpleExpression]) -> ASTExpression:
+        unary_minus = ASTNodeFactory.create_ast_unary_operator(is_unary_minus=True, source_position=cls._source_position())
+        return ASTNodeFactory.create_ast_expression(unary_operator=unary_minus, expression=node, source_position=cls._source_position())
+
+    @classmethod
+    def _strip_leading_minus(cls, node: Union[ASTExpression, ASTSimpleExpression]) -> Union[ASTExpression, ASTSimpleExpression, None]:
+        r"""
+        Returns the tree of the string representation of ``node`` without the leading minus sign, or None if it does not start with a minus sign.
+        """
+        if isinstance(node, ASTExpression):
+            if node.is_unary_operator() and node.get_unary_operator().is_unary_minus:
+                return node.get_expression()
+
+            if node.is_compound_expression():
+                lhs = cls._strip_leading_minus(node.get_lhs())
+                if lhs is not None:
+                    return ASTNodeFactory.create_ast_compound_expression(lhs, node.get_binary_operator(), node.get_rhs(), cls._source_position())
+
+        return None
+
+    @classmethod
+    def _binary(cls, lhs: Union[ASTExpression, ASTSimpleExpression], rhs: Union[ASTExpression, ASTSimpleExpression], **kwargs) -> ASTExpression:
+        op = ASTNodeFactory.create_ast_arithmetic_operator(source_position=cls._source_position(), **kwargs)
+        return ASTNodeFactory.create_ast_compound_expression(lhs, op, rhs, cls._source_position())
+
+    @classmethod
+    def _product(cls, factors: List[Union[ASTExpression, ASTSimpleExpression]]) -> Union[ASTExpression, ASTSimpleExpression]:
+        node = factors[0]
+        for factor in factors[1:]:
+            node = cls._binary(node, factor, is_times_op=True)
+
+        return node
+
+    @classmethod
+    def _from_sympy(cls, expr: sympy.Basic) -> Union[ASTExpression, ASTSimpleExpression]:
+        if expr.is_Integer or expr.is_Float:
+            if expr.is_negative:
+                return cls._negate(cls._from_sympy(-expr))
+
+            value = int(expr) if expr.is_Integer else float(expr)
+            return ASTNodeFactory.create_ast_simple_expression(numeric_literal=value, source_position=cls._source_position())
+
+        if expr.is_Rational:
+            if expr.is_negative:
+                return cls._negate(cls._from_sympy(-expr))
+
+            return cls._binary(cls._from_sympy(sympy.Integer(expr.p)), cls._from_sympy(sympy.Integer(expr.q)), is_div_op=True)
+
+        if expr in [sympy.true, sympy.false] or (expr.is_Symbol and str(expr) in ["true", "True", "false", "False"]):
+            return ASTNodeFactory.create_ast_simple_expression(boolean_literal=str(expr) in ["true", "True"], source_position=cls._source_position())
+
+        if expr.is_Symbol and str(expr) == "inf":
+            return ASTNodeFactory.create_ast_simple_expression(is_inf=True, source_position=cls._source_position())
+
+        if expr.is_Symbol or expr.is_NumberSymbol or expr in [sympy.oo, sympy.nan]:
+            name = "e" if expr is sympy.E else str(expr)
+            variable = ASTNodeFactory.create_ast_variable(name, source_position=cls._source_position())
+            return ASTNodeFactory.create_ast_simple_expression(variable=variable, source_position=cls._source_position())
+
+        if expr.is_Function:
+            # the value at zero of the Heaviside function is not printed
+            args = [cls._from_sympy(arg) for arg in (expr.pargs if isinstance(expr, sympy.Heaviside) else expr.args)]
+            function_call = ASTNodeFactory.create_ast_function_call(type(expr).__name__, args, cls._source_position())
+            return ASTNodeFactory.create_ast_simple_expression(function_call=function_call, source_position=cls._source_position())
+
+        if expr.is_Add:
+            # follows ``StrPrinter._print_Add()``
+            terms = expr.as_ordered_terms()
+            node = cls._from_sympy(terms[0])
+            for term in terms[1:]:
+                term_node = cls._from_sympy(term)
+                stripped_term_node = cls._strip_leading_minus(term_node)
+                if stripped_term_node is None:
+                    node = cls._binary(node, term_node, is_plus_op=True)
+                else:
+                    node = cls._binary(node, stripped_term_node, is_minus_op=True)
+
+            return node
+
+        if expr.is_Mul:
+            # follows ``StrPrinter._print_Mul()``
+            coeff, _ = expr.as_coeff_Mul()
+            negative = coeff < 0
+            if negative:
+                expr = -expr
+
+            numerator = []
+            denominator = []
+            for factor in expr.as_ordered_factors():
+                if factor.is_Pow and factor.exp.as_coeff_Mul()[0] < 0:
+                    if factor.exp is sympy.S.NegativeOne:
+                        denominator.append(factor.base)
+                    else:
+                        denominator.append(sympy.Pow(factor.base, -factor.exp, evaluate=False))
+                elif factor.is_Rational:
+                    if factor.p != 1:
+                        numerator.append(sympy.Rational(factor.p))
+                    if factor.q != 1:
+                        denominator.append(sympy.Rational(factor.q))
+                else:
+                    numerator.append(factor)
+
+            numerator = numerator or [sympy.S.One]
+            node = cls._product([cls._parenthesize(factor, PRECEDENCE["Mul"]) for factor in numerator])
+            if negative:
+                node = cls._negate_leftmost(node)
+
+            if len(denominator) == 1:
+                node = cls._binary(node, cls._parenthesize(denominator[0], PRECEDENCE["Mul"]), is_div_op=True)
+            elif len(denominator) > 1:
+                denominator_node = cls._product([cls._parenthesize(factor, PRECEDENCE["Mul"]) for factor in denominator])
+                node = cls._binary(node, cls._encapsulate(denominator_node), is_div_op=True)
+
+            return node
+
+        if expr.is_Pow:
+            # follows ``StrPrinter._print_Pow()``
+            if expr.exp is sympy.S.Half:
+                return cls._from_sympy(sympy.Function("sqrt")(expr.base))
+
+            if expr.exp == -sympy.S.Half:
+                return cls._binary(cls._from_sympy(sympy.S.One), cls._from_sympy(sympy.Function("sqrt")(expr.base)), is_div_op=True)
+
+            if expr.exp is sympy.S.NegativeOne:
+                return cls._binary(cls._from_sympy(sympy.S.One), cls._parenthesize(expr.base, PRECEDENCE["Pow"]), is_div_op=True)
+
+            return cls._binary(cls._parenthesize(expr.base, PRECEDENCE["Pow"]), cls._parenthesize(expr.exp, PRECEDENCE["Pow"]), is_pow_op=True)
+
+        if type(expr) in cls._sympy_comparisons.keys():
+            op = ASTNodeFactory.create_ast_comparison_operator(source_position=cls._source_position(), **{cls._sympy_comparisons[type(expr)]: True})
+            return ASTNodeFactory.create_ast_compound_expression(cls._from_sympy(expr.lhs), op, cls._from_sympy(expr.rhs), cls._source_position())
+
+        raise NotImplementedError("Cannot convert sympy expression \"" + str(expr) + "\"")
+
+    @classmethod
+    def _negate_leftmost(cls, node: Union[ASTExpression, ASTSimpleExpression]) -> ASTExpression:
+        r"""
+        Returns the tree of the string representation of ``node`` preceded by a minus sign, which binds to the leftmost factor.
+        """
+        if isinstance(node, ASTExpression) and node.is_compound_expression() and node.get_binary_operator().is_times_op:
+            return ASTNodeFactory.create_ast_compound_expression(cls._negate_leftmost(node.get_lhs()), node.get_binary_operator(), node.get_rhs(), cls._source_position())
+
+        return cls._negate(node)
@@ -49,6 +49,7 @@ from pynestml.meta_model.ast_stmt import ASTStmt
 from pynestml.meta_model.ast_synapse import ASTSynapse
 from pynestml.meta_model.ast_variable import ASTVariable
 from pynestml.symbols.predefined_functions import PredefinedFunctions
+from pynestml.symbols.predefined_types import PredefinedTypes
 from pynestml.symbols.symbol import SymbolKind
 from pynestml.symbols.variable_symbol import VariableSymbol, VariableType
 from pynestml.symbols.variable_symbol import BlockType
@@ -324,6 +325,25 @@ class ASTUtils:
         ast.accept(ASTHigherOrderVisitor(visit_funcs=loc_get_all_of_type))
         return ret
 
+    @classmethod
+    def get_nodes_with_invalid_parent_link(cls, ast: ASTNode) -> List[ASTNode]:
+        """
+        For debugging: finds all nodes below the handed over node whose parent link does not point to the node that contains them (see ``ASTNode.get_parent()``).
+        :param ast: a single meta_model node
+        :return: a list of the nodes with an invalid parent link
+        """
+        ret = list()
+        stack = [ast]
+        while stack:
+            node = stack.pop()
+            for child in node.get_children():
+                if child.parent is not node:
+                    ret.append(child)
+
+                stack.append(child)
+
+        return ret
+
     @classmethod
     def get_vectorized_variable(cls, ast, scope):
         """
@@ -425,6 +445,7 @@ class ASTUtils:
                                                                       ASTSourceLocation.get_added_source_position())
             internal.update_scope(neuron.get_scope())
             neuron.get_body().get_body_elements().append(internal)
+            internal.parent = neuron.get_body()
         return neuron
 
     @classmethod
@@ -442,6 +463,7 @@ class ASTUtils:
             state = ASTNodeFactory.create_ast_block_with_variables(True, False, False, list(),
                                                                    ASTSourceLocation.get_added_source_position())
             neuron.get_body().get_body_elements().append(state)
+            state.parent = neuron.get_body()
         return neuron
 
     @classmethod
@@ -470,6 +492,7 @@ class ASTUtils:
         if neuron.get_state_blocks() is None:
             ASTUtils.create_state_block(neuron)
         neuron.get_state_blocks().get_declarations().append(declaration)
+        declaration.parent = neuron.get_state_blocks()
         return
 
     @classmethod
@@ -587,19 +610,21 @@ class ASTUtils:
             ast_ext_var.accept(ASTSymbolTableVisitor())
 
             if isinstance(_expr, ASTSimpleExpression) and _expr.is_variable():
-                Logger.log_message(None, -1, "ASTSimpleExpression replacement made (var = " + str(
-                    ast_ext_var.get_name()) + ") in expression: " + str(node.get_parent(_expr)), None, LoggingLevel.INFO)
+                Logger.log_deferred_message(lambda: (-1, "ASTSimpleExpression replacement made (var = " + str(
+                    ast_ext_var.get_name()) + ") in expression: " + str(node.get_parent(_expr))), log_level=LoggingLevel.INFO)
                 _expr.set_variable(ast_ext_var)
                 return
 
             if isinstance(_expr, ASTVariable):
-                if isinstance(node.get_parent(_expr), ASTAssignment):
-                    node.get_parent(_expr).lhs = ast_ext_var
-                    Logger.log_message(None, -1, "ASTVariable replacement made in expression: "
-                                       + str(node.get_parent(_expr)), None, LoggingLevel.INFO)
-                elif isinstance(node.get_parent(_expr), ASTSimpleExpression) and node.get_parent(_expr).is_variable():
-                    node.get_parent(_expr).set_variable(ast_ext_var)
-                elif isinstance(node.get_parent(_expr), ASTDeclaration):
+                parent = node.get_parent(_expr)
+                if isinstance(parent, ASTAssignment):
+                    parent.lhs = ast_ext_var
+                    ast_ext_var.parent = parent
+                    Logger.log_deferred_message(lambda: (-1, "ASTVariable replacement made in expression: "
+                                                         + str(parent)), log_level=LoggingLevel.INFO)
+                elif isinstance(parent, ASTSimpleExpression) and parent.is_variable():
+                    parent.set_variable(ast_ext_var)
+                elif isinstance(parent, ASTDeclaration):
                     # variable could occur on the left-hand side; ignore. Only replace if it occurs on the right-hand side.
                     pass
                 else:
@@ -719,6 +744,7 @@ class ASTUtils:
                 if not decl.get_variables()[0].name.endswith(var_name_suffix):
                     ASTUtils.add_suffix_to_decl_lhs(decl, suffix=var_name_suffix)
                 to_block.get_declarations().append(decl)
+                decl.parent = to_block
                 decl.update_scope(to_block.get_scope())
 
                 ast_symbol_table_visitor = ASTSymbolTableVisitor()
@@ -742,6 +768,7 @@ class ASTUtils:
                 from_block.declarations.remove(decl)
             ASTUtils.add_suffix_to_decl_lhs(decl, suffix=var_name_suffix)
             to_block.get_declarations().append(decl)
+            decl.parent = to_block
             decl.update_scope(to_block.get_scope())
 
         return decls
@@ -932,7 +959,6 @@ class ASTUtils:
         :return: the neuron extended by the variable
         """
         from pynestml.utils.model_parser import ModelParser
-        from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 
         tmp = ModelParser.parse_expression(init_expression)
         vector_variable = ASTUtils.get_vectorized_variable(tmp, neuron.get_scope())
@@ -943,12 +969,7 @@ class ASTUtils:
         ast_declaration = ModelParser.parse_declaration(declaration_string)
         if vector_variable is not None:
             ast_declaration.set_size_parameter(vector_variable.get_vector_parameter())
-        neuron.add_to_internal_block(ast_declaration)
-        ast_declaration.update_scope(neuron.get_internals_blocks().get_scope())
-        symtable_visitor = ASTSymbolTableVisitor()
-        symtable_visitor.block_type_stack.push(BlockType.INTERNALS)
-        ast_declaration.accept(symtable_visitor)
-        symtable_visitor.block_type_stack.pop()
+        neuron.add_to_internal_block(ast_declaration)   # also registers the declared symbol
         return neuron
 
     @classmethod
@@ -974,7 +995,6 @@ class ASTUtils:
         :return: a modified neuron
         """
         from pynestml.utils.model_parser import ModelParser
-        from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 
         tmp = ModelParser.parse_expression(initial_value)
         vector_variable = ASTUtils.get_vectorized_variable(tmp, neuron.get_scope())
@@ -984,15 +1004,95 @@ class ASTUtils:
         ast_declaration = ModelParser.parse_declaration(declaration_string)
         if vector_variable is not None:
             ast_declaration.set_size_parameter(vector_variable.get_vector_parameter())
-        neuron.add_to_state_block(ast_declaration)
-        ast_declaration.update_scope(neuron.get_state_blocks().get_scope())
+        neuron.add_to_state_block(ast_declaration)   # also registers the declared symbol
 
+        return neuron
+
+    @classmethod
+    def register_symbols_declared_by(cls, node: Union[ASTDeclaration, ASTInlineExpression], scope, block_type: Optional[BlockType] = None) -> None:
+        """
+        Adds the symbols declared by a declaration or inline expression to the given scope, and updates the scope of the node and its children.
+        :param node: a declaration or inline expression
+        :param scope: the scope to add the symbols to
+        :param block_type: the type of the block containing the declaration
+        """
+        from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
+
+        node.update_scope(scope)
         symtable_visitor = ASTSymbolTableVisitor()
-        symtable_visitor.block_type_stack.push(BlockType.STATE)
-        ast_declaration.accept(symtable_visitor)
-        symtable_visitor.block_type_stack.pop()
+        if block_type is not None:
+            symtable_visitor.block_type_stack.push(block_type)
+        node.accept(symtable_visitor)
+        if block_type is not None:
+            symtable_visitor.block_type_stack.pop()
 
-        return neuron
+    @classmethod
+    def unregister_symbols_declared_by(cls, node: ASTNode) -> None:
+        """
+        Removes the symbols declared by a node (for instance, a declaration or inline expression) from its scope.
+        :param node: the declaring node
+        """
+        scope = node.get_scope()
+        if scope is None:
+            return
+
+        for symbol in scope.get_symbols_in_this_scope():
+            if symbol.get_referenced_object() is node:
+                scope.delete_symbol(symbol)
+
+    @classmethod
+    def update_symbol_table_incrementally(cls, model: Union[ASTNeuron, ASTSynapse]) -> None:
+        """
+        Brings the symbol table of a model up to date after it has been rewritten, without rebuilding it from scratch and without checking the context conditions again.
+
+        The methods of this class that add or modify declarations register the corresponding symbols themselves. What remains to be done is to remove the symbols of declarations that are no longer part of the model, to restore the order in which the symbols would have been added by a full rebuild, and to assign the ODEs and kernels to the variables again.
+        :param model: a neuron or synapse
+        """
+        positions = {}
+
+        def record_position(node):
+            positions.setdefault(id(node), len(positions))
+
+        model.accept(ASTHigherOrderVisitor(visit_funcs=record_position))
+
+        def is_declared(symbol) -> bool:
+            node = symbol.get_referenced_object()
+            if node is None:
+                return True    # predefined symbol
+
+            if id(node) not in positions:
+                return False
+
+            if isinstance(node, ASTDeclaration):
+                return symbol.get_symbol_name() in [var.get_complete_name() for var in node.get_variables()]
+
+            return True
+
+        scope = model.get_scope()
+
+        # add the types that have been registered since the symbol table was built, as a full rebuild would
+        for type_name, type_symbol in PredefinedTypes.get_types().items():
+            if scope.resolve_to_symbol(type_name, SymbolKind.TYPE) is None:
+                scope.add_symbol(type_symbol)
+
+        # remove symbols of removed declarations, and symbols that have been registered more than once (keeping the latest)
+        registered = set()
+        for symbol in reversed(scope.get_symbols_in_this_scope()):
+            key = (symbol.get_symbol_name(), symbol.get_symbol_kind(), id(symbol.get_referenced_object()))
+            if not is_declared(symbol) or (symbol.get_referenced_object() is not None and key in registered):
+                scope.delete_symbol(symbol)
+            registered.add(key)
+
+        scope.sort_symbols(key=lambda symbol: -1 if symbol.get_referenced_object() is None
+                           else positions[id(symbol.get_referenced_object())])
+
+        for symbol in scope.get_symbols_in_this_scope():
+            if isinstance(symbol, VariableSymbol) and not symbol.is_predefined:
+                symbol.set_ode_or_kernel(None)
+
+        if isinstance(model, ASTNeuron) and model.get_equations_blocks() is not None \
+           and len(model.get_equations_blocks().get_declarations()) > 0:
+            cls.assign_ode_to_variables(model.get_equations_blocks())
 
     @classmethod
     def declaration_in_state_block(cls, neuron: ASTNeuron, variable_name: str) -> bool:
@@ -1028,7 +1128,7 @@ class ASTUtils:
                                               source_position=ASTSourceLocation.get_added_source_position())
         if not neuron.get_update_blocks():
             neuron.create_empty_update_block()
-        neuron.get_update_blocks().get_block().get_stmts().append(stmt)
+        neuron.get_update_blocks().get_block().add_stmt(stmt)
         small_stmt.update_scope(neuron.get_update_blocks().get_block().get_scope())
         stmt.update_scope(neuron.get_update_blocks().get_block().get_scope())
         return neuron
@@ -1047,7 +1147,7 @@ class ASTUtils:
                                               source_position=ASTSourceLocation.get_added_source_position())
         if not neuron.get_update_blocks():
             neuron.create_empty_update_block()
-        neuron.get_update_blocks().get_block().get_stmts().append(stmt)
+        neuron.get_update_blocks().get_block().add_stmt(stmt)
         small_stmt.update_scope(neuron.get_update_blocks().get_block().get_scope())
         stmt.update_scope(neuron.get_update_blocks().get_block().get_scope())
         return neuron
@@ -1451,6 +1551,10 @@ class ASTUtils:
             return
 
         for iv_decl in neuron.get_state_blocks().get_declarations():
+            if not any([cls.is_ode_variable(var.get_name(), neuron) for var in iv_decl.get_variables()]):
+                continue
+
+            cls.unregister_symbols_declared_by(iv_decl)
             for var in iv_decl.get_variables():
                 var_name = var.get_complete_name()
                 if cls.is_ode_variable(var.get_name(), neuron):
@@ -1468,6 +1572,8 @@ class ASTUtils:
                     iv_expr.update_scope(neuron.get_state_blocks().get_scope())
                     iv_decl.set_expression(iv_expr)
 
+            cls.register_symbols_declared_by(iv_decl, neuron.get_state_blocks().get_scope(), BlockType.STATE)
+
     @classmethod
     def create_initial_values_for_kernels(cls, neuron: ASTNeuron, solver_dicts: List[dict], kernels: List[ASTKernel]) -> None:
         """
@@ -1609,6 +1715,7 @@ class ASTUtils:
                 target_definition = str(target.get_expression())
                 target_definition = re.sub(matcher, "(" + str(source.get_expression()) + ")", target_definition)
                 target.expression = ModelParser.parse_expression(target_definition)
+                target.expression.parent = target
                 target.expression.update_scope(source.get_scope())
                 target.expression.accept(ASTSymbolTableVisitor())
 
@@ -1618,6 +1725,12 @@ class ASTUtils:
 
                 target.expression.accept(ASTHigherOrderVisitor(visit_funcs=log_set_source_position))
 
+        # the symbols still refer to the original defining expressions
+        for inline_expression in inline_expressions:
+            if inline_expression.get_scope() is not None:
+                cls.unregister_symbols_declared_by(inline_expression)
+                cls.register_symbols_declared_by(inline_expression, inline_expression.get_scope())
+
         return inline_expressions
 
     @classmethod
@@ -1640,6 +1753,7 @@ class ASTUtils:
                 target_definition = str(target.get_rhs())
                 target_definition = re.sub(matcher, "(" + str(m.get_expression()) + ")", target_definition)
                 target.rhs = ModelParser.parse_expression(target_definition)
+                target.rhs.parent = target
                 target.update_scope(m.get_scope())
                 target.accept(ASTSymbolTableVisitor())
 
@@ -1654,8 +1768,10 @@ class ASTUtils:
     @classmethod
     def get_delta_factors_(cls, neuron: ASTNeuron, equations_block: ASTEquationsBlock) -> dict:
         r"""
-        For every occurrence of a convolution of the form `x^(n) = a * convolve(kernel, inport) + ...` where `kernel` is a delta function, add the element `(x^(n), inport) --> a` to the set.
+        For every occurrence of a convolution of the form `x^(n) = a * convolve(kernel, inport) + ...` where `kernel` is a delta function, add the element `(x^(n), inport) --> a` to the set. The factors `a` are given as sympy expressions, in which physical units appear as symbols.
         """
+        from pynestml.utils.ast_sympy_converter import ASTSympyConverter
+
         delta_factors = {}
         for ode_eq in equations_block.get_ode_equations():
             var = ode_eq.get_lhs()
@@ -1667,16 +1783,13 @@ class ASTUtils:
                 kernel = conv_call.args[0]
                 if cls.is_delta_kernel(neuron.get_kernel_by_name(kernel.get_variable().get_name())):
                     inport = conv_call.args[1].get_variable()
-                    expr_str = str(expr)
-                    sympy_expr = sympy.parsing.sympy_parser.parse_expr(expr_str)
-                    sympy_expr = sympy.expand(sympy_expr)
-                    sympy_conv_expr = sympy.parsing.sympy_parser.parse_expr(str(conv_call))
-                    factor_str = []
+                    sympy_expr = sympy.expand(ASTSympyConverter.to_sympy(expr, convert_units=False))
+                    sympy_conv_expr = ASTSympyConverter.to_sympy(conv_call, convert_units=False)
+                    factor = []
                     for term in sympy.Add.make_args(sympy_expr):
                         if term.find(sympy_conv_expr):
-                            factor_str.append(str(term.replace(sympy_conv_expr, 1)))
-                    factor_str = " + ".join(factor_str)
-                    delta_factors[(var, inport)] = factor_str
+                            factor.append(term.replace(sympy_conv_expr, 1))
+                    delta_factors[(var, inport)] = sympy.Add(*factor)
 
         return delta_factors
 
@@ -1752,6 +1865,7 @@ class ASTUtils:
                     ast_variable = ASTVariable(replace_with_var_name + '__d' * var.get_differential_order(),
                                                differential_order=0)
                     ast_variable.set_source_position(var.get_source_position())
+                    ast_variable.update_scope(_expr.get_scope())
                     _expr.set_variable(ast_variable)
 
             elif isinstance(_expr, ASTVariable):
@@ -1783,6 +1897,7 @@ class ASTUtils:
                     ast_variable = ASTVariable(cls.to_ode_toolbox_processed_name(
                         var.get_complete_name()), differential_order=0)
                     ast_variable.set_source_position(var.get_source_position())
+                    ast_variable.update_scope(_expr.get_scope())
                     _expr.set_variable(ast_variable)
 
             elif isinstance(_expr, ASTVariable):
@@ -1825,6 +1940,7 @@ class ASTUtils:
                 else:
                     ast_variable = ASTVariable(buffer_var)
                     ast_variable.set_source_position(_expr.get_source_position())
+                    ast_variable.update_scope(_expr.get_scope())
                     _expr.set_variable(ast_variable)
 
         def func(x):
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+#
+# disk_cache.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Any, Iterable, Optional, Union
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+
+class DiskCache:
+    r"""
+    A content-addressed, size-bounded key/value store on disk.
+
+    Each entry is stored in its own file, named after its key. The modification time of an entry file is updated whenever the entry is read, so that when the total size of the cache exceeds the maximum size, the least recently used entries can be evicted first.
+
+    Entries are written to a temporary file and then atomically moved into place, so that several processes can safely share the same cache directory.
+    """
+
+    _entry_suffix = ".cache"
+
+    def __init__(self, cache_dir: str, max_size: Optional[int] = None):
+        r"""
+        :param cache_dir: the directory in which the entries are stored; created if it does not yet exist
+        :param max_size: maximum total size of all entries in bytes; no limit if None
+        """
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+        os.makedirs(self._cache_dir, exist_ok=True)
+
+    @staticmethod
+    def compute_key(*items: Union[str, bytes]) -> str:
+        r"""
+        Compute a cache key from the given strings and/or byte strings.
+        :param items: the data the key should depend upon
+        :return: a hexadecimal digest
+        """
+        h = hashlib.sha256()
+        for item in items:
+            if isinstance(item, str):
+                item = item.encode("utf-8")
+            h.update(hashlib.sha256(item).digest())   # hash each item separately, so that item boundaries are part of the key
+
+        return h.hexdigest()
+
+    @staticmethod
+    def compute_directory_key(path: str) -> str:
+        r"""
+        Compute a cache key from the names and contents of all files in a directory (recursively).
+        :param path: path to the directory
+        :return: a hexadecimal digest
+        """
+        items = []
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for fn in sorted(files):
+                if fn.endswith(".pyc"):
+                    continue
+                items.append(os.path.relpath(os.path.join(root, fn), path))
+                with open(os.path.join(root, fn), "rb") as f:
+                    items.append(f.read())
+
+        return DiskCache.compute_key(*items)
+
+    def _get_entry_path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, key + self._entry_suffix)
+
+    def get(self, key: str) -> Optional[bytes]:
+        r"""
+        Retrieve an entry from the cache.
+        :param key: the key of the entry
+        :return: the stored data, or None if the cache does not contain an entry for this key
+        """
+        entry_path = self._get_entry_path(key)
+        try:
+            with open(entry_path, "rb") as f:
+                data = f.read()
+            os.utime(entry_path)    # mark as recently used
+        except OSError:
+            return None
+
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        r"""
+        Store an entry in the cache, replacing any existing entry for the same key. Least recently used entries are evicted if the maximum cache size is exceeded.
+        :param key: the key of the entry
+        :param data: the data to store
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._get_entry_path(key))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self.evict()
+
+    def get_object(self, key: str) -> Optional[Any]:
+        r"""
+        Retrieve a pickled Python object from the cache.
+        :param key: the key of the entry
+        :return: the stored object, or None if the cache does not contain a (readable) entry for this key
+        """
+        data = self.get(key)
+        if data is None:
+            return None
+
+        try:
+            return pickle.loads(data)
+        except Exception:
+            # entry was written by an incompatible version or is otherwise corrupt
+            self.remove(key)
+            return None
+
+    def put_object(self, key: str, obj: Any) -> None:
+        r"""
+        Pickle a Python object and store it in the cache.
+        :param key: the key of the entry
+        :param obj: the object to store
+        """
+        self.put(key, pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def remove(self, key: str) -> None:
+        r"""
+        Remove an entry from the cache, if it exists.
+        :param key: the key of the entry
+        """
+        try:
+            os.remove(self._get_entry_path(key))
+        except OSError:
+            pass
+
+    def _get_entries(self) -> Iterable[os.DirEntry]:
+        with os.scandir(self._cache_dir) as it:
+            return [entry for entry in it if entry.name.endswith(self._entry_suffix) and entry.is_file()]
+
+    def get_size(self) -> int:
+        r"""
+        Returns the total size of all entries in the cache in bytes.
+        """
+        return sum([entry.stat().st_size for entry in self._get_entries()])
+
+    def evict(self) -> None:
+        r"""
+        Remove least recently used entries until the total size of the cache is at most the maximum size.
+        """
+        if self._max_size is None:
+            return
+
+        entries = []
+        for entry in self._get_entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue    # removed by another process in the meantime
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        total_size = sum([size for _, size, _ in entries])
+        for _, size, path in sorted(entries):
+            if total_size <= self._max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total_size -= size
+
+    def clear(self) -> None:
+        r"""
+        Remove all entries from the cache.
+        """
+        for entry in self._get_entries():
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+#
+# json_lines_log_writer.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Any, List, Mapping
+
+import json
+
+
+class JSONLinesLogWriter:
+    r"""
+    Writes log messages to a file in the JSON lines format, i.e. one JSON object per line, while they are logged.
+
+    The lines are written in batches: whenever ``batch_size`` messages have been received, they are written to the file and flushed. If processing is aborted, at most the messages of the last (incomplete) batch are lost.
+    """
+
+    def __init__(self, path: str, batch_size: int = 100):
+        r"""
+        :param path: the file to write to. An existing file is overwritten.
+        :param batch_size: the number of messages that are written to the file at once
+        """
+        self._file = open(path, "w")
+        self._batch_size = batch_size
+        self._lines: List[str] = []
+
+    def write(self, entry: Mapping[str, Any]) -> None:
+        r"""
+        Writes a single log message.
+        :param entry: the message in the same format as an element of the list returned by ``Logger.get_json_format()``
+        """
+        self._lines.append(json.dumps(entry) + "\n")
+        if len(self._lines) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        r"""
+        Writes all received messages to the file.
+        """
+        if self._lines:
+            self._file.write("".join(self._lines))
+            self._lines = []
+        self._file.flush()
+
+    def close(self) -> None:
+        r"""
+        Writes all received messages to the file, and closes it.
+        """
+        self.flush()
+        self._file.close()
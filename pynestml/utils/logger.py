@@ -19,7 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import List, Mapping, Optional, Tuple
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from collections import OrderedDict
 from enum import Enum
@@ -28,6 +28,7 @@ import json
 from pynestml.meta_model.ast_node import ASTNode
 from pynestml.utils.ast_source_location import ASTSourceLocation
 from pynestml.utils.messages import MessageCode
+from pynestml.utils.toolchain_context import ContextBound
 
 
 class LoggingLevel(Enum):
@@ -41,7 +42,7 @@ class LoggingLevel(Enum):
     NO = 4
 
 
-class Logger:
+class Logger(metaclass=ContextBound):
     """
     This class represents a logger which can be used to print messages to the screen depending on the logging
     level.
@@ -62,27 +63,101 @@ class Logger:
         curr_message A counter indicating the current message, this enables a sorting by the number of message
         logging_level Indicates messages of which level shall be printed to the screen.
         current_node The currently processed model. This enables to retrieve all messages belonging to a certain model
+        message_buffer If not None, a list to which received messages are appended instead of being logged, so that they can be logged later in a different order
+        bounded   If True, only the number of received DEBUG and INFO messages is kept, but not the messages themselves. This bounds the memory used by the log when processing many models
+        store_suppressed If False, messages which are not printed at the current logging level are only counted, but not stored in the log
+        suppressed_levels The logging levels of messages which are neither printed nor stored, but only counted
+        message_ids_by_artifact Index of the log: map from artifact name (str) to the ids of the messages logged for it
+        message_ids_by_level Index of the log: map from logging level to the ids of the messages of that level
+        message_ids_by_artifact_and_level Index of the log: map from artifact name and logging level to the ids of the messages
+        message_counts Map from artifact name and logging level to the number of messages received, including those that are not kept in the log in bounded mode
+        log_writer If not None, a ``JSONLinesLogWriter`` to which each message is written when it is stored in the log
+
+    All of these attributes are kept separately for each ``ToolchainContext``.
     """
+    _context_attributes = ("log", "curr_message", "log_frozen", "logging_level", "current_node", "no_print", "message_buffer",
+                           "bounded", "store_suppressed", "suppressed_levels", "log_writer", "message_ids_by_artifact",
+                           "message_ids_by_level", "message_ids_by_artifact_and_level", "message_counts")
     log = {}
     curr_message = None
     log_frozen = False
     logging_level = None
     current_node = None
     no_print = False
+    message_buffer = None
+    bounded = False
+    store_suppressed = True
+    suppressed_levels: Tuple[LoggingLevel, ...] = ()
+    log_writer = None
+    message_ids_by_artifact: Dict[str, List[int]] = {}
+    message_ids_by_level: Dict[LoggingLevel, List[int]] = {}
+    message_ids_by_artifact_and_level: Dict[Tuple[str, LoggingLevel], List[int]] = {}
+    message_counts: Dict[Tuple[str, LoggingLevel], int] = {}
 
     @classmethod
-    def init_logger(cls, logging_level: LoggingLevel):
+    def init_logger(cls, logging_level: LoggingLevel, bounded: bool = False, store_suppressed: bool = True):
         """
         Initializes the logger.
         :param logging_level: the logging level as required
         :type logging_level: LoggingLevel
+        :param bounded: if True, only the number of DEBUG and INFO messages is kept, but not the messages themselves
+        :param store_suppressed: if False, messages which are not printed at the logging level are only counted, but not stored in the log
         """
         cls.logging_level = logging_level
+        cls.bounded = bounded
+        cls.store_suppressed = store_suppressed
         cls.curr_message = 0
         cls.log = {}
+        cls._clear_index()
+        cls._update_suppressed_levels()
         cls.log_frozen = False
         return
 
+    @classmethod
+    def _clear_index(cls) -> None:
+        cls.message_ids_by_artifact = {}
+        cls.message_ids_by_level = {}
+        cls.message_ids_by_artifact_and_level = {}
+        cls.message_counts = {}
+
+    @classmethod
+    def _count_message(cls, artifact_name: str, log_level: LoggingLevel, count: int = 1) -> None:
+        key = (artifact_name, log_level)
+        cls.message_counts[key] = cls.message_counts.get(key, 0) + count
+
+    @classmethod
+    def _add_to_log(cls, entry: Tuple[str, ASTNode, LoggingLevel, MessageCode, ASTSourceLocation, str], count: bool = True, write: bool = True) -> None:
+        """
+        Stores a single entry in the log under the current message id, and adds it to the index.
+        :param entry: a log entry (artifact name, node, level, code, position, message)
+        :param count: whether the entry should be counted in ``message_counts``
+        :param write: whether the entry should be written to the log writer, if there is one
+        """
+        artifact_name, log_level = entry[0], entry[2]
+        if count:
+            cls._count_message(artifact_name, log_level)
+
+        if not cls.is_stored(log_level):
+            return
+
+        cls.log[cls.curr_message] = entry
+        cls.message_ids_by_artifact.setdefault(artifact_name, []).append(cls.curr_message)
+        cls.message_ids_by_level.setdefault(log_level, []).append(cls.curr_message)
+        cls.message_ids_by_artifact_and_level.setdefault((artifact_name, log_level), []).append(cls.curr_message)
+        if write and cls.log_writer is not None:
+            cls.log_writer.write(cls._get_json_entry(entry))
+
+    @classmethod
+    def set_log_writer(cls, log_writer) -> None:
+        """
+        Sets the ``JSONLinesLogWriter`` to which each message is written when it is stored in the log. The messages that are already in the log are written to it first.
+        :param log_writer: a log writer, or None to stop writing messages
+        """
+        cls.log_writer = log_writer
+        if log_writer is not None:
+            for entry in cls.log.values():
+                log_writer.write(cls._get_json_entry(entry))
+
     @classmethod
     def freeze_log(cls, do_freeze: bool = True):
         """
@@ -105,9 +180,40 @@ class Logger:
         :param log: the log
         :param counter: the counter
         """
-        cls.log = log
+        cls.log = {}
+        cls._clear_index()
+        for message_id, entry in log.items():
+            cls.curr_message = message_id
+            cls._add_to_log(entry, write=False)
         cls.curr_message = counter
 
+    @classmethod
+    def get_message_counts(cls) -> Mapping[Tuple[str, LoggingLevel], int]:
+        """
+        Returns the number of messages received per artifact and logging level. In bounded mode, this includes the messages which are not kept in the log.
+        :return: mapping from artifact name and logging level to the number of messages
+        """
+        return cls.message_counts
+
+    @classmethod
+    def merge_log(cls, entries: Sequence[Tuple[str, ASTNode, LoggingLevel, MessageCode, ASTSourceLocation, str]],
+                  message_counts: Optional[Mapping[Tuple[str, LoggingLevel], int]] = None) -> None:
+        """
+        Appends log entries that were recorded elsewhere (for instance, by a worker process) to the log. The entries are not printed again.
+        :param entries: log entries in the format as stored in the log
+        :param message_counts: the number of messages per artifact and logging level that were recorded together with the entries (see ``get_message_counts()``). If not given, the entries are counted.
+        """
+        if cls.log_frozen:
+            return
+        if cls.curr_message is None:
+            cls.init_logger(LoggingLevel.INFO)
+        for entry in entries:
+            cls._add_to_log(entry, count=message_counts is None)
+            cls.curr_message += 1
+        if message_counts is not None:
+            for (artifact_name, log_level), count in message_counts.items():
+                cls._count_message(artifact_name, log_level, count)
+
     @classmethod
     def log_message(cls, node: ASTNode = None, code: MessageCode = None, message: str = None, error_position: ASTSourceLocation = None, log_level: LoggingLevel = None):
         """
@@ -124,25 +230,20 @@ class Logger:
         """
         if cls.log_frozen:
             return
+        if cls.message_buffer is not None:
+            cls.message_buffer.append((node, code, message, error_position, log_level))
+            return
         if cls.curr_message is None:
             cls.init_logger(LoggingLevel.INFO)
-        from pynestml.meta_model.ast_node import ASTNode
-        from pynestml.utils.ast_source_location import ASTSourceLocation
         assert (node is None or isinstance(node, ASTNode)), \
             '(PyNestML.Logger) Wrong type of node provided (%s)!' % type(node)
         assert (error_position is None or isinstance(error_position, ASTSourceLocation)), \
             '(PyNestML.Logger) Wrong type of error position provided (%s)!' % type(error_position)
-        from pynestml.meta_model.ast_neuron import ASTNeuron
-        if isinstance(node, ASTNeuron):
-            cls.log[cls.curr_message] = (
-                node.get_artifact_name(), node, log_level, code, error_position, message)
-        elif cls.current_node is not None:
-            cls.log[cls.curr_message] = (cls.current_node.get_artifact_name(), cls.current_node,
-                                         log_level, code, error_position, message)
+        log_node = cls._get_log_node(node)
+        if log_node is not None:
+            cls._add_to_log((log_node.get_artifact_name(), log_node, log_level, code, error_position, message))
         cls.curr_message += 1
-        if cls.no_print:
-            return
-        if cls.logging_level.value <= log_level.value:
+        if cls.is_printed(log_level):
             to_print = '[' + str(cls.curr_message) + ','
             to_print = (to_print + (node.get_name() + ', ' if node is not None else
                                     cls.current_node.get_name() + ', ' if cls.current_node is not None else 'GLOBAL, '))
@@ -151,6 +252,67 @@ class Logger:
             to_print = to_print + str(message)
             print(to_print)
 
+    @classmethod
+    def log_deferred_message(cls, get_message: Callable[[], Tuple[MessageCode, str]], node: ASTNode = None, error_position: ASTSourceLocation = None, log_level: LoggingLevel = None):
+        """
+        Logs a message like ``log_message()``, but only constructs it if it is printed or stored at the current logging level; otherwise, it is only counted. This avoids formatting messages that are dropped anyway, e.g. INFO messages when the logging level is ERROR.
+        :param get_message: a function that returns the code and the text of the message, e.g. ``lambda: Messages.get_start_processing_file(file_path)``
+        :param node: the node in which the error occurred
+        :param error_position: the position on which the error occurred.
+        :param log_level: the corresponding log level.
+        """
+        if cls.log_frozen:
+            return
+        if cls.curr_message is None:
+            cls.init_logger(LoggingLevel.INFO)
+        if log_level in cls.suppressed_levels:
+            # the message is neither printed nor stored, so it is only counted
+            if cls.message_buffer is not None:
+                cls.message_buffer.append((node, None, None, error_position, log_level))
+                return
+            log_node = cls._get_log_node(node)
+            if log_node is not None:
+                cls._count_message(log_node.get_artifact_name(), log_level)
+            cls.curr_message += 1
+            return
+        code, message = get_message()
+        cls.log_message(node=node, code=code, message=message, error_position=error_position, log_level=log_level)
+
+    @classmethod
+    def _get_log_node(cls, node: Optional[ASTNode]) -> Optional[ASTNode]:
+        """
+        Returns the model under which a message on the handed over node is logged.
+        """
+        if node is not None:
+            from pynestml.meta_model.ast_neuron import ASTNeuron
+            if isinstance(node, ASTNeuron):
+                return node
+        return cls.current_node
+
+    @classmethod
+    def _update_suppressed_levels(cls) -> None:
+        cls.suppressed_levels = tuple([level for level in LoggingLevel if not cls.is_printed(level) and not cls.is_stored(level)])
+
+    @classmethod
+    def is_printed(cls, log_level: LoggingLevel) -> bool:
+        """
+        Indicates whether messages of the handed over level are printed at the current logging level.
+        :param log_level: a logging level
+        :return: True if such messages are printed
+        """
+        return not cls.no_print and cls.logging_level.value <= log_level.value
+
+    @classmethod
+    def is_stored(cls, log_level: LoggingLevel) -> bool:
+        """
+        Indicates whether messages of the handed over level are stored in the log (otherwise, they are only counted).
+        :param log_level: a logging level
+        :return: True if such messages are stored
+        """
+        if cls.bounded and log_level in [LoggingLevel.DEBUG, LoggingLevel.INFO]:
+            return False
+        return cls.store_suppressed or cls.logging_level.value <= log_level.value
+
     @classmethod
     def string_to_level(cls, string: str) -> LoggingLevel:
         """
@@ -211,6 +373,7 @@ class Logger:
         if cls.log_frozen:
             return
         cls.logging_level = level
+        cls._update_suppressed_levels()
 
     @classmethod
     def set_current_node(cls, node: Optional[ASTNode]) -> None:
@@ -234,13 +397,13 @@ class Logger:
         """
         if level is None and node is None:
             return cls.get_log()
-        ret = list()
-        for (artifactName, node_i, logLevel, code, errorPosition, message) in cls.log.values():
-            if (level == logLevel if level is not None else True) and (
-                    node if node is not None else True) and (
-                    node.get_artifact_name() == artifactName if node is not None else True):
-                ret.append((node, logLevel, message))
-        return ret
+        if node is None:
+            message_ids = cls.message_ids_by_level.get(level, [])
+        elif level is None:
+            message_ids = cls.message_ids_by_artifact.get(node.get_artifact_name(), [])
+        else:
+            message_ids = cls.message_ids_by_artifact_and_level.get((node.get_artifact_name(), level), [])
+        return [(node, cls.log[message_id][2], cls.log[message_id][5]) for message_id in message_ids]
 
     @classmethod
     def get_all_messages_of_level(cls, level: LoggingLevel) -> List[Tuple[ASTNode, LoggingLevel, str]]:
@@ -254,9 +417,9 @@ class Logger:
         if level is None:
             return cls.get_log()
         ret = list()
-        for (artifactName, node, logLevel, code, errorPosition, message) in cls.log.values():
-            if level == logLevel:
-                ret.append((node, logLevel, message))
+        for message_id in cls.message_ids_by_level.get(level, []):
+            (artifactName, node, logLevel, code, errorPosition, message) = cls.log[message_id]
+            ret.append((node, logLevel, message))
         return ret
 
     @classmethod
@@ -270,12 +433,24 @@ class Logger:
         if node is None:
             return cls.get_log()
         ret = list()
-        for (artifactName, node_i, logLevel, code, errorPosition, message) in cls.log.values():
-            if (node_i == node if node is not None else True) and \
-                    (node.get_artifact_name() == artifactName if node is not None else True):
+        for message_id in cls.message_ids_by_artifact.get(node.get_artifact_name(), []):
+            (artifactName, node_i, logLevel, code, errorPosition, message) = cls.log[message_id]
+            if node_i == node:
                 ret.append((node, logLevel, message))
         return ret
 
+    @classmethod
+    def get_message_count(cls, node: Optional[ASTNode], level: LoggingLevel) -> int:
+        """
+        Returns the number of messages which have a certain logging level, and have been reported for the model of the handed over node (if given). In bounded mode, this includes the messages which are not kept in the log.
+        :param node: a single node instance, or None
+        :param level: a logging level
+        :return: the number of messages
+        """
+        if node is None:
+            return sum([count for (artifact_name, log_level), count in cls.message_counts.items() if log_level == level])
+        return cls.message_counts.get((node.get_artifact_name(), level), 0)
+
     @classmethod
     def has_errors(cls, node: ASTNode) -> bool:
         """
@@ -284,7 +459,7 @@ class Logger:
         :return: True if errors detected, otherwise False
         :rtype: bool
         """
-        return len(cls.get_all_messages_of_level_and_or_node(node, LoggingLevel.ERROR)) > 0
+        return cls.get_message_count(node, LoggingLevel.ERROR) > 0
 
     @classmethod
     def get_json_format(cls) -> str:
@@ -292,33 +467,23 @@ class Logger:
         Returns the log in a format which can be used to be stored to a file.
         :return: a string containing the log
         """
-        ret = '['
-        for messageNr in cls.log.keys():
-            (artifactName, node, logLevel, code, errorPosition, message) = cls.log[messageNr]
-            ret += '{' + \
-                   '"filename":"' + \
-                   artifactName + \
-                   '", ' + \
-                   '"nodeName":"' + \
-                   (node.get_name() if node is not None else 'GLOBAL') + '", ' + \
-                   '"severity":"' \
-                   + str(logLevel.name) + '", '
-            if code is not None:
-                ret += '"code":"' + \
-                       code.name + \
-                       '", '
-            ret += '"row":"' + \
-                   (str(errorPosition.get_start_line()) if errorPosition is not None else '') + \
-                   '", ' + \
-                   '"col":"' \
-                   + (str(errorPosition.get_start_column()) if errorPosition is not None else '') + \
-                   '", ' + \
-                   '"message":"' + str(message).replace('"', "'") + '"}'
-            ret += ','
-        if len(cls.log.keys()) == 0:
-            parsed = json.loads('[]', object_pairs_hook=OrderedDict)
-        else:
-            ret = ret[:-1]  # delete the last ","
-            ret += ']'
-            parsed = json.loads(ret, object_pairs_hook=OrderedDict)
-        return json.dumps(parsed, indent=2, sort_keys=False)
+        return json.dumps([cls._get_json_entry(entry) for entry in cls.log.values()], indent=2, sort_keys=False)
+
+    @classmethod
+    def _get_json_entry(cls, entry: Tuple[str, ASTNode, LoggingLevel, MessageCode, ASTSourceLocation, str]) -> Mapping[str, str]:
+        """
+        Converts a log entry to the format of the elements of the list returned by ``get_json_format()``.
+        :param entry: a log entry (artifact name, node, level, code, position, message)
+        :return: a mapping from field name to value
+        """
+        (artifactName, node, logLevel, code, errorPosition, message) = entry
+        ret = OrderedDict()
+        ret["filename"] = artifactName
+        ret["nodeName"] = node.get_name() if node is not None else 'GLOBAL'
+        ret["severity"] = str(logLevel.name)
+        if isinstance(code, MessageCode):
+            ret["code"] = code.name
+        ret["row"] = str(errorPosition.get_start_line()) if errorPosition is not None else ''
+        ret["col"] = str(errorPosition.get_start_column()) if errorPosition is not None else ''
+        ret["message"] = str(message).replace('"', "'")
+        return ret
@@ -111,6 +111,12 @@ class MessageCode(Enum):
     PRIORITY_DEFINED_FOR_ONLY_ONE_EVENT_HANDLER = 82
     REPEATED_PRIORITY_VALUE = 83
     DELAY_VARIABLE = 84
+    BUILD_CACHE_HIT = 85
+    BUILD_CACHE_MISS = 86
+    ODE_TOOLBOX_RESULT_FROM_CACHE = 87
+    INCREMENTAL_SYMBOL_TABLE_UPDATE_MISMATCH = 88
+    COMPILE_SERVER_STARTED = 89
+    COMPILE_SERVER_NOT_AVAILABLE = 90
 
 
 class Messages:
@@ -1180,3 +1186,33 @@ class Messages:
     def get_function_is_delay_variable(cls, func):
         message = "Function '" + func + "' is not a function but a delay variable."
         return MessageCode.DELAY_VARIABLE, message
+
+    @classmethod
+    def get_build_cache_hit(cls, model_name: str) -> Tuple[MessageCode, str]:
+        message = "Model '" + model_name + "' is unchanged; reusing previously generated code from the build cache"
+        return MessageCode.BUILD_CACHE_HIT, message
+
+    @classmethod
+    def get_build_cache_miss(cls, model_name: str) -> Tuple[MessageCode, str]:
+        message = "Model '" + model_name + "' not found in the build cache; generating code"
+        return MessageCode.BUILD_CACHE_MISS, message
+
+    @classmethod
+    def get_ode_toolbox_result_from_cache(cls) -> Tuple[MessageCode, str]:
+        message = "Reusing ODE-toolbox analysis result from the cache"
+        return MessageCode.ODE_TOOLBOX_RESULT_FROM_CACHE, message
+
+    @classmethod
+    def get_incremental_symbol_table_update_mismatch(cls, model_name: str, difference: str) -> Tuple[MessageCode, str]:
+        message = "Incremental symbol table update of model '" + model_name + "' differs from a full rebuild:\n" + difference
+        return MessageCode.INCREMENTAL_SYMBOL_TABLE_UPDATE_MISMATCH, message
+
+    @classmethod
+    def get_compile_server_started(cls, socket_path: str) -> Tuple[MessageCode, str]:
+        message = "Compile server listening on '" + socket_path + "'"
+        return MessageCode.COMPILE_SERVER_STARTED, message
+
+    @classmethod
+    def get_compile_server_not_available(cls, socket_path: str, error: str) -> Tuple[MessageCode, str]:
+        message = "Could not connect to the compile server on '" + socket_path + "': " + error
+        return MessageCode.COMPILE_SERVER_NOT_AVAILABLE, message
@@ -19,12 +19,20 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Tuple
+from typing import Callable, Dict, Optional, Tuple
 
-from antlr4 import CommonTokenStream, FileStream, InputStream
+import os
+import threading
+from collections import OrderedDict
+
+from antlr4 import CommonTokenStream, FileStream, InputStream, ParserRuleContext, PredictionMode
 from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
 from antlr4.error.ErrorListener import ConsoleErrorListener
+from antlr4.error.Errors import ParseCancellationException
 
+import pynestml
+from pynestml.cocos.co_cos_manager import CoCosManager
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
 from pynestml.generated.PyNestMLLexer import PyNestMLLexer
 from pynestml.generated.PyNestMLParser import PyNestMLParser
 from pynestml.meta_model.ast_arithmetic_operator import ASTArithmeticOperator
@@ -52,6 +60,7 @@ from pynestml.meta_model.ast_kernel import ASTKernel
 from pynestml.meta_model.ast_logical_operator import ASTLogicalOperator
 from pynestml.meta_model.ast_nestml_compilation_unit import ASTNestMLCompilationUnit
 from pynestml.meta_model.ast_neuron import ASTNeuron
+from pynestml.meta_model.ast_node import ASTNode
 from pynestml.meta_model.ast_neuron_or_synapse_body import ASTNeuronOrSynapseBody
 from pynestml.meta_model.ast_ode_equation import ASTOdeEquation
 from pynestml.meta_model.ast_output_block import ASTOutputBlock
@@ -67,20 +76,41 @@ from pynestml.meta_model.ast_update_block import ASTUpdateBlock
 from pynestml.meta_model.ast_variable import ASTVariable
 from pynestml.meta_model.ast_while_stmt import ASTWhileStmt
 from pynestml.symbol_table.symbol_table import SymbolTable
+from pynestml.utils.arithmetic_expression_parser import ArithmeticExpressionParser
 from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.disk_cache import DiskCache
 from pynestml.utils.error_listener import NestMLErrorListener
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
+from pynestml.utils.profiler import Profiler
 from pynestml.visitors.ast_builder_visitor import ASTBuilderVisitor
+from pynestml.visitors.ast_data_type_visitor import ASTDataTypeVisitor
 from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
 from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 
 
 class ModelParser:
+    # if True, input is first parsed in the faster SLL prediction mode, see parse_with_fallback()
+    two_stage_parsing = True
+
+    # if True, arithmetic expressions are parsed by the hand-written ArithmeticExpressionParser, see parse_expression()
+    fast_expression_parsing = True
+
+    # maximum number of trees kept by _parse_memoized()
+    parse_cache_max_entries = 4096
+
+    _parse_cache: Dict[Tuple[str, str], ASTNode] = OrderedDict()
+    _parse_cache_lock = threading.Lock()
+
+    # key of the version of the parser and of the classes of the abstract syntax tree, computed upon first use in _get_ast_cache_key()
+    _ast_version_key: Optional[str] = None
+
     @classmethod
     def parse_model(cls, file_path=None):
         """
         Parses a handed over model and returns the meta_model representation of it.
+
+        If the incremental build cache is used (see ``FrontendConfiguration.get_cache_dir()``), the abstract syntax tree is looked up in the cache by a hash of the contents of the file before it is parsed, and stored in the cache after it has been built. Only the symbol table is then constructed for a cached tree.
         :param file_path: the path to the file which shall be parsed.
         :type file_path: str
         :return: a new ASTNESTMLCompilationUnit object.
@@ -93,9 +123,50 @@ class ModelParser:
             Logger.log_message(node=None, code=None, message=message,
                                error_position=None, log_level=LoggingLevel.ERROR)
             return
-        code, message = Messages.get_start_processing_file(file_path)
-        Logger.log_message(node=None, code=code, message=message, error_position=None, log_level=LoggingLevel.INFO)
+        Logger.log_deferred_message(lambda: Messages.get_start_processing_file(file_path), log_level=LoggingLevel.INFO)
+
+        ast = None
+        ast_cache = cls._get_ast_cache()
+        if ast_cache is not None:
+            ast_cache_key = cls._get_ast_cache_key(file_path)
+            ast = ast_cache.get_object(ast_cache_key)
+            if ast is not None:
+                cls._restore_cached_ast(ast)
+
+        if ast is None:
+            ast = cls._build_ast(input_file)
+            if ast is None:
+                return
+
+            if ast_cache is not None:
+                # store the tree before the symbol table is constructed, as the scopes refer to the predefined symbols
+                ast_cache.put_object(ast_cache_key, ast)
+
+        # create and update the corresponding symbol tables
+        SymbolTable.initialize_symbol_table(ast.get_source_position())
+        for neuron in ast.get_neuron_list():
+            with Profiler.phase("symbol_table", neuron.get_name()):
+                neuron.accept(ASTSymbolTableVisitor())
+            SymbolTable.add_neuron_scope(neuron.get_name(), neuron.get_scope())
+        for synapse in ast.get_synapse_list():
+            with Profiler.phase("symbol_table", synapse.get_name()):
+                synapse.accept(ASTSymbolTableVisitor())
+            SymbolTable.add_synapse_scope(synapse.get_name(), synapse.get_scope())
+
+        # store source paths
+        for neuron in ast.get_neuron_list():
+            neuron.file_path = file_path
+        ast.file_path = file_path
+
+        return ast
 
+    @classmethod
+    def _build_ast(cls, input_file: FileStream) -> Optional[ASTNestMLCompilationUnit]:
+        r"""
+        Lex and parse the input, and build the abstract syntax tree from the parse tree.
+        :param input_file: the input stream
+        :return: the compilation unit, or None if a lexer or parser error occurred
+        """
         # create a lexer and hand over the input
         lexer = PyNestMLLexer()
         lexer.removeErrorListeners()
@@ -112,56 +183,125 @@ class ModelParser:
             code, message = Messages.get_lexer_error()
             Logger.log_message(node=None, code=None, message=message,
                                error_position=None, log_level=LoggingLevel.ERROR)
-            return
+            return None
         # parse the file
         parser = PyNestMLParser(None)
         parser.removeErrorListeners()
         parser.addErrorListener(ConsoleErrorListener())
         parserErrorListener = NestMLErrorListener()
         parser.addErrorListener(parserErrorListener)
-        # parser._errHandler = BailErrorStrategy()	# N.B. uncomment this line and the next to halt immediately on parse errors
-        # parser._errHandler.reset(parser)
         parser.setTokenStream(stream)
-        compilation_unit = parser.nestMLCompilationUnit()
+        compilation_unit = parse_with_fallback(parser, parser.nestMLCompilationUnit)
         if parserErrorListener._error_occurred:
             code, message = Messages.get_parser_error()
             Logger.log_message(node=None, code=None, message=message,
                                error_position=None, log_level=LoggingLevel.ERROR)
-            return
+            return None
 
         # create a new visitor and return the new AST
         ast_builder_visitor = ASTBuilderVisitor(stream.tokens)
-        ast = ast_builder_visitor.visit(compilation_unit)
+        return ast_builder_visitor.visit(compilation_unit)
 
-        # create and update the corresponding symbol tables
-        SymbolTable.initialize_symbol_table(ast.get_source_position())
-        for neuron in ast.get_neuron_list():
-            neuron.accept(ASTSymbolTableVisitor())
-            SymbolTable.add_neuron_scope(neuron.get_name(), neuron.get_scope())
-        for synapse in ast.get_synapse_list():
-            synapse.accept(ASTSymbolTableVisitor())
-            SymbolTable.add_synapse_scope(synapse.get_name(), synapse.get_scope())
+    @classmethod
+    def _get_ast_cache(cls) -> Optional[DiskCache]:
+        if FrontendConfiguration.get_cache_dir() is None:
+            return None
 
-        # store source paths
-        for neuron in ast.get_neuron_list():
-            neuron.file_path = file_path
-        ast.file_path = file_path
+        return DiskCache(FrontendConfiguration.get_cache_dir(),
+                         max_size=FrontendConfiguration.get_cache_max_size() * 1024**2)
 
-        return ast
+    @classmethod
+    def _get_ast_cache_key(cls, file_path: str) -> str:
+        r"""
+        Compute the key of the abstract syntax tree of a file in the cache. Besides the name and the contents of the file, the key depends on the suffix that is appended to the model names, and on the version of the parser and of the classes of the tree: the generated lexer and parser, the ``meta_model`` package and the visitors that build the tree. A cached tree is therefore never loaded into classes other than the ones it was pickled from.
+        :param file_path: the path to the file
+        :return: the cache key
+        """
+        if cls._ast_version_key is None:
+            pynestml_dir = os.path.dirname(pynestml.__file__)
+            source_files = [os.path.join(pynestml_dir, "visitors", fn) for fn in ["ast_builder_visitor.py",
+                                                                                  "ast_data_type_visitor.py",
+                                                                                  "comment_collector_visitor.py"]]
+            source_contents = []
+            for source_file in source_files:
+                with open(source_file, "rb") as f:
+                    source_contents.append(f.read())
+            cls._ast_version_key = DiskCache.compute_key("ast",
+                                                         pynestml.__version__,
+                                                         DiskCache.compute_directory_key(os.path.join(pynestml_dir, "generated")),
+                                                         DiskCache.compute_directory_key(os.path.join(pynestml_dir, "meta_model")),
+                                                         *source_contents)
+
+        with open(file_path, "rb") as f:
+            contents = f.read()
+
+        return DiskCache.compute_key(cls._ast_version_key, FrontendConfiguration.suffix, os.path.basename(file_path), contents)
+
+    @classmethod
+    def _restore_cached_ast(cls, ast: ASTNestMLCompilationUnit) -> None:
+        r"""
+        Repeat the side effects of building an abstract syntax tree for a tree that was loaded from the cache: the data types are resolved to the predefined types of the current run, and the checks that are performed while building are repeated, so that their messages are logged again.
+        :param ast: the compilation unit
+        """
+        def resolve_data_type(node):
+            if isinstance(node, ASTDataType):
+                node.accept(ASTDataTypeVisitor())
+
+        ast.accept(ASTHigherOrderVisitor(resolve_data_type))
+
+        models = ast.get_neuron_list() + ast.get_synapse_list()
+        if models:
+            Logger.set_current_node(models[-1])
+        CoCosManager.check_neuron_names_unique(ast)
+
+    @classmethod
+    def _parse_memoized(cls, rule_name: str, string: str) -> Optional[ASTNode]:
+        r"""
+        Parse a string with the given rule of the parser, and return a clone of the resulting tree. The trees of the most recently parsed strings are kept as templates, so that strings which are parsed over and over again (such as the expressions and assignments created by the code generators) are lexed and parsed only once. Trees of strings with syntax errors are not kept.
+        :param rule_name: the name of the start rule, e.g. ``"expression"``
+        :param string: the string to parse
+        :return: the tree
+        """
+        key = (rule_name, string)
+        with cls._parse_cache_lock:
+            template = cls._parse_cache.get(key)
+            if template is not None:
+                cls._parse_cache.move_to_end(key)
+
+        if template is None:
+            if rule_name == "expression" and cls.fast_expression_parsing:
+                template = ArithmeticExpressionParser.parse(string)
+
+            if template is None:
+                builder, parser = tokenize(string)
+                template = builder.visit(parse_with_fallback(parser, getattr(parser, rule_name)))
+                if template is None:
+                    return None
+
+                template.accept(ASTHigherOrderVisitor(log_set_added_source_position))
+                if parser.getNumberOfSyntaxErrors() > 0:
+                    return template
+
+            with cls._parse_cache_lock:
+                cls._parse_cache[key] = template
+                while len(cls._parse_cache) > cls.parse_cache_max_entries:
+                    cls._parse_cache.popitem(last=False)
+
+        return template.clone()
 
     @classmethod
     def parse_expression(cls, string):
         # type: (str) -> ASTExpression
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.expression())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        r"""
+        Parse an expression. Arithmetic expressions (see ``ArithmeticExpressionParser``) are parsed without the ANTLR parser if ``fast_expression_parsing`` is set.
+        """
+        return cls._parse_memoized("expression", string)
 
     @classmethod
     def parse_declaration(cls, string):
         # type: (str) -> ASTDeclaration
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.declaration())
+        ret = builder.visit(parse_with_fallback(parser, parser.declaration))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -169,23 +309,20 @@ class ModelParser:
     def parse_stmt(cls, string):
         # type: (str) -> ASTStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.stmt())
+        ret = builder.visit(parse_with_fallback(parser, parser.stmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_assignment(cls, string):
         # type: (str) -> ASTAssignment
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.assignment())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls._parse_memoized("assignment", string)
 
     @classmethod
     def parse_bit_operator(cls, string):
         # type: (str) -> ASTArithmeticOperator
         builder, parser = tokenize(string)
-        ret = builder.visit(parser.bitOperator())
+        ret = builder.visit(parse_with_fallback(parser, parser.bitOperator))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -193,7 +330,7 @@ class ModelParser:
     def parse_block(cls, string):
         # type: (str) -> ASTBlock
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.block())
+        ret = builder.visit(parse_with_fallback(parser, parser.block))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -201,14 +338,14 @@ class ModelParser:
     def parse_block_with_variables(cls, string):
         # type: (str) -> ASTBlockWithVariables
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.blockWithVariables())
+        ret = builder.visit(parse_with_fallback(parser, parser.blockWithVariables))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
     @classmethod
     def parse_neuron_or_synapse_body(cls, string: str) -> ASTNeuronOrSynapseBody:
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.body())
+        ret = builder.visit(parse_with_fallback(parser, parser.body))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -216,7 +353,7 @@ class ModelParser:
     def parse_comparison_operator(cls, string):
         # type: (str) -> ASTComparisonOperator
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.comparisonOperator())
+        ret = builder.visit(parse_with_fallback(parser, parser.comparisonOperator))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -224,7 +361,7 @@ class ModelParser:
     def parse_compound_stmt(cls, string):
         # type: (str) -> ASTCompoundStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.compoundStmt())
+        ret = builder.visit(parse_with_fallback(parser, parser.compoundStmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -232,7 +369,7 @@ class ModelParser:
     def parse_data_type(cls, string):
         # type: (str) -> ASTDataType
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.dataType())
+        ret = builder.visit(parse_with_fallback(parser, parser.dataType))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -240,7 +377,7 @@ class ModelParser:
     def parse_elif_clause(cls, string):
         # type: (str) -> ASTElifClause
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.elifClause())
+        ret = builder.visit(parse_with_fallback(parser, parser.elifClause))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -248,7 +385,7 @@ class ModelParser:
     def parse_else_clause(cls, string):
         # type: (str) -> ASTElseClause
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.elseClause())
+        ret = builder.visit(parse_with_fallback(parser, parser.elseClause))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -256,7 +393,7 @@ class ModelParser:
     def parse_equations_block(cls, string):
         # type: (str) -> ASTEquationsBlock
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.equationsBlock())
+        ret = builder.visit(parse_with_fallback(parser, parser.equationsBlock))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -264,7 +401,7 @@ class ModelParser:
     def parse_for_stmt(cls, string):
         # type: (str) -> ASTForStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.forStmt())
+        ret = builder.visit(parse_with_fallback(parser, parser.forStmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -272,7 +409,7 @@ class ModelParser:
     def parse_function(cls, string):
         # type: (str) -> ASTFunction
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.function())
+        ret = builder.visit(parse_with_fallback(parser, parser.function))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -280,7 +417,7 @@ class ModelParser:
     def parse_function_call(cls, string):
         # type: (str) -> ASTFunctionCall
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.functionCall())
+        ret = builder.visit(parse_with_fallback(parser, parser.functionCall))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -288,7 +425,7 @@ class ModelParser:
     def parse_if_clause(cls, string):
         # type: (str) -> ASTIfClause
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.ifClause())
+        ret = builder.visit(parse_with_fallback(parser, parser.ifClause))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -296,7 +433,7 @@ class ModelParser:
     def parse_if_stmt(cls, string):
         # type: (str) -> ASTIfStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.ifStmt())
+        ret = builder.visit(parse_with_fallback(parser, parser.ifStmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -304,7 +441,7 @@ class ModelParser:
     def parse_input_block(cls, string):
         # type: (str) -> ASTInputBlock
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.inputBlock())
+        ret = builder.visit(parse_with_fallback(parser, parser.inputBlock))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -312,7 +449,7 @@ class ModelParser:
     def parse_input_port(cls, string):
         # type: (str) -> ASTInputPort
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.inputPort())
+        ret = builder.visit(parse_with_fallback(parser, parser.inputPort))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -320,7 +457,7 @@ class ModelParser:
     def parse_input_qualifier(cls, string):
         # type: (str) -> ASTInputQualifier
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.inputQualifier())
+        ret = builder.visit(parse_with_fallback(parser, parser.inputQualifier))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -328,7 +465,7 @@ class ModelParser:
     def parse_logic_operator(cls, string):
         # type: (str) -> ASTLogicalOperator
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.logicalOperator())
+        ret = builder.visit(parse_with_fallback(parser, parser.logicalOperator))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -336,7 +473,7 @@ class ModelParser:
     def parse_nestml_compilation_unit(cls, string):
         # type: (str) -> ASTNestMLCompilationUnit
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.nestMLCompilationUnit())
+        ret = builder.visit(parse_with_fallback(parser, parser.nestMLCompilationUnit))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -344,7 +481,7 @@ class ModelParser:
     def parse_neuron(cls, string):
         # type: (str) -> ASTNeuron
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.neuron())
+        ret = builder.visit(parse_with_fallback(parser, parser.neuron))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -352,7 +489,7 @@ class ModelParser:
     def parse_synapse(cls, string):
         # type: (str) -> ASTSynapse
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.synapse())
+        ret = builder.visit(parse_with_fallback(parser, parser.synapse))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -360,7 +497,7 @@ class ModelParser:
     def parse_ode_equation(cls, string):
         # type: (str) -> ASTOdeEquation
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.odeEquation())
+        ret = builder.visit(parse_with_fallback(parser, parser.odeEquation))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -368,7 +505,7 @@ class ModelParser:
     def parse_inline_expression(cls, string):
         # type: (str) -> ASTInlineExpression
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.inlineExpression())
+        ret = builder.visit(parse_with_fallback(parser, parser.inlineExpression))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -376,7 +513,7 @@ class ModelParser:
     def parse_kernel(cls, string):
         # type: (str) -> ASTKernel
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.kernel())
+        ret = builder.visit(parse_with_fallback(parser, parser.kernel))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -384,7 +521,7 @@ class ModelParser:
     def parse_output_block(cls, string):
         # type: (str) -> ASTOutputBlock
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.outputBlock())
+        ret = builder.visit(parse_with_fallback(parser, parser.outputBlock))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -392,7 +529,7 @@ class ModelParser:
     def parse_parameter(cls, string):
         # type: (str) -> ASTParameter
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.parameter())
+        ret = builder.visit(parse_with_fallback(parser, parser.parameter))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -400,7 +537,7 @@ class ModelParser:
     def parse_return_stmt(cls, string):
         # type: (str) -> ASTReturnStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.returnStmt())
+        ret = builder.visit(parse_with_fallback(parser, parser.returnStmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -408,7 +545,7 @@ class ModelParser:
     def parse_simple_expression(cls, string):
         # type: (str) -> ASTSimpleExpression
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.simpleExpression())
+        ret = builder.visit(parse_with_fallback(parser, parser.simpleExpression))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -416,7 +553,7 @@ class ModelParser:
     def parse_small_stmt(cls, string):
         # type: (str) -> ASTSmallStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.smallStmt())
+        ret = builder.visit(parse_with_fallback(parser, parser.smallStmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -424,7 +561,7 @@ class ModelParser:
     def parse_unary_operator(cls, string):
         # type: (str) -> ASTUnaryOperator
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.unaryOperator())
+        ret = builder.visit(parse_with_fallback(parser, parser.unaryOperator))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -432,7 +569,7 @@ class ModelParser:
     def parse_unit_type(cls, string):
         # type: (str) -> ASTUnitType
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.unitType())
+        ret = builder.visit(parse_with_fallback(parser, parser.unitType))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -440,7 +577,7 @@ class ModelParser:
     def parse_update_block(cls, string):
         # type: (str) -> ASTUpdateBlock
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.updateBlock())
+        ret = builder.visit(parse_with_fallback(parser, parser.updateBlock))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -448,7 +585,7 @@ class ModelParser:
     def parse_variable(cls, string):
         # type: (str) -> ASTVariable
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.variable())
+        ret = builder.visit(parse_with_fallback(parser, parser.variable))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
@@ -456,20 +593,60 @@ class ModelParser:
     def parse_while_stmt(cls, string):
         # type: (str) -> ASTWhileStmt
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.whileStmt())
+        ret = builder.visit(parse_with_fallback(parser, parser.whileStmt))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
         return ret
 
 
+# lexer and parser used by tokenize(), created once for each thread
+_tokenizer = threading.local()
+
+
 def tokenize(string: str) -> Tuple[ASTBuilderVisitor, PyNestMLParser]:
-    lexer = PyNestMLLexer(InputStream(string))
+    try:
+        lexer = _tokenizer.lexer
+        parser = _tokenizer.parser
+    except AttributeError:
+        lexer = _tokenizer.lexer = PyNestMLLexer()
+        parser = _tokenizer.parser = PyNestMLParser(None)
+
+    # setting the input resets the lexer and the parser
+    lexer.inputStream = InputStream(string)
     # create a token stream
     stream = CommonTokenStream(lexer)
     stream.fill()
-    parser = PyNestMLParser(stream)
+    parser.setTokenStream(stream)
     builder = ASTBuilderVisitor(stream.tokens)
     return builder, parser
 
 
+def parse_with_fallback(parser: PyNestMLParser, rule: Callable[[], ParserRuleContext]) -> ParserRuleContext:
+    r"""
+    Parse the token stream of the parser with the given rule in two stages (if ``ModelParser.two_stage_parsing`` is set). The input is first parsed in the SLL prediction mode, which is faster than the full LL mode but can fail on valid input, and parsing is stopped at the first syntax error. Only if this fails, the input is parsed again from the start in the full LL mode, with the error listeners and the default error strategy of the parser, so that syntax errors are reported as before.
+    :param parser: the parser, with the token stream set
+    :param rule: the method of the parser for the start rule, e.g. ``parser.expression``
+    :return: the parse tree
+    """
+    if not ModelParser.two_stage_parsing:
+        return rule()
+
+    error_listeners = parser._listeners
+    error_handler = parser._errHandler
+    parser._listeners = []
+    parser._errHandler = BailErrorStrategy()
+    parser._interp.predictionMode = PredictionMode.SLL
+    try:
+        return rule()
+    except ParseCancellationException:
+        # rewind the token stream and parse again
+        parser.reset()
+    finally:
+        parser._listeners = error_listeners
+        parser._errHandler = error_handler
+        parser._interp.predictionMode = PredictionMode.LL
+
+    return rule()
+
+
 def log_set_added_source_position(node):
     node.set_source_position(ASTSourceLocation.get_added_source_position())
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+#
+# ode_toolbox_utils.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import odetoolbox
+import sympy
+
+try:
+    # internal ODE-toolbox API, used to perform the analysis for the analytic and the numeric solver in a single pass
+    from odetoolbox import _find_analytically_solvable_equations, _find_variable_definition, _from_json_to_shapes, \
+        _get_all_first_order_variables, _init_logging, _read_global_config
+    from odetoolbox.config import Config
+    from odetoolbox.shapes import MalformedInputException, Shape
+    from odetoolbox.system_of_shapes import SystemOfShapes
+    SINGLE_PASS_ANALYSIS_AVAILABLE = True
+except ImportError:
+    SINGLE_PASS_ANALYSIS_AVAILABLE = False
+
+
+class ODEToolboxUtils:
+    r"""
+    Utility functions for invoking ODE-toolbox.
+    """
+
+    @classmethod
+    def analysis(cls, indict: Dict[str, Any], disable_stiffness_check: bool = False,
+                 preserve_expressions: Union[bool, Iterable[str]] = False, simplify_expression: Optional[str] = None,
+                 log_level: Union[str, int] = "WARNING", single_pass: bool = True) -> List[Dict[str, Any]]:
+        r"""
+        Obtain the solvers that are used for code generation for the given system of equations: a propagator (analytic) solver for the equations that can be solved analytically, if any, and, if any of the equations has to be solved numerically, a numeric solver that includes *all* state variables (including the analytically solvable ones).
+
+        This is equivalent to calling ``odetoolbox.analysis()`` twice, once normally and once with ``disable_analytic_solver=True``, and combining the analytic solver from the first with the numeric solver from the second result. Where possible, both solvers are derived from a single analysis pass, so that the input is parsed and the system is analysed only once.
+
+        :param indict: the ODE-toolbox input dictionary
+        :param disable_stiffness_check: whether to skip the stiffness test
+        :param preserve_expressions: see ``odetoolbox.analysis()``
+        :param simplify_expression: see ``odetoolbox.analysis()``
+        :param log_level: the ODE-toolbox logging level
+        :param single_pass: set to False to always invoke ``odetoolbox.analysis()`` twice
+        :return: a list containing at most one analytic and at most one numeric solver
+        """
+        if single_pass and SINGLE_PASS_ANALYSIS_AVAILABLE and disable_stiffness_check:
+            return cls._single_pass_analysis(indict, preserve_expressions=preserve_expressions,
+                                             simplify_expression=simplify_expression, log_level=log_level)
+
+        kwargs = {"disable_stiffness_check": disable_stiffness_check,
+                  "preserve_expressions": preserve_expressions,
+                  "simplify_expression": simplify_expression,
+                  "log_level": log_level}
+        solver_result = odetoolbox.analysis(indict, **kwargs)
+        analytic_solvers = [x for x in solver_result if x["solver"] == "analytical"]
+        if not any([x["solver"].startswith("numeric") for x in solver_result]):
+            return analytic_solvers
+
+        numeric_solvers = [x for x in odetoolbox.analysis(indict, disable_analytic_solver=True, **kwargs)
+                           if x["solver"].startswith("numeric")]
+        return analytic_solvers + numeric_solvers
+
+    @classmethod
+    def _single_pass_analysis(cls, indict: Dict[str, Any], preserve_expressions: Union[bool, Iterable[str]],
+                              simplify_expression: Optional[str], log_level: Union[str, int]) -> List[Dict[str, Any]]:
+        r"""
+        Follows ``odetoolbox._analysis()`` (without stiffness test), but generates the numeric solver for all state variables instead of only for those that cannot be solved analytically.
+        """
+        _init_logging(log_level)
+
+        if "dynamics" not in indict:
+            return []
+
+        _read_global_config(indict)
+
+        if simplify_expression:
+            Config.config["simplify_expression"] = simplify_expression
+
+        parameters = None
+        if "parameters" in indict.keys():
+            parameters = {sympy.Symbol(k) if type(k) is str else k: v for k, v in indict["parameters"].items()}
+
+        shapes, parameters = _from_json_to_shapes(indict, parameters=parameters)
+
+        for shape in shapes:
+            if not shape.is_homogeneous() and shape.order > 1:
+                raise MalformedInputException("For symbol " + str(shape.symbol) + ": higher-order inhomogeneous ODEs are not supported")
+
+        shape_sys = SystemOfShapes.from_shapes(shapes, parameters=parameters)
+        _, node_is_analytically_solvable = _find_analytically_solvable_equations(shape_sys, shapes, parameters=parameters)
+
+        solvers_json = []
+        analytic_syms = [node_sym for node_sym, _node_is_analytically_solvable in node_is_analytically_solvable.items()
+                         if _node_is_analytically_solvable]
+        if analytic_syms:
+            analytic_solver_json = shape_sys.get_sub_system(analytic_syms).generate_propagator_solver()
+            analytic_solver_json["solver"] = "analytical"
+            solvers_json.append(analytic_solver_json)
+
+        if len(analytic_syms) < len(shape_sys.x_):
+            numeric_solver_json = shape_sys.get_sub_system(shape_sys.x_).generate_numeric_solver(state_variables=shape_sys.x_)
+            numeric_solver_json["solver"] = "numeric"
+            solvers_json.append(numeric_solver_json)
+
+        cls._add_initial_values(solvers_json, shapes)
+        cls._add_parameters(solvers_json, indict)
+        cls._convert_expressions_to_str(solvers_json, indict, preserve_expressions)
+
+        return solvers_json
+
+    @classmethod
+    def _add_initial_values(cls, solvers_json: List[Dict[str, Any]], shapes) -> None:
+        for solver_json in solvers_json:
+            solver_json["initial_values"] = {}
+            for shape in shapes:
+                all_shape_symbols = [str(sympy.Symbol(str(shape.symbol) + Config().differential_order_symbol * i)) for i in range(shape.order)]
+                for sym in all_shape_symbols:
+                    if sym in solver_json["state_variables"]:
+                        solver_json["initial_values"][sym] = str(shape.get_initial_value(sym.replace(Config().differential_order_symbol, "'")))
+
+    @classmethod
+    def _add_parameters(cls, solvers_json: List[Dict[str, Any]], indict: Dict[str, Any]) -> None:
+        if "parameters" not in indict.keys():
+            return
+
+        for solver_json in solvers_json:
+            solver_json["parameters"] = {}
+            exprs = list(solver_json.get("update_expressions", {}).values()) + list(solver_json.get("propagators", {}).values())
+            for param_name, param_expr in indict["parameters"].items():
+                # only make parameters appear in a solver if they are actually used there
+                if any([param_name in [str(sym) for sym in expr.atoms()] for expr in exprs]):
+                    solver_json["parameters"][param_name] = str(sympy.parsing.sympy_parser.parse_expr(param_expr, global_dict=Shape._sympy_globals).n())
+
+    @classmethod
+    def _convert_expressions_to_str(cls, solvers_json: List[Dict[str, Any]], indict: Dict[str, Any],
+                                    preserve_expressions: Union[bool, Iterable[str]]) -> None:
+        if type(preserve_expressions) is bool:
+            preserve_expressions = _get_all_first_order_variables(indict) if preserve_expressions else []
+        else:
+            first_order_vars = _get_all_first_order_variables(indict)
+            for preserve_expressions_var in preserve_expressions:
+                if preserve_expressions_var not in first_order_vars:
+                    raise MalformedInputException("Requested to preserve expression of variable \"" + preserve_expressions_var + "\", but it was not defined as a first-order ODE")
+
+        for solver_json in solvers_json:
+            if "update_expressions" in solver_json.keys():
+                for sym, expr in solver_json["update_expressions"].items():
+                    solver_json["update_expressions"][sym] = str(expr)
+                    if sym in preserve_expressions and "analytic" not in solver_json["solver"]:
+                        var_def_str = _find_variable_definition(indict, sym, order=1)
+                        assert var_def_str is not None
+                        solver_json["update_expressions"][sym] = var_def_str.replace("'", Config().differential_order_symbol)
+
+            if "propagators" in solver_json.keys():
+                for sym, expr in solver_json["propagators"].items():
+                    solver_json["propagators"][sym] = str(expr)
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+#
+# profiler.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import contextlib
+import json
+import os
+import platform
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
+import pynestml
+from pynestml.utils.toolchain_context import ContextBound
+
+
+class Profiler(metaclass=ContextBound):
+    r"""
+    Records the wall time and peak memory usage of each phase of the toolchain (parsing, symbol table construction, context condition checks, transformers, ODE-toolbox analysis, template rendering, building), per model.
+
+    Phases can be nested; the time of a phase includes that of the phases nested inside it. Memory usage is measured as the peak resident set size of the process up to the end of the phase; if it grew during a phase, that phase set a new high-water mark. Memory used by external processes (such as the compiler during the build) is not included. Peak memory is not recorded on platforms where the ``resource`` module is not available.
+
+    Profiling is disabled by default. When disabled, ``Profiler.phase()`` has negligible overhead. The records are kept separately for each ``ToolchainContext``.
+    """
+    _context_attributes = ("enabled", "records", "start_time", "_stack")
+
+    enabled = False
+    records: List[Dict[str, Any]] = []
+    start_time = None
+    _stack: List[Dict[str, Any]] = []
+
+    @classmethod
+    def init_profiler(cls, enabled: bool) -> None:
+        r"""
+        Initialize (and reset) the profiler.
+        :param enabled: whether to record any phases
+        """
+        cls.enabled = enabled
+        cls.records = []
+        cls._stack = []
+        cls.start_time = time.time()
+
+    @classmethod
+    def get_peak_memory(cls) -> Optional[int]:
+        r"""
+        Returns the peak resident set size of the current process.
+        :return: the peak memory usage in bytes, or None if it cannot be determined
+        """
+        if resource is None:
+            return None
+
+        peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform != "darwin":
+            peak_memory *= 1024     # reported in kilobytes rather than bytes
+
+        return peak_memory
+
+    @classmethod
+    @contextlib.contextmanager
+    def phase(cls, name: str, model: Optional[str] = None, detail: Optional[str] = None) -> Iterator[None]:
+        r"""
+        Context manager that records the wall time and peak memory usage of the code executed in its context.
+
+        Each record contains the name of the phase, the model and detail, the names of the enclosing phases (joined with "/"), the process ID, the start time (in seconds since the epoch), the wall time (in seconds) and the peak memory usage (in bytes).
+
+        :param name: name of the phase, e.g. "parse" or "ode_toolbox_analysis"
+        :param model: name of the neuron or synapse that is processed, if any
+        :param detail: further information, e.g. the name of the file being parsed or the template being rendered
+        """
+        if not cls.enabled:
+            yield
+            return
+
+        record = {"phase": name,
+                  "model": model,
+                  "detail": detail,
+                  "parent": "/".join([parent["phase"] for parent in cls._stack]) if cls._stack else None,
+                  "pid": os.getpid(),
+                  "start": time.time()}
+        cls._stack.append(record)
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            record["wall_time"] = time.perf_counter() - start_time
+            record["peak_memory"] = cls.get_peak_memory()
+            cls._stack.pop()
+            cls.records.append(record)
+
+    @classmethod
+    def get_records(cls) -> List[Dict[str, Any]]:
+        r"""
+        Returns the records of all phases that have been completed.
+        :return: a list of records
+        """
+        return cls.records
+
+    @classmethod
+    def merge_records(cls, records: Sequence[Dict[str, Any]]) -> None:
+        r"""
+        Add records obtained by another profiler instance, for instance in a worker process.
+        :param records: a list of records
+        """
+        cls.records.extend(records)
+
+    @classmethod
+    def get_summary(cls) -> Dict[str, Dict[str, Any]]:
+        r"""
+        Returns, for each phase, the number of times it was run, the total wall time and the maximum peak memory usage. Nested occurrences of a phase (for instance, context condition checks that run during the construction of a symbol table that is itself part of another phase) are counted separately from top-level occurrences by prefixing the phase name with the names of the enclosing phases.
+        :return: a dictionary mapping phase name to summary
+        """
+        summary = {}
+        for record in cls.records:
+            name = record["phase"] if record["parent"] is None else record["parent"] + "/" + record["phase"]
+            if name not in summary.keys():
+                summary[name] = {"count": 0, "wall_time": 0., "peak_memory": None}
+            summary[name]["count"] += 1
+            summary[name]["wall_time"] += record["wall_time"]
+            if record["peak_memory"] is not None:
+                summary[name]["peak_memory"] = max(summary[name]["peak_memory"] or 0, record["peak_memory"])
+
+        return summary
+
+    @classmethod
+    def write(cls, path: str) -> None:
+        r"""
+        Write the records in JSON format to the given file.
+        :param path: path of the output file
+        """
+        profile = {"pynestml_version": pynestml.__version__,
+                   "python_version": platform.python_version(),
+                   "start": cls.start_time,
+                   "wall_time": time.time() - cls.start_time,
+                   "peak_memory": cls.get_peak_memory(),
+                   "summary": cls.get_summary(),
+                   "phases": sorted(cls.records, key=lambda record: record["start"])}
+
+        with open(path, "w") as f:
+            json.dump(profile, f, indent=2)
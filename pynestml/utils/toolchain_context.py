@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+#
+# toolchain_context.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator
+
+import contextlib
+import contextvars
+import copy
+
+
+class ToolchainContext:
+    r"""
+    The state of a single run ("job") of the toolchain: the frontend configuration, the log, the symbol table, the predefined types, units, functions and variables, and the profiler.
+
+    This state is accessed through the class attributes of ``FrontendConfiguration``, ``Logger``, ``SymbolTable``, ``PredefinedTypes`` etc., which are declared in their ``_context_attributes`` and resolved in the currently active context (see ``ContextBound``). Each job can therefore run in a context of its own, and several jobs can run concurrently in one process, e.g. in a thread pool:
+
+    .. code-block:: python
+
+       context = ToolchainContext()
+       with context.activate():
+           generate_target(...)
+
+    The active context is kept in a context variable, so that it is local to each thread (and to each asyncio task). Code that does not activate a context uses the default context, which is shared by the whole process.
+    """
+
+    def __init__(self):
+        self._states: Dict[type, Dict[str, Any]] = {}
+
+    def get_state(self, cls: ContextBound) -> Dict[str, Any]:
+        r"""
+        Returns the values of the context attributes of a class in this context. The first time that the state of a class is requested, it is initialized with (shallow copies of) the values given in the class body.
+        :param cls: a class declaring context attributes
+        :return: the values of the context attributes, by name
+        """
+        state = self._states.get(cls)
+        if state is None:
+            state = {name: copy.copy(value) for name, value in type(cls).context_defaults.items()}
+            self._states[cls] = state
+
+        return state
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator[ToolchainContext]:
+        r"""
+        Context manager that makes this context the active one in the current thread, and restores the previously active context afterwards. Activations can be nested.
+        """
+        token = _current_context.set(self)
+        try:
+            yield self
+        finally:
+            _current_context.reset(token)
+
+    @classmethod
+    def get_current(cls) -> ToolchainContext:
+        r"""
+        Returns the currently active context.
+        :return: the active context, or the default context if none has been activated
+        """
+        return _current_context.get()
+
+
+_current_context = contextvars.ContextVar("toolchain_context", default=ToolchainContext())
+
+
+class _ContextAttribute:
+    r"""
+    Data descriptor (on the metaclass) that resolves a class attribute in the currently active ``ToolchainContext``.
+    """
+
+    __slots__ = ("owner", "name")
+
+    def __init__(self, name: str):
+        self.owner = None
+        self.name = name
+
+    def __get__(self, cls, metacls=None):
+        if cls is None:
+            return self
+
+        # this is called for every access of the attribute, so ``get_state()`` is only called if the state has not been initialized yet
+        try:
+            return _current_context.get()._states[self.owner][self.name]
+        except KeyError:
+            return _current_context.get().get_state(self.owner)[self.name]
+
+    def __set__(self, cls, value) -> None:
+        try:
+            _current_context.get()._states[self.owner][self.name] = value
+        except KeyError:
+            _current_context.get().get_state(self.owner)[self.name] = value
+
+
+class ContextBound(type):
+    r"""
+    Metaclass for classes that keep the state of a toolchain run in class attributes. The attributes named in the ``_context_attributes`` of the class body are not stored in the class itself, but in the active ``ToolchainContext``; the values given in the class body are used as initial values in each context.
+
+    The attributes are resolved by data descriptors on a metaclass that is derived for each such class, so that reading or assigning them through ``cls`` works as for plain class attributes.
+    """
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        context_defaults = {attr_name: namespace.pop(attr_name) for attr_name in namespace.get("_context_attributes", ())}
+        if not context_defaults:
+            return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+        descriptors = {attr_name: _ContextAttribute(attr_name) for attr_name in context_defaults.keys()}
+        derived_mcs = type(name + "ContextBound", (mcs,), dict(descriptors, context_defaults=context_defaults))
+        cls = super().__new__(derived_mcs, name, bases, namespace, **kwargs)
+        for descriptor in descriptors.values():
+            descriptor.owner = cls
+
+        return cls
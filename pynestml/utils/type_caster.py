@@ -35,11 +35,10 @@ class TypeCaster:
             UnitTypeSymbol.get_conversion_factor(_lhs_type_symbol.astropy_unit,
                                                  _rhs_type_symbol.astropy_unit))
         _containing_expression.type = _lhs_type_symbol
-        code, message = Messages.get_implicit_magnitude_conversion(_lhs_type_symbol, _rhs_type_symbol,
-                                                                   _containing_expression.get_implicit_conversion_factor())
-        Logger.log_message(code=code, message=message,
-                           error_position=_containing_expression.get_source_position(),
-                           log_level=LoggingLevel.INFO)
+        Logger.log_deferred_message(lambda: Messages.get_implicit_magnitude_conversion(_lhs_type_symbol, _rhs_type_symbol,
+                                                                                       _containing_expression.get_implicit_conversion_factor()),
+                                    error_position=_containing_expression.get_source_position(),
+                                    log_level=LoggingLevel.INFO)
 
     @staticmethod
     def try_to_recover_or_error(_lhs_type_symbol, _rhs_type_symbol, _containing_expression):
@@ -53,10 +52,10 @@ class TypeCaster:
                     TypeCaster.do_magnitude_conversion_rhs_to_lhs(
                         _rhs_type_symbol, _lhs_type_symbol, _containing_expression)
             # the units are mutually convertible (e.g. V and A*Ohm)
-            code, message = Messages.get_implicit_cast_rhs_to_lhs(_rhs_type_symbol.print_symbol(),
-                                                                  _lhs_type_symbol.print_symbol())
-            Logger.log_message(error_position=_containing_expression.get_source_position(),
-                               code=code, message=message, log_level=LoggingLevel.INFO)
+            Logger.log_deferred_message(lambda: Messages.get_implicit_cast_rhs_to_lhs(_rhs_type_symbol.print_symbol(),
+                                                                                      _lhs_type_symbol.print_symbol()),
+                                        error_position=_containing_expression.get_source_position(),
+                                        log_level=LoggingLevel.INFO)
         else:
             code, message = Messages.get_type_different_from_expected(_lhs_type_symbol, _rhs_type_symbol)
             Logger.log_message(error_position=_containing_expression.get_source_position(),
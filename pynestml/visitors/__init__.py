@@ -24,6 +24,7 @@ __all__ = [
     'ast_boolean_literal_visitor.py',
     'ast_builder_visitor.py',
     'ast_comparison_operator_visitor.py',
+    'ast_composite_visitor.py',
     'ast_condition_visitor.py',
     'ast_data_type_visitor.py',
     'ast_dot_operator_visitor.py',
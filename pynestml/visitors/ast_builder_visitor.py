@@ -488,10 +488,10 @@ class ASTBuilderVisitor(PyNestMLParserVisitor):
         return neuron
 
     def visitNamespaceDecoratorNamespace(self, ctx):
-        return ctx.NAME()
+        return str(ctx.NAME())
 
     def visitNamespaceDecoratorName(self, ctx):
-        return ctx.NAME()
+        return str(ctx.NAME())
 
     def visitAnyDecorator(self, ctx):
         from pynestml.generated.PyNestMLLexer import PyNestMLLexer
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+#
+# ast_composite_visitor.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from pynestml.meta_model.ast_node import ASTNode
+from pynestml.visitors.ast_visitor import ASTVisitor
+
+
+class ASTCompositeVisitor(ASTVisitor):
+    """
+    Runs several visitors in a single traversal of the AST, e.g.
+
+    .. code-block:: python
+
+       symbol_table_visitor = ASTSymbolTableVisitor()
+       mark_delay_vars_visitor = ASTMarkDelayVarsVisitor()
+       expr.accept(ASTCompositeVisitor([symbol_table_visitor, mark_delay_vars_visitor]))
+
+    Each node is handed to the ``visit_*()`` and ``endvisit_*()`` methods that the visitors override for its type (or to their generic ``visit()`` and ``endvisit()`` methods, if these are overridden), in the order in which the visitors were given: all visitors visit a node before its children are traversed, and end the visit after all of its children have been traversed. If the real self of a visitor (see ``set_real_self()``) is another visitor, the methods of the latter are called, as they would be if the visitor was run by itself.
+
+    Only visitors that do not change the way the AST is traversed can be combined (see ``can_combine()``). The visitors should not depend on the changes that another visitor makes to a node or its children: running them in one traversal gives the same results as running them one after another only if the visitors are independent of each other.
+    """
+
+    def __init__(self, visitors: Sequence[ASTVisitor]):
+        """
+        Standard constructor.
+        :param visitors: the visitors to run
+        """
+        super(ASTCompositeVisitor, self).__init__()
+        for visitor in visitors:
+            assert self.can_combine(visitor), "Visitor " + type(visitor).__name__ + " changes the traversal of the AST and cannot be combined with other visitors"
+
+        self._visitors = visitors
+        self._visit_methods: Dict[type, List[Tuple[int, Callable]]] = {}
+        self._endvisit_methods: Dict[type, List[Tuple[int, Callable]]] = {}
+
+    def get_visitors(self) -> Sequence[ASTVisitor]:
+        """
+        Returns the visitors that are run by this visitor.
+        :return: the visitors
+        """
+        return self._visitors
+
+    @classmethod
+    def can_combine(cls, visitor: ASTVisitor) -> bool:
+        """
+        Checks whether the handed over visitor can be run together with others, i.e. its real self uses the standard traversal of the AST.
+        :param visitor: a visitor
+        :return: True if the visitor can be combined with others
+        """
+        real_self = visitor.get_real_self()
+        if real_self.get_real_self() is not real_self:
+            return False
+
+        for name in dir(ASTVisitor):
+            if (name in ["handle", "traverse"] or name.startswith("traverse_")) \
+               and getattr(type(real_self), name) is not getattr(ASTVisitor, name):
+                return False
+
+        return True
+
+    def visit(self, node: ASTNode) -> None:
+        for _, method in self._get_methods(node, "visit", self._visit_methods):
+            method(node)
+
+    def endvisit(self, node: ASTNode) -> None:
+        for _, method in self._get_methods(node, "endvisit", self._endvisit_methods):
+            method(node)
+
+    def _get_methods(self, node: ASTNode, prefix: str, methods_by_type: Dict[type, List[Tuple[int, Callable]]]) -> List[Tuple[int, Callable]]:
+        """
+        Returns the methods of the visitors that handle the node, together with the index of their visitor. Visitors that do not override a method for the type of the node are skipped.
+        """
+        methods = methods_by_type.get(type(node))
+        if methods is not None:
+            return methods
+
+        methods = []
+        method_names = ASTVisitor._get_method_names(type(node))
+        method_name = method_names[0 if prefix == "visit" else 2] if method_names else None
+        for i, visitor in enumerate(self._visitors):
+            real_self = visitor.get_real_self()
+            if getattr(type(real_self), prefix) is not getattr(ASTVisitor, prefix):
+                # the generic method is overridden (e.g. ``ASTHigherOrderVisitor``)
+                methods.append((i, getattr(real_self, prefix)))
+            elif method_name is not None \
+                    and getattr(type(real_self), method_name) is not getattr(ASTVisitor, method_name):
+                methods.append((i, getattr(real_self, method_name)))
+
+        methods_by_type[type(node)] = methods
+        return methods
@@ -36,6 +36,7 @@ from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.either import Either
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
+from pynestml.utils.profiler import Profiler
 from pynestml.utils.stack import Stack
 from pynestml.visitors.ast_data_type_visitor import ASTDataTypeVisitor
 from pynestml.visitors.ast_visitor import ASTVisitor
@@ -61,9 +62,8 @@ class ASTSymbolTableVisitor(ASTVisitor):
         """
         # set current processed neuron
         Logger.set_current_node(node)
-        code, message = Messages.get_start_building_symbol_table()
-        Logger.log_message(node=node, code=code, error_position=node.get_source_position(),
-                           message=message, log_level=LoggingLevel.DEBUG)
+        Logger.log_deferred_message(Messages.get_start_building_symbol_table, node=node,
+                                    error_position=node.get_source_position(), log_level=LoggingLevel.DEBUG)
         scope = Scope(scope_type=ScopeType.GLOBAL, source_position=node.get_source_position())
         node.update_scope(scope)
         node.get_body().update_scope(scope)
@@ -80,7 +80,8 @@ class ASTSymbolTableVisitor(ASTVisitor):
 
     def endvisit_neuron(self, node):
         # before following checks occur, we need to ensure several simple properties
-        CoCosManager.post_symbol_table_builder_checks(node, after_ast_rewrite=self.after_ast_rewrite_)
+        with Profiler.phase("cocos", node.get_name()):
+            CoCosManager.post_symbol_table_builder_checks(node, after_ast_rewrite=self.after_ast_rewrite_)
 
         # update the equations
         if node.get_equations_blocks() is not None and len(node.get_equations_blocks().get_declarations()) > 0:
@@ -107,9 +108,8 @@ class ASTSymbolTableVisitor(ASTVisitor):
         # set current processed synapse
         # Logger.set_current_synapse(node)
         Logger.set_current_node(node)
-        code, message = Messages.get_start_building_symbol_table()
-        Logger.log_message(node=node, code=code, error_position=node.get_source_position(),
-                           message=message, log_level=LoggingLevel.DEBUG)
+        Logger.log_deferred_message(Messages.get_start_building_symbol_table, node=node,
+                                    error_position=node.get_source_position(), log_level=LoggingLevel.DEBUG)
         # before starting the work on the synapse, make everything which was implicit explicit
         # but if we have a model without an equations block, just skip this step
         scope = Scope(scope_type=ScopeType.GLOBAL, source_position=node.get_source_position())
@@ -129,7 +129,8 @@ class ASTSymbolTableVisitor(ASTVisitor):
 
     def endvisit_synapse(self, node):
         # before following checks occur, we need to ensure several simple properties
-        CoCosManager.post_symbol_table_builder_checks(node)
+        with Profiler.phase("cocos", node.get_name()):
+            CoCosManager.post_symbol_table_builder_checks(node)
         Logger.set_current_node(None)
 
     def endvisit_synapse_body(self, node):
@@ -19,6 +19,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from typing import Dict, Tuple
+
 from pynestml.meta_model.ast_arithmetic_operator import ASTArithmeticOperator
 from pynestml.meta_model.ast_assignment import ASTAssignment
 from pynestml.meta_model.ast_bit_operator import ASTBitOperator
@@ -69,6 +71,52 @@ class ASTVisitor:
         real_self (ASTVisitor): The visitor which will be used during the visiting of a node.
     """
 
+    # the classes of the nodes and the suffixes of the names of their methods, in the order in which they are checked: a class has to come before its base classes
+    _node_classes = [(ASTArithmeticOperator, "arithmetic_operator"),
+                     (ASTAssignment, "assignment"),
+                     (ASTBitOperator, "bit_operator"),
+                     (ASTBlock, "block"),
+                     (ASTBlockWithVariables, "block_with_variables"),
+                     (ASTNeuronOrSynapseBody, "neuron_or_synapse_body"),
+                     (ASTComparisonOperator, "comparison_operator"),
+                     (ASTCompoundStmt, "compound_stmt"),
+                     (ASTDataType, "data_type"),
+                     (ASTDeclaration, "declaration"),
+                     (ASTElifClause, "elif_clause"),
+                     (ASTElseClause, "else_clause"),
+                     (ASTEquationsBlock, "equations_block"),
+                     (ASTExpression, "expression"),
+                     (ASTForStmt, "for_stmt"),
+                     (ASTFunction, "function"),
+                     (ASTFunctionCall, "function_call"),
+                     (ASTIfClause, "if_clause"),
+                     (ASTIfStmt, "if_stmt"),
+                     (ASTInputBlock, "input_block"),
+                     (ASTInputPort, "input_port"),
+                     (ASTInputQualifier, "input_qualifier"),
+                     (ASTLogicalOperator, "logical_operator"),
+                     (ASTNestMLCompilationUnit, "compilation_unit"),
+                     (ASTNeuron, "neuron"),
+                     (ASTSynapse, "synapse"),
+                     (ASTOdeEquation, "ode_equation"),
+                     (ASTInlineExpression, "inline_expression"),
+                     (ASTKernel, "kernel"),
+                     (ASTOutputBlock, "output_block"),
+                     (ASTParameter, "parameter"),
+                     (ASTReturnStmt, "return_stmt"),
+                     (ASTSimpleExpression, "simple_expression"),
+                     (ASTSmallStmt, "small_stmt"),
+                     (ASTUnaryOperator, "unary_operator"),
+                     (ASTUnitType, "unit_type"),
+                     (ASTUpdateBlock, "update_block"),
+                     (ASTOnReceiveBlock, "on_receive_block"),
+                     (ASTVariable, "variable"),
+                     (ASTWhileStmt, "while_stmt"),
+                     (ASTStmt, "stmt")]
+
+    # maps the type of a node to the names of its methods (see ``_get_method_names()``)
+    _method_names: Dict[type, Tuple[str, ...]] = {}
+
     def __init__(self):
         """
         Standard constructor.
@@ -733,9 +781,10 @@ class ASTVisitor:
         return self.real_self
 
     def handle(self, _node):
-        self.get_real_self().visit(_node)
-        self.get_real_self().traverse(_node)
-        self.get_real_self().endvisit(_node)
+        real_self = self.get_real_self()
+        real_self.visit(_node)
+        real_self.traverse(_node)
+        real_self.endvisit(_node)
         return
 
     def visit(self, node):
@@ -744,130 +793,9 @@ class ASTVisitor:
         :param node: The ASTElement to visit
         :type node:  ASTElement or inherited
         """
-        if isinstance(node, ASTArithmeticOperator):
-            self.visit_arithmetic_operator(node)
-            return
-        if isinstance(node, ASTAssignment):
-            self.visit_assignment(node)
-            return
-        if isinstance(node, ASTBitOperator):
-            self.visit_bit_operator(node)
-            return
-        if isinstance(node, ASTBlock):
-            self.visit_block(node)
-            return
-        if isinstance(node, ASTBlockWithVariables):
-            self.visit_block_with_variables(node)
-            return
-        if isinstance(node, ASTNeuronOrSynapseBody):
-            self.visit_neuron_or_synapse_body(node)
-            return
-        if isinstance(node, ASTComparisonOperator):
-            self.visit_comparison_operator(node)
-            return
-        if isinstance(node, ASTCompoundStmt):
-            self.visit_compound_stmt(node)
-            return
-        if isinstance(node, ASTDataType):
-            self.visit_data_type(node)
-            return
-        if isinstance(node, ASTDeclaration):
-            self.visit_declaration(node)
-            return
-        if isinstance(node, ASTElifClause):
-            self.visit_elif_clause(node)
-            return
-        if isinstance(node, ASTElseClause):
-            self.visit_else_clause(node)
-            return
-        if isinstance(node, ASTEquationsBlock):
-            self.visit_equations_block(node)
-            return
-        if isinstance(node, ASTExpression):
-            self.visit_expression(node)
-            return
-        if isinstance(node, ASTForStmt):
-            self.visit_for_stmt(node)
-            return
-        if isinstance(node, ASTFunction):
-            self.visit_function(node)
-            return
-        if isinstance(node, ASTFunctionCall):
-            self.visit_function_call(node)
-            return
-        if isinstance(node, ASTIfClause):
-            self.visit_if_clause(node)
-            return
-        if isinstance(node, ASTIfStmt):
-            self.visit_if_stmt(node)
-            return
-        if isinstance(node, ASTInputBlock):
-            self.visit_input_block(node)
-            return
-        if isinstance(node, ASTInputPort):
-            self.visit_input_port(node)
-            return
-        if isinstance(node, ASTInputQualifier):
-            self.visit_input_qualifier(node)
-            return
-        if isinstance(node, ASTLogicalOperator):
-            self.visit_logical_operator(node)
-            return
-        if isinstance(node, ASTNestMLCompilationUnit):
-            self.visit_compilation_unit(node)
-            return
-        if isinstance(node, ASTNeuron):
-            self.visit_neuron(node)
-            return
-        if isinstance(node, ASTSynapse):
-            self.visit_synapse(node)
-            return
-        if isinstance(node, ASTOdeEquation):
-            self.visit_ode_equation(node)
-            return
-        if isinstance(node, ASTInlineExpression):
-            self.visit_inline_expression(node)
-            return
-        if isinstance(node, ASTKernel):
-            self.visit_kernel(node)
-            return
-        if isinstance(node, ASTOutputBlock):
-            self.visit_output_block(node)
-            return
-        if isinstance(node, ASTParameter):
-            self.visit_parameter(node)
-            return
-        if isinstance(node, ASTReturnStmt):
-            self.visit_return_stmt(node)
-            return
-        if isinstance(node, ASTSimpleExpression):
-            self.visit_simple_expression(node)
-            return
-        if isinstance(node, ASTSmallStmt):
-            self.visit_small_stmt(node)
-            return
-        if isinstance(node, ASTUnaryOperator):
-            self.visit_unary_operator(node)
-            return
-        if isinstance(node, ASTUnitType):
-            self.visit_unit_type(node)
-            return
-        if isinstance(node, ASTUpdateBlock):
-            self.visit_update_block(node)
-            return
-        if isinstance(node, ASTOnReceiveBlock):
-            self.visit_on_receive_block(node)
-            return
-        if isinstance(node, ASTVariable):
-            self.visit_variable(node)
-            return
-        if isinstance(node, ASTWhileStmt):
-            self.visit_while_stmt(node)
-            return
-        if isinstance(node, ASTStmt):
-            self.visit_stmt(node)
-            return
-        return
+        method_names = ASTVisitor._get_method_names(type(node))
+        if method_names:
+            getattr(self, method_names[0])(node)
 
     def traverse(self, node):
         """
@@ -875,130 +803,9 @@ class ASTVisitor:
         :param node: The ASTElement to visit
         :type node: Inherited from ASTElement
         """
-        if isinstance(node, ASTArithmeticOperator):
-            self.traverse_arithmetic_operator(node)
-            return
-        if isinstance(node, ASTAssignment):
-            self.traverse_assignment(node)
-            return
-        if isinstance(node, ASTBitOperator):
-            self.traverse_bit_operator(node)
-            return
-        if isinstance(node, ASTBlock):
-            self.traverse_block(node)
-            return
-        if isinstance(node, ASTBlockWithVariables):
-            self.traverse_block_with_variables(node)
-            return
-        if isinstance(node, ASTNeuronOrSynapseBody):
-            self.traverse_neuron_or_synapse_body(node)
-            return
-        if isinstance(node, ASTComparisonOperator):
-            self.traverse_comparison_operator(node)
-            return
-        if isinstance(node, ASTCompoundStmt):
-            self.traverse_compound_stmt(node)
-            return
-        if isinstance(node, ASTDataType):
-            self.traverse_data_type(node)
-            return
-        if isinstance(node, ASTDeclaration):
-            self.traverse_declaration(node)
-            return
-        if isinstance(node, ASTElifClause):
-            self.traverse_elif_clause(node)
-            return
-        if isinstance(node, ASTElseClause):
-            self.traverse_else_clause(node)
-            return
-        if isinstance(node, ASTEquationsBlock):
-            self.traverse_equations_block(node)
-            return
-        if isinstance(node, ASTExpression):
-            self.traverse_expression(node)
-            return
-        if isinstance(node, ASTForStmt):
-            self.traverse_for_stmt(node)
-            return
-        if isinstance(node, ASTFunction):
-            self.traverse_function(node)
-            return
-        if isinstance(node, ASTFunctionCall):
-            self.traverse_function_call(node)
-            return
-        if isinstance(node, ASTIfClause):
-            self.traverse_if_clause(node)
-            return
-        if isinstance(node, ASTIfStmt):
-            self.traverse_if_stmt(node)
-            return
-        if isinstance(node, ASTInputBlock):
-            self.traverse_input_block(node)
-            return
-        if isinstance(node, ASTInputPort):
-            self.traverse_input_port(node)
-            return
-        if isinstance(node, ASTInputQualifier):
-            self.traverse_input_qualifier(node)
-            return
-        if isinstance(node, ASTLogicalOperator):
-            self.traverse_logical_operator(node)
-            return
-        if isinstance(node, ASTNestMLCompilationUnit):
-            self.traverse_compilation_unit(node)
-            return
-        if isinstance(node, ASTNeuron):
-            self.traverse_neuron(node)
-            return
-        if isinstance(node, ASTSynapse):
-            self.traverse_synapse(node)
-            return
-        if isinstance(node, ASTOdeEquation):
-            self.traverse_ode_equation(node)
-            return
-        if isinstance(node, ASTInlineExpression):
-            self.traverse_inline_expression(node)
-            return
-        if isinstance(node, ASTKernel):
-            self.traverse_kernel(node)
-            return
-        if isinstance(node, ASTOutputBlock):
-            self.traverse_output_block(node)
-            return
-        if isinstance(node, ASTParameter):
-            self.traverse_parameter(node)
-            return
-        if isinstance(node, ASTReturnStmt):
-            self.traverse_return_stmt(node)
-            return
-        if isinstance(node, ASTSimpleExpression):
-            self.traverse_simple_expression(node)
-            return
-        if isinstance(node, ASTSmallStmt):
-            self.traverse_small_stmt(node)
-            return
-        if isinstance(node, ASTUnaryOperator):
-            self.traverse_unary_operator(node)
-            return
-        if isinstance(node, ASTUnitType):
-            self.traverse_unit_type(node)
-            return
-        if isinstance(node, ASTUpdateBlock):
-            self.traverse_update_block(node)
-            return
-        if isinstance(node, ASTOnReceiveBlock):
-            self.traverse_on_receive_block(node)
-            return
-        if isinstance(node, ASTVariable):
-            self.traverse_variable(node)
-            return
-        if isinstance(node, ASTWhileStmt):
-            self.traverse_while_stmt(node)
-            return
-        if isinstance(node, ASTStmt):
-            self.traverse_stmt(node)
-            return
-        return
+        method_names = ASTVisitor._get_method_names(type(node))
+        if method_names:
+            getattr(self, method_names[1])(node)
 
     def endvisit(self, node):
         """
@@ -1006,130 +813,28 @@ class ASTVisitor:
         :param node: The ASTElement to endvisit
         :type node:  ASTElement or inherited
         """
-        if isinstance(node, ASTArithmeticOperator):
-            self.endvisit_arithmetic_operator(node)
-            return
-        if isinstance(node, ASTAssignment):
-            self.endvisit_assignment(node)
-            return
-        if isinstance(node, ASTBitOperator):
-            self.endvisit_bit_operator(node)
-            return
-        if isinstance(node, ASTBlock):
-            self.endvisit_block(node)
-            return
-        if isinstance(node, ASTBlockWithVariables):
-            self.endvisit_block_with_variables(node)
-            return
-        if isinstance(node, ASTNeuronOrSynapseBody):
-            self.endvisit_neuron_or_synapse_body(node)
-            return
-        if isinstance(node, ASTComparisonOperator):
-            self.endvisit_comparison_operator(node)
-            return
-        if isinstance(node, ASTCompoundStmt):
-            self.endvisit_compound_stmt(node)
-            return
-        if isinstance(node, ASTDataType):
-            self.endvisit_data_type(node)
-            return
-        if isinstance(node, ASTDeclaration):
-            self.endvisit_declaration(node)
-            return
-        if isinstance(node, ASTElifClause):
-            self.endvisit_elif_clause(node)
-            return
-        if isinstance(node, ASTElseClause):
-            self.endvisit_else_clause(node)
-            return
-        if isinstance(node, ASTEquationsBlock):
-            self.endvisit_equations_block(node)
-            return
-        if isinstance(node, ASTExpression):
-            self.endvisit_expression(node)
-            return
-        if isinstance(node, ASTForStmt):
-            self.endvisit_for_stmt(node)
-            return
-        if isinstance(node, ASTFunction):
-            self.endvisit_function(node)
-            return
-        if isinstance(node, ASTFunctionCall):
-            self.endvisit_function_call(node)
-            return
-        if isinstance(node, ASTIfClause):
-            self.endvisit_if_clause(node)
-            return
-        if isinstance(node, ASTIfStmt):
-            self.endvisit_if_stmt(node)
-            return
-        if isinstance(node, ASTInputBlock):
-            self.endvisit_input_block(node)
-            return
-        if isinstance(node, ASTInputPort):
-            self.endvisit_input_port(node)
-            return
-        if isinstance(node, ASTInputQualifier):
-            self.endvisit_input_qualifier(node)
-            return
-        if isinstance(node, ASTLogicalOperator):
-            self.endvisit_logical_operator(node)
-            return
-        if isinstance(node, ASTNestMLCompilationUnit):
-            self.endvisit_compilation_unit(node)
-            return
-        if isinstance(node, ASTNeuron):
-            self.endvisit_neuron(node)
-            return
-        if isinstance(node, ASTSynapse):
-            self.endvisit_synapse(node)
-            return
-        if isinstance(node, ASTOdeEquation):
-            self.endvisit_ode_equation(node)
-            return
-        if isinstance(node, ASTInlineExpression):
-            self.endvisit_inline_expression(node)
-            return
-        if isinstance(node, ASTKernel):
-            self.endvisit_kernel(node)
-            return
-        if isinstance(node, ASTOutputBlock):
-            self.endvisit_output_block(node)
-            return
-        if isinstance(node, ASTParameter):
-            self.endvisit_parameter(node)
-            return
-        if isinstance(node, ASTReturnStmt):
-            self.endvisit_return_stmt(node)
-            return
-        if isinstance(node, ASTSimpleExpression):
-            self.endvisit_simple_expression(node)
-            return
-        if isinstance(node, ASTSmallStmt):
-            self.endvisit_small_stmt(node)
-            return
-        if isinstance(node, ASTUnaryOperator):
-            self.endvisit_unary_operator(node)
-            return
-        if isinstance(node, ASTUnitType):
-            self.endvisit_unit_type(node)
-            return
-        if isinstance(node, ASTUpdateBlock):
-            self.endvisit_update_block(node)
-            return
-        if isinstance(node, ASTOnReceiveBlock):
-            self.endvisit_on_receive_block(node)
-            return
-        if isinstance(node, ASTVariable):
-            self.endvisit_variable(node)
-            return
-        if isinstance(node, ASTWhileStmt):
-            self.endvisit_while_stmt(node)
-            return
-        if isinstance(node, ASTStmt):
-            self.endvisit_stmt(node)
-            return
-        return
+        method_names = ASTVisitor._get_method_names(type(node))
+        if method_names:
+            getattr(self, method_names[2])(node)
+
+    @classmethod
+    def _get_method_names(cls, node_type: type) -> Tuple[str, ...]:
+        """
+        Returns the names of the visit, traverse and endvisit methods for nodes of the handed over type, e.g. ("visit_function_call", "traverse_function_call", "endvisit_function_call"). The names are found once for each type, from the first class in ``_node_classes`` of which the type is a subclass.
+        :param node_type: the type of a node
+        :return: the method names, or an empty tuple if the type has no methods
+        """
+        method_names = cls._method_names.get(node_type)
+        if method_names is None:
+            method_names = ()
+            for node_class, suffix in cls._node_classes:
+                if issubclass(node_type, node_class):
+                    method_names = ("visit_" + suffix, "traverse_" + suffix, "endvisit_" + suffix)
+                    break
+
+            cls._method_names[node_type] = method_names
+
+        return method_names
 
     def traverse_arithmetic_operator(self, node):
         return
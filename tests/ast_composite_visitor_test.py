@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+#
+# ast_composite_visitor_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import unittest
+
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
+from pynestml.meta_model.ast_variable import ASTVariable
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.toolchain_context import ToolchainContext
+from pynestml.visitors.ast_composite_visitor import ASTCompositeVisitor
+from pynestml.visitors.ast_expression_type_visitor import ASTExpressionTypeVisitor
+from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+from pynestml.visitors.ast_visitor import ASTVisitor
+
+
+class RecordingVisitor(ASTVisitor):
+    def __init__(self, name, calls):
+        super(RecordingVisitor, self).__init__()
+        self.name = name
+        self.calls = calls
+
+    def visit_simple_expression(self, node):
+        self.calls.append(self.name + ".visit_simple_expression")
+
+    def visit_variable(self, node):
+        self.calls.append(self.name + ".visit_" + node.get_name())
+
+    def endvisit_variable(self, node):
+        self.calls.append(self.name + ".endvisit_" + node.get_name())
+
+
+class ASTCompositeVisitorTest(unittest.TestCase):
+    """
+    Tests that the visitors run by a composite visitor are called as they would be if they were run one after another.
+    """
+
+    def setUp(self):
+        self._context = ToolchainContext()
+        self._context_manager = self._context.activate()
+        self._context_manager.__enter__()
+        Logger.init_logger(LoggingLevel.ERROR)
+        FrontendConfiguration.suffix = ""
+        init_predefined()
+        Logger.set_current_node(None)
+
+    def tearDown(self):
+        self._context_manager.__exit__(None, None, None)
+
+    def test_order_of_calls(self):
+        calls = []
+        node = ASTSimpleExpression(variable=ASTVariable("V_m"))
+        node.accept(ASTCompositeVisitor([RecordingVisitor("a", calls), RecordingVisitor("b", calls)]))
+        assert calls == ["a.visit_simple_expression", "b.visit_simple_expression", "a.visit_V_m", "b.visit_V_m",
+                         "a.endvisit_V_m", "b.endvisit_V_m"]
+
+    def test_same_result_as_separate_visitors(self):
+        models_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models"))
+        neuron = ModelParser.parse_model(os.path.join(models_path, "neurons", "iaf_psc_exp.nestml")).get_neuron_list()[0]
+
+        separate_calls = []
+        separate_nodes = []
+        neuron.accept(RecordingVisitor("a", separate_calls))
+        neuron.accept(ASTHigherOrderVisitor(visit_funcs=separate_nodes.append))
+
+        calls = []
+        nodes = []
+        neuron.accept(ASTCompositeVisitor([RecordingVisitor("a", calls),
+                                           ASTHigherOrderVisitor(visit_funcs=nodes.append)]))
+        assert calls == separate_calls
+        assert len(nodes) == len(separate_nodes)
+        assert all([node is separate_node for node, separate_node in zip(nodes, separate_nodes)])
+
+    def test_real_self(self):
+        calls = []
+        visitor = RecordingVisitor("a", calls)
+        visitor.set_real_self(RecordingVisitor("b", calls))
+        ASTVariable("V_m").accept(ASTCompositeVisitor([visitor]))
+        assert calls == ["b.visit_V_m", "b.endvisit_V_m"]
+
+    def test_can_combine(self):
+        assert ASTCompositeVisitor.can_combine(RecordingVisitor("a", []))
+        assert not ASTCompositeVisitor.can_combine(ASTExpressionTypeVisitor())
+        with self.assertRaises(AssertionError):
+            ASTCompositeVisitor([ASTExpressionTypeVisitor()])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+#
+# ast_parent_link_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import unittest
+
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.meta_model.ast_node import ASTNode
+from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
+from pynestml.utils.ast_utils import ASTUtils
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.toolchain_context import ToolchainContext
+
+
+class ASTParentLinkTest(unittest.TestCase):
+    """
+    Tests that the parent links of the nodes are set by the parser and by clone(), and that get_parent() gives the same result as a search of the tree, also after the tree has been modified.
+    """
+
+    def setUp(self):
+        self._context = ToolchainContext()
+        self._context_manager = self._context.activate()
+        self._context_manager.__enter__()
+        Logger.init_logger(LoggingLevel.ERROR)
+        FrontendConfiguration.suffix = ""
+        init_predefined()
+        Logger.set_current_node(None)
+
+    def tearDown(self):
+        self._context_manager.__exit__(None, None, None)
+
+    def _parse_neuron(self):
+        models_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models"))
+        return ModelParser.parse_model(os.path.join(models_path, "neurons", "iaf_psc_exp.nestml")).get_neuron_list()[0]
+
+    def _all_nodes(self, ast):
+        nodes = [ast]
+        for child in ast.get_children():
+            nodes.extend(self._all_nodes(child))
+
+        return nodes
+
+    def test_parent_links(self):
+        neuron = self._parse_neuron()
+        assert ASTUtils.get_nodes_with_invalid_parent_link(neuron) == []
+        for node in self._all_nodes(neuron)[1:]:
+            assert neuron.get_parent(node) is neuron.find_parent(node)
+            assert neuron.get_parent(node) is node.parent
+
+        # a node that is not part of the tree has no parent in it
+        assert neuron.get_parent(self._parse_neuron().get_equations_blocks()) is None
+        assert neuron.get_parent(neuron) is None
+
+    def test_clone(self):
+        neuron = self._parse_neuron()
+        neuron_clone = neuron.clone()
+        assert ASTUtils.get_nodes_with_invalid_parent_link(neuron_clone) == []
+        assert neuron.get_parent(neuron_clone.get_equations_blocks()) is None
+
+    def test_modified_tree(self):
+        neuron = self._parse_neuron()
+        ASTNode.check_parent_links = True
+        try:
+            # replace an expression without setting the parent link of the new expression
+            decl = neuron.get_parameter_blocks().get_declarations()[0]
+            old_expr = decl.get_expression()
+            new_expr = ASTSimpleExpression(numeric_literal=42)
+            decl.expression = new_expr
+            assert ASTUtils.get_nodes_with_invalid_parent_link(neuron) == [new_expr]
+            assert neuron.get_parent(new_expr) is decl
+            assert neuron.get_parent(old_expr) is None
+
+            # the links have been repaired by get_parent()
+            assert ASTUtils.get_nodes_with_invalid_parent_link(neuron) == []
+        finally:
+            ASTNode.check_parent_links = False
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+#
+# ast_sympy_converter_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import unittest
+
+import sympy
+from odetoolbox.shapes import Shape
+
+from pynestml.codegeneration.printers.ode_toolbox_reference_converter import ODEToolboxReferenceConverter
+from pynestml.codegeneration.printers.unitless_expression_printer import UnitlessExpressionPrinter
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.utils.ast_sympy_converter import ASTSympyConverter
+from pynestml.utils.ast_utils import ASTUtils
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.toolchain_context import ToolchainContext
+
+
+class ASTSympyConverterTest(unittest.TestCase):
+    """
+    Tests that converting expressions between the abstract syntax tree and sympy directly gives the same results as printing them and parsing the printed string.
+    """
+
+    sympy_expressions = ["a + b - c", "-a + b", "-a - b", "-a*b", "a*(b + c)", "-(a + b)/c", "a/(b*c)", "a/b/c", "2*a/3",
+                         "-3*a/2", "a**2", "a**(-2)", "(-a)**b", "a**b**c", "(a**b)**c", "1/a", "1/(a + b)", "sqrt(a)", "1/sqrt(a + b)",
+                         "exp(-t/tau)", "-exp(-t/tau)/tau**2", "t*exp(-t/tau)*E/tau", "a*exp(-t/tau) + b*exp(-t/(2*tau))",
+                         "Heaviside(a - b)", "Min(a, b)", "0.25*a - 1.5e-3", "-2.5*a", "a < b", "a >= b + 1"]
+
+    def setUp(self):
+        self._context = ToolchainContext()
+        self._context_manager = self._context.activate()
+        self._context_manager.__enter__()
+        Logger.init_logger(LoggingLevel.ERROR)
+        FrontendConfiguration.suffix = ""
+        init_predefined()
+        Logger.set_current_node(None)
+
+    def tearDown(self):
+        self._context_manager.__exit__(None, None, None)
+
+    def _get_model_expressions(self):
+        expressions = []
+        models_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models"))
+        for model_file_name in ["neurons/iaf_psc_alpha.nestml", "neurons/aeif_cond_exp.nestml", "neurons/hh_psc_alpha.nestml",
+                                "neurons/iaf_psc_delta.nestml", "neurons/terub_gpe.nestml", "neurons/wb_cond_multisyn.nestml",
+                                "synapses/stdp_triplet_naive.nestml"]:
+            compilation_unit = ModelParser.parse_model(os.path.join(models_path, model_file_name))
+            for model in compilation_unit.get_neuron_list() + compilation_unit.get_synapse_list():
+                equations_block = model.get_equations_block()
+                if equations_block is not None:
+                    expressions.extend([ode_eq.get_rhs() for ode_eq in equations_block.get_ode_equations()])
+                    expressions.extend([inline_expr.get_expression() for inline_expr in equations_block.get_inline_expressions()])
+                    for kernel in equations_block.get_kernels():
+                        expressions.extend(kernel.get_expressions())
+
+                parameters_block = model.get_parameter_blocks()
+                if parameters_block is not None:
+                    expressions.extend([decl.get_expression() for decl in parameters_block.get_declarations() if decl.has_expression()])
+
+        assert len(expressions) > 100
+
+        return expressions
+
+    def test_to_sympy(self):
+        printer = UnitlessExpressionPrinter(ODEToolboxReferenceConverter())
+        for expr in self._get_model_expressions():
+            expected = sympy.parsing.sympy_parser.parse_expr(printer.print_expression(expr), global_dict=Shape._sympy_globals)
+            assert ASTSympyConverter.to_sympy(expr) == expected, str(expr)
+
+    def test_from_sympy(self):
+        expr_strs = list(self.sympy_expressions)
+        # floating-point numbers are printed with 15 digits, and are not rounded by ``from_sympy()``
+        expr_strs += [str(ASTSympyConverter.to_sympy(expr)) for expr in self._get_model_expressions()]
+        global_dict = dict(Shape._sympy_globals, Min=sympy.Min, Max=sympy.Max, sqrt=sympy.sqrt)
+        sympy_exprs = [sympy.parsing.sympy_parser.parse_expr(s, global_dict=global_dict) for s in expr_strs]
+        for sympy_expr in sympy_exprs:
+            # Euler's number is converted to the NESTML constant ``e``
+            expected = ModelParser.parse_expression(str(sympy_expr.xreplace({sympy.E: sympy.Symbol("e")})))
+            assert ASTSympyConverter.from_sympy(sympy_expr).equals(expected), str(sympy_expr)
+
+    def test_delta_factors(self):
+        model_file_name = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", "iaf_psc_delta.nestml"))
+        factor_expr = sympy.parsing.sympy_parser.parse_expr("mV / pA / ms")
+        assert ASTSympyConverter.from_sympy(factor_expr).equals(ModelParser.parse_expression(str(factor_expr)))
+        neuron = ModelParser.parse_model(model_file_name).get_neuron_list()[0]
+        delta_factors = ASTUtils.get_delta_factors_(neuron, neuron.get_equations_block())
+        assert list(delta_factors.values()) == [factor_expr]
+
+
+if __name__ == "__main__":
+    unittest.main()
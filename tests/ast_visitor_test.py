@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# ast_visitor_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from pynestml.meta_model.ast_namespace_decorator import ASTNamespaceDecorator
+from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
+from pynestml.meta_model.ast_variable import ASTVariable
+from pynestml.visitors.ast_visitor import ASTVisitor
+
+
+class RecordingVisitor(ASTVisitor):
+    def __init__(self):
+        super(RecordingVisitor, self).__init__()
+        self.calls = []
+
+    def visit_simple_expression(self, node):
+        self.calls.append("visit_simple_expression")
+
+    def endvisit_simple_expression(self, node):
+        self.calls.append("endvisit_simple_expression")
+
+    def visit_variable(self, node):
+        self.calls.append("visit_" + node.get_name())
+
+    def endvisit_variable(self, node):
+        self.calls.append("endvisit_" + node.get_name())
+
+
+class DerivedSimpleExpression(ASTSimpleExpression):
+    pass
+
+
+class ASTVisitorTest(unittest.TestCase):
+    """
+    Tests the dispatch of the nodes to the methods of the visitor.
+    """
+
+    def test_dispatch(self):
+        visitor = RecordingVisitor()
+        ASTSimpleExpression(variable=ASTVariable("V_m")).accept(visitor)
+        assert visitor.calls == ["visit_simple_expression", "visit_V_m", "endvisit_V_m", "endvisit_simple_expression"]
+
+    def test_dispatch_of_derived_class(self):
+        visitor = RecordingVisitor()
+        DerivedSimpleExpression(variable=ASTVariable("V_m")).accept(visitor)
+        assert visitor.calls == ["visit_simple_expression", "visit_V_m", "endvisit_V_m", "endvisit_simple_expression"]
+
+    def test_node_without_methods(self):
+        visitor = RecordingVisitor()
+        ASTNamespaceDecorator("nest", "homogeneous").accept(visitor)
+        assert visitor.calls == []
+
+    def test_method_names(self):
+        for node_class, suffix in ASTVisitor._node_classes:
+            method_names = ASTVisitor._get_method_names(node_class)
+            assert method_names == ("visit_" + suffix, "traverse_" + suffix, "endvisit_" + suffix)
+            for method_name in method_names:
+                assert callable(getattr(ASTVisitor, method_name))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#
+# cocos_engine_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import glob
+import os
+import unittest
+from unittest.mock import patch
+
+from pynestml.cocos.co_co_all_variables_defined import ASTExpressionCollectorVisitor
+from pynestml.cocos.co_co_function_calls_consistent import CoCoFunctionCallsConsistent
+from pynestml.cocos.co_cos_engine import ASTFusedVisitor, CoCosEngine
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.symbol_table.symbol_table import SymbolTable
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+
+
+class CoCosEngineTest(unittest.TestCase):
+    """
+    Tests that checking the cocos in a single traversal of the model gives the same messages, in the same order, as checking them one after another.
+    """
+
+    def _parse(self, path):
+        init_predefined()
+        SymbolTable.initialize_symbol_table(ASTSourceLocation(start_line=0, start_column=0, end_line=0, end_column=0))
+        Logger.init_logger(LoggingLevel.INFO)
+        Logger.set_current_node(None)
+        ModelParser.parse_model(path)
+
+        # messages may contain addresses of objects, so only compare their code, position and level
+        return [(code, str(error_position), log_level) for (_, _, log_level, code, error_position, _) in Logger.get_log().values()]
+
+    def test_same_messages(self):
+        paths = sorted(glob.glob(os.path.join(os.path.dirname(__file__), "invalid", "*.nestml"))
+                       + glob.glob(os.path.join(os.path.dirname(__file__), "valid", "*.nestml")))
+        for path in paths:
+            messages = self._parse(path)
+            with patch.object(CoCosEngine, "check_co_cos", CoCosEngine.check_co_cos_separately):
+                messages_separately = self._parse(path)
+
+            self.assertEqual(messages, messages_separately, "Messages differ for model " + path)
+
+    def test_can_fuse(self):
+        self.assertTrue(ASTFusedVisitor.can_fuse(CoCoFunctionCallsConsistent.get_visitor(None)))
+        self.assertFalse(ASTFusedVisitor.can_fuse(ASTExpressionCollectorVisitor()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+#
+# compile_server_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from pynestml.frontend.compile_server import send_request
+from pynestml.frontend.pynestml_frontend import main
+from pynestml.utils.messages import MessageCode
+
+
+class CompileServerTest(unittest.TestCase):
+    """
+    Tests that requests can be forwarded to a compile server, and that each request is processed in a context of its own.
+    """
+
+    def _start_server(self, socket_path):
+        server = subprocess.Popen([sys.executable, "-c", "import sys; from pynestml.frontend.pynestml_frontend import main; sys.exit(main())",
+                                   "--serve", socket_path],
+                                  cwd=os.path.join(os.path.dirname(__file__), os.pardir))
+        for _ in range(600):
+            if os.path.exists(socket_path) or server.poll() is not None:
+                break
+            time.sleep(.1)
+
+        assert os.path.exists(socket_path)
+
+        return server
+
+    def test_requests(self):
+        input_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", "iaf_psc_exp.nestml"))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            socket_path = os.path.join(tmp_dir, "nestml.sock")
+            server = self._start_server(socket_path)
+            try:
+                for i in range(2):
+                    target_path = os.path.join(tmp_dir, "target_" + str(i))
+                    params = ["nestml", "--client", socket_path, "--input_path", input_path, "--target_platform", "autodoc",
+                              "--target_path", target_path, "--logging_level", "INFO"]
+                    with patch.object(sys, "argv", params):
+                        assert main() == 0
+
+                    assert os.path.exists(os.path.join(target_path, "iaf_psc_exp.rst"))
+
+                # the log of the response only contains the messages of that request
+                response = send_request(socket_path, {"args": params[3:], "cwd": tmp_dir})
+                assert response["exit_code"] == 0
+                assert MessageCode.CODE_SUCCESSFULLY_GENERATED.name in [entry.get("code") for entry in response["log"]]
+                assert set([entry["filename"] for entry in response["log"] if entry["nodeName"] != "GLOBAL"]) == {"iaf_psc_exp.nestml"}
+
+                # relative paths are resolved in the working directory of the client
+                response = send_request(socket_path, {"args": ["--input_path", "iaf_psc_exp.nestml", "--target_platform", "autodoc",
+                                                               "--target_path", os.path.join(tmp_dir, "target_relative")],
+                                                      "cwd": os.path.dirname(input_path)})
+                assert response["exit_code"] == 0
+
+                response = send_request(socket_path, {"args": ["--input_path", os.path.join(tmp_dir, "nonexistent.nestml")],
+                                                      "cwd": tmp_dir})
+                assert response["exit_code"] != 0
+            finally:
+                send_request(socket_path, {"shutdown": True})
+                server.wait(timeout=60)
+
+            assert server.returncode == 0
+            assert not os.path.exists(socket_path)
+
+    def test_server_not_available(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.object(sys, "argv", ["nestml", "--client", os.path.join(tmp_dir, "nestml.sock"), "--input_path", "x.nestml"]):
+                assert main() == 1
+
+
+if __name__ == "__main__":
+    unittest.main()
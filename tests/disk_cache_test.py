@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+#
+# disk_cache_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from pynestml.utils.disk_cache import DiskCache
+
+
+class DiskCacheTest(unittest.TestCase):
+    """
+    Tests storage, retrieval and least-recently-used eviction of disk cache entries.
+    """
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp(prefix='nestml-cache-')
+
+    def test_put_get(self):
+        cache = DiskCache(self.cache_dir)
+        key = DiskCache.compute_key('foo', b'bar')
+        assert cache.get(key) is None
+
+        cache.put(key, b'data')
+        assert cache.get(key) == b'data'
+
+        cache.put_object(key, {'a': [1, 2, 3]})
+        assert cache.get_object(key) == {'a': [1, 2, 3]}
+
+        cache.remove(key)
+        assert cache.get(key) is None
+
+    def test_compute_key(self):
+        assert DiskCache.compute_key('ab', 'c') == DiskCache.compute_key('ab', 'c')
+        assert DiskCache.compute_key('ab', 'c') != DiskCache.compute_key('a', 'bc')
+
+    def test_lru_eviction(self):
+        cache = DiskCache(self.cache_dir, max_size=250)
+        for i, key in enumerate(['a', 'b']):
+            cache.put(key, 100 * b'x')
+            os.utime(os.path.join(self.cache_dir, key + '.cache'), ns=(i * 10**9, i * 10**9))
+
+        cache.get('a')      # 'b' is now the least recently used entry
+        cache.put('c', 100 * b'x')
+
+        assert cache.get('a') is not None
+        assert cache.get('b') is None
+        assert cache.get('c') is not None
+        assert cache.get_size() <= 250
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -25,7 +25,9 @@ import unittest
 
 from antlr4 import *
 
+from pynestml.codegeneration.printers.nestml_printer import NESTMLPrinter
 from pynestml.meta_model.ast_nestml_compilation_unit import ASTNestMLCompilationUnit
+from pynestml.utils.arithmetic_expression_parser import ArithmeticExpressionParser
 from pynestml.utils.ast_source_location import ASTSourceLocation
 from pynestml.generated.PyNestMLLexer import PyNestMLLexer
 from pynestml.generated.PyNestMLParser import PyNestMLParser
@@ -35,6 +37,7 @@ from pynestml.symbols.predefined_types import PredefinedTypes
 from pynestml.symbols.predefined_units import PredefinedUnits
 from pynestml.symbols.predefined_variables import PredefinedVariables
 from pynestml.utils.logger import LoggingLevel, Logger
+from pynestml.utils.model_parser import ModelParser, parse_with_fallback, tokenize
 from pynestml.visitors.ast_builder_visitor import ASTBuilderVisitor
 
 # setups the infrastructure
@@ -74,6 +77,60 @@ class ExpressionParsingTest(unittest.TestCase):
         ast = ast_builder_visitor.visit(compilation_unit)
         self.assertTrue(isinstance(ast, ASTNestMLCompilationUnit))
 
+    def test_memoized_parsing(self):
+        """
+        Test that repeatedly parsed expressions and assignments give the same trees as parsing them afresh, and that each call returns a tree of its own.
+        """
+        for rule_name, string in [('expression', '__P__V_m__V_m * V_m + __P__V_m__I_syn * I_syn'),
+                                  ('expression', 'V_m > V_th ? 1 : exp(-(t - t_lastspike) / (tau_m * ms))'),
+                                  ('expression', 'not (a or b) and -x**2 != 3.5E-3 mV'),
+                                  ('assignment', 'I_syn_exc += exc_spikes * (pA * s) / s'),
+                                  ('assignment', 'g_ex\' = g_ex\' * exp(-__h / tau_syn)')]:
+            builder, parser = tokenize(string)
+            expected = builder.visit(parse_with_fallback(parser, getattr(parser, rule_name)))
+
+            parse = getattr(ModelParser, 'parse_' + rule_name)
+            trees = [parse(string) for _ in range(3)]
+            for tree in trees:
+                assert tree.equals(expected)
+                assert NESTMLPrinter().print_node(tree) == NESTMLPrinter().print_node(expected)
+
+            assert trees[1] is not trees[2]
+            if rule_name == 'assignment':
+                trees[1].get_variable().set_name('modified')
+            else:
+                trees[1].is_encapsulated = not trees[1].is_encapsulated
+            assert parse(string).equals(expected)
+
+    def test_arithmetic_expression_parser(self):
+        """
+        Test that the hand-written parser gives the same trees as the ANTLR parser for arithmetic expressions, and that it rejects all other expressions.
+        """
+        arithmetic_expressions = ['__P__I_kernel_exc__X__exc_spikes__I_kernel_exc__X__exc_spikes * I_kernel_exc__X__exc_spikes',
+                                  '1.0*exp(-__h/tau_syn_exc)',
+                                  '-1.0*tau_m*tau_syn_exc*(-exp(__h/tau_m) + exp(__h/tau_syn_exc))*exp(-__h/tau_syn_exc - __h/tau_m)/(C_m*(tau_m - tau_syn_exc))',
+                                  'a - b + c - d', 'a / b * c / d', 'a ** b ** c', '-a ** b', 'a ** -b', '2 ** -1 * x', '-a * b', '- - a', '+a - +b',
+                                  '(a + b) * (c - (d))', 'f()', 'f(a, b + c, -d)', 'pow(V_m, 2)', '1.e5 + .5 + 1E-3 + 1.5e+3 + 01 + 0', 'e ** $a_b1']
+        other_expressions = ['10 ms', '1e', 'a < b', 'V_m\'', 'a % b', 'inf', 'true', 'a ? b : c', 'x[1]', 'not a', 'a b', 'a +', '(a', 'f(a,)',
+                             '', 'a += b', 'a ^ b']
+
+        for string in arithmetic_expressions + other_expressions:
+            tree = ArithmeticExpressionParser.parse(string)
+            assert (tree is not None) == (string in arithmetic_expressions), string
+            if tree is None:
+                continue
+
+            builder, parser = tokenize(string)
+            expected = builder.visit(parse_with_fallback(parser, parser.expression))
+            assert parser.getNumberOfSyntaxErrors() == 0
+            assert tree.equals(expected), string
+            assert NESTMLPrinter().print_node(tree) == NESTMLPrinter().print_node(expected), string
+            assert str(tree) == str(expected), string
+            assert tree.get_source_position().is_added_source_position()
+
+        # parsing falls back to the ANTLR parser for other expressions
+        assert ModelParser.parse_expression('10 ms').get_numeric_literal() == 10
+
 
 if __name__ == '__main__':
     unittest.main()
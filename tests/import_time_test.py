@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#
+# import_time_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+
+HEAVY_MODULES = ["astropy", "jinja2", "odetoolbox", "sympy", "pynestml.generated.PyNestMLParser"]
+
+
+class ImportTimeTest(unittest.TestCase):
+    """
+    Tests that starting the command line interface does not import heavy dependencies (the parser, sympy, astropy, jinja2 and ODE-toolbox), and that ODE-toolbox is only imported for targets that need it. Each test runs in a fresh interpreter, and reports the time taken to import the frontend.
+    """
+
+    def _run(self, script):
+        script = textwrap.dedent("""
+            import json
+            import sys
+            import time
+
+            start_time = time.perf_counter()
+            import pynestml.frontend.pynestml_frontend as pynestml_frontend
+            import_time = time.perf_counter() - start_time
+        """) + textwrap.dedent(script) + textwrap.dedent("""
+            print(json.dumps({"import_time": import_time,
+                              "imported_modules": [m for m in %s if m in sys.modules]}))
+        """ % repr(HEAVY_MODULES))
+
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join([os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir))]
+                                            + ([env["PYTHONPATH"]] if "PYTHONPATH" in env.keys() else []))
+        output = subprocess.check_output([sys.executable, "-c", script], env=env, stderr=subprocess.DEVNULL)
+        result = json.loads(output.decode().strip().split("\n")[-1])
+        print("Frontend import time: %.3f s" % result["import_time"])
+
+        return result
+
+    def test_import_frontend(self):
+        result = self._run("")
+        assert result["imported_modules"] == []
+
+    def test_help(self):
+        result = self._run("""
+            sys.argv = ["nestml", "--help"]
+            try:
+                pynestml_frontend.main()
+            except SystemExit:
+                pass
+        """)
+        assert result["imported_modules"] == []
+
+    def test_autodoc_target_does_not_import_odetoolbox(self):
+        input_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", "iaf_psc_exp.nestml"))
+        with tempfile.TemporaryDirectory() as target_path:
+            result = self._run("""
+                pynestml_frontend.generate_target(%s, target_platform="autodoc", target_path=%s)
+            """ % (repr(input_path), repr(target_path)))
+        assert "sympy" in result["imported_modules"]
+        assert "odetoolbox" not in result["imported_modules"]
+
+
+if __name__ == "__main__":
+    unittest.main()
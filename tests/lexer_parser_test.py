@@ -21,13 +21,18 @@
 
 import glob
 import os
+import tempfile
 import unittest
 
 from antlr4 import *
 from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
 
+from pynestml.codegeneration.printers.nestml_printer import NESTMLPrinter
+from pynestml.frontend.pynestml_frontend import init_predefined
 from pynestml.generated.PyNestMLLexer import PyNestMLLexer
 from pynestml.generated.PyNestMLParser import PyNestMLParser
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
 
 
 class LexerParserTest(unittest.TestCase):
@@ -60,6 +65,45 @@ class LexerParserTest(unittest.TestCase):
             compilation_unit = parser.nestMLCompilationUnit()
             assert compilation_unit is not None
 
+    def _build_ast(self, input_file, two_stage_parsing):
+        ModelParser.two_stage_parsing = two_stage_parsing
+        try:
+            return ModelParser._build_ast(input_file)
+        finally:
+            ModelParser.two_stage_parsing = True
+
+    def test_two_stage_parsing(self):
+        """
+        Test that parsing in the SLL prediction mode first, with a fallback to the full LL mode, gives the same trees as parsing in the full LL mode only, and that syntax errors are still reported.
+        """
+        init_predefined()
+        Logger.init_logger(LoggingLevel.NO)
+        model_files = glob.glob(os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, 'models', 'neurons', '*.nestml')))
+        assert len(model_files) > 0
+
+        for filename in model_files:
+            trees = [NESTMLPrinter().print_node(self._build_ast(FileStream(filename), two_stage_parsing)) for two_stage_parsing in [False, True]]
+            assert trees[0] == trees[1]
+
+        for expression in ['V_m * exp(-t / tau_m) + I_e', '(a + b', 'a ** -2 > 0 and not b']:
+            trees = []
+            for two_stage_parsing in [False, True]:
+                ModelParser.two_stage_parsing = two_stage_parsing
+                try:
+                    trees.append(NESTMLPrinter().print_node(ModelParser.parse_expression(expression)))
+                finally:
+                    ModelParser.two_stage_parsing = True
+            assert trees[0] == trees[1]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'syntax_error.nestml')
+            with open(path, 'w') as f:
+                f.write('neuron syntax_error:\n    state:\n        V_m mV = * 2\n')
+            for two_stage_parsing in [False, True]:
+                Logger.init_logger(LoggingLevel.NO)
+                assert self._build_ast(FileStream(path), two_stage_parsing) is None
+                assert Logger.get_message_count(None, LoggingLevel.ERROR) == 1
+
 
 if __name__ == '__main__':
     unittest.main()
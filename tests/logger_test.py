@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+#
+# logger_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import os
+import tempfile
+import unittest
+
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.symbol_table.symbol_table import SymbolTable
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.json_lines_log_writer import JSONLinesLogWriter
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.messages import MessageCode
+from pynestml.utils.model_parser import ModelParser
+
+
+class LoggerTest(unittest.TestCase):
+    """
+    Tests that the index of the log gives the same results as scanning the whole log, that in bounded mode, only the number of DEBUG and INFO messages is kept, that messages which are neither printed nor stored are not constructed, and that the messages streamed to a JSON lines file are the same as those in the JSON format of the log.
+    """
+
+    model_file_names = ["CoCoUnitNumeratorNotOne.nestml", "CoCoValueAssignedToInputPort.nestml", "CoCoVariableRedeclared.nestml"]
+
+    def _parse_models(self, bounded):
+        init_predefined()
+        SymbolTable.initialize_symbol_table(ASTSourceLocation(start_line=0, start_column=0, end_line=0, end_column=0))
+        Logger.init_logger(LoggingLevel.NO, bounded=bounded)
+        Logger.set_current_node(None)
+        models = []
+        for model_file_name in self.model_file_names:
+            compilation_unit = ModelParser.parse_model(os.path.join(os.path.dirname(__file__), "invalid", model_file_name))
+            models.extend(compilation_unit.get_neuron_list())
+
+        return models
+
+    def test_index(self):
+        models = self._parse_models(bounded=False)
+        for model in models + [None]:
+            for level in LoggingLevel:
+                # scan the whole log
+                messages = [(model, log_level, message) for (artifact_name, node, log_level, code, error_position, message) in Logger.get_log().values()
+                            if log_level == level and (model is None or artifact_name == model.get_artifact_name())]
+                if model is not None:
+                    assert Logger.get_all_messages_of_level_and_or_node(model, level) == messages
+                assert Logger.get_message_count(model, level) == len(messages)
+
+        for model in models:
+            assert Logger.has_errors(model)
+
+        # restoring the log rebuilds the index
+        log = dict(Logger.get_log())
+        Logger.set_log({}, Logger.curr_message)
+        assert not Logger.has_errors(models[0])
+        Logger.set_log(log, Logger.curr_message)
+        assert Logger.has_errors(models[0])
+
+    def test_bounded(self):
+        models = self._parse_models(bounded=False)
+        message_counts = dict(Logger.get_message_counts())
+        log_json = json.loads(Logger.get_json_format())
+
+        models_bounded = self._parse_models(bounded=True)
+        assert Logger.get_message_counts() == message_counts
+        assert all([log_level in [LoggingLevel.WARNING, LoggingLevel.ERROR] for (_, _, log_level, _, _, _) in Logger.get_log().values()])
+        assert json.loads(Logger.get_json_format()) == [entry for entry in log_json if entry["severity"] in ["WARNING", "ERROR"]]
+        for model, model_bounded in zip(models, models_bounded):
+            assert Logger.has_errors(model_bounded)
+
+        # counts are merged together with the entries
+        entries = list(Logger.get_log().values())
+        Logger.init_logger(LoggingLevel.NO, bounded=True)
+        Logger.merge_log(entries, message_counts)
+        assert Logger.get_message_counts() == message_counts
+
+    def test_deferred(self):
+        model = self._parse_models(bounded=False)[0]
+        Logger.set_current_node(model)
+        constructed = []
+
+        def get_message():
+            constructed.append(True)
+            return MessageCode.START_PROCESSING_FILE, "message"
+
+        for logging_level, store_suppressed, expect_constructed in [(LoggingLevel.ERROR, False, False),
+                                                                    (LoggingLevel.ERROR, True, True),
+                                                                    (LoggingLevel.INFO, False, True)]:
+            constructed.clear()
+            Logger.init_logger(logging_level, store_suppressed=store_suppressed)
+            Logger.no_print = True
+            Logger.log_deferred_message(get_message, log_level=LoggingLevel.INFO)
+            Logger.no_print = False
+            assert bool(constructed) == expect_constructed
+            assert len(Logger.get_log()) == int(expect_constructed)
+            assert Logger.get_message_count(model, LoggingLevel.INFO) == 1
+
+    def test_log_writer(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "log.jsonl")
+            Logger.init_logger(LoggingLevel.NO)
+            Logger.set_log_writer(JSONLinesLogWriter(path, batch_size=2))
+            models = self._parse_models(bounded=False)
+            Logger.log_message(node=models[0], message="message \"in quotes\"", log_level=LoggingLevel.ERROR)
+            log_json = json.loads(Logger.get_json_format())
+
+            # messages are written in batches while they are logged
+            with open(path) as f:
+                assert len(f.readlines()) == len(log_json) - len(log_json) % 2
+
+            Logger.log_writer.close()
+            Logger.set_log_writer(None)
+            with open(path) as f:
+                assert [json.loads(line) for line in f] == log_json
+
+            # messages which are already in the log are written when the writer is set
+            Logger.set_log_writer(JSONLinesLogWriter(path))
+            Logger.log_writer.close()
+            Logger.set_log_writer(None)
+            with open(path) as f:
+                assert [json.loads(line) for line in f] == log_json
+
+if __name__ == "__main__":
+    unittest.main()
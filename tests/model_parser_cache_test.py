@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#
+# model_parser_cache_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from pynestml.codegeneration.printers.nestml_printer import NESTMLPrinter
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.toolchain_context import ToolchainContext
+
+
+class ModelParserCacheTest(unittest.TestCase):
+    """
+    Tests that abstract syntax trees loaded from the cache give the same models, symbol tables and log messages as freshly parsed ones.
+    """
+
+    model_paths = [os.path.join("models", "neurons", "iaf_psc_exp.nestml"),
+                   os.path.join("models", "synapses", "stdp_synapse.nestml"),
+                   os.path.join("tests", "invalid", "CoCoVariableRedeclared.nestml"),
+                   os.path.join("tests", "invalid", "CoCoMultipleNeuronsWithEqualName.nestml")]
+
+    def _parse_models(self, cache_dir):
+        results = []
+        with ToolchainContext().activate():
+            FrontendConfiguration.cache_dir = cache_dir
+            init_predefined()
+            Logger.init_logger(LoggingLevel.NO)
+            for model_path in self.model_paths:
+                Logger.set_log({}, 0)
+                compilation_unit = ModelParser.parse_model(os.path.join(os.path.dirname(__file__), os.pardir, model_path))
+                models = compilation_unit.get_neuron_list() + compilation_unit.get_synapse_list()
+                symbols = [sorted([symbol.get_symbol_name() for symbol in model.get_scope().get_symbols_in_complete_scope()]) for model in models]
+                messages = [(log_level, code, message) for (_, _, log_level, code, _, message) in Logger.get_log().values()]
+                results.append((NESTMLPrinter().print_node(compilation_unit), symbols, messages))
+
+        return results
+
+    def test_cached_parse(self):
+        expected_results = self._parse_models(None)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # first run: parse and store the trees
+            assert self._parse_models(cache_dir) == expected_results
+            assert len(os.listdir(cache_dir)) >= len(self.model_paths)
+
+            # second run: load the trees without parsing
+            with mock.patch.object(ModelParser, "_build_ast", side_effect=AssertionError("parsed instead of loaded from cache")):
+                assert self._parse_models(cache_dir) == expected_results
+
+
+if __name__ == "__main__":
+    unittest.main()
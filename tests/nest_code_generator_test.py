@@ -21,6 +21,8 @@
 
 import json
 import os
+import shutil
+import tempfile
 import unittest
 import json
 
@@ -34,6 +36,7 @@ from pynestml.symbols.predefined_types import PredefinedTypes
 from pynestml.symbols.predefined_units import PredefinedUnits
 from pynestml.symbols.predefined_variables import PredefinedVariables
 from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.messages import MessageCode
 from pynestml.utils.model_parser import ModelParser
 
 
@@ -148,6 +151,93 @@ class CodeGeneratorTest(unittest.TestCase):
         nestCodeGenerator = NESTCodeGenerator(codegen_opts)
         nestCodeGenerator.generate_code(compilation_unit.get_neuron_list())
 
+    def test_iaf_psc_exp_with_ode_cache(self):
+        input_path = str(os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join(
+            os.pardir, 'models', 'neurons', 'iaf_psc_exp.nestml'))))
+        ode_cache_dir = tempfile.mkdtemp(prefix='nestml-ode-cache-')
+
+        params = list()
+        params.append('--input_path')
+        params.append(input_path)
+        params.append('--logging_level')
+        params.append('INFO')
+        params.append('--target_path')
+        params.append(self.target_path)
+        params.append('--ode_cache_dir')
+        params.append(ode_cache_dir)
+        params.append('--dev')
+
+        generated_code = []
+        for cache_hit in [False, True]:
+            FrontendConfiguration.parse_config(params)
+            compilation_unit = ModelParser.parse_model(input_path)
+            nestCodeGenerator = NESTCodeGenerator()
+            nestCodeGenerator.generate_code(compilation_unit.get_neuron_list())
+
+            codes = [code for (_, _, _, code, _, _) in Logger.get_log().values()]
+            assert (MessageCode.ODE_TOOLBOX_RESULT_FROM_CACHE in codes) == cache_hit
+            with open(os.path.join(self.target_path, 'iaf_psc_exp.h')) as f:
+                generated_code.append([line for line in f.readlines() if "Generated from NESTML" not in line])
+
+        assert generated_code[0] == generated_code[1]
+        shutil.rmtree(ode_cache_dir)
+
+    def test_iaf_psc_exp_keep_ode_toolbox_results(self):
+        input_path = str(os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join(
+            os.pardir, 'models', 'neurons', 'iaf_psc_exp.nestml'))))
+
+        params = list()
+        params.append('--input_path')
+        params.append(input_path)
+        params.append('--logging_level')
+        params.append('INFO')
+        params.append('--target_path')
+        params.append(self.target_path)
+        params.append('--dev')
+
+        generated_code = []
+        NESTCodeGenerator._ode_toolbox_result_cache.clear()
+        NESTCodeGenerator.keep_ode_toolbox_results = True
+        try:
+            for cache_hit in [False, True]:
+                FrontendConfiguration.parse_config(params)
+                compilation_unit = ModelParser.parse_model(input_path)
+                nestCodeGenerator = NESTCodeGenerator()
+                nestCodeGenerator.generate_code(compilation_unit.get_neuron_list())
+
+                codes = [code for (_, _, _, code, _, _) in Logger.get_log().values()]
+                assert (MessageCode.ODE_TOOLBOX_RESULT_FROM_CACHE in codes) == cache_hit
+                with open(os.path.join(self.target_path, 'iaf_psc_exp.h')) as f:
+                    generated_code.append([line for line in f.readlines() if "Generated from NESTML" not in line])
+        finally:
+            NESTCodeGenerator.keep_ode_toolbox_results = False
+            NESTCodeGenerator._ode_toolbox_result_cache.clear()
+
+        assert generated_code[0] == generated_code[1]
+
+    def test_incremental_symbol_table_update(self):
+        input_path = str(os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join(
+            os.pardir, 'models', 'neurons', 'aeif_cond_alpha.nestml'))))
+
+        params = list()
+        params.append('--input_path')
+        params.append(input_path)
+        params.append('--logging_level')
+        params.append('INFO')
+        params.append('--target_path')
+        params.append(self.target_path)
+        params.append('--dev')
+        FrontendConfiguration.parse_config(params)
+
+        compilation_unit = ModelParser.parse_model(input_path)
+
+        # compare the symbol table after each incremental update with a full rebuild
+        nestCodeGenerator = NESTCodeGenerator({"check_incremental_symbol_table_update": True})
+        nestCodeGenerator.generate_code(compilation_unit.get_neuron_list())
+
+        codes = [code for (_, _, _, code, _, _) in Logger.get_log().values()]
+        assert MessageCode.INCREMENTAL_SYMBOL_TABLE_UPDATE_MISMATCH not in codes
+
     def tearDown(self):
         import shutil
         shutil.rmtree(self.target_path)
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+#
+# ode_toolbox_utils_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from pynestml.utils.ode_toolbox_utils import ODEToolboxUtils
+
+
+class ODEToolboxUtilsTest(unittest.TestCase):
+    """
+    Tests that the single-pass ODE-toolbox analysis gives the same result as invoking ODE-toolbox twice.
+    """
+
+    def _test_analysis(self, indict, expected_solvers):
+        kwargs = {"disable_stiffness_check": True,
+                  "preserve_expressions": False,
+                  "simplify_expression": "sympy.logcombine(sympy.powsimp(sympy.expand(expr)))"}
+        solver_result = ODEToolboxUtils.analysis(indict, **kwargs)
+        assert [solver["solver"] for solver in solver_result] == expected_solvers
+        assert solver_result == ODEToolboxUtils.analysis(indict, single_pass=False, **kwargs)
+
+        return solver_result
+
+    def test_analytic_and_numeric(self):
+        indict = {"dynamics": [{"expression": "I_syn' = -I_syn / tau_syn",
+                                "initial_values": {"I_syn": "0"}},
+                               {"expression": "V_m' = -V_m / tau_m + exp(V_m / delta) + I_syn / C_m",
+                                "initial_values": {"V_m": "-70"}}],
+                   "parameters": {"tau_syn": "2", "tau_m": "10", "C_m": "250", "delta": "2"},
+                   "options": {"output_timestep_symbol": "__h"}}
+        solver_result = self._test_analysis(indict, ["analytical", "numeric"])
+
+        # the numeric solver includes all state variables
+        assert sorted(solver_result[1]["state_variables"]) == ["I_syn", "V_m"]
+
+    def test_analytic_only(self):
+        indict = {"dynamics": [{"expression": "V_m' = -V_m / tau_m",
+                                "initial_values": {"V_m": "-70"}}],
+                   "parameters": {"tau_m": "10"},
+                   "options": {"output_timestep_symbol": "__h"}}
+        self._test_analysis(indict, ["analytical"])
+
+    def test_numeric_only(self):
+        indict = {"dynamics": [{"expression": "V_m' = V_m**2 / tau_m",
+                                "initial_values": {"V_m": "-70"}}],
+                   "parameters": {"tau_m": "10"},
+                   "options": {"output_timestep_symbol": "__h"}}
+        self._test_analysis(indict, ["numeric"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+#
+# predefined_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from astropy import units as u
+
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.symbols.predefined_functions import PredefinedFunctions
+from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.symbols.predefined_units import PredefinedUnits
+from pynestml.symbols.predefined_variables import PredefinedVariables
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.unit_type import UnitType
+
+
+class PredefinedTest(unittest.TestCase):
+    """
+    Tests that the predefined units, types, functions and variables are correctly restored from a snapshot, and that units can be registered from a precomputed table.
+    """
+
+    def setUp(self):
+        Logger.init_logger(LoggingLevel.INFO)
+
+    def tearDown(self):
+        FrontendConfiguration.cache_dir = None
+
+    def test_register_units_from_table(self):
+        PredefinedUnits.register_units()
+        name2unit = dict(PredefinedUnits.get_units())
+
+        PredefinedUnits.register_units(unit_table=PredefinedUnits.get_unit_table())
+        assert name2unit.keys() == PredefinedUnits.get_units().keys()
+        for name, unit in name2unit.items():
+            assert PredefinedUnits.get_unit(name).get_unit() is unit.get_unit()
+
+    def test_restore(self):
+        init_predefined()
+        init_predefined()
+        assert all([cls.has_snapshot() for cls in [PredefinedUnits, PredefinedTypes, PredefinedFunctions, PredefinedVariables]])
+        units = dict(PredefinedUnits.get_units())
+        types = dict(PredefinedTypes.get_types())
+        functions = dict(PredefinedFunctions.get_function_symbols())
+        variables = dict(PredefinedVariables.get_variables())
+
+        # register a new unit during a run; it should not be present after restoring
+        PredefinedTypes.register_unit(u.mV * u.nS**3)
+        assert len(PredefinedUnits.get_units()) == len(units) + 1
+        assert len(PredefinedTypes.get_types()) == len(types) + 1
+
+        init_predefined()
+        assert PredefinedUnits.get_units() == units
+        assert dict(PredefinedTypes.get_types()) == types
+        assert PredefinedFunctions.get_function_symbols() == functions
+        assert PredefinedVariables.get_variables() == variables
+
+        # restored types still return copies
+        assert PredefinedTypes.get_type("mV") is not types["mV"]
+        assert PredefinedTypes.get_type("mV").equals(types["mV"])
+
+    def test_unit_table_in_cache(self):
+        PredefinedUnits.register_units()
+        name2unit = dict(PredefinedUnits.get_units())
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            FrontendConfiguration.cache_dir = cache_dir
+            PredefinedUnits._snapshot = None
+            init_predefined()
+            assert len(os.listdir(cache_dir)) == 1
+
+            # the second time around, the table is read from the cache
+            PredefinedUnits._snapshot = None
+            with patch.object(PredefinedUnits, "get_unit_table", side_effect=AssertionError):
+                init_predefined()
+            assert PredefinedUnits.get_units().keys() == name2unit.keys()
+
+        assert isinstance(PredefinedUnits.get_unit("mV"), UnitType)
+        assert PredefinedUnits.get_unit("mV").get_unit() is u.mV
+
+
+if __name__ == "__main__":
+    unittest.main()
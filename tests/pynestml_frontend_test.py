@@ -19,14 +19,18 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+import json
 import os
 import pytest
+import shutil
 import sys
 import tempfile
 import unittest
 
 from pynestml.frontend.pynestml_frontend import main
 from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.utils.logger import Logger
+from pynestml.utils.messages import MessageCode
 
 try:
     # python 3.4+ should use builtin unittest.mock not mock package
@@ -82,6 +86,142 @@ class PyNestMLFrontendTest(unittest.TestCase):
             exit_code = main()
         self.assertTrue(exit_code == 0)
 
+    def test_codegeneration_autodoc_parallel(self):
+        paths = [str(os.path.realpath(os.path.join(os.path.dirname(__file__),
+                                                   os.path.join('..', 'models', 'neurons', fn))))
+                 for fn in ['iaf_psc_exp.nestml', 'izhikevich.nestml']]
+        params = list()
+        params.append('nestml')
+        params.append('--input_path')
+        params.extend(paths)
+        params.append('--target_platform')
+        params.append('autodoc')
+        params.append('--logging_level')
+        params.append('INFO')
+        params.append('--target_path')
+        params.append('target_autodoc_parallel')
+        params.append('--jobs')
+        params.append('2')
+        params.append('--dev')
+
+        exit_code = None
+        with patch.object(sys, 'argv', params):
+            exit_code = main()
+        self.assertTrue(exit_code == 0)
+        for model_name in ['iaf_psc_exp', 'izhikevich']:
+            assert os.path.isfile(os.path.join('target_autodoc_parallel', model_name + '.rst'))
+
+    def test_codegeneration_autodoc_store_log(self):
+        paths = [str(os.path.realpath(os.path.join(os.path.dirname(__file__),
+                                                   os.path.join('..', 'models', 'neurons', fn))))
+                 for fn in ['iaf_psc_exp.nestml', 'izhikevich.nestml']]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            params = list()
+            params.append('nestml')
+            params.append('--input_path')
+            params.extend(paths)
+            params.append('--target_platform')
+            params.append('autodoc')
+            params.append('--target_path')
+            params.append(os.path.join(tmp_dir, 'target'))
+            params.append('--jobs')
+            params.append('2')
+            params.append('--store_log')
+            params.append('--dev')
+
+            exit_code = None
+            with patch.object(sys, 'argv', params):
+                exit_code = main()
+            self.assertTrue(exit_code == 0)
+
+            # the messages are streamed to log.jsonl as they are logged; log.txt contains the same messages
+            with open(os.path.join(tmp_dir, 'report', 'log.jsonl')) as f:
+                streamed_log = [json.loads(line) for line in f]
+            with open(os.path.join(tmp_dir, 'report', 'log.txt')) as f:
+                log = json.load(f)
+            assert streamed_log == log
+            assert set([entry['filename'] for entry in log]) == set(['iaf_psc_exp.nestml', 'izhikevich.nestml'])
+
+    def test_codegeneration_autodoc_build_cache(self):
+        path = str(os.path.realpath(os.path.join(os.path.dirname(__file__),
+                                                 os.path.join('..', 'models', 'neurons', 'iaf_psc_exp.nestml'))))
+        cache_dir = tempfile.mkdtemp(prefix='nestml-cache-')
+        params = list()
+        params.append('nestml')
+        params.append('--input_path')
+        params.append(path)
+        params.append('--target_platform')
+        params.append('autodoc')
+        params.append('--target_path')
+        params.append('target_autodoc_cache')
+        params.append('--cache_dir')
+        params.append(cache_dir)
+        params.append('--logging_level')
+        params.append('INFO')      # cache hits and misses are INFO messages, which are not stored at the default level
+        params.append('--dev')
+
+        for cache_hit in [False, True]:
+            if os.path.isdir('target_autodoc_cache'):
+                shutil.rmtree('target_autodoc_cache')
+
+            exit_code = None
+            with patch.object(sys, 'argv', params):
+                exit_code = main()
+            self.assertTrue(exit_code == 0)
+            assert os.path.isfile(os.path.join('target_autodoc_cache', 'iaf_psc_exp.rst'))
+            assert os.path.isfile(os.path.join('target_autodoc_cache', 'index.rst'))
+
+            codes = [code for (_, _, _, code, _, _) in Logger.get_log().values()]
+            assert (MessageCode.BUILD_CACHE_HIT in codes) == cache_hit
+            assert (MessageCode.BUILD_CACHE_MISS in codes) != cache_hit
+
+        shutil.rmtree(cache_dir)
+
+    def test_codegeneration_autodoc_profile(self):
+        path = str(os.path.realpath(os.path.join(os.path.dirname(__file__),
+                                                 os.path.join('..', 'models', 'neurons', 'iaf_psc_exp.nestml'))))
+        fd, profile_path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        params = list()
+        params.append('nestml')
+        params.append('--input_path')
+        params.append(path)
+        params.append('--target_platform')
+        params.append('autodoc')
+        params.append('--target_path')
+        params.append('target_autodoc_profile')
+        params.append('--profile')
+        params.append(profile_path)
+        params.append('--dev')
+
+        exit_code = None
+        with patch.object(sys, 'argv', params):
+            exit_code = main()
+        self.assertTrue(exit_code == 0)
+
+        with open(profile_path) as f:
+            profile = json.load(f)
+        os.remove(profile_path)
+
+        phases = [(record['phase'], record['model']) for record in profile['phases']]
+        assert ('parse', None) in phases
+        assert ('symbol_table', 'iaf_psc_exp') in phases
+        assert ('cocos', 'iaf_psc_exp') in phases
+        assert ('render', 'iaf_psc_exp') in phases
+        assert all([record['wall_time'] >= 0. for record in profile['phases']])
+        assert profile['summary']['parse/symbol_table']['count'] == 1
+
+    def test_jobs_parsing_wrong_number_of_jobs_specified(self):
+        with pytest.raises(Exception):
+            path = str(os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join('..', 'models'))))
+
+            params = list()
+            params.append('--input_path')
+            params.append(path)
+            params.append('--jobs')
+            params.append('0')
+            FrontendConfiguration.parse_config(params)
+
     def test_module_name_parsing_right_module_name_specified(self):
         path = str(os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join('..', 'models'))))
 
@@ -22,13 +22,14 @@ import os
 import unittest
 
 from pynestml.utils.ast_source_location import ASTSourceLocation
-from pynestml.symbol_table.scope import ScopeType
+from pynestml.symbol_table.scope import Scope, ScopeType
 from pynestml.symbol_table.symbol_table import SymbolTable
 from pynestml.symbols.predefined_functions import PredefinedFunctions
 from pynestml.symbols.predefined_types import PredefinedTypes
 from pynestml.symbols.predefined_units import PredefinedUnits
 from pynestml.symbols.predefined_variables import PredefinedVariables
 from pynestml.symbols.symbol import SymbolKind
+from pynestml.symbols.variable_symbol import BlockType, VariableSymbol, VariableType
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.model_parser import ModelParser
 
@@ -66,6 +67,42 @@ class SymbolTableResolutionTest(unittest.TestCase):
         res7 = scope.resolve_to_all_scopes('test6', SymbolKind.VARIABLE)
         self.assertTrue(res7 is not None and res7.get_scope_type() == ScopeType.UPDATE)
 
+    def test_add_delete_update_symbol(self):
+        def make_symbol(name):
+            return VariableSymbol(name=name, block_type=BlockType.STATE, type_symbol=PredefinedTypes.get_real_type(),
+                                  variable_type=VariableType.VARIABLE)
+
+        scope = Scope(scope_type=ScopeType.GLOBAL)
+        sub_scope = Scope(scope_type=ScopeType.UPDATE, enclosing_scope=scope)
+        scope.add_scope(sub_scope)
+        symbol_a = make_symbol('a')
+        symbol_a_sub = make_symbol('a')
+        scope.add_symbol(symbol_a)
+        scope.add_symbol(symbol_a)   # adding the same symbol twice has no effect
+        sub_scope.add_symbol(symbol_a_sub)
+        self.assertEqual(scope.get_symbols_in_this_scope(), [symbol_a])
+        self.assertEqual(scope.get_scopes(), [sub_scope])
+        self.assertIs(scope.resolve_to_symbol('a', SymbolKind.VARIABLE), symbol_a)
+        self.assertIsNone(scope.resolve_to_symbol('a', SymbolKind.FUNCTION))
+        self.assertIs(sub_scope.resolve_to_symbol('a', SymbolKind.VARIABLE), symbol_a_sub)
+        self.assertEqual(scope.resolve_to_all_symbols('a', SymbolKind.VARIABLE), [symbol_a, symbol_a_sub])
+        self.assertEqual(scope.resolve_to_all_scopes('a', SymbolKind.VARIABLE), [scope, sub_scope])
+
+        # replace the symbol by a new one
+        symbol_a_new = make_symbol('a')
+        scope.update_variable_symbol(symbol_a_new)
+        self.assertIs(scope.resolve_to_symbol('a', SymbolKind.VARIABLE), symbol_a_new)
+        self.assertEqual(scope.declared_elements, [sub_scope, symbol_a_new])
+
+        # delete symbols and scopes
+        self.assertFalse(scope.delete_symbol(symbol_a))
+        self.assertTrue(scope.delete_symbol(symbol_a_new))
+        self.assertIs(sub_scope.resolve_to_symbol('a', SymbolKind.VARIABLE), symbol_a_sub)
+        self.assertIs(scope.resolve_to_all_symbols('a', SymbolKind.VARIABLE), symbol_a_sub)
+        self.assertTrue(scope.delete_scope(sub_scope))
+        self.assertIsNone(scope.resolve_to_all_symbols('a', SymbolKind.VARIABLE))
+        self.assertEqual(scope.declared_elements, [])
+
 
 if __name__ == '__main__':
     unittest.main()
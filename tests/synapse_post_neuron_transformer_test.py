@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#
+# synapse_post_neuron_transformer_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import unittest
+
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.transformers.synapse_post_neuron_transformer import SynapsePostNeuronTransformer
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.model_parser import ModelParser
+from pynestml.utils.toolchain_context import ToolchainContext
+
+
+class SynapsePostNeuronTransformerTest(unittest.TestCase):
+    """
+    Tests that the co-generated synapse shares the blocks that are not changed by the transformation with the original synapse, and that the original synapse is not changed.
+    """
+
+    def setUp(self):
+        self._context = ToolchainContext()
+        self._context_manager = self._context.activate()
+        self._context_manager.__enter__()
+        Logger.init_logger(LoggingLevel.ERROR)
+        FrontendConfiguration.suffix = ""
+        init_predefined()
+        Logger.set_current_node(None)
+
+    def tearDown(self):
+        self._context_manager.__exit__(None, None, None)
+
+    def test_copy_on_write(self):
+        models_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models"))
+        neuron = ModelParser.parse_model(os.path.join(models_path, "neurons", "iaf_psc_exp.nestml")).get_neuron_list()[0]
+        synapse = ModelParser.parse_model(os.path.join(models_path, "synapses", "stdp_synapse.nestml")).get_synapse_list()[0]
+        neuron_str = str(neuron)
+        synapse_blocks = list(synapse.get_body().get_body_elements())
+        synapse_block_strs = [str(block) for block in synapse_blocks]
+
+        transformer = SynapsePostNeuronTransformer({"neuron_synapse_pairs": [{"neuron": "iaf_psc_exp",
+                                                                              "synapse": "stdp",
+                                                                              "post_ports": ["post_spikes"]}]})
+        models = transformer.transform([neuron, synapse])
+        new_synapse = models[1]
+        new_neuron = models[2]
+        assert new_synapse.get_name() == "stdp__with_iaf_psc_exp"
+        assert new_neuron.get_name() == "iaf_psc_exp__with_stdp"
+
+        # the original models are not changed
+        assert str(neuron) == neuron_str
+        assert synapse.get_body().get_body_elements() == synapse_blocks
+        assert [str(block) for block in synapse_blocks] == synapse_block_strs
+
+        # the parameters are only copied to the neuron, but the kernels for the postsynaptic trace are moved
+        assert new_synapse.get_parameter_blocks() is synapse.get_parameter_blocks()
+        assert new_synapse.get_input_blocks() is synapse.get_input_blocks()
+        assert new_synapse.get_equations_blocks() is not synapse.get_equations_blocks()
+        assert len(new_synapse.get_equations_blocks().get_kernels()) < len(synapse.get_equations_blocks().get_kernels())
+        assert new_synapse.get_on_receive_block("post_spikes") is not synapse.get_on_receive_block("post_spikes")
+
+        # the neuron is copied completely
+        assert not any([block is neuron_block for block in new_neuron.get_body().get_body_elements()
+                        for neuron_block in neuron.get_body().get_body_elements()])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+#
+# toolchain_context_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import threading
+import unittest
+
+from pynestml.codegeneration.nest_code_generator import NESTCodeGenerator
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.frontend.pynestml_frontend import generate_target
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.toolchain_context import ToolchainContext
+
+
+class ToolchainContextTest(unittest.TestCase):
+    """
+    Tests that the state of the toolchain is kept separately for each context, so that several runs can be performed concurrently in one process.
+    """
+
+    model_file_names = ["iaf_psc_exp.nestml", "izhikevich.nestml", "hh_psc_alpha.nestml", "aeif_cond_exp.nestml"]
+
+    def test_state_per_context(self):
+        Logger.init_logger(LoggingLevel.ERROR)
+        FrontendConfiguration.module_name = "defaultmodule"
+        context = ToolchainContext()
+        with context.activate():
+            # a new context starts out with the initial values given in the class body
+            assert FrontendConfiguration.module_name is None
+            assert Logger.logging_level is None
+            FrontendConfiguration.module_name = "xyzzymodule"
+            Logger.init_logger(LoggingLevel.INFO)
+
+            with ToolchainContext().activate():
+                assert FrontendConfiguration.module_name is None
+
+            assert FrontendConfiguration.module_name == "xyzzymodule"
+
+        assert FrontendConfiguration.module_name == "defaultmodule"
+        assert Logger.logging_level == LoggingLevel.ERROR
+        with context.activate():
+            assert Logger.logging_level == LoggingLevel.INFO
+
+    def _generate(self, model_file_name, target_path, context):
+        input_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, "models", "neurons", model_file_name))
+        generate_target(input_path, target_platform="autodoc", target_path=target_path, logging_level="NO", store_log=True,
+                        context=context)
+
+    def _read_files(self, path):
+        files = {}
+        for fn in os.listdir(path):
+            with open(os.path.join(path, fn)) as f:
+                # the time of generation differs between runs
+                files[fn] = [line for line in f.readlines() if "Generated at" not in line]
+
+        return files
+
+    def test_concurrent_runs(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            expected_files = []
+            for i, model_file_name in enumerate(self.model_file_names):
+                target_path = os.path.join(tmp_dir, "sequential_" + str(i), "target")
+                self._generate(model_file_name, target_path, None)
+                expected_files.append(self._read_files(target_path))
+
+            contexts = [ToolchainContext() for _ in self.model_file_names]
+            exceptions = []
+
+            def run(i):
+                try:
+                    self._generate(self.model_file_names[i], os.path.join(tmp_dir, "concurrent_" + str(i), "target"), contexts[i])
+                except Exception as e:
+                    exceptions.append(e)
+
+            threads = [threading.Thread(target=run, args=(i,)) for i in range(len(self.model_file_names))]
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+
+            assert not exceptions
+            for i, (model_file_name, context) in enumerate(zip(self.model_file_names, contexts)):
+                assert self._read_files(os.path.join(tmp_dir, "concurrent_" + str(i), "target")) == expected_files[i]
+                with context.activate():
+                    # each log only contains the messages of its own run
+                    assert set([artifact_name for (artifact_name, _, _, _, _, _) in Logger.get_log().values()]) == {model_file_name}
+
+    def test_templates_per_code_generator(self):
+        code_generator = NESTCodeGenerator()
+        num_module_templates = len(code_generator._module_templates)
+        code_generator.set_options({})
+        assert len(code_generator._module_templates) == num_module_templates
+        assert len(NESTCodeGenerator()._module_templates) == num_module_templates
+
+
+if __name__ == "__main__":
+    unittest.main()